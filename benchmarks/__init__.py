@@ -0,0 +1,2 @@
+# Descrição: Suíte de benchmarks do compilador T++.
+#            Executar com: python -m benchmarks
@@ -0,0 +1,223 @@
+# Descrição: Executa a suíte de benchmarks do compilador T++.
+#            Para cada perfil de tamanho gera um programa sintético (benchmarks/gerador.py) e mede
+#            separadamente as fases de análise léxica, análise sintática, exportação da árvore,
+#            checkRules e podaArvore, reportando vazão (linhas/s, nós/s) e pico de memória.
+#            Os resultados são gravados em JSON para comparação entre execuções.
+#
+#            Uso: python -m benchmarks [--perfil nome] [--repeticoes N] [--saida arquivo.json]
+#                                      [--comparar base.json] [--limiar 0.10]
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if raiz not in sys.path:
+    sys.path.insert(0, raiz)
+
+import tppcompilador
+import tppparser
+import tppsema
+from mytree import ExportadorDot, ExportadorDotUnico
+from benchmarks.gerador import perfis, geraPerfil
+
+fases = ['lex', 'parse', 'export', 'checkRules', 'podaArvore']
+
+diretorio_resultados = os.path.join(raiz, 'benchmarks', 'resultados')
+
+
+# Conta os nós de uma árvore sem recursão
+def contaNos(root):
+    total = 0
+    pilha = [root]
+    while pilha:
+        node = pilha.pop()
+        total += 1
+        pilha.extend(node.children)
+    return total
+
+
+# Executa todas as fases sobre o código-fonte, retornando o tempo (e o pico de memória) de cada uma
+def executaFases(fonte, memoria=False):
+    medidas = {}
+    contexto = {}
+    saida = io.StringIO()
+
+    tppparser.root = None
+    tppsema.reiniciaEstado()
+
+    def lex():
+        contexto['tokens'] = tppcompilador.analisaLexico(fonte)
+
+    def parse():
+        tokens = iter(contexto['tokens'])
+        tppparser.parser.parse(tokenfunc=lambda: next(tokens, None))
+
+    def export():
+        with tempfile.TemporaryDirectory() as pasta:
+            ExportadorDot(tppparser.root).to_dotfile(os.path.join(pasta, 'bench.ast.dot'))
+            ExportadorDotUnico(tppparser.root).to_dotfile(os.path.join(pasta, 'bench.unique.ast.dot'))
+
+    def checkRules():
+        tppsema.root = tppparser.root
+        tppsema.checkRules()
+
+    def podaArvore():
+        tppsema.podaArvore(exportar=False)
+
+    etapas = {
+        'lex': lex,
+        'parse': parse,
+        'export': export,
+        'checkRules': checkRules,
+        'podaArvore': podaArvore,
+    }
+
+    with contextlib.redirect_stdout(saida):
+        for fase in fases:
+            if memoria:
+                tracemalloc.reset_peak()
+            inicio = time.perf_counter()
+            etapas[fase]()
+            tempo = time.perf_counter() - inicio
+            medidas[fase] = {'tempo': tempo}
+            if memoria:
+                medidas[fase]['pico_memoria'] = tracemalloc.get_traced_memory()[1]
+            if fase == 'parse':
+                contexto['nos'] = contaNos(tppparser.root)
+
+    contexto['diagnosticos'] = len(tppsema.diagnosticos)
+    return medidas, contexto
+
+
+# Mede um programa: repete as fases, fica com a mediana dos tempos e mede a memória numa execução à parte
+def medePrograma(fonte, repeticoes):
+    tempos = {fase: [] for fase in fases}
+    for i in range(repeticoes):
+        medidas, contexto = executaFases(fonte)
+        for fase in fases:
+            tempos[fase].append(medidas[fase]['tempo'])
+
+    tracemalloc.start()
+    try:
+        memoria, contexto = executaFases(fonte, memoria=True)
+    finally:
+        tracemalloc.stop()
+
+    linhas = len(fonte.splitlines())
+    nos = contexto['nos']
+    resultado = {
+        'linhas': linhas,
+        'tokens': len(contexto['tokens']),
+        'nos': nos,
+        'diagnosticos': contexto['diagnosticos'],
+        'fases': {},
+    }
+    total = 0.0
+    for fase in fases:
+        tempo = statistics.median(tempos[fase])
+        total += tempo
+        resultado['fases'][fase] = {
+            'tempo': tempo,
+            'minimo': min(tempos[fase]),
+            'linhas_por_s': linhas / tempo if tempo else None,
+            'nos_por_s': nos / tempo if tempo else None,
+            'pico_memoria': memoria[fase]['pico_memoria'],
+        }
+    resultado['total'] = {
+        'tempo': total,
+        'linhas_por_s': linhas / total if total else None,
+        'nos_por_s': nos / total if total else None,
+        'pico_memoria': max(memoria[fase]['pico_memoria'] for fase in fases),
+    }
+    return resultado
+
+
+# Compara dois resultados e retorna as fases cujo tempo piorou além do limiar
+def comparaResultados(base, atual, limiar):
+    regressoes = []
+    for perfil, medidas in atual['resultados'].items():
+        if perfil not in base['resultados']:
+            continue
+        anteriores = base['resultados'][perfil]
+        for fase in list(medidas['fases']) + ['total']:
+            novo = medidas['total'] if fase == 'total' else medidas['fases'][fase]
+            antigo = anteriores['total'] if fase == 'total' else anteriores['fases'].get(fase)
+            if not antigo or not antigo['tempo']:
+                continue
+            razao = novo['tempo'] / antigo['tempo']
+            marca = ''
+            if razao > 1 + limiar:
+                marca = '  <-- regressão'
+                regressoes.append((perfil, fase, razao))
+            print('%-10s %-12s %10.4fs -> %10.4fs  (x%.2f)%s' % (
+                perfil, fase, antigo['tempo'], novo['tempo'], razao, marca))
+    return regressoes
+
+
+def imprimeResultado(perfil, resultado):
+    print('%s: %d linhas, %d tokens, %d nós, %d diagnósticos' % (
+        perfil, resultado['linhas'], resultado['tokens'], resultado['nos'], resultado['diagnosticos']))
+    for fase in fases + ['total']:
+        medida = resultado['total'] if fase == 'total' else resultado['fases'][fase]
+        print('  %-12s %10.4fs %12.0f linhas/s %12.0f nós/s %10.1f KiB' % (
+            fase, medida['tempo'], medida['linhas_por_s'] or 0, medida['nos_por_s'] or 0,
+            medida['pico_memoria'] / 1024))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Benchmarks do compilador T++.')
+    parser.add_argument('--perfil', action='append', choices=sorted(perfis),
+                        help='perfil a executar (pode repetir; padrão: todos)')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', help='arquivo JSON de saída')
+    parser.add_argument('--comparar', help='arquivo JSON de uma execução anterior')
+    parser.add_argument('--limiar', type=float, default=0.10,
+                        help='piora relativa tolerada na comparação (padrão: 0.10)')
+    opcoes = parser.parse_args(args)
+
+    nomes = opcoes.perfil or list(perfis)
+    relatorio = {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'repeticoes': opcoes.repeticoes,
+        'semente': opcoes.semente,
+        'resultados': {},
+    }
+    for nome in nomes:
+        fonte = geraPerfil(nome, semente=opcoes.semente)
+        resultado = medePrograma(fonte, opcoes.repeticoes)
+        resultado['parametros'] = perfis[nome]
+        relatorio['resultados'][nome] = resultado
+        imprimeResultado(nome, resultado)
+
+    saida = opcoes.saida
+    if saida is None:
+        os.makedirs(diretorio_resultados, exist_ok=True)
+        saida = os.path.join(diretorio_resultados, datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    print('Resultados gravados em ' + saida)
+
+    if opcoes.comparar:
+        with open(opcoes.comparar, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        if comparaResultados(base, relatorio, opcoes.limiar):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
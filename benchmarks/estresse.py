@@ -0,0 +1,129 @@
+# Descrição: Teste de estresse do compilador T++ com programas muito profundos.
+#            Gera uma expressão longa (encadeada à esquerda, com profundidade proporcional ao número
+#            de termos) e blocos se/repita aninhados, e executa sobre eles, com o limite de recursão
+#            padrão do Python, a análise léxica, a análise sintática, o percurso da árvore, as regras
+#            semânticas (checkRules), a poda, a exportação (.dot), a organização do programa com a dobra
+#            de constantes (tppexecutor.Leiaute) e a compilação para o executor de closures, para o
+#            bytecode e para LLVM. Uma fase que estoura a pilha é reportada como falha.
+#
+#            Uso: python -m benchmarks.estresse [--termos 50000] [--profundidade 5000]
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if raiz not in sys.path:
+    sys.path.insert(0, raiz)
+
+import tppbytecode
+import tppcompilador
+import tppexecutor
+import tppllvm
+import tppparser
+import tppsema
+from mytree import ExportadorDot, ExportadorDotUnico
+from benchmarks.gerador import geraExpressaoLonga, geraBlocosAninhados
+
+fases = ['lex', 'parse', 'percurso', 'checkRules', 'podaArvore', 'export', 'organiza', 'executor', 'bytecode', 'llvm']
+
+
+# Executa as fases sobre o programa; retorna o tempo de cada fase e a fase que falhou (ou None)
+def executaEstresse(fonte):
+    tempos = {}
+    contexto = {}
+
+    tppparser.root = None
+    tppsema.reiniciaEstado()
+
+    def lex():
+        contexto['tokens'] = tppcompilador.analisaLexico(fonte)
+
+    def parse():
+        tokens = iter(contexto['tokens'])
+        tppparser.parser.parse(tokenfunc=lambda: next(tokens, None))
+        tppsema.root = tppparser.root
+
+    def percurso():
+        contexto['nos'] = len(tppsema.listaNos(tppsema.root))
+        tppsema.buscaNos(tppsema.root, 'fator')
+
+    def checkRules():
+        tppsema.checkRules()
+
+    def podaArvore():
+        tppsema.podaArvore(exportar=False)
+
+    def export():
+        with tempfile.TemporaryDirectory() as pasta:
+            ExportadorDot(tppsema.root).to_dotfile(os.path.join(pasta, 'estresse.ast.dot'))
+            ExportadorDotUnico(tppsema.root).to_dotfile(os.path.join(pasta, 'estresse.unique.ast.dot'))
+
+    def organiza():
+        tppexecutor.Leiaute(tppsema.root)
+
+    def executor():
+        tppexecutor.compilaPrograma(tppsema.root)
+
+    def bytecode():
+        tppbytecode.traduzPrograma(tppsema.root)
+
+    def llvm():
+        tppllvm.geraPrograma(tppsema.root)
+
+    etapas = {
+        'lex': lex,
+        'parse': parse,
+        'percurso': percurso,
+        'checkRules': checkRules,
+        'podaArvore': podaArvore,
+        'export': export,
+        'organiza': organiza,
+        'executor': executor,
+        'bytecode': bytecode,
+        'llvm': llvm,
+    }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for fase in fases:
+            inicio = time.perf_counter()
+            try:
+                etapas[fase]()
+            except RecursionError:
+                return tempos, contexto, fase
+            tempos[fase] = time.perf_counter() - inicio
+    return tempos, contexto, None
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.estresse',
+                                     description='Teste de estresse do compilador T++ com programas profundos.')
+    parser.add_argument('--termos', type=int, default=50000, help='termos da expressão longa')
+    parser.add_argument('--profundidade', type=int, default=5000, help='profundidade dos blocos aninhados')
+    opcoes = parser.parse_args(args)
+
+    programas = {
+        'expressao (%d termos)' % opcoes.termos: geraExpressaoLonga(opcoes.termos),
+        'blocos (%d níveis)' % opcoes.profundidade: geraBlocosAninhados(opcoes.profundidade),
+    }
+
+    falhas = 0
+    for nome, fonte in programas.items():
+        tempos, contexto, falha = executaEstresse(fonte)
+        print('%s: %d linhas, %d nós' % (nome, len(fonte.splitlines()), contexto.get('nos', 0)))
+        for fase in fases:
+            if fase in tempos:
+                print('  %-12s %10.4fs' % (fase, tempos[fase]))
+            elif fase == falha:
+                print('  %-12s RecursionError' % fase)
+        if falha is not None:
+            falhas += 1
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+# Descrição: Benchmark da execução de programas T++.
+#            Compila uma vez cada programa de referência (ordenação pelo método da bolha, busca binária
+#            sobre o vetor ordenado, produto de matrizes e um laço aritmético com chamadas de função,
+#            que passam quase todo o tempo no acesso aos elementos dos arranjos) para cada forma de
+#            execução (closures, tppexecutor.py; bytecode, tppbytecode.py) e mede o tempo da execução
+#            sobre uma entrada gerada com semente fixa, conferindo a saída com o resultado calculado em
+#            Python. Cada medida é a mediana de várias execuções.
+#
+#            Uso: python -m benchmarks.execucao [--tamanho 300] [--repeticoes 3] [--forma closures|bytecode]
+#                                               [--arranjos array|numpy]
+
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if raiz not in sys.path:
+    sys.path.insert(0, raiz)
+
+import tpparranjos
+import tppbytecode
+import tppcompilador
+import tppexecutor
+
+# Formas de execução: compilam a árvore podada em um programa com o método executa(entrada, saida)
+formas = {
+    'closures': tppexecutor.compilaPrograma,
+    'bytecode': tppbytecode.traduzPrograma,
+}
+
+# Programas de referência; {n} é o tamanho do vetor
+bolha = '''
+inteiro: v[{n}]
+
+ordena(inteiro: w[], inteiro: n)
+  inteiro: i, j, aux
+  i := 0
+  repita
+    j := 0
+    repita
+      se w[j] > w[j+1] então
+        aux := w[j]
+        w[j] := w[j+1]
+        w[j+1] := aux
+      fim
+      j := j + 1
+    até j >= n - i - 1
+    i := i + 1
+  até i >= n - 1
+fim
+
+inteiro principal()
+  inteiro: i
+  i := 0
+  repita
+    leia(v[i])
+    i := i + 1
+  até i = {n}
+  ordena(v, {n})
+  i := 0
+  repita
+    escreva(v[i])
+    i := i + 1
+  até i = {n}
+  retorna(0)
+fim
+'''
+
+busca = '''
+inteiro: v[{n}]
+
+inteiro buscaBinaria(inteiro: w[], inteiro: n, inteiro: x)
+  inteiro: inicio, final, meio
+  inicio := 0
+  final := n - 1
+  repita
+    meio := (inicio + final) / 2
+    se w[meio] = x então
+      retorna(meio)
+    fim
+    se w[meio] < x então
+      inicio := meio + 1
+    senão
+      final := meio - 1
+    fim
+  até inicio > final
+  retorna(-1)
+fim
+
+inteiro principal()
+  inteiro: i, encontrados
+  i := 0
+  repita
+    v[i] := 2 * i
+    i := i + 1
+  até i = {n}
+  encontrados := 0
+  repita
+    i := 0
+    repita
+      se buscaBinaria(v, {n}, i) >= 0 então
+        encontrados := encontrados + 1
+      fim
+      i := i + 1
+    até i = 2 * {n}
+    escreva(encontrados)
+    encontrados := 0
+    i := i + 1
+  até i > 2 * {n}
+  retorna(0)
+fim
+'''
+
+# Produto de matrizes quadradas de ordem {m}; escreve a soma dos elementos do produto
+matrizes = '''
+inteiro: a[{m}][{m}]
+inteiro: b[{m}][{m}]
+
+multiplica(inteiro: n)
+  inteiro: c[{m}][{m}]
+  inteiro: i, j, k, soma
+  i := 0
+  repita
+    j := 0
+    repita
+      k := 0
+      repita
+        c[i][j] := c[i][j] + a[i][k] * b[k][j]
+        k := k + 1
+      até k = n
+      j := j + 1
+    até j = n
+    i := i + 1
+  até i = n
+  soma := 0
+  i := 0
+  repita
+    j := 0
+    repita
+      soma := soma + c[i][j]
+      j := j + 1
+    até j = n
+    i := i + 1
+  até i = n
+  escreva(soma)
+fim
+
+inteiro principal()
+  inteiro: i, j
+  i := 0
+  repita
+    j := 0
+    repita
+      a[i][j] := i + j
+      b[i][j] := i - j
+      j := j + 1
+    até j = {m}
+    i := i + 1
+  até i = {m}
+  multiplica({m})
+  retorna(0)
+fim
+'''
+
+aritmetica = '''
+flutuante quadrado(flutuante: x)
+  retorna(x * x)
+fim
+
+inteiro principal()
+  inteiro: i
+  flutuante: soma
+  i := 1
+  repita
+    soma := soma + quadrado(1.0 / i)
+    i := i + 1
+  até i > {n} * 50
+  escreva(soma)
+  retorna(0)
+fim
+'''
+
+
+# Programas do benchmark: (fonte, entrada, saída esperada)
+def programas(tamanho):
+    gerador = random.Random(tamanho)
+    valores = [gerador.randrange(-1000, 1000) for _ in range(tamanho)]
+    soma = 0.0
+    for i in range(1, tamanho * 50 + 1):
+        soma += (1.0 / i) * (1.0 / i)
+    m = max(2, tamanho // 10)
+    produto = sum((i + k) * (k - j) for i in range(m) for j in range(m) for k in range(m))
+    return {
+        'bolha': (bolha.format(n=tamanho), ' '.join(map(str, valores)), list(map(str, sorted(valores)))),
+        'busca': (busca.format(n=tamanho), '', [str(tamanho)]),
+        'matrizes': (matrizes.format(m=m), '', [str(produto)]),
+        'aritmetica': (aritmetica.format(n=tamanho), '', [str(soma)]),
+    }
+
+
+# Mede a compilação da árvore podada (closures ou bytecode) e a execução do programa; retorna os tempos (em
+# segundos)
+def mede(fonte, entrada, esperado, repeticoes, forma='closures', arranjos='array'):
+    resultado = tppcompilador.compila(fonte)
+    if not resultado.sucesso():
+        raise resultado.erro
+    inicio = time.perf_counter()
+    programa = formas[forma](resultado.root)
+    compilacao = time.perf_counter() - inicio
+
+    tempos = []
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        inicio = time.perf_counter()
+        programa.executa(io.StringIO(entrada), saida, arranjos)
+        tempos.append(time.perf_counter() - inicio)
+        if saida.getvalue().split() != esperado:
+            raise AssertionError('saída incorreta')
+    return compilacao, statistics.median(tempos)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.execucao',
+                                     description='Benchmark da execução de programas T++.')
+    parser.add_argument('--tamanho', type=int, default=300, help='tamanho dos vetores dos programas')
+    parser.add_argument('--repeticoes', type=int, default=3, help='execuções de cada programa')
+    parser.add_argument('--forma', choices=sorted(formas), action='append', help='forma de execução (padrão: todas)')
+    parser.add_argument('--arranjos', choices=tpparranjos.formas, default='array',
+                        help='armazenamento dos arranjos (numpy usa array.array se o NumPy não estiver instalado)')
+    opcoes = parser.parse_args(args)
+
+    for nome, (fonte, entrada, esperado) in programas(opcoes.tamanho).items():
+        for forma in opcoes.forma or formas:
+            compilacao, execucao = mede(fonte, entrada, esperado, opcoes.repeticoes, forma, opcoes.arranjos)
+            print('%-12s %-10s compilação %8.4fs  execução %8.4fs' % (nome, forma, compilacao, execucao))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# Descrição: Gerador determinístico de programas T++ sintéticos para o benchmark.
+#            O tamanho do programa é controlado pelo número de funções, comandos por corpo,
+#            profundidade das expressões, declarações de vetores/matrizes e densidade de chamadas.
+#            A mesma semente gera sempre o mesmo programa. Também gera os programas do teste de
+#            estresse (expressões longas e blocos profundamente aninhados).
+
+import random
+
+# Perfis de tamanho usados pelo benchmark
+perfis = {
+    'pequeno': {
+        'funcoes': 3,
+        'comandos': 8,
+        'profundidade': 2,
+        'vetores': 2,
+        'chamadas': 0.2,
+    },
+    'medio': {
+        'funcoes': 10,
+        'comandos': 15,
+        'profundidade': 3,
+        'vetores': 4,
+        'chamadas': 0.2,
+    },
+    'grande': {
+        'funcoes': 20,
+        'comandos': 20,
+        'profundidade': 3,
+        'vetores': 8,
+        'chamadas': 0.2,
+    },
+}
+
+operadores_aritmeticos = ['+', '-', '*']
+operadores_relacionais = ['<', '>', '=', '<>', '<=', '>=']
+operadores_logicos = ['&&', '||']
+
+
+class GeradorTpp:
+
+    def __init__(self, funcoes=5, comandos=10, profundidade=3, vetores=2, chamadas=0.2, semente=0):
+        self.funcoes = funcoes
+        self.comandos = comandos
+        self.profundidade = profundidade
+        self.vetores = vetores
+        self.chamadas = chamadas
+        self.rand = random.Random(semente)
+        self.linhas = []
+        self.vetoresGlobais = []
+        self.funcoesGeradas = []
+
+    # Adiciona uma linha ao programa com a indentação correspondente
+    def emite(self, nivel, texto):
+        self.linhas.append('\t' * nivel + texto)
+
+    # Gera um fator simples: número, variável, elemento de vetor ou chamada de função
+    def fator(self, variaveis):
+        escolha = self.rand.random()
+        if self.funcoesGeradas and escolha < self.chamadas:
+            nome, aridade = self.rand.choice(self.funcoesGeradas)
+            argumentos = ', '.join(self.fator(variaveis) for i in range(aridade))
+            return '%s(%s)' % (nome, argumentos)
+        if self.vetoresGlobais and escolha < self.chamadas + 0.15:
+            nome, tamanho = self.rand.choice(self.vetoresGlobais)
+            return '%s[%d]' % (nome, self.rand.randrange(tamanho))
+        if escolha < 0.7:
+            return self.rand.choice(variaveis)
+        return str(self.rand.randint(0, 100))
+
+    # Gera uma expressão aritmética com a profundidade pedida
+    def expressao(self, variaveis, profundidade):
+        if profundidade <= 0:
+            return self.fator(variaveis)
+        esquerda = self.expressao(variaveis, profundidade - 1)
+        direita = self.expressao(variaveis, self.rand.randrange(profundidade))
+        operador = self.rand.choice(operadores_aritmeticos)
+        if self.rand.random() < 0.3:
+            return '(%s %s %s)' % (esquerda, operador, direita)
+        return '%s %s %s' % (esquerda, operador, direita)
+
+    # Gera uma condição para 'se' e 'repita'
+    def condicao(self, variaveis):
+        profundidade = max(1, self.profundidade - 2)
+        condicao = '%s %s %s' % (self.expressao(variaveis, profundidade),
+                                 self.rand.choice(operadores_relacionais),
+                                 self.expressao(variaveis, 0))
+        if self.rand.random() < 0.3:
+            condicao = '%s %s %s %s %s' % (condicao, self.rand.choice(operadores_logicos),
+                                          self.rand.choice(variaveis),
+                                          self.rand.choice(operadores_relacionais),
+                                          self.fator(variaveis))
+        return condicao
+
+    # Gera um comando (ação) do corpo de uma função
+    def comando(self, nivel, variaveis, restantes):
+        escolha = self.rand.random()
+        if escolha < 0.1 and nivel < 4 and restantes > 2:
+            self.emite(nivel, 'se %s então' % self.condicao(variaveis))
+            self.comando(nivel + 1, variaveis, restantes - 1)
+            self.emite(nivel, 'senão')
+            self.comando(nivel + 1, variaveis, restantes - 1)
+            self.emite(nivel, 'fim')
+        elif escolha < 0.18 and nivel < 4 and restantes > 2:
+            self.emite(nivel, 'repita')
+            self.comando(nivel + 1, variaveis, restantes - 1)
+            self.emite(nivel, 'até %s' % self.condicao(variaveis))
+        elif escolha < 0.25:
+            self.emite(nivel, 'leia(%s)' % self.rand.choice(variaveis))
+        elif escolha < 0.32:
+            self.emite(nivel, 'escreva(%s)' % self.expressao(variaveis, self.profundidade))
+        elif escolha < 0.42 and self.vetoresGlobais:
+            nome, tamanho = self.rand.choice(self.vetoresGlobais)
+            self.emite(nivel, '%s[%d] := %s' % (nome, self.rand.randrange(tamanho),
+                                                self.expressao(variaveis, self.profundidade)))
+        else:
+            self.emite(nivel, '%s := %s' % (self.rand.choice(variaveis),
+                                            self.expressao(variaveis, self.profundidade)))
+
+    # Gera uma função com parâmetros, declarações locais, comandos e retorno
+    def funcao(self, indice):
+        nome = 'func%d' % indice
+        aridade = self.rand.randint(0, 3)
+        parametros = ['p%d' % i for i in range(aridade)]
+        locais = ['x%d' % i for i in range(3)]
+        variaveis = parametros + locais + ['g0']
+
+        self.emite(0, 'inteiro %s(%s)' % (nome, ', '.join('inteiro: ' + p for p in parametros)))
+        self.emite(1, 'inteiro: ' + ', '.join(locais))
+        for i in range(self.comandos):
+            self.comando(1, variaveis, self.comandos - i)
+        self.emite(1, 'retorna(%s)' % self.expressao(variaveis, self.profundidade))
+        self.emite(0, 'fim')
+        self.emite(0, '')
+        self.funcoesGeradas.append((nome, aridade))
+
+    # Gera o programa completo e retorna o código-fonte
+    def gera(self):
+        self.emite(0, '{programa gerado automaticamente para benchmark}')
+        self.emite(0, 'inteiro: g0')
+        for i in range(self.vetores):
+            tamanho = self.rand.randint(10, 100)
+            if i % 3 == 2:
+                self.emite(0, 'flutuante: m%d[%d][%d]' % (i, tamanho, tamanho))
+            else:
+                self.emite(0, 'inteiro: v%d[%d]' % (i, tamanho))
+                self.vetoresGlobais.append(('v%d' % i, tamanho))
+        self.emite(0, '')
+
+        for i in range(self.funcoes):
+            self.funcao(i)
+
+        variaveis = ['a', 'b', 'g0']
+        self.emite(0, 'inteiro principal()')
+        self.emite(1, 'inteiro: a, b')
+        self.emite(1, 'g0 := 0')
+        for i in range(self.comandos):
+            self.comando(1, variaveis, self.comandos - i)
+        self.emite(1, 'retorna(0)')
+        self.emite(0, 'fim')
+        return '\n'.join(self.linhas) + '\n'
+
+
+# Gera um programa T++ de forma determinística a partir dos parâmetros de tamanho
+def geraPrograma(funcoes=5, comandos=10, profundidade=3, vetores=2, chamadas=0.2, semente=0):
+    gerador = GeradorTpp(funcoes=funcoes, comandos=comandos, profundidade=profundidade,
+                         vetores=vetores, chamadas=chamadas, semente=semente)
+    return gerador.gera()
+
+
+# Gera o programa correspondente a um dos perfis pré-definidos
+def geraPerfil(nome, semente=0):
+    return geraPrograma(semente=semente, **perfis[nome])
+
+
+# Programa com uma única expressão longa: x := x - 1 + x - 1 + x ... (termos operandos, encadeados à esquerda)
+def geraExpressaoLonga(termos=50000):
+    operandos = ' '.join(('+ x' if i % 2 else '- 1') for i in range(termos - 1))
+    return ('inteiro principal()\n'
+            '  inteiro: x\n'
+            '  leia(x)\n'
+            '  x := x ' + operandos + '\n'
+            '  retorna(x)\n'
+            'fim\n')
+
+
+# Programa com blocos se/repita aninhados na profundidade informada
+def geraBlocosAninhados(profundidade=5000):
+    linhas = ['inteiro principal()', '  inteiro: x', '  leia(x)']
+    for i in range(profundidade):
+        linhas.append('se x > %d então' % i if i % 2 == 0 else 'repita')
+    linhas.append('x := x + 1')
+    for i in reversed(range(profundidade)):
+        linhas.append('fim' if i % 2 == 0 else 'até x > %d' % i)
+    linhas += ['  retorna(x)', 'fim', '']
+    return '\n'.join(linhas)
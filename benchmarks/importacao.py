@@ -0,0 +1,82 @@
+# Descrição: Orçamento do tempo de importação do compilador T++.
+#            Importa o programa principal em um interpretador novo com python -X importtime e
+#            verifica que:
+#              - os módulos de exportação e visualização (anytree.exporter, ...) e os de modos que não
+#                foram pedidos (observação, processos paralelos) não são importados;
+#              - o tempo de importação, sem a carga das tabelas LALR (tempo próprio do tppparser,
+#                reportado à parte), cabe no orçamento.
+#            Cada medida é a mediana de várias execuções. Retorna 1 se o orçamento for excedido.
+#
+#            Uso: python -m benchmarks.importacao [--modulo main] [--orcamento 0.10] [--repeticoes 5]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que não devem ser carregados só por importar o compilador
+proibidos = [
+    'anytree.exporter',
+    'tppobservador',
+    'multiprocessing',
+    'subprocess',
+]
+
+# Módulo cujo tempo próprio é a carga (ou, sem tabela válida, a construção) das tabelas LALR
+modulo_tabelas = 'tppparser'
+
+
+# Importa o módulo em um interpretador novo; devolve {módulo: (tempo próprio, tempo acumulado)} em segundos
+def medeImportacao(modulo):
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + modulo],
+                              cwd=raiz, capture_output=True, text=True, check=True)
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|')
+        tempos[nome.strip()] = (int(proprio) / 1e6, int(acumulado) / 1e6)
+    return tempos
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.importacao',
+                                     description='Orçamento do tempo de importação do compilador T++.')
+    parser.add_argument('--modulo', default='main', help='módulo importado (padrão: main)')
+    parser.add_argument('--orcamento', type=float, default=0.10,
+                        help='tempo máximo de importação, sem as tabelas LALR, em segundos')
+    parser.add_argument('--repeticoes', type=int, default=5, help='execuções medidas')
+    opcoes = parser.parse_args(args)
+
+    medidas = [medeImportacao(opcoes.modulo) for _ in range(opcoes.repeticoes)]
+    total = statistics.median(tempos[opcoes.modulo][1] for tempos in medidas)
+    tabelas = statistics.median(tempos.get(modulo_tabelas, (0.0, 0.0))[0] for tempos in medidas)
+    proprios = {}
+    for tempos in medidas:
+        for nome, (proprio, acumulado) in tempos.items():
+            proprios.setdefault(nome, []).append(proprio)
+
+    print('import %s: %.4fs (tabelas LALR: %.4fs, demais módulos: %.4fs, orçamento: %.4fs)' % (
+        opcoes.modulo, total, tabelas, total - tabelas, opcoes.orcamento))
+    print('módulos mais caros (tempo próprio, sem as tabelas):')
+    mais_caros = sorted(((statistics.median(valores), nome) for nome, valores in proprios.items()
+                         if nome != modulo_tabelas), reverse=True)[:10]
+    for proprio, nome in mais_caros:
+        print('  %-40s %8.4fs' % (nome, proprio))
+
+    falhas = 0
+    importados = [nome for nome in proibidos if nome in medidas[0]]
+    for nome in importados:
+        print('FALHOU: %s foi importado' % nome)
+        falhas += 1
+    if total - tabelas > opcoes.orcamento:
+        print('FALHOU: importação acima do orçamento')
+        falhas += 1
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,8 +5,9 @@
 #            O programa chama o analisador léxico e sintático, e caso a árvore sintática
 #            não seja vazia, chama o analisador semântico.
 
+import tppcompilador
 import tppparser
-import tppsema
+from tppestatisticas import Estatisticas, PerfilRegras
 from myerror import MyError
 from sys import argv
 import os
@@ -14,8 +15,55 @@ import os
 # Inicializa o manipulador de erros com o arquivo de erros adequado
 error_handler = MyError('MainErrors')
 
-if __name__ == "__main__":
-    numParameters = len(argv) # Número de parâmetros
+# Separa os arquivos das opções da linha de comando (--opcao ou --opcao=valor)
+def separaOpcoes(parametros):
+    arquivos = []
+    opcoes = {}
+    for parametro in parametros:
+        if parametro.startswith('--'):
+            nome, igual, valor = parametro[2:].partition('=')
+            opcoes[nome] = valor if igual else True
+        else:
+            arquivos.append(parametro)
+    return arquivos, opcoes
+
+# Grava em JSON as estatísticas da compilação ou o índice de referências cruzadas (na saída padrão ou no arquivo
+# informado em --stats=arquivo / --xref=arquivo)
+def gravaJson(objeto, destino):
+    if destino is True:
+        print(objeto.json())
+    else:
+        with open(destino, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(objeto.json() + '\n')
+
+# Converte a fase em que a compilação falhou no erro correspondente do programa principal
+def verificaResultado(resultado):
+    if resultado.faseErro == 'sintatica':
+        raise IOError(error_handler.newError(False, 'ERR-MAIN-SYN-ERR'))
+    elif resultado.faseErro == 'semantica':
+        raise IOError(error_handler.newError(False, 'ERR-MAIN-SEM-ERR'))
+    elif resultado.faseErro == 'poda':
+        raise resultado.erro
+    elif not resultado.arvoreGerada():
+        print(tppparser.error_handler.newError(False, 'WAR-SYN-NOT-GEN-SYN-TREE'))
+        raise IOError(error_handler.newError(False, 'ERR-MAIN-SYN-ERR'))
+
+# Executa o compilador com os parâmetros da linha de comando (sem o nome do programa); os erros são
+# lançados como exceções. Também é usado pelo servidor de compilação (tppd.py)
+def main(parametros):
+    arquivos, opcoes = separaOpcoes(parametros)
+
+    # Modo de observação: --watch PASTA ou --watch=PASTA
+    if 'watch' in opcoes:
+        pasta = opcoes['watch'] if opcoes['watch'] is not True else ''.join(arquivos[:1])
+        if (opcoes['watch'] is True and len(arquivos) != 1) or not os.path.isdir(pasta):
+            raise IOError(error_handler.newError(False, 'ERR-MAIN-USE'))
+        import tppobservador
+        tppobservador.observa(pasta, trabalhadores=int(opcoes.get('jobs', 1)),
+                              gramatica='precedencia' if 'precedence' in opcoes else 'cascata')
+        return None
+
+    numParameters = len(arquivos) + 1 # Número de parâmetros
 
     if numParameters != 2:
         error = "Número de parâmetros Inválido, verifique a sintaxe. "
@@ -24,24 +72,31 @@ if __name__ == "__main__":
             raise IOError(error_handler.newError(False, 'ERR-MAIN-USE'))
         raise IOError(error_handler.newError(False, 'ERR-MAIN-USE'))
 
-    aux = argv[1].split('.')
+    aux = arquivos[0].split('.')
     if aux[-1] != 'tpp':
         raise IOError(error_handler.newError(False, 'ERR-MAIN-NOT-TPP'))
-    elif not os.path.exists(argv[1]):
+    elif not os.path.exists(arquivos[0]):
         raise IOError(error_handler.newError(False, 'ERR-MAIN-FILE-NOT-EXISTS'))
     else:
-        try:
-            tppparser.main()
-        except Exception as e:
-            raise IOError(error_handler.newError(False, 'ERR-MAIN-SYN-ERR'))
-
-        if tppparser.root is not None and tppparser.root.children != ():
-            # Análise semântica
-            try:
-                tppsema.root = tppparser.root
-                tppsema.checkRules()  # Realiza a análise semântica
-            except Exception as e:
-                raise IOError(error_handler.newError(False, 'ERR-MAIN-SEM-ERR'))
-            tppsema.podaArvore()   # Realiza a poda da árvore sintática
-        else:
-            raise IOError(error_handler.newError(False, 'ERR-MAIN-SYN-ERR'))
+        estatisticas = Estatisticas() if 'stats' in opcoes else None
+        perfil = PerfilRegras() if 'profile' in opcoes else None
+
+        # Análise sintática, exportação da árvore, análise semântica e poda
+        resultado = tppcompilador.compilaArquivo(arquivos[0],
+                                                 exportar=None if 'no-export' in opcoes else arquivos[0],
+                                                 captura=False, estatisticas=estatisticas, perfil=perfil,
+                                                 trabalhadores=int(opcoes.get('jobs', 1)),
+                                                 gramatica='precedencia' if 'precedence' in opcoes else 'cascata',
+                                                 elimina='elimina' in opcoes)
+        if estatisticas is not None:
+            gravaJson(estatisticas, opcoes['stats'])
+        if 'xref' in opcoes and resultado.referencias is not None:
+            gravaJson(resultado.referencias, opcoes['xref'])
+        if perfil is not None:
+            print(perfil.relatorio())
+
+        verificaResultado(resultado)
+        return resultado
+
+if __name__ == "__main__":
+    main(argv[1:])
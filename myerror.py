@@ -1,12 +1,17 @@
 import configparser
 
+import tpptabelas
+
+# Catálogo de mensagens, lido da pasta do compilador (ou de dentro do .pyz) uma única vez
+catalogo = tpptabelas.leRecurso('ErrorMessages.properties').decode('UTF-8')
+
 class MyError:
     VERMELHO = '\033[31;1m'  # Código para vermelho escuro
     RESET = '\033[0m'   
     
     def __init__(self, et):
         self.config = configparser.RawConfigParser()
-        self.config.read('ErrorMessages.properties', encoding='UTF-8')
+        self.config.read_string(catalogo)
         self.errorType = et
 
     def newError(self, optkey, key, **data):
@@ -23,9 +23,11 @@
 #           - root: nó raiz
 #           - nodenamefunc: função que retorna o nome do nó
 
-from anytree import Node, RenderTree, AsciiStyle, PreOrderIter
-from anytree.exporter import DotExporter
-from anytree import NodeMixin, RenderTree
+# Os exportadores do anytree (anytree.exporter) só são importados quando uma exportação é pedida
+# (ver ExportadorDot e ExportadorDotUnico no fim do arquivo)
+from anytree import NodeMixin
+import contextlib
+from time import perf_counter
 
 # "type": [PROGRAMA, ID, SE]
 # "scope": [Node's scope]
@@ -61,11 +63,19 @@ from anytree import NodeMixin, RenderTree
 
 node_sequence = 0
 
+# Tempo acumulado na criação de nós; só é medido quando não é None (ver tppestatisticas)
+tempo_criacao = None
+
+# Quando falso, a troca de pai não percorre o caminho até a raiz procurando ciclos (ver semVerificarCiclos)
+verificar_ciclos = True
+
 class MyNode(NodeMixin):  # Add Node feature   
 
   def __init__(self, name, parent=None, id=None, type=None, label=None, children=None, line=None):
+    global node_sequence, tempo_criacao
+    if tempo_criacao is not None:
+      inicio = perf_counter()
     super(MyNode, self).__init__()
-    global node_sequence
 
     if (id):
       self.id = id
@@ -81,6 +91,21 @@ class MyNode(NodeMixin):  # Add Node feature
     self.line = line
     if children:
       self.children = children
+    if tempo_criacao is not None:
+      tempo_criacao += perf_counter() - inicio
+
+  # Troca de pai do anytree; sem a verificação de ciclos, que custa a profundidade do novo pai (usa os métodos
+  # privados __detach e __attach do NodeMixin, ver requirements.txt)
+  def _defineParent(self, value):
+    if verificar_ciclos:
+      NodeMixin.parent.fset(self, value)
+      return
+    parent = self.parent
+    if parent is not value:
+      self._NodeMixin__detach(parent)
+      self._NodeMixin__attach(value)
+
+  parent = property(NodeMixin.parent.fget, _defineParent)
 
   def nodenamefunc(node):
     return '%s' % (node.name)
@@ -93,4 +118,80 @@ class MyNode(NodeMixin):  # Add Node feature
     return ''
 
   def edgetypefunc(node, child):
-    return '--'
\ No newline at end of file
+    return '--'
+
+
+# Desliga a verificação de ciclos do anytree enquanto a árvore é apenas reorganizada (ex.: a poda, que
+# só move nós para junto de um ancestral e não pode criar ciclos); em árvores profundas cada troca de pai
+# percorreria o caminho até a raiz
+@contextlib.contextmanager
+def semVerificarCiclos():
+  global verificar_ciclos
+  anterior = verificar_ciclos
+  verificar_ciclos = False
+  try:
+    yield
+  finally:
+    verificar_ciclos = anterior
+
+
+# Percorre a subárvore em pré-ordem com uma pilha explícita, sem recursão (o PreOrderIter e o
+# RenderTree do anytree são geradores recursivos e estouram o limite de recursão em árvores profundas).
+#   filter_: só retorna os nós aceitos (os filhos dos nós recusados continuam sendo percorridos)
+#   stop: não entra nos nós aceitos por stop
+#   maxlevel: profundidade máxima (a raiz é o nível 1)
+def preOrdem(node, filter_=None, stop=None, maxlevel=None):
+  pilha = [(node, 1)]
+  while pilha:
+    item, nivel = pilha.pop()
+    if stop is not None and stop(item):
+      continue
+    if filter_ is None or filter_(item):
+      yield item
+    if maxlevel is None or nivel < maxlevel:
+      pilha.extend((filho, nivel + 1) for filho in reversed(item.children))
+
+
+# Substitui os percursos recursivos do DotExporter pelo percurso iterativo (preOrdem). Os nomes são os dos métodos
+# privados do anytree 2.12/2.13 (fixado em requirements.txt; mytree_test.py falha se eles mudarem)
+class PercursoIterativoDot:
+
+  def _DotExporter__iter_nodes(self, indent, nodenamefunc, nodeattrfunc, filter_):
+    for node in preOrdem(self.node, filter_=filter_, stop=self.stop, maxlevel=self.maxlevel):
+      nodename = nodenamefunc(node)
+      nodeattr = nodeattrfunc(node)
+      nodeattr = f" [{nodeattr}]" if nodeattr is not None else ""
+      yield f'{indent}"{self.esc(nodename)}"{nodeattr};'
+
+  def _DotExporter__iter_edges(self, indent, nodenamefunc, edgeattrfunc, edgetypefunc, filter_):
+    maxlevel = self.maxlevel - 1 if self.maxlevel else None
+    for node in preOrdem(self.node, filter_=filter_, stop=self.stop, maxlevel=maxlevel):
+      nodename = nodenamefunc(node)
+      for child in node.children:
+        if not filter_(child):
+          continue
+        childname = nodenamefunc(child)
+        edgeattr = edgeattrfunc(node, child)
+        edgetype = edgetypefunc(node, child)
+        edgeattr = f" [{edgeattr}]" if edgeattr is not None else ""
+        yield f'{indent}"{self.esc(nodename)}" {edgetype} "{self.esc(childname)}"{edgeattr};'
+
+
+# Cria os exportadores (DotExporter e UniqueDotExporter com o percurso iterativo) no primeiro acesso a
+# mytree.ExportadorDot ou mytree.ExportadorDotUnico, importando anytree.exporter só nesse momento
+def _criaExportadores():
+  global ExportadorDot, ExportadorDotUnico
+  from anytree.exporter import DotExporter, UniqueDotExporter
+
+  class ExportadorDot(PercursoIterativoDot, DotExporter):
+    pass
+
+  class ExportadorDotUnico(PercursoIterativoDot, UniqueDotExporter):
+    pass
+
+
+def __getattr__(nome):
+  if nome in ('ExportadorDot', 'ExportadorDotUnico'):
+    _criaExportadores()
+    return globals()[nome]
+  raise AttributeError("module %r has no attribute %r" % (__name__, nome))
@@ -0,0 +1,44 @@
+import inspect
+
+from anytree import NodeMixin
+from anytree.exporter import DotExporter
+
+import mytree
+from mytree import MyNode, semVerificarCiclos
+
+
+def cadeia(profundidade):
+    raiz = no = MyNode(name='raiz')
+    with semVerificarCiclos():
+        for i in range(profundidade):
+            no = MyNode(name='no%d' % i, parent=no)
+    return raiz, no
+
+
+def test_001():
+    # Os métodos privados do anytree substituídos em mytree existem com os mesmos parâmetros; se uma versão
+    # nova os renomear, a exportação voltaria em silêncio ao percurso recursivo (fixe a versão em requirements.txt)
+    for classe, nome, substituto in [
+            (DotExporter, '_DotExporter__iter_nodes', mytree.PercursoIterativoDot._DotExporter__iter_nodes),
+            (DotExporter, '_DotExporter__iter_edges', mytree.PercursoIterativoDot._DotExporter__iter_edges)]:
+        assert hasattr(classe, nome), '%s.%s não existe nesta versão do anytree' % (classe.__name__, nome)
+        assert inspect.signature(getattr(classe, nome)) == inspect.signature(substituto)
+    for nome in ['_NodeMixin__detach', '_NodeMixin__attach']:
+        assert hasattr(NodeMixin, nome), 'NodeMixin.%s não existe nesta versão do anytree' % nome
+        assert list(inspect.signature(getattr(NodeMixin, nome)).parameters) == ['self', 'parent']
+
+
+def test_002():
+    # A exportação de uma árvore mais profunda que o limite de recursão usa o percurso iterativo
+    raiz, folha = cadeia(5000)
+    linhas = list(mytree.ExportadorDot(raiz, nodenamefunc=MyNode.nodenamefunc))
+    assert sum(1 for linha in linhas if ' -> ' in linha) == 5000
+
+
+def test_003():
+    # A troca de pai sem verificação de ciclos mantém os dois lados da ligação
+    raiz, folha = cadeia(3)
+    meio = folha.parent
+    with semVerificarCiclos():
+        folha.parent = raiz
+    assert folha.parent is raiz and folha in raiz.children and folha not in meio.children
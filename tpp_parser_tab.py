@@ -0,0 +1,187 @@
+
+# tpp_parser_tab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programaABRE_COLCHETE ABRE_PARENTESE ATE ATRIBUICAO DIFERENTE DIVIDE DOIS_PONTOS E ENTAO ESCREVA FECHA_COLCHETE FECHA_PARENTESE FIM FLUTUANTE ID IGUAL INTEIRO LEIA MAIOR MAIOR_IGUAL MAIS MENOR MENOR_IGUAL MENOS NAO NUM_INTEIRO NUM_NOTACAO_CIENTIFICA NUM_PONTO_FLUTUANTE OU REPITA RETORNA SE SENAO VEZES VIRGULAprograma : lista_declaracoeslista_declaracoes : lista_declaracoes declaracao\n                        | declaracao\n    declaracao : declaracao_variaveis\n                | inicializacao_variaveis\n                | declaracao_funcao\n    declaracao_variaveis : tipo DOIS_PONTOS lista_variaveisdeclaracao_variaveis : tipo DOIS_PONTOS errorinicializacao_variaveis : atribuicaolista_variaveis : lista_variaveis VIRGULA var\n                        | var\n    lista_variaveis : error VIRGULA var\n                        | lista_variaveis VIRGULA error\n    var : ID\n            | ID indice\n    var : error indice\n            | ID error\n    indice : indice ABRE_COLCHETE expressao FECHA_COLCHETE\n                | ABRE_COLCHETE expressao FECHA_COLCHETE\n    indice : error ABRE_COLCHETE expressao FECHA_COLCHETE\n                | indice error expressao FECHA_COLCHETE\n                | indice ABRE_COLCHETE error FECHA_COLCHETE\n                | indice ABRE_COLCHETE expressao error\n                | indice ABRE_COLCHETE error\n                | error expressao FECHA_COLCHETE\n                | ABRE_COLCHETE error FECHA_COLCHETE\n                | ABRE_COLCHETE expressao error\n                | ABRE_COLCHETE error\n    tipo : INTEIRO\n        | FLUTUANTE\n    declaracao_funcao : tipo cabecalho \n                        | cabecalho \n    declaracao_funcao : error cabecalho \n                        | tipo error\n                        | error \n    cabecalho : ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIMcabecalho : error ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIM\n                | ID error lista_parametros FECHA_PARENTESE corpo FIM\n                | ID ABRE_PARENTESE error FECHA_PARENTESE corpo FIM\n                | ID ABRE_PARENTESE lista_parametros error corpo FIM\n                | ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE error FIM\n                | ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo error\n                | ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo\n    lista_parametros : lista_parametros VIRGULA parametro\n                    | parametro\n                    | vazio\n    lista_parametros : error VIRGULA parametro\n                    | vazio VIRGULA parametro\n                    | lista_parametros VIRGULA error\n                    | error\n    parametro : tipo DOIS_PONTOS ID\n                | parametro ABRE_COLCHETE FECHA_COLCHETE\n    parametro : error DOIS_PONTOS ID\n                | tipo error ID\n                | tipo DOIS_PONTOS error\n                | error ABRE_COLCHETE FECHA_COLCHETE\n                | parametro error FECHA_COLCHETE\n                | parametro ABRE_COLCHETE error\n    corpo : corpo acao\n            | vazio\n    corpo : error acao\n            | corpo error\n    acao : expressao\n            | declaracao_variaveis\n            | se\n            | repita\n            | leia\n            | escreva\n            | retorna\n            | error     \n    se : SE expressao ENTAO corpo FIM\n          | SE expressao ENTAO corpo SENAO corpo FIM\n    se : error expressao ENTAO corpo FIM\n        | SE error ENTAO corpo FIM\n        | SE expressao error corpo FIM\n        | SE expressao ENTAO error FIM\n        | SE expressao ENTAO corpo error\n        | error expressao ENTAO corpo SENAO corpo FIM\n        | SE error ENTAO corpo SENAO corpo FIM\n        | SE expressao error corpo SENAO corpo FIM\n        | SE expressao ENTAO error SENAO corpo FIM\n        | SE expressao ENTAO corpo error corpo FIM\n        | SE expressao ENTAO corpo SENAO error FIM\n        | SE expressao ENTAO corpo SENAO corpo error\n    repita : REPITA corpo ATE expressaorepita : error corpo ATE expressao\n            | REPITA error ATE expressao\n            | REPITA corpo error expressao\n            | REPITA corpo ATE error\n    atribuicao : var ATRIBUICAO expressaoatribuicao : error ATRIBUICAO expressao\n            | var error expressao\n            | var ATRIBUICAO error\n    leia : LEIA ABRE_PARENTESE var FECHA_PARENTESEleia :  LEIA error expressao FECHA_PARENTESE\n            | LEIA ABRE_PARENTESE error FECHA_PARENTESE\n            | LEIA ABRE_PARENTESE expressao error\n    escreva : ESCREVA ABRE_PARENTESE expressao FECHA_PARENTESEescreva : ESCREVA error expressao FECHA_PARENTESE\n                | ESCREVA ABRE_PARENTESE error FECHA_PARENTESE\n                | ESCREVA ABRE_PARENTESE expressao error\n    retorna : RETORNA ABRE_PARENTESE expressao FECHA_PARENTESEretorna : RETORNA error expressao FECHA_PARENTESE\n                | RETORNA ABRE_PARENTESE error FECHA_PARENTESE\n                | RETORNA ABRE_PARENTESE expressao error\n    expressao : expressao_logica\n                    | atribuicao\n    expressao_logica : expressao_simples\n                        | expressao_logica operador_logico expressao_simples\n    expressao_logica : error operador_logico expressao_simples\n                        | expressao_logica error expressao_simples\n                        | expressao_logica operador_logico error\n        expressao_simples : expressao_aditiva\n                        | expressao_simples operador_relacional expressao_aditiva\n    expressao_aditiva : expressao_multiplicativa\n                        | expressao_aditiva operador_soma expressao_multiplicativa\n    expressao_multiplicativa : expressao_unaria\n                               | expressao_multiplicativa operador_multiplicacao expressao_unaria\n        expressao_unaria : fator\n                        | operador_soma fator\n                        | operador_negacao fator\n        operador_relacional : MENOR\n                            | MAIOR\n                            | IGUAL\n                            | DIFERENTE \n                            | MENOR_IGUAL\n                            | MAIOR_IGUAL\n    operador_soma : MAIS\n                    | MENOS\n    operador_logico : E\n                    | OU\n    operador_logico : E error\n                    | OU error\n    operador_negacao : NAOoperador_negacao : NAO error  operador_multiplicacao : VEZES\n                            | DIVIDE\n        operador_multiplicacao : error fator : ABRE_PARENTESE expressao FECHA_PARENTESE\n            | var\n            | chamada_funcao\n            | numero\n        fator : ABRE_PARENTESE error FECHA_PARENTESE\n            | error expressao FECHA_PARENTESE\n            | ABRE_PARENTESE expressao error\n        numero : NUM_INTEIRO\n                | NUM_PONTO_FLUTUANTE\n                | NUM_NOTACAO_CIENTIFICA\n    chamada_funcao : ID ABRE_PARENTESE lista_argumentos FECHA_PARENTESEchamada_funcao : ID ABRE_PARENTESE error FECHA_PARENTESElista_argumentos : lista_argumentos VIRGULA expressao\n                    | expressao\n                    | vazio\n        lista_argumentos : error VIRGULA expressao\n                    | lista_argumentos error expressao\n                    | lista_argumentos VIRGULA error\n        vazio : '
+    
+_lr_action_items = {'error':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,63,64,65,66,67,68,69,70,71,72,73,74,75,77,78,79,80,81,82,84,85,86,87,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,114,115,116,118,119,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,243,244,246,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[8,8,-3,-4,-5,-6,17,20,-9,-32,-29,-30,27,29,-2,32,-34,-31,35,36,-33,36,61,66,69,71,36,74,75,66,-7,78,-11,80,61,81,86,36,91,-107,-108,27,-113,80,104,107,-117,-119,107,-141,-142,-128,-129,109,-146,-147,-148,-91,110,117,-46,120,36,123,125,81,-90,81,-92,128,-50,81,133,36,134,36,81,107,140,141,81,144,-25,147,107,107,-122,-123,-124,-125,-126,-127,107,152,107,-136,-137,-138,-120,-140,81,-121,-135,81,156,160,164,166,156,170,174,81,-19,-27,-26,177,160,160,69,160,-10,78,78,-12,69,-110,-144,-132,-133,-143,-139,-145,-20,-109,81,-111,-114,104,184,81,-152,-153,-118,117,-53,-56,187,202,-60,117,-49,-52,-58,-57,117,-51,-55,-54,-21,-18,-23,-22,206,187,202,202,202,125,-149,213,36,-150,36,216,-61,-63,-64,-65,-66,-67,-68,-69,220,222,224,226,228,216,-37,-59,-36,216,-41,-40,-39,-38,-19,-151,81,-155,-154,229,202,234,81,237,187,240,36,244,36,247,36,216,-63,160,36,253,160,160,257,216,36,27,81,262,265,81,269,81,202,-86,276,187,202,202,-85,81,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,160,-71,285,216,-76,160,-75,160,-74,160,202,292,187,202,202,202,202,-78,-72,216,-83,-82,-81,-80,-79,]),'INTEIRO':([0,2,3,4,5,6,8,9,10,15,17,18,21,23,24,28,29,30,31,32,33,34,35,37,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,111,114,115,118,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,203,204,205,206,207,208,209,210,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[11,11,-3,-4,-5,-6,-35,-9,-32,-2,-34,-31,-33,11,-16,11,11,-15,-7,-8,-11,-14,11,11,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,11,-157,11,11,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,11,11,-60,-21,-18,-23,-22,11,11,11,11,11,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-37,-59,-36,-42,-41,-40,-39,-38,-19,11,11,11,11,-70,-63,-157,-157,-157,-157,-62,11,-86,11,11,11,11,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,11,11,11,11,11,11,11,-78,-72,-62,-83,-82,-81,-80,-79,]),'FLUTUANTE':([0,2,3,4,5,6,8,9,10,15,17,18,21,23,24,28,29,30,31,32,33,34,35,37,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,111,114,115,118,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,203,204,205,206,207,208,209,210,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[12,12,-3,-4,-5,-6,-35,-9,-32,-2,-34,-31,-33,12,-16,12,12,-15,-7,-8,-11,-14,12,12,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,12,-157,12,12,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,12,12,-60,-21,-18,-23,-22,12,12,12,12,12,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-37,-59,-36,-42,-41,-40,-39,-38,-19,12,12,12,12,-70,-63,-157,-157,-157,-157,-62,12,-86,12,12,12,12,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,12,12,12,12,12,12,12,-78,-72,-62,-83,-82,-81,-80,-79,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,15,16,17,18,20,21,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,66,67,69,70,71,72,75,77,78,79,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,112,114,119,120,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,203,204,205,206,207,208,209,210,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[14,14,-3,-4,-5,-6,19,19,-9,-32,-29,-30,-2,34,-34,-31,45,-33,45,-16,45,45,45,45,-15,-7,-8,-11,-14,45,45,45,-106,-107,-108,-140,-113,-14,-115,45,-117,-119,45,-141,-142,-128,-129,-134,-146,-147,-148,-91,45,45,45,45,-90,45,-92,45,34,45,34,45,45,45,-130,-131,45,-25,45,45,45,-122,-123,-124,-125,-126,-127,45,45,45,-136,-137,-138,-120,-140,45,-121,-135,45,158,-157,169,171,45,-19,-27,-26,-157,-157,-157,45,-157,-10,-13,-12,45,-110,-144,-132,-133,-143,-139,-145,-20,-109,45,-111,-114,-116,45,-118,45,45,-60,-21,-18,-23,-22,45,45,45,45,45,-149,45,45,-150,45,45,-61,-63,-64,-65,-66,-67,-68,-69,45,-157,45,-37,-59,-36,45,-41,-40,-39,-38,-19,45,45,45,45,45,45,45,45,45,45,45,45,45,-63,-157,45,-157,-157,-157,45,45,45,45,45,45,45,-86,45,45,45,45,-85,45,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,45,-76,-157,-75,-157,-74,-157,45,45,45,45,45,45,45,-78,-72,45,-83,-82,-81,-80,-79,]),'$end':([1,2,3,4,5,6,8,9,10,15,17,18,21,24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,123,124,125,126,127,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,162,172,173,174,175,176,182,185,187,188,189,190,191,192,193,194,195,203,204,205,206,207,208,209,210,211,251,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,274,276,277,279,281,290,291,292,293,294,295,296,297,],[0,-1,-3,-4,-5,-6,-35,-9,-32,-2,-34,-31,-33,-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-24,-19,-27,-26,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,-60,-21,-18,-23,-22,-43,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-37,-59,-36,-42,-41,-40,-39,-38,-19,-86,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-71,-77,-76,-75,-74,-78,-72,-84,-83,-82,-81,-80,-79,]),'DOIS_PONTOS':([7,11,12,61,65,74,75,86,156,164,196,],[16,-29,-30,112,119,112,112,112,112,112,16,]),'ATRIBUICAO':([8,13,14,24,29,30,36,43,45,69,71,75,80,81,86,89,110,123,124,125,126,145,152,172,173,174,175,187,202,206,211,213,216,220,229,237,239,240,244,247,257,276,292,],[22,26,-14,-16,-17,-15,22,26,-14,22,22,22,-17,22,22,-25,22,22,-19,-27,-26,-20,22,-21,-18,-23,-22,22,22,22,-19,22,22,22,22,22,26,22,22,22,22,22,22,]),'ABRE_PARENTESE':([8,14,17,19,20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,199,200,201,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[23,28,23,28,37,60,-16,60,60,60,60,-15,-7,-8,-11,-14,60,60,60,-106,-107,-108,-140,-113,100,-115,60,-117,-119,60,-141,-142,-128,-129,-134,-146,-147,-148,-91,60,60,60,60,-90,60,-92,60,60,60,60,60,-130,-131,60,-25,60,60,60,-122,-123,-124,-125,-126,-127,60,60,60,-136,-137,-138,-120,-140,60,-121,-135,60,-157,60,-19,-27,-26,-157,-157,-157,60,-157,-10,-13,-12,60,-110,-144,-132,-133,-143,-139,-145,-20,-109,60,-111,-114,-116,60,-118,60,60,-60,-21,-18,-23,-22,60,60,60,60,60,-149,60,60,-150,60,60,-61,-63,-64,-65,-66,-67,-68,-69,60,-157,223,225,227,60,-59,60,-19,60,60,60,60,60,60,60,60,60,60,60,60,60,-63,-157,60,-157,-157,-157,60,60,60,60,60,60,60,-86,60,60,60,60,-85,60,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,60,-76,-157,-75,-157,-74,-157,60,60,60,60,60,60,60,-78,-72,60,-83,-82,-81,-80,-79,]),'ABRE_COLCHETE':([8,14,20,24,29,30,32,34,36,45,61,63,69,71,74,75,78,80,81,86,89,107,110,123,124,125,126,133,134,145,147,152,156,157,158,159,163,164,165,166,167,168,169,170,171,172,173,174,175,187,202,206,211,213,216,220,229,237,240,244,247,257,276,292,],[25,25,38,67,38,67,25,25,25,25,113,116,25,25,113,130,38,38,136,130,-25,25,25,25,-19,-27,-26,25,25,-20,25,25,113,116,-53,-56,116,113,-52,-58,-57,116,-51,-55,-54,-21,-18,-23,-22,25,25,25,-19,25,136,25,136,25,25,25,25,25,25,25,]),'MAIS':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,48,49,51,52,53,54,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[53,53,-16,53,53,53,53,-15,-7,-8,-11,-14,53,53,53,-106,-107,-108,-140,53,-14,-115,-117,-119,-141,-142,-128,-129,-146,-147,-148,-91,53,53,53,53,-90,53,-92,53,53,53,53,53,-130,-131,53,-25,53,53,53,-122,-123,-124,-125,-126,-127,53,53,53,-136,-137,-138,-120,-140,53,-121,53,-157,53,-19,-27,-26,-157,-157,-157,53,-157,-10,-13,-12,53,-110,-144,-132,-133,-143,-139,-145,-20,-109,53,-111,53,-116,53,-118,53,53,-60,-21,-18,-23,-22,53,53,53,53,53,-149,53,53,-150,53,53,-61,-63,-64,-65,-66,-67,-68,-69,53,-157,53,-59,53,-19,53,53,53,53,53,53,53,53,53,53,53,53,53,-63,-157,53,-157,-157,-157,53,53,53,-140,53,53,53,53,-86,53,53,53,53,-85,53,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,53,-76,-157,-75,-157,-74,-157,53,53,53,53,53,53,53,-78,-72,53,-83,-82,-81,-80,-79,]),'MENOS':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,48,49,51,52,53,54,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[54,54,-16,54,54,54,54,-15,-7,-8,-11,-14,54,54,54,-106,-107,-108,-140,54,-14,-115,-117,-119,-141,-142,-128,-129,-146,-147,-148,-91,54,54,54,54,-90,54,-92,54,54,54,54,54,-130,-131,54,-25,54,54,54,-122,-123,-124,-125,-126,-127,54,54,54,-136,-137,-138,-120,-140,54,-121,54,-157,54,-19,-27,-26,-157,-157,-157,54,-157,-10,-13,-12,54,-110,-144,-132,-133,-143,-139,-145,-20,-109,54,-111,54,-116,54,-118,54,54,-60,-21,-18,-23,-22,54,54,54,54,54,-149,54,54,-150,54,54,-61,-63,-64,-65,-66,-67,-68,-69,54,-157,54,-59,54,-19,54,54,54,54,54,54,54,54,54,54,54,54,54,-63,-157,54,-157,-157,-157,54,54,54,-140,54,54,54,54,-86,54,54,54,54,-85,54,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,54,-76,-157,-75,-157,-74,-157,54,54,54,54,54,54,54,-78,-72,54,-83,-82,-81,-80,-79,]),'NAO':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,48,49,51,52,53,54,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[55,55,-16,55,55,55,55,-15,-7,-8,-11,-14,55,55,55,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-128,-129,-146,-147,-148,-91,55,55,55,55,-90,55,-92,55,55,55,55,55,-130,-131,55,-25,55,55,55,-122,-123,-124,-125,-126,-127,55,55,55,-136,-137,-138,-120,-140,55,-121,55,-157,55,-19,-27,-26,-157,-157,-157,55,-157,-10,-13,-12,55,-110,-144,-132,-133,-143,-139,-145,-20,-109,55,-111,-114,-116,55,-118,55,55,-60,-21,-18,-23,-22,55,55,55,55,55,-149,55,55,-150,55,55,-61,-63,-64,-65,-66,-67,-68,-69,55,-157,55,-59,55,-19,55,55,55,55,55,55,55,55,55,55,55,55,55,-63,-157,55,-157,-157,-157,55,55,55,55,55,55,55,-86,55,55,55,55,-85,55,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,55,-76,-157,-75,-157,-74,-157,55,55,55,55,55,55,55,-78,-72,55,-83,-82,-81,-80,-79,]),'NUM_INTEIRO':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[56,56,-16,56,56,56,56,-15,-7,-8,-11,-14,56,56,56,-106,-107,-108,-140,-113,-14,-115,56,-117,-119,56,-141,-142,-128,-129,-134,-146,-147,-148,-91,56,56,56,56,-90,56,-92,56,56,56,56,56,-130,-131,56,-25,56,56,56,-122,-123,-124,-125,-126,-127,56,56,56,-136,-137,-138,-120,-140,56,-121,-135,56,-157,56,-19,-27,-26,-157,-157,-157,56,-157,-10,-13,-12,56,-110,-144,-132,-133,-143,-139,-145,-20,-109,56,-111,-114,-116,56,-118,56,56,-60,-21,-18,-23,-22,56,56,56,56,56,-149,56,56,-150,56,56,-61,-63,-64,-65,-66,-67,-68,-69,56,-157,56,-59,56,-19,56,56,56,56,56,56,56,56,56,56,56,56,56,-63,-157,56,-157,-157,-157,56,56,56,56,56,56,56,-86,56,56,56,56,-85,56,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,56,-76,-157,-75,-157,-74,-157,56,56,56,56,56,56,56,-78,-72,56,-83,-82,-81,-80,-79,]),'NUM_PONTO_FLUTUANTE':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[57,57,-16,57,57,57,57,-15,-7,-8,-11,-14,57,57,57,-106,-107,-108,-140,-113,-14,-115,57,-117,-119,57,-141,-142,-128,-129,-134,-146,-147,-148,-91,57,57,57,57,-90,57,-92,57,57,57,57,57,-130,-131,57,-25,57,57,57,-122,-123,-124,-125,-126,-127,57,57,57,-136,-137,-138,-120,-140,57,-121,-135,57,-157,57,-19,-27,-26,-157,-157,-157,57,-157,-10,-13,-12,57,-110,-144,-132,-133,-143,-139,-145,-20,-109,57,-111,-114,-116,57,-118,57,57,-60,-21,-18,-23,-22,57,57,57,57,57,-149,57,57,-150,57,57,-61,-63,-64,-65,-66,-67,-68,-69,57,-157,57,-59,57,-19,57,57,57,57,57,57,57,57,57,57,57,57,57,-63,-157,57,-157,-157,-157,57,57,57,57,57,57,57,-86,57,57,57,57,-85,57,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,57,-76,-157,-75,-157,-74,-157,57,57,57,57,57,57,57,-78,-72,57,-83,-82,-81,-80,-79,]),'NUM_NOTACAO_CIENTIFICA':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,66,67,69,70,71,72,75,78,80,81,82,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,114,123,124,125,126,127,128,129,130,131,132,133,135,136,138,139,140,141,142,143,144,145,146,147,148,149,150,152,155,160,161,162,172,173,174,175,176,177,178,179,180,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197,198,202,204,206,211,213,216,218,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,240,244,247,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[58,58,-16,58,58,58,58,-15,-7,-8,-11,-14,58,58,58,-106,-107,-108,-140,-113,-14,-115,58,-117,-119,58,-141,-142,-128,-129,-134,-146,-147,-148,-91,58,58,58,58,-90,58,-92,58,58,58,58,58,-130,-131,58,-25,58,58,58,-122,-123,-124,-125,-126,-127,58,58,58,-136,-137,-138,-120,-140,58,-121,-135,58,-157,58,-19,-27,-26,-157,-157,-157,58,-157,-10,-13,-12,58,-110,-144,-132,-133,-143,-139,-145,-20,-109,58,-111,-114,-116,58,-118,58,58,-60,-21,-18,-23,-22,58,58,58,58,58,-149,58,58,-150,58,58,-61,-63,-64,-65,-66,-67,-68,-69,58,-157,58,-59,58,-19,58,58,58,58,58,58,58,58,58,58,58,58,58,-63,-157,58,-157,-157,-157,58,58,58,58,58,58,58,-86,58,58,58,58,-85,58,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,58,-76,-157,-75,-157,-74,-157,58,58,58,58,58,58,58,-78,-72,58,-83,-82,-81,-80,-79,]),'VIRGULA':([23,24,28,29,30,31,32,33,34,35,37,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,61,62,63,64,69,70,71,72,73,74,75,76,80,86,89,100,105,106,108,123,124,125,126,132,133,135,138,139,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,163,164,165,166,167,168,169,170,171,172,173,174,175,182,185,211,212,213,214,215,],[-157,-16,-157,-157,-15,77,79,-11,-14,-157,-157,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,111,115,-45,118,-28,-90,-93,-92,115,111,111,115,-17,111,-25,-157,-120,-140,-121,-24,-19,-27,-26,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,183,186,-152,-153,-118,-47,-53,-56,-44,-49,-52,-58,-57,-48,-51,-55,-54,-21,-18,-23,-22,-149,-150,-20,-151,-156,-155,-154,]),'FECHA_PARENTESE':([23,24,28,29,30,35,37,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,61,62,63,64,69,70,71,72,73,74,75,76,80,83,86,87,89,100,105,106,108,110,123,124,125,126,137,138,139,142,143,144,145,146,147,148,149,150,151,152,153,154,155,157,158,159,163,164,165,166,167,168,169,170,171,172,173,174,175,182,185,211,212,213,214,215,217,230,239,240,242,243,244,245,246,247,248,249,258,],[-157,-16,-157,-157,-15,-157,-157,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-50,114,-45,-46,-28,-90,-93,-92,127,129,-50,131,-17,139,142,143,-25,-157,-120,-140,-121,142,-24,-19,-27,-26,139,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,182,185,-152,-153,-118,-47,-53,-56,-44,-49,-52,-58,-57,-48,-51,-55,-54,-21,-18,-23,-22,-149,-150,-19,-151,-156,-155,-154,139,139,260,261,263,264,266,267,268,270,271,139,139,]),'FIM':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,114,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,202,204,206,211,229,230,231,233,234,235,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-157,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,203,-60,-21,-18,-23,-22,205,207,208,209,210,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-62,-59,-62,-19,-70,-63,-157,-157,-157,-157,272,-86,274,277,279,281,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,290,291,293,294,295,296,297,-78,-72,-62,-83,-82,-81,-80,-79,]),'SE':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,114,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,204,206,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-157,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,197,197,-60,-21,-18,-23,-22,197,197,197,197,197,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-59,-62,-19,197,197,197,197,-70,-63,-157,-157,-157,-157,-62,197,-86,197,197,197,197,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,197,197,197,197,197,197,197,-78,-72,-62,-83,-82,-81,-80,-79,]),'REPITA':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,114,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,204,206,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-157,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,198,198,-60,-21,-18,-23,-22,198,198,198,198,198,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-59,-62,-19,198,198,198,198,-70,-63,-157,-157,-157,-157,-62,198,-86,198,198,198,198,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,198,198,198,198,198,198,198,-78,-72,-62,-83,-82,-81,-80,-79,]),'LEIA':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,114,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,204,206,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-157,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,199,199,-60,-21,-18,-23,-22,199,199,199,199,199,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-59,-62,-19,199,199,199,199,-70,-63,-157,-157,-157,-157,-62,199,-86,199,199,199,199,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,199,199,199,199,199,199,199,-78,-72,-62,-83,-82,-81,-80,-79,]),'ESCREVA':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,114,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,204,206,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-157,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,200,200,-60,-21,-18,-23,-22,200,200,200,200,200,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-59,-62,-19,200,200,200,200,-70,-63,-157,-157,-157,-157,-62,200,-86,200,200,200,200,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,200,200,200,200,200,200,200,-78,-72,-62,-83,-82,-81,-80,-79,]),'RETORNA':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,114,123,124,125,126,127,128,129,131,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,160,161,162,172,173,174,175,176,177,178,179,180,182,185,187,188,189,190,191,192,193,194,195,198,202,204,206,211,216,218,221,222,229,230,231,233,234,235,237,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-157,-24,-19,-27,-26,-157,-157,-157,-157,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,201,201,-60,-21,-18,-23,-22,201,201,201,201,201,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-59,-62,-19,201,201,201,201,-70,-63,-157,-157,-157,-157,-62,201,-86,201,201,201,201,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-157,-71,-157,-62,-76,-157,-75,-157,-74,-157,201,201,201,201,201,201,201,-78,-72,-62,-83,-82,-81,-80,-79,]),'SENAO':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,123,124,125,126,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,162,172,173,174,175,182,185,187,188,189,190,191,192,193,194,195,202,204,211,231,233,234,235,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,274,276,277,279,281,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-24,-19,-27,-26,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,-60,-21,-18,-23,-22,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-62,-59,-19,-157,-157,-157,-157,273,-86,275,278,280,282,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-71,-62,-76,-75,-74,-78,-72,-84,-83,-82,-81,-80,-79,]),'ATE':([24,30,31,32,33,34,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,123,124,125,126,132,133,135,138,139,142,143,144,145,146,147,148,149,150,155,162,172,173,174,175,182,185,187,188,189,190,191,192,193,194,195,198,202,204,206,211,218,221,222,229,230,237,251,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,274,276,277,279,281,286,290,291,292,293,294,295,296,297,],[-16,-15,-7,-8,-11,-14,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-24,-19,-27,-26,-10,-13,-12,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,-60,-21,-18,-23,-22,-149,-150,-70,-61,-63,-64,-65,-66,-67,-68,-69,-157,-62,-59,-157,-19,232,236,238,-70,-63,-62,-86,-85,-89,-88,-87,-94,-96,-97,-95,-98,-101,-100,-99,-102,-105,-104,-103,-73,-71,-77,-76,-75,-74,232,-78,-72,-84,-83,-82,-81,-80,-79,]),'VEZES':([24,30,43,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,139,142,143,144,145,150,155,172,173,174,175,182,185,211,239,],[-16,-15,-140,-14,102,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,-144,-143,-139,-145,-20,102,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'DIVIDE':([24,30,43,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,139,142,143,144,145,150,155,172,173,174,175,182,185,211,239,],[-16,-15,-140,-14,103,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,-144,-143,-139,-145,-20,103,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'MENOR':([24,30,42,43,44,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,148,149,150,155,172,173,174,175,182,185,211,239,],[-16,-15,93,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,93,-144,-143,-139,-145,-20,93,93,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'MAIOR':([24,30,42,43,44,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,148,149,150,155,172,173,174,175,182,185,211,239,],[-16,-15,94,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,94,-144,-143,-139,-145,-20,94,94,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'IGUAL':([24,30,42,43,44,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,148,149,150,155,172,173,174,175,182,185,211,239,],[-16,-15,95,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,95,-144,-143,-139,-145,-20,95,95,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'DIFERENTE':([24,30,42,43,44,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,148,149,150,155,172,173,174,175,182,185,211,239,],[-16,-15,96,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,96,-144,-143,-139,-145,-20,96,96,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'MENOR_IGUAL':([24,30,42,43,44,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,148,149,150,155,172,173,174,175,182,185,211,239,],[-16,-15,97,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,97,-144,-143,-139,-145,-20,97,97,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'MAIOR_IGUAL':([24,30,42,43,44,45,46,48,49,51,52,56,57,58,69,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,148,149,150,155,172,173,174,175,182,185,211,239,],[-16,-15,98,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-28,-17,-25,-120,-140,-121,-24,-19,-27,-26,98,-144,-143,-139,-145,-20,98,98,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,-140,]),'E':([24,30,36,40,42,43,44,45,46,48,49,51,52,56,57,58,69,71,75,80,81,86,89,105,106,108,110,123,124,125,126,138,139,142,143,144,145,146,147,148,149,150,152,155,172,173,174,175,182,185,187,202,206,211,213,216,220,229,237,239,240,244,247,257,276,292,],[-16,-15,84,84,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,84,84,84,-17,84,84,-25,-120,-140,-121,84,84,-19,-27,-26,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,84,-118,-21,-18,-23,-22,-149,-150,84,84,84,-19,84,84,84,84,84,-140,84,84,84,84,84,84,]),'OU':([24,30,36,40,42,43,44,45,46,48,49,51,52,56,57,58,69,71,75,80,81,86,89,105,106,108,110,123,124,125,126,138,139,142,143,144,145,146,147,148,149,150,152,155,172,173,174,175,182,185,187,202,206,211,213,216,220,229,237,239,240,244,247,257,276,292,],[-16,-15,85,85,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,85,85,85,-17,85,85,-25,-120,-140,-121,85,85,-19,-27,-26,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,85,-118,-21,-18,-23,-22,-149,-150,85,85,85,-19,85,85,85,85,85,-140,85,85,85,85,85,85,]),'FECHA_COLCHETE':([24,30,39,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,68,69,70,71,72,80,88,89,105,106,108,113,116,117,121,122,123,124,125,126,130,137,138,139,142,143,144,145,146,147,148,149,150,155,172,173,174,175,181,182,185,211,230,249,],[-16,-15,89,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,124,126,-90,-93,-92,-17,145,-25,-120,-140,-121,159,165,167,172,173,175,-19,-27,-26,159,89,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,-21,-18,-23,-22,211,-149,-150,-19,89,89,]),'ENTAO':([24,30,40,41,42,43,44,45,46,48,49,51,52,56,57,58,59,69,70,71,72,80,89,105,106,108,123,124,125,126,138,139,142,143,144,145,146,147,148,149,150,155,172,173,174,175,182,185,211,217,219,220,249,258,],[-16,-15,-106,-107,-108,-140,-113,-14,-115,-117,-119,-141,-142,-146,-147,-148,-91,-28,-90,-93,-92,-17,-25,-120,-140,-121,-24,-19,-27,-26,-110,-144,-143,-139,-145,-20,-109,-112,-111,-114,-116,-118,-21,-18,-23,-22,-149,-150,-19,231,233,235,231,231,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'programa':([0,],[1,]),'lista_declaracoes':([0,],[2,]),'declaracao':([0,2,],[3,15,]),'declaracao_variaveis':([0,2,160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[4,4,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,]),'inicializacao_variaveis':([0,2,],[5,5,]),'declaracao_funcao':([0,2,],[6,6,]),'tipo':([0,2,23,28,29,35,37,111,115,118,160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[7,7,65,65,65,65,65,65,65,65,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,196,]),'atribuicao':([0,2,20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,86,100,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[9,9,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'cabecalho':([0,2,7,8,],[10,10,18,21,]),'var':([0,2,16,20,22,25,26,27,29,36,37,38,47,50,60,66,67,69,71,75,77,78,79,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[13,13,33,43,43,43,43,43,43,43,43,43,106,106,43,43,43,43,43,43,132,43,135,43,43,106,43,106,106,106,106,43,106,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,239,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'indice':([8,14,32,34,36,45,69,71,75,81,86,107,110,123,133,134,147,152,187,202,206,213,216,220,229,237,240,244,247,257,276,292,],[24,30,24,30,24,30,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'lista_variaveis':([16,],[31,]),'expressao':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,86,100,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[39,59,68,70,72,39,83,87,88,87,121,122,83,83,83,39,39,137,83,153,83,83,83,68,181,83,83,189,189,189,189,189,189,189,212,214,215,217,219,217,217,83,230,189,83,189,189,241,242,243,245,246,248,249,251,256,258,259,83,83,83,189,189,189,189,189,83,217,189,189,189,189,189,189,189,217,]),'expressao_logica':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,86,100,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'expressao_simples':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,82,86,90,91,100,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,138,42,146,148,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'expressao_aditiva':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,82,86,90,91,92,100,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,149,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'expressao_multiplicativa':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,150,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'operador_soma':([20,22,25,26,27,29,36,37,38,44,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,149,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[47,47,47,47,47,47,47,47,47,99,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,99,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'expressao_unaria':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,155,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'fator':([20,22,25,26,27,29,36,37,38,47,50,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[49,49,49,49,49,49,49,49,49,105,108,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'operador_negacao':([20,22,25,26,27,29,36,37,38,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'chamada_funcao':([20,22,25,26,27,29,36,37,38,47,50,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'numero':([20,22,25,26,27,29,36,37,38,47,50,60,66,67,69,71,75,78,80,81,82,86,90,91,92,99,100,101,107,110,123,130,136,147,152,160,161,176,177,178,179,180,183,184,186,187,197,202,206,213,216,218,220,221,222,223,224,225,226,227,228,229,232,236,237,238,240,244,247,250,252,253,254,255,257,276,283,284,285,286,287,288,289,292,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'lista_parametros':([23,28,29,35,37,],[62,73,76,76,62,]),'parametro':([23,28,29,35,37,111,115,118,],[63,63,63,63,63,157,163,168,]),'vazio':([23,28,29,35,37,100,114,127,128,129,131,187,198,202,206,229,231,233,234,235,237,273,275,276,278,280,282,292,],[64,64,64,64,64,154,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,]),'operador_logico':([36,40,69,71,75,81,86,110,123,152,187,202,206,213,216,220,229,237,240,244,247,257,276,292,],[82,90,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'operador_relacional':([42,138,146,148,],[92,92,92,92,]),'operador_multiplicacao':([46,150,],[101,101,]),'lista_argumentos':([100,],[151,]),'corpo':([114,127,128,129,131,187,198,202,206,229,231,233,234,235,237,273,275,276,278,280,282,292,],[161,176,178,179,180,218,221,218,218,218,250,252,254,255,218,283,284,286,287,288,289,218,]),'acao':([160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[188,204,204,188,204,204,204,188,204,204,188,204,204,188,204,204,204,204,188,204,204,204,204,]),'se':([160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,]),'repita':([160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,192,]),'leia':([160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,]),'escreva':([160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,194,]),'retorna':([160,161,176,177,178,179,180,216,218,221,222,250,252,253,254,255,283,284,285,286,287,288,289,],[195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> programa","S'",1,None,None,None),
+  ('programa -> lista_declaracoes','programa',1,'p_programa','tppparser.py',48),
+  ('lista_declaracoes -> lista_declaracoes declaracao','lista_declaracoes',2,'p_lista_declaracoes','tppparser.py',69),
+  ('lista_declaracoes -> declaracao','lista_declaracoes',1,'p_lista_declaracoes','tppparser.py',70),
+  ('declaracao -> declaracao_variaveis','declaracao',1,'p_declaracao','tppparser.py',89),
+  ('declaracao -> inicializacao_variaveis','declaracao',1,'p_declaracao','tppparser.py',90),
+  ('declaracao -> declaracao_funcao','declaracao',1,'p_declaracao','tppparser.py',91),
+  ('declaracao_variaveis -> tipo DOIS_PONTOS lista_variaveis','declaracao_variaveis',3,'p_declaracao_variaveis','tppparser.py',106),
+  ('declaracao_variaveis -> tipo DOIS_PONTOS error','declaracao_variaveis',3,'p_declaracao_variaveis_error','tppparser.py',125),
+  ('inicializacao_variaveis -> atribuicao','inicializacao_variaveis',1,'p_inicializacao_variaveis','tppparser.py',130),
+  ('lista_variaveis -> lista_variaveis VIRGULA var','lista_variaveis',3,'p_lista_variaveis','tppparser.py',143),
+  ('lista_variaveis -> var','lista_variaveis',1,'p_lista_variaveis','tppparser.py',144),
+  ('lista_variaveis -> error VIRGULA var','lista_variaveis',3,'p_lista_variaveis_error','tppparser.py',157),
+  ('lista_variaveis -> lista_variaveis VIRGULA error','lista_variaveis',3,'p_lista_variaveis_error','tppparser.py',158),
+  ('var -> ID','var',1,'p_var','tppparser.py',164),
+  ('var -> ID indice','var',2,'p_var','tppparser.py',165),
+  ('var -> error indice','var',2,'p_var_error','tppparser.py',177),
+  ('var -> ID error','var',2,'p_var_error','tppparser.py',178),
+  ('indice -> indice ABRE_COLCHETE expressao FECHA_COLCHETE','indice',4,'p_indice','tppparser.py',184),
+  ('indice -> ABRE_COLCHETE expressao FECHA_COLCHETE','indice',3,'p_indice','tppparser.py',185),
+  ('indice -> error ABRE_COLCHETE expressao FECHA_COLCHETE','indice',4,'p_indice_error','tppparser.py',214),
+  ('indice -> indice error expressao FECHA_COLCHETE','indice',4,'p_indice_error','tppparser.py',215),
+  ('indice -> indice ABRE_COLCHETE error FECHA_COLCHETE','indice',4,'p_indice_error','tppparser.py',216),
+  ('indice -> indice ABRE_COLCHETE expressao error','indice',4,'p_indice_error','tppparser.py',217),
+  ('indice -> indice ABRE_COLCHETE error','indice',3,'p_indice_error','tppparser.py',218),
+  ('indice -> error expressao FECHA_COLCHETE','indice',3,'p_indice_error','tppparser.py',219),
+  ('indice -> ABRE_COLCHETE error FECHA_COLCHETE','indice',3,'p_indice_error','tppparser.py',220),
+  ('indice -> ABRE_COLCHETE expressao error','indice',3,'p_indice_error','tppparser.py',221),
+  ('indice -> ABRE_COLCHETE error','indice',2,'p_indice_error','tppparser.py',222),
+  ('tipo -> INTEIRO','tipo',1,'p_tipo','tppparser.py',233),
+  ('tipo -> FLUTUANTE','tipo',1,'p_tipo','tppparser.py',234),
+  ('declaracao_funcao -> tipo cabecalho','declaracao_funcao',2,'p_declaracao_funcao','tppparser.py',251),
+  ('declaracao_funcao -> cabecalho','declaracao_funcao',1,'p_declaracao_funcao','tppparser.py',252),
+  ('declaracao_funcao -> error cabecalho','declaracao_funcao',2,'p_declaracao_funcao_error','tppparser.py',262),
+  ('declaracao_funcao -> tipo error','declaracao_funcao',2,'p_declaracao_funcao_error','tppparser.py',263),
+  ('declaracao_funcao -> error','declaracao_funcao',1,'p_declaracao_funcao_error','tppparser.py',264),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho','tppparser.py',270),
+  ('cabecalho -> error ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',297),
+  ('cabecalho -> ID error lista_parametros FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',298),
+  ('cabecalho -> ID ABRE_PARENTESE error FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',299),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros error corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',300),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE error FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',301),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo error','cabecalho',6,'p_cabecalho_error','tppparser.py',302),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo','cabecalho',5,'p_cabecalho_error','tppparser.py',303),
+  ('lista_parametros -> lista_parametros VIRGULA parametro','lista_parametros',3,'p_lista_parametros','tppparser.py',309),
+  ('lista_parametros -> parametro','lista_parametros',1,'p_lista_parametros','tppparser.py',310),
+  ('lista_parametros -> vazio','lista_parametros',1,'p_lista_parametros','tppparser.py',311),
+  ('lista_parametros -> error VIRGULA parametro','lista_parametros',3,'p_lista_parametros_error','tppparser.py',326),
+  ('lista_parametros -> vazio VIRGULA parametro','lista_parametros',3,'p_lista_parametros_error','tppparser.py',327),
+  ('lista_parametros -> lista_parametros VIRGULA error','lista_parametros',3,'p_lista_parametros_error','tppparser.py',328),
+  ('lista_parametros -> error','lista_parametros',1,'p_lista_parametros_error','tppparser.py',329),
+  ('parametro -> tipo DOIS_PONTOS ID','parametro',3,'p_parametro','tppparser.py',337),
+  ('parametro -> parametro ABRE_COLCHETE FECHA_COLCHETE','parametro',3,'p_parametro','tppparser.py',338),
+  ('parametro -> error DOIS_PONTOS ID','parametro',3,'p_parametro_error','tppparser.py',363),
+  ('parametro -> tipo error ID','parametro',3,'p_parametro_error','tppparser.py',364),
+  ('parametro -> tipo DOIS_PONTOS error','parametro',3,'p_parametro_error','tppparser.py',365),
+  ('parametro -> error ABRE_COLCHETE FECHA_COLCHETE','parametro',3,'p_parametro_error','tppparser.py',366),
+  ('parametro -> parametro error FECHA_COLCHETE','parametro',3,'p_parametro_error','tppparser.py',367),
+  ('parametro -> parametro ABRE_COLCHETE error','parametro',3,'p_parametro_error','tppparser.py',368),
+  ('corpo -> corpo acao','corpo',2,'p_corpo','tppparser.py',375),
+  ('corpo -> vazio','corpo',1,'p_corpo','tppparser.py',376),
+  ('corpo -> error acao','corpo',2,'p_corpo_error','tppparser.py',391),
+  ('corpo -> corpo error','corpo',2,'p_corpo_error','tppparser.py',392),
+  ('acao -> expressao','acao',1,'p_acao','tppparser.py',398),
+  ('acao -> declaracao_variaveis','acao',1,'p_acao','tppparser.py',399),
+  ('acao -> se','acao',1,'p_acao','tppparser.py',400),
+  ('acao -> repita','acao',1,'p_acao','tppparser.py',401),
+  ('acao -> leia','acao',1,'p_acao','tppparser.py',402),
+  ('acao -> escreva','acao',1,'p_acao','tppparser.py',403),
+  ('acao -> retorna','acao',1,'p_acao','tppparser.py',404),
+  ('acao -> error','acao',1,'p_acao','tppparser.py',405),
+  ('se -> SE expressao ENTAO corpo FIM','se',5,'p_se','tppparser.py',428),
+  ('se -> SE expressao ENTAO corpo SENAO corpo FIM','se',7,'p_se','tppparser.py',429),
+  ('se -> error expressao ENTAO corpo FIM','se',5,'p_se_error','tppparser.py',464),
+  ('se -> SE error ENTAO corpo FIM','se',5,'p_se_error','tppparser.py',465),
+  ('se -> SE expressao error corpo FIM','se',5,'p_se_error','tppparser.py',466),
+  ('se -> SE expressao ENTAO error FIM','se',5,'p_se_error','tppparser.py',467),
+  ('se -> SE expressao ENTAO corpo error','se',5,'p_se_error','tppparser.py',468),
+  ('se -> error expressao ENTAO corpo SENAO corpo FIM','se',7,'p_se_error','tppparser.py',469),
+  ('se -> SE error ENTAO corpo SENAO corpo FIM','se',7,'p_se_error','tppparser.py',470),
+  ('se -> SE expressao error corpo SENAO corpo FIM','se',7,'p_se_error','tppparser.py',471),
+  ('se -> SE expressao ENTAO error SENAO corpo FIM','se',7,'p_se_error','tppparser.py',472),
+  ('se -> SE expressao ENTAO corpo error corpo FIM','se',7,'p_se_error','tppparser.py',473),
+  ('se -> SE expressao ENTAO corpo SENAO error FIM','se',7,'p_se_error','tppparser.py',474),
+  ('se -> SE expressao ENTAO corpo SENAO corpo error','se',7,'p_se_error','tppparser.py',475),
+  ('repita -> REPITA corpo ATE expressao','repita',4,'p_repita','tppparser.py',482),
+  ('repita -> error corpo ATE expressao','repita',4,'p_repita_error','tppparser.py',501),
+  ('repita -> REPITA error ATE expressao','repita',4,'p_repita_error','tppparser.py',502),
+  ('repita -> REPITA corpo error expressao','repita',4,'p_repita_error','tppparser.py',503),
+  ('repita -> REPITA corpo ATE error','repita',4,'p_repita_error','tppparser.py',504),
+  ('atribuicao -> var ATRIBUICAO expressao','atribuicao',3,'p_atribuicao','tppparser.py',511),
+  ('atribuicao -> error ATRIBUICAO expressao','atribuicao',3,'p_atribuicao_error','tppparser.py',525),
+  ('atribuicao -> var error expressao','atribuicao',3,'p_atribuicao_error','tppparser.py',526),
+  ('atribuicao -> var ATRIBUICAO error','atribuicao',3,'p_atribuicao_error','tppparser.py',527),
+  ('leia -> LEIA ABRE_PARENTESE var FECHA_PARENTESE','leia',4,'p_leia','tppparser.py',534),
+  ('leia -> LEIA error expressao FECHA_PARENTESE','leia',4,'p_leia_error','tppparser.py',555),
+  ('leia -> LEIA ABRE_PARENTESE error FECHA_PARENTESE','leia',4,'p_leia_error','tppparser.py',556),
+  ('leia -> LEIA ABRE_PARENTESE expressao error','leia',4,'p_leia_error','tppparser.py',557),
+  ('escreva -> ESCREVA ABRE_PARENTESE expressao FECHA_PARENTESE','escreva',4,'p_escreva','tppparser.py',564),
+  ('escreva -> ESCREVA error expressao FECHA_PARENTESE','escreva',4,'p_escreva_error','tppparser.py',584),
+  ('escreva -> ESCREVA ABRE_PARENTESE error FECHA_PARENTESE','escreva',4,'p_escreva_error','tppparser.py',585),
+  ('escreva -> ESCREVA ABRE_PARENTESE expressao error','escreva',4,'p_escreva_error','tppparser.py',586),
+  ('retorna -> RETORNA ABRE_PARENTESE expressao FECHA_PARENTESE','retorna',4,'p_retorna','tppparser.py',593),
+  ('retorna -> RETORNA error expressao FECHA_PARENTESE','retorna',4,'p_retorna_error','tppparser.py',613),
+  ('retorna -> RETORNA ABRE_PARENTESE error FECHA_PARENTESE','retorna',4,'p_retorna_error','tppparser.py',614),
+  ('retorna -> RETORNA ABRE_PARENTESE expressao error','retorna',4,'p_retorna_error','tppparser.py',615),
+  ('expressao -> expressao_logica','expressao',1,'p_expressao','tppparser.py',623),
+  ('expressao -> atribuicao','expressao',1,'p_expressao','tppparser.py',624),
+  ('expressao_logica -> expressao_simples','expressao_logica',1,'p_expressao_logica','tppparser.py',632),
+  ('expressao_logica -> expressao_logica operador_logico expressao_simples','expressao_logica',3,'p_expressao_logica','tppparser.py',633),
+  ('expressao_logica -> error operador_logico expressao_simples','expressao_logica',3,'p_error_expressao_logica','tppparser.py',644),
+  ('expressao_logica -> expressao_logica error expressao_simples','expressao_logica',3,'p_error_expressao_logica','tppparser.py',645),
+  ('expressao_logica -> expressao_logica operador_logico error','expressao_logica',3,'p_error_expressao_logica','tppparser.py',646),
+  ('expressao_simples -> expressao_aditiva','expressao_simples',1,'p_expressao_simples','tppparser.py',653),
+  ('expressao_simples -> expressao_simples operador_relacional expressao_aditiva','expressao_simples',3,'p_expressao_simples','tppparser.py',654),
+  ('expressao_aditiva -> expressao_multiplicativa','expressao_aditiva',1,'p_expressao_aditiva','tppparser.py',667),
+  ('expressao_aditiva -> expressao_aditiva operador_soma expressao_multiplicativa','expressao_aditiva',3,'p_expressao_aditiva','tppparser.py',668),
+  ('expressao_multiplicativa -> expressao_unaria','expressao_multiplicativa',1,'p_expressao_multiplicativa','tppparser.py',681),
+  ('expressao_multiplicativa -> expressao_multiplicativa operador_multiplicacao expressao_unaria','expressao_multiplicativa',3,'p_expressao_multiplicativa','tppparser.py',682),
+  ('expressao_unaria -> fator','expressao_unaria',1,'p_expressao_unaria','tppparser.py',696),
+  ('expressao_unaria -> operador_soma fator','expressao_unaria',2,'p_expressao_unaria','tppparser.py',697),
+  ('expressao_unaria -> operador_negacao fator','expressao_unaria',2,'p_expressao_unaria','tppparser.py',698),
+  ('operador_relacional -> MENOR','operador_relacional',1,'p_operador_relacional','tppparser.py',717),
+  ('operador_relacional -> MAIOR','operador_relacional',1,'p_operador_relacional','tppparser.py',718),
+  ('operador_relacional -> IGUAL','operador_relacional',1,'p_operador_relacional','tppparser.py',719),
+  ('operador_relacional -> DIFERENTE','operador_relacional',1,'p_operador_relacional','tppparser.py',720),
+  ('operador_relacional -> MENOR_IGUAL','operador_relacional',1,'p_operador_relacional','tppparser.py',721),
+  ('operador_relacional -> MAIOR_IGUAL','operador_relacional',1,'p_operador_relacional','tppparser.py',722),
+  ('operador_soma -> MAIS','operador_soma',1,'p_operador_soma','tppparser.py',752),
+  ('operador_soma -> MENOS','operador_soma',1,'p_operador_soma','tppparser.py',753),
+  ('operador_logico -> E','operador_logico',1,'p_operador_logico','tppparser.py',768),
+  ('operador_logico -> OU','operador_logico',1,'p_operador_logico','tppparser.py',769),
+  ('operador_logico -> E error','operador_logico',2,'p_error_operador_logico','tppparser.py',783),
+  ('operador_logico -> OU error','operador_logico',2,'p_error_operador_logico','tppparser.py',784),
+  ('operador_negacao -> NAO','operador_negacao',1,'p_operador_negacao','tppparser.py',790),
+  ('operador_negacao -> NAO error','operador_negacao',2,'p_error_operador_negacao','tppparser.py',799),
+  ('operador_multiplicacao -> VEZES','operador_multiplicacao',1,'p_operador_multiplicacao','tppparser.py',805),
+  ('operador_multiplicacao -> DIVIDE','operador_multiplicacao',1,'p_operador_multiplicacao','tppparser.py',806),
+  ('operador_multiplicacao -> error','operador_multiplicacao',1,'p_error_operador_multiplicacao','tppparser.py',820),
+  ('fator -> ABRE_PARENTESE expressao FECHA_PARENTESE','fator',3,'p_fator','tppparser.py',825),
+  ('fator -> var','fator',1,'p_fator','tppparser.py',826),
+  ('fator -> chamada_funcao','fator',1,'p_fator','tppparser.py',827),
+  ('fator -> numero','fator',1,'p_fator','tppparser.py',828),
+  ('fator -> ABRE_PARENTESE error FECHA_PARENTESE','fator',3,'p_fator_error','tppparser.py',847),
+  ('fator -> error expressao FECHA_PARENTESE','fator',3,'p_fator_error','tppparser.py',848),
+  ('fator -> ABRE_PARENTESE expressao error','fator',3,'p_fator_error','tppparser.py',849),
+  ('numero -> NUM_INTEIRO','numero',1,'p_numero','tppparser.py',855),
+  ('numero -> NUM_PONTO_FLUTUANTE','numero',1,'p_numero','tppparser.py',856),
+  ('numero -> NUM_NOTACAO_CIENTIFICA','numero',1,'p_numero','tppparser.py',857),
+  ('chamada_funcao -> ID ABRE_PARENTESE lista_argumentos FECHA_PARENTESE','chamada_funcao',4,'p_chamada_funcao','tppparser.py',880),
+  ('chamada_funcao -> ID ABRE_PARENTESE error FECHA_PARENTESE','chamada_funcao',4,'p_chamada_funcao_error','tppparser.py',902),
+  ('lista_argumentos -> lista_argumentos VIRGULA expressao','lista_argumentos',3,'p_lista_argumentos','tppparser.py',907),
+  ('lista_argumentos -> expressao','lista_argumentos',1,'p_lista_argumentos','tppparser.py',908),
+  ('lista_argumentos -> vazio','lista_argumentos',1,'p_lista_argumentos','tppparser.py',909),
+  ('lista_argumentos -> error VIRGULA expressao','lista_argumentos',3,'p_lista_argumentos_error','tppparser.py',925),
+  ('lista_argumentos -> lista_argumentos error expressao','lista_argumentos',3,'p_lista_argumentos_error','tppparser.py',926),
+  ('lista_argumentos -> lista_argumentos VIRGULA error','lista_argumentos',3,'p_lista_argumentos_error','tppparser.py',927),
+  ('vazio -> <empty>','vazio',0,'p_vazio','tppparser.py',934),
+]
@@ -0,0 +1,175 @@
+
+# tpp_precedencia_tab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programaleftEOUleftMENORMAIORIGUALDIFERENTEMENOR_IGUALMAIOR_IGUALleftMAISMENOSleftVEZESDIVIDEABRE_COLCHETE ABRE_PARENTESE ATE ATRIBUICAO DIFERENTE DIVIDE DOIS_PONTOS E ENTAO ESCREVA FECHA_COLCHETE FECHA_PARENTESE FIM FLUTUANTE ID IGUAL INTEIRO LEIA MAIOR MAIOR_IGUAL MAIS MENOR MENOR_IGUAL MENOS NAO NUM_INTEIRO NUM_NOTACAO_CIENTIFICA NUM_PONTO_FLUTUANTE OU REPITA RETORNA SE SENAO VEZES VIRGULAprograma : lista_declaracoeslista_declaracoes : lista_declaracoes declaracao\n                        | declaracao\n    expressao : expressao_binaria\n                 | atribuicao\n    declaracao : declaracao_variaveis\n                | inicializacao_variaveis\n                | declaracao_funcao\n    expressao_binaria : expressao_binaria E expressao_binaria\n                         | expressao_binaria OU expressao_binaria\n                         | expressao_binaria MENOR expressao_binaria\n                         | expressao_binaria MAIOR expressao_binaria\n                         | expressao_binaria IGUAL expressao_binaria\n                         | expressao_binaria DIFERENTE expressao_binaria\n                         | expressao_binaria MENOR_IGUAL expressao_binaria\n                         | expressao_binaria MAIOR_IGUAL expressao_binaria\n                         | expressao_binaria MAIS expressao_binaria\n                         | expressao_binaria MENOS expressao_binaria\n                         | expressao_binaria VEZES expressao_binaria\n                         | expressao_binaria DIVIDE expressao_binaria\n    declaracao_variaveis : tipo DOIS_PONTOS lista_variaveisexpressao_binaria : fator\n                         | expressao_unaria\n    declaracao_variaveis : tipo DOIS_PONTOS errorexpressao_binaria : expressao_binaria E error\n                         | expressao_binaria OU error\n    inicializacao_variaveis : atribuicaoexpressao_unaria : MAIS fator\n                        | MENOS fator\n                        | NAO fator\n    lista_variaveis : lista_variaveis VIRGULA var\n                        | var\n    lista_variaveis : error VIRGULA var\n                        | lista_variaveis VIRGULA error\n    var : ID\n            | ID indice\n    var : error indice\n            | ID error\n    indice : indice ABRE_COLCHETE expressao FECHA_COLCHETE\n                | ABRE_COLCHETE expressao FECHA_COLCHETE\n    indice : error ABRE_COLCHETE expressao FECHA_COLCHETE\n                | indice error expressao FECHA_COLCHETE\n                | indice ABRE_COLCHETE error FECHA_COLCHETE\n                | indice ABRE_COLCHETE expressao error\n                | indice ABRE_COLCHETE error\n                | error expressao FECHA_COLCHETE\n                | ABRE_COLCHETE error FECHA_COLCHETE\n                | ABRE_COLCHETE expressao error\n                | ABRE_COLCHETE error\n    tipo : INTEIRO\n        | FLUTUANTE\n    declaracao_funcao : tipo cabecalho \n                        | cabecalho \n    declaracao_funcao : error cabecalho \n                        | tipo error\n                        | error \n    cabecalho : ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIMcabecalho : error ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIM\n                | ID error lista_parametros FECHA_PARENTESE corpo FIM\n                | ID ABRE_PARENTESE error FECHA_PARENTESE corpo FIM\n                | ID ABRE_PARENTESE lista_parametros error corpo FIM\n                | ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE error FIM\n                | ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo error\n                | ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo\n    lista_parametros : lista_parametros VIRGULA parametro\n                    | parametro\n                    | vazio\n    lista_parametros : error VIRGULA parametro\n                    | vazio VIRGULA parametro\n                    | lista_parametros VIRGULA error\n                    | error\n    parametro : tipo DOIS_PONTOS ID\n                | parametro ABRE_COLCHETE FECHA_COLCHETE\n    parametro : error DOIS_PONTOS ID\n                | tipo error ID\n                | tipo DOIS_PONTOS error\n                | error ABRE_COLCHETE FECHA_COLCHETE\n                | parametro error FECHA_COLCHETE\n                | parametro ABRE_COLCHETE error\n    corpo : corpo acao\n            | vazio\n    corpo : error acao\n            | corpo error\n    acao : expressao\n            | declaracao_variaveis\n            | se\n            | repita\n            | leia\n            | escreva\n            | retorna\n            | error     \n    se : SE expressao ENTAO corpo FIM\n          | SE expressao ENTAO corpo SENAO corpo FIM\n    se : error expressao ENTAO corpo FIM\n        | SE error ENTAO corpo FIM\n        | SE expressao error corpo FIM\n        | SE expressao ENTAO error FIM\n        | SE expressao ENTAO corpo error\n        | error expressao ENTAO corpo SENAO corpo FIM\n        | SE error ENTAO corpo SENAO corpo FIM\n        | SE expressao error corpo SENAO corpo FIM\n        | SE expressao ENTAO error SENAO corpo FIM\n        | SE expressao ENTAO corpo error corpo FIM\n        | SE expressao ENTAO corpo SENAO error FIM\n        | SE expressao ENTAO corpo SENAO corpo error\n    repita : REPITA corpo ATE expressaorepita : error corpo ATE expressao\n            | REPITA error ATE expressao\n            | REPITA corpo error expressao\n            | REPITA corpo ATE error\n    atribuicao : var ATRIBUICAO expressaoatribuicao : error ATRIBUICAO expressao\n            | var error expressao\n            | var ATRIBUICAO error\n    leia : LEIA ABRE_PARENTESE var FECHA_PARENTESEleia :  LEIA error expressao FECHA_PARENTESE\n            | LEIA ABRE_PARENTESE error FECHA_PARENTESE\n            | LEIA ABRE_PARENTESE expressao error\n    escreva : ESCREVA ABRE_PARENTESE expressao FECHA_PARENTESEescreva : ESCREVA error expressao FECHA_PARENTESE\n                | ESCREVA ABRE_PARENTESE error FECHA_PARENTESE\n                | ESCREVA ABRE_PARENTESE expressao error\n    retorna : RETORNA ABRE_PARENTESE expressao FECHA_PARENTESEretorna : RETORNA error expressao FECHA_PARENTESE\n                | RETORNA ABRE_PARENTESE error FECHA_PARENTESE\n                | RETORNA ABRE_PARENTESE expressao error\n    fator : ABRE_PARENTESE expressao FECHA_PARENTESE\n            | var\n            | chamada_funcao\n            | numero\n        fator : ABRE_PARENTESE error FECHA_PARENTESE\n            | error expressao FECHA_PARENTESE\n            | ABRE_PARENTESE expressao error\n        numero : NUM_INTEIRO\n                | NUM_PONTO_FLUTUANTE\n                | NUM_NOTACAO_CIENTIFICA\n    chamada_funcao : ID ABRE_PARENTESE lista_argumentos FECHA_PARENTESEchamada_funcao : ID ABRE_PARENTESE error FECHA_PARENTESElista_argumentos : lista_argumentos VIRGULA expressao\n                    | expressao\n                    | vazio\n        lista_argumentos : error VIRGULA expressao\n                    | lista_argumentos error expressao\n                    | lista_argumentos VIRGULA error\n        vazio : '
+    
+_lr_action_items = {'error':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,58,59,60,61,62,63,64,65,66,67,68,69,70,72,73,74,75,76,78,79,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,104,105,106,108,109,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,238,239,241,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[8,8,-3,-6,-7,-8,17,20,-27,-53,-50,-51,27,29,-2,32,-55,-52,35,36,-54,36,56,61,64,66,36,69,70,61,-21,73,-32,75,56,76,78,36,-4,-5,96,96,-22,-23,27,-129,-130,96,75,-134,-135,-136,-112,100,107,-67,110,36,113,115,76,-111,76,-113,118,-71,76,123,36,124,36,76,76,131,-46,134,136,96,96,96,96,96,96,96,96,96,96,-28,-128,76,-29,-30,148,76,151,155,159,161,151,165,169,76,-40,-48,-47,172,155,155,64,155,-31,73,73,-33,64,-132,-131,-127,-133,-41,-9,76,-10,76,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,179,76,-140,-141,107,-74,-77,182,197,-81,107,-70,-73,-79,-78,107,-72,-76,-75,-42,-39,-44,-43,201,182,197,197,197,115,-137,208,36,-138,36,211,-82,-84,-85,-86,-87,-88,-89,-90,215,217,219,221,223,211,-58,-80,-57,211,-62,-61,-60,-59,-40,-139,76,-143,-142,224,197,229,76,232,182,235,36,239,36,242,36,211,-84,155,36,248,155,155,252,211,36,27,76,257,260,76,264,76,197,-107,271,182,197,197,-106,76,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,155,-92,280,211,-97,155,-96,155,-95,155,197,287,182,197,197,197,197,-99,-93,211,-104,-103,-102,-101,-100,]),'INTEIRO':([0,2,3,4,5,6,8,9,10,15,17,18,21,23,24,28,29,30,31,32,33,34,35,37,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,101,104,105,108,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,198,199,200,201,202,203,204,205,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[11,11,-3,-6,-7,-8,-56,-27,-53,-2,-55,-52,-54,11,-37,11,11,-36,-21,-24,-32,-35,11,11,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,11,-145,11,11,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,11,11,-81,-42,-39,-44,-43,11,11,11,11,11,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-58,-80,-57,-63,-62,-61,-60,-59,-40,11,11,11,11,-91,-84,-145,-145,-145,-145,-83,11,-107,11,11,11,11,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,11,11,11,11,11,11,11,-99,-93,-83,-104,-103,-102,-101,-100,]),'FLUTUANTE':([0,2,3,4,5,6,8,9,10,15,17,18,21,23,24,28,29,30,31,32,33,34,35,37,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,101,104,105,108,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,198,199,200,201,202,203,204,205,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[12,12,-3,-6,-7,-8,-56,-27,-53,-2,-55,-52,-54,12,-37,12,12,-36,-21,-24,-32,-35,12,12,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,12,-145,12,12,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,12,12,-81,-42,-39,-44,-43,12,12,12,12,12,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-58,-80,-57,-63,-62,-61,-60,-59,-40,12,12,12,12,-91,-84,-145,-145,-145,-145,-83,12,-107,12,12,12,12,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,12,12,12,12,12,12,12,-99,-93,-83,-104,-103,-102,-101,-100,]),'ID':([0,2,3,4,5,6,7,8,9,10,11,12,15,16,17,18,20,21,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,61,62,64,65,66,67,70,72,73,74,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,102,104,109,110,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,198,199,200,201,202,203,204,205,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[14,14,-3,-6,-7,-8,19,19,-27,-53,-50,-51,-2,34,-55,-52,50,-54,50,-37,50,50,50,50,-36,-21,-24,-32,-35,50,50,50,-4,-5,50,50,-22,-23,-128,-129,-130,50,-35,-134,-135,-136,-112,50,50,50,50,-111,50,-113,50,34,50,34,50,50,50,-46,50,50,50,50,50,50,50,50,50,50,50,50,-28,-128,50,-29,-30,50,50,153,-145,164,166,50,-40,-48,-47,-145,-145,-145,50,-145,-31,-34,-33,50,-132,-131,-127,-133,-41,-9,50,-10,50,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,50,50,50,-81,-42,-39,-44,-43,50,50,50,50,50,-137,50,50,-138,50,50,-82,-84,-85,-86,-87,-88,-89,-90,50,-145,50,-58,-80,-57,50,-62,-61,-60,-59,-40,50,50,50,50,50,50,50,50,50,50,50,50,50,-84,-145,50,-145,-145,-145,50,50,50,50,50,50,50,-107,50,50,50,50,-106,50,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,50,-97,-145,-96,-145,-95,-145,50,50,50,50,50,50,50,-99,-93,50,-104,-103,-102,-101,-100,]),'$end':([1,2,3,4,5,6,8,9,10,15,17,18,21,24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,113,114,115,116,117,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,157,167,168,169,170,171,177,180,182,183,184,185,186,187,188,189,190,198,199,200,201,202,203,204,205,206,246,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,269,271,272,274,276,285,286,287,288,289,290,291,292,],[0,-1,-3,-6,-7,-8,-56,-27,-53,-2,-55,-52,-54,-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-81,-42,-39,-44,-43,-64,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-58,-80,-57,-63,-62,-61,-60,-59,-40,-107,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-92,-98,-97,-96,-95,-99,-93,-105,-104,-103,-102,-101,-100,]),'DOIS_PONTOS':([7,11,12,56,60,69,70,78,151,159,191,],[16,-50,-51,102,109,102,102,102,102,102,16,]),'ATRIBUICAO':([8,13,14,24,29,30,36,46,50,64,66,70,75,76,78,81,100,113,114,115,116,132,148,167,168,169,170,182,197,201,206,208,211,215,224,232,234,235,239,242,252,271,287,],[22,26,-35,-37,-38,-36,22,26,-35,22,22,22,-38,22,22,-46,22,22,-40,-48,-47,-41,22,-42,-39,-44,-43,22,22,22,-40,22,22,22,22,22,26,22,22,22,22,22,22,]),'ABRE_PARENTESE':([8,14,17,19,20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,194,195,196,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[23,28,23,28,37,55,-37,55,55,55,55,-36,-21,-24,-32,-35,55,55,55,-4,-5,55,55,-22,-23,-128,-129,-130,55,99,-134,-135,-136,-112,55,55,55,55,-111,55,-113,55,55,55,55,55,-46,55,55,55,55,55,55,55,55,55,55,55,55,-28,-128,55,-29,-30,55,55,-145,55,-40,-48,-47,-145,-145,-145,55,-145,-31,-34,-33,55,-132,-131,-127,-133,-41,-9,55,-10,55,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,55,55,55,-81,-42,-39,-44,-43,55,55,55,55,55,-137,55,55,-138,55,55,-82,-84,-85,-86,-87,-88,-89,-90,55,-145,218,220,222,55,-80,55,-40,55,55,55,55,55,55,55,55,55,55,55,55,55,-84,-145,55,-145,-145,-145,55,55,55,55,55,55,55,-107,55,55,55,55,-106,55,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,55,-97,-145,-96,-145,-95,-145,55,55,55,55,55,55,55,-99,-93,55,-104,-103,-102,-101,-100,]),'ABRE_COLCHETE':([8,14,20,24,29,30,32,34,36,50,56,58,64,66,69,70,73,75,76,78,81,96,100,113,114,115,116,123,124,132,134,136,148,151,152,153,154,158,159,160,161,162,163,164,165,166,167,168,169,170,182,197,201,206,208,211,215,224,232,235,239,242,252,271,287,],[25,25,38,62,38,62,25,25,25,25,103,106,25,25,103,120,38,38,126,120,-46,25,25,25,-40,-48,-47,25,25,-41,25,25,25,103,106,-74,-77,106,103,-73,-79,-78,106,-72,-76,-75,-42,-39,-44,-43,25,25,25,-40,25,126,25,126,25,25,25,25,25,25,25,]),'MAIS':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,44,45,46,47,48,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[42,42,-37,42,42,42,42,-36,-21,-24,-32,-35,42,42,42,90,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,42,42,42,42,-111,42,-113,42,42,42,42,42,-46,42,42,42,42,42,42,42,42,42,42,42,42,-28,-128,42,-29,-30,42,42,-145,42,-40,-48,-47,-145,-145,-145,42,-145,-31,-34,-33,42,-132,-131,-127,-133,-41,90,42,90,42,90,90,90,90,90,90,-17,-18,-19,-20,42,42,42,-81,-42,-39,-44,-43,42,42,42,42,42,-137,42,42,-138,42,42,-82,-84,-85,-86,-87,-88,-89,-90,42,-145,42,-80,42,-40,42,42,42,42,42,42,42,42,42,42,42,42,42,-84,-145,42,-145,-145,-145,42,42,42,-128,42,42,42,42,-107,42,42,42,42,-106,42,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,42,-97,-145,-96,-145,-95,-145,42,42,42,42,42,42,42,-99,-93,42,-104,-103,-102,-101,-100,]),'MENOS':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,44,45,46,47,48,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[43,43,-37,43,43,43,43,-36,-21,-24,-32,-35,43,43,43,91,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,43,43,43,43,-111,43,-113,43,43,43,43,43,-46,43,43,43,43,43,43,43,43,43,43,43,43,-28,-128,43,-29,-30,43,43,-145,43,-40,-48,-47,-145,-145,-145,43,-145,-31,-34,-33,43,-132,-131,-127,-133,-41,91,43,91,43,91,91,91,91,91,91,-17,-18,-19,-20,43,43,43,-81,-42,-39,-44,-43,43,43,43,43,43,-137,43,43,-138,43,43,-82,-84,-85,-86,-87,-88,-89,-90,43,-145,43,-80,43,-40,43,43,43,43,43,43,43,43,43,43,43,43,43,-84,-145,43,-145,-145,-145,43,43,43,-128,43,43,43,43,-107,43,43,43,43,-106,43,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,43,-97,-145,-96,-145,-95,-145,43,43,43,43,43,43,43,-99,-93,43,-104,-103,-102,-101,-100,]),'NAO':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,44,45,46,47,48,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[49,49,-37,49,49,49,49,-36,-21,-24,-32,-35,49,49,49,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,49,49,49,49,-111,49,-113,49,49,49,49,49,-46,49,49,49,49,49,49,49,49,49,49,49,49,-28,-128,49,-29,-30,49,49,-145,49,-40,-48,-47,-145,-145,-145,49,-145,-31,-34,-33,49,-132,-131,-127,-133,-41,-9,49,-10,49,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,49,49,49,-81,-42,-39,-44,-43,49,49,49,49,49,-137,49,49,-138,49,49,-82,-84,-85,-86,-87,-88,-89,-90,49,-145,49,-80,49,-40,49,49,49,49,49,49,49,49,49,49,49,49,49,-84,-145,49,-145,-145,-145,49,49,49,49,49,49,49,-107,49,49,49,49,-106,49,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,49,-97,-145,-96,-145,-95,-145,49,49,49,49,49,49,49,-99,-93,49,-104,-103,-102,-101,-100,]),'NUM_INTEIRO':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[51,51,-37,51,51,51,51,-36,-21,-24,-32,-35,51,51,51,-4,-5,51,51,-22,-23,-128,-129,-130,51,-35,-134,-135,-136,-112,51,51,51,51,-111,51,-113,51,51,51,51,51,-46,51,51,51,51,51,51,51,51,51,51,51,51,-28,-128,51,-29,-30,51,51,-145,51,-40,-48,-47,-145,-145,-145,51,-145,-31,-34,-33,51,-132,-131,-127,-133,-41,-9,51,-10,51,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,51,51,51,-81,-42,-39,-44,-43,51,51,51,51,51,-137,51,51,-138,51,51,-82,-84,-85,-86,-87,-88,-89,-90,51,-145,51,-80,51,-40,51,51,51,51,51,51,51,51,51,51,51,51,51,-84,-145,51,-145,-145,-145,51,51,51,51,51,51,51,-107,51,51,51,51,-106,51,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,51,-97,-145,-96,-145,-95,-145,51,51,51,51,51,51,51,-99,-93,51,-104,-103,-102,-101,-100,]),'NUM_PONTO_FLUTUANTE':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[52,52,-37,52,52,52,52,-36,-21,-24,-32,-35,52,52,52,-4,-5,52,52,-22,-23,-128,-129,-130,52,-35,-134,-135,-136,-112,52,52,52,52,-111,52,-113,52,52,52,52,52,-46,52,52,52,52,52,52,52,52,52,52,52,52,-28,-128,52,-29,-30,52,52,-145,52,-40,-48,-47,-145,-145,-145,52,-145,-31,-34,-33,52,-132,-131,-127,-133,-41,-9,52,-10,52,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,52,52,52,-81,-42,-39,-44,-43,52,52,52,52,52,-137,52,52,-138,52,52,-82,-84,-85,-86,-87,-88,-89,-90,52,-145,52,-80,52,-40,52,52,52,52,52,52,52,52,52,52,52,52,52,-84,-145,52,-145,-145,-145,52,52,52,52,52,52,52,-107,52,52,52,52,-106,52,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,52,-97,-145,-96,-145,-95,-145,52,52,52,52,52,52,52,-99,-93,52,-104,-103,-102,-101,-100,]),'NUM_NOTACAO_CIENTIFICA':([20,22,24,25,26,27,29,30,31,32,33,34,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,61,62,64,65,66,67,70,73,75,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,113,114,115,116,117,118,119,120,121,122,123,125,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,155,156,157,167,168,169,170,171,172,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,197,199,201,206,208,211,213,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,235,239,242,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[53,53,-37,53,53,53,53,-36,-21,-24,-32,-35,53,53,53,-4,-5,53,53,-22,-23,-128,-129,-130,53,-35,-134,-135,-136,-112,53,53,53,53,-111,53,-113,53,53,53,53,53,-46,53,53,53,53,53,53,53,53,53,53,53,53,-28,-128,53,-29,-30,53,53,-145,53,-40,-48,-47,-145,-145,-145,53,-145,-31,-34,-33,53,-132,-131,-127,-133,-41,-9,53,-10,53,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,53,53,53,-81,-42,-39,-44,-43,53,53,53,53,53,-137,53,53,-138,53,53,-82,-84,-85,-86,-87,-88,-89,-90,53,-145,53,-80,53,-40,53,53,53,53,53,53,53,53,53,53,53,53,53,-84,-145,53,-145,-145,-145,53,53,53,53,53,53,53,-107,53,53,53,53,-106,53,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,53,-97,-145,-96,-145,-95,-145,53,53,53,53,53,53,53,-99,-93,53,-104,-103,-102,-101,-100,]),'VIRGULA':([23,24,28,29,30,31,32,33,34,35,37,40,41,44,45,46,47,48,50,51,52,53,54,56,57,58,59,64,65,66,67,68,69,70,71,75,78,81,94,95,97,98,99,113,114,115,116,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,152,153,154,158,159,160,161,162,163,164,165,166,167,168,169,170,177,180,206,207,208,209,210,],[-145,-37,-145,-145,-36,72,74,-32,-35,-145,-145,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,101,105,-66,108,-49,-111,-114,-113,105,101,101,105,-38,101,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,178,181,-140,-141,-68,-74,-77,-65,-70,-73,-79,-78,-69,-72,-76,-75,-42,-39,-44,-43,-137,-138,-41,-139,-144,-143,-142,]),'FECHA_PARENTESE':([23,24,28,29,30,35,37,40,41,44,45,46,47,48,50,51,52,53,54,56,57,58,59,64,65,66,67,68,69,70,71,75,77,78,79,81,94,95,97,98,99,100,113,114,115,116,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,152,153,154,158,159,160,161,162,163,164,165,166,167,168,169,170,177,180,206,207,208,209,210,212,225,234,235,237,238,239,240,241,242,243,244,253,],[-145,-37,-145,-145,-36,-145,-145,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-71,104,-66,-67,-49,-111,-114,-113,117,119,-71,121,-38,128,129,130,-46,-28,-128,-29,-30,-145,129,-45,-40,-48,-47,128,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,177,180,-140,-141,-68,-74,-77,-65,-70,-73,-79,-78,-69,-72,-76,-75,-42,-39,-44,-43,-137,-138,-40,-139,-144,-143,-142,128,128,255,256,258,259,261,262,263,265,266,128,128,]),'FIM':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,104,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,197,199,201,206,224,225,226,228,229,230,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,198,-81,-42,-39,-44,-43,200,202,203,204,205,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-83,-80,-83,-40,-91,-84,-145,-145,-145,-145,267,-107,269,272,274,276,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,285,286,288,289,290,291,292,-99,-93,-83,-104,-103,-102,-101,-100,]),'SE':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,104,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,199,201,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,192,192,-81,-42,-39,-44,-43,192,192,192,192,192,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-80,-83,-40,192,192,192,192,-91,-84,-145,-145,-145,-145,-83,192,-107,192,192,192,192,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,192,192,192,192,192,192,192,-99,-93,-83,-104,-103,-102,-101,-100,]),'REPITA':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,104,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,199,201,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,193,193,-81,-42,-39,-44,-43,193,193,193,193,193,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-80,-83,-40,193,193,193,193,-91,-84,-145,-145,-145,-145,-83,193,-107,193,193,193,193,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,193,193,193,193,193,193,193,-99,-93,-83,-104,-103,-102,-101,-100,]),'LEIA':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,104,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,199,201,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,194,194,-81,-42,-39,-44,-43,194,194,194,194,194,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-80,-83,-40,194,194,194,194,-91,-84,-145,-145,-145,-145,-83,194,-107,194,194,194,194,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,194,194,194,194,194,194,194,-99,-93,-83,-104,-103,-102,-101,-100,]),'ESCREVA':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,104,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,199,201,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,195,195,-81,-42,-39,-44,-43,195,195,195,195,195,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-80,-83,-40,195,195,195,195,-91,-84,-145,-145,-145,-145,-83,195,-107,195,195,195,195,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,195,195,195,195,195,195,195,-99,-93,-83,-104,-103,-102,-101,-100,]),'RETORNA':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,104,113,114,115,116,117,118,119,121,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,157,167,168,169,170,171,172,173,174,175,177,180,182,183,184,185,186,187,188,189,190,193,197,199,201,206,211,213,216,217,224,225,226,228,229,230,232,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-145,-45,-40,-48,-47,-145,-145,-145,-145,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,196,196,-81,-42,-39,-44,-43,196,196,196,196,196,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-80,-83,-40,196,196,196,196,-91,-84,-145,-145,-145,-145,-83,196,-107,196,196,196,196,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-145,-92,-145,-83,-97,-145,-96,-145,-95,-145,196,196,196,196,196,196,196,-99,-93,-83,-104,-103,-102,-101,-100,]),'SENAO':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,113,114,115,116,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,157,167,168,169,170,177,180,182,183,184,185,186,187,188,189,190,197,199,206,226,228,229,230,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,269,271,272,274,276,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-81,-42,-39,-44,-43,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-83,-80,-40,-145,-145,-145,-145,268,-107,270,273,275,277,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-92,-83,-97,-96,-95,-99,-93,-105,-104,-103,-102,-101,-100,]),'ATE':([24,30,31,32,33,34,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,113,114,115,116,122,123,125,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,157,167,168,169,170,177,180,182,183,184,185,186,187,188,189,190,193,197,199,201,206,213,216,217,224,225,232,246,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,269,271,272,274,276,281,285,286,287,288,289,290,291,292,],[-37,-36,-21,-24,-32,-35,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-31,-34,-33,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-81,-42,-39,-44,-43,-137,-138,-91,-82,-84,-85,-86,-87,-88,-89,-90,-145,-83,-80,-145,-40,227,231,233,-91,-84,-83,-107,-106,-110,-109,-108,-115,-117,-118,-116,-119,-122,-121,-120,-123,-126,-125,-124,-94,-92,-98,-97,-96,-95,227,-99,-93,-105,-104,-103,-102,-101,-100,]),'E':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,82,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'OU':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,83,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'MENOR':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,84,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,84,-25,84,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'MAIOR':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,85,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,85,-25,85,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'IGUAL':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,86,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,86,-25,86,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'DIFERENTE':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,87,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,87,-25,87,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'MENOR_IGUAL':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,88,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,88,-25,88,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'MAIOR_IGUAL':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,89,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,89,-25,89,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'VEZES':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,92,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,92,-25,92,-26,92,92,92,92,92,92,92,92,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'DIVIDE':([24,30,40,44,45,46,47,48,50,51,52,53,64,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,234,],[-37,-36,93,-22,-23,-128,-129,-130,-35,-134,-135,-136,-49,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,93,-25,93,-26,93,93,93,93,93,93,93,93,-19,-20,-42,-39,-44,-43,-137,-138,-40,-128,]),'FECHA_COLCHETE':([24,30,39,40,41,44,45,46,47,48,50,51,52,53,54,63,64,65,66,67,75,80,81,94,95,97,98,103,106,107,111,112,113,114,115,116,120,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,176,177,180,206,225,244,],[-37,-36,81,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,114,116,-111,-114,-113,-38,132,-46,-28,-128,-29,-30,154,160,162,167,168,170,-40,-48,-47,154,81,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,206,-137,-138,-40,81,81,]),'ENTAO':([24,30,40,41,44,45,46,47,48,50,51,52,53,54,64,65,66,67,75,81,94,95,97,98,113,114,115,116,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,167,168,169,170,177,180,206,212,214,215,244,253,],[-37,-36,-4,-5,-22,-23,-128,-129,-130,-35,-134,-135,-136,-112,-49,-111,-114,-113,-38,-46,-28,-128,-29,-30,-45,-40,-48,-47,-132,-131,-127,-133,-41,-9,-25,-10,-26,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-42,-39,-44,-43,-137,-138,-40,226,228,230,226,226,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'programa':([0,],[1,]),'lista_declaracoes':([0,],[2,]),'declaracao':([0,2,],[3,15,]),'declaracao_variaveis':([0,2,155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[4,4,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,]),'inicializacao_variaveis':([0,2,],[5,5,]),'declaracao_funcao':([0,2,],[6,6,]),'tipo':([0,2,23,28,29,35,37,101,105,108,155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[7,7,60,60,60,60,60,60,60,60,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,191,]),'atribuicao':([0,2,20,22,25,26,27,29,36,37,38,55,61,62,64,66,70,73,75,76,78,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[9,9,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'cabecalho':([0,2,7,8,],[10,10,18,21,]),'var':([0,2,16,20,22,25,26,27,29,36,37,38,42,43,49,55,61,62,64,66,70,72,73,74,75,76,78,82,83,84,85,86,87,88,89,90,91,92,93,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[13,13,33,46,46,46,46,46,46,46,46,46,95,95,95,46,46,46,46,46,46,122,46,125,46,46,46,95,95,95,95,95,95,95,95,95,95,95,95,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,234,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'indice':([8,14,32,34,36,50,64,66,70,76,78,96,100,113,123,124,134,136,148,182,197,201,208,211,215,224,232,235,239,242,252,271,287,],[24,30,24,30,24,30,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'lista_variaveis':([16,],[31,]),'expressao':([20,22,25,26,27,29,36,37,38,55,61,62,64,66,70,73,75,76,78,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[39,54,63,65,67,39,77,79,80,79,111,112,77,77,77,39,39,127,77,77,149,77,77,63,176,77,77,77,184,184,184,184,184,184,184,207,209,210,212,214,212,212,77,225,184,77,184,184,236,237,238,240,241,243,244,246,251,253,254,77,77,77,184,184,184,184,184,77,212,184,184,184,184,184,184,184,212,]),'expressao_binaria':([20,22,25,26,27,29,36,37,38,55,61,62,64,66,70,73,75,76,78,82,83,84,85,86,87,88,89,90,91,92,93,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,133,135,137,138,139,140,141,142,143,144,145,146,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'fator':([20,22,25,26,27,29,36,37,38,42,43,49,55,61,62,64,66,70,73,75,76,78,82,83,84,85,86,87,88,89,90,91,92,93,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[44,44,44,44,44,44,44,44,44,94,97,98,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'expressao_unaria':([20,22,25,26,27,29,36,37,38,55,61,62,64,66,70,73,75,76,78,82,83,84,85,86,87,88,89,90,91,92,93,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'chamada_funcao':([20,22,25,26,27,29,36,37,38,42,43,49,55,61,62,64,66,70,73,75,76,78,82,83,84,85,86,87,88,89,90,91,92,93,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'numero':([20,22,25,26,27,29,36,37,38,42,43,49,55,61,62,64,66,70,73,75,76,78,82,83,84,85,86,87,88,89,90,91,92,93,96,99,100,113,120,126,134,136,148,155,156,171,172,173,174,175,178,179,181,182,192,197,201,208,211,213,215,216,217,218,219,220,221,222,223,224,227,231,232,233,235,239,242,245,247,248,249,250,252,271,278,279,280,281,282,283,284,287,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'lista_parametros':([23,28,29,35,37,],[57,68,71,71,57,]),'parametro':([23,28,29,35,37,101,105,108,],[58,58,58,58,58,152,158,163,]),'vazio':([23,28,29,35,37,99,104,117,118,119,121,182,193,197,201,224,226,228,229,230,232,268,270,271,273,275,277,287,],[59,59,59,59,59,150,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,]),'lista_argumentos':([99,],[147,]),'corpo':([104,117,118,119,121,182,193,197,201,224,226,228,229,230,232,268,270,271,273,275,277,287,],[156,171,173,174,175,213,216,213,213,213,245,247,249,250,213,278,279,281,282,283,284,213,]),'acao':([155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[183,199,199,183,199,199,199,183,199,199,183,199,199,183,199,199,199,199,183,199,199,199,199,]),'se':([155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,186,]),'repita':([155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,]),'leia':([155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,]),'escreva':([155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,189,]),'retorna':([155,156,171,172,173,174,175,211,213,216,217,245,247,248,249,250,278,279,280,281,282,283,284,],[190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,190,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> programa","S'",1,None,None,None),
+  ('programa -> lista_declaracoes','programa',1,'p_programa','tppparser.py',48),
+  ('lista_declaracoes -> lista_declaracoes declaracao','lista_declaracoes',2,'p_lista_declaracoes','tppparser.py',69),
+  ('lista_declaracoes -> declaracao','lista_declaracoes',1,'p_lista_declaracoes','tppparser.py',70),
+  ('expressao -> expressao_binaria','expressao',1,'p_expressao','tppprecedencia.py',86),
+  ('expressao -> atribuicao','expressao',1,'p_expressao','tppprecedencia.py',87),
+  ('declaracao -> declaracao_variaveis','declaracao',1,'p_declaracao','tppparser.py',89),
+  ('declaracao -> inicializacao_variaveis','declaracao',1,'p_declaracao','tppparser.py',90),
+  ('declaracao -> declaracao_funcao','declaracao',1,'p_declaracao','tppparser.py',91),
+  ('expressao_binaria -> expressao_binaria E expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',95),
+  ('expressao_binaria -> expressao_binaria OU expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',96),
+  ('expressao_binaria -> expressao_binaria MENOR expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',97),
+  ('expressao_binaria -> expressao_binaria MAIOR expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',98),
+  ('expressao_binaria -> expressao_binaria IGUAL expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',99),
+  ('expressao_binaria -> expressao_binaria DIFERENTE expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',100),
+  ('expressao_binaria -> expressao_binaria MENOR_IGUAL expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',101),
+  ('expressao_binaria -> expressao_binaria MAIOR_IGUAL expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',102),
+  ('expressao_binaria -> expressao_binaria MAIS expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',103),
+  ('expressao_binaria -> expressao_binaria MENOS expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',104),
+  ('expressao_binaria -> expressao_binaria VEZES expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',105),
+  ('expressao_binaria -> expressao_binaria DIVIDE expressao_binaria','expressao_binaria',3,'p_expressao_binaria','tppprecedencia.py',106),
+  ('declaracao_variaveis -> tipo DOIS_PONTOS lista_variaveis','declaracao_variaveis',3,'p_declaracao_variaveis','tppparser.py',106),
+  ('expressao_binaria -> fator','expressao_binaria',1,'p_expressao_binaria_fator','tppprecedencia.py',118),
+  ('expressao_binaria -> expressao_unaria','expressao_binaria',1,'p_expressao_binaria_fator','tppprecedencia.py',119),
+  ('declaracao_variaveis -> tipo DOIS_PONTOS error','declaracao_variaveis',3,'p_declaracao_variaveis_error','tppparser.py',125),
+  ('expressao_binaria -> expressao_binaria E error','expressao_binaria',3,'p_expressao_binaria_error','tppprecedencia.py',125),
+  ('expressao_binaria -> expressao_binaria OU error','expressao_binaria',3,'p_expressao_binaria_error','tppprecedencia.py',126),
+  ('inicializacao_variaveis -> atribuicao','inicializacao_variaveis',1,'p_inicializacao_variaveis','tppparser.py',130),
+  ('expressao_unaria -> MAIS fator','expressao_unaria',2,'p_expressao_unaria','tppprecedencia.py',133),
+  ('expressao_unaria -> MENOS fator','expressao_unaria',2,'p_expressao_unaria','tppprecedencia.py',134),
+  ('expressao_unaria -> NAO fator','expressao_unaria',2,'p_expressao_unaria','tppprecedencia.py',135),
+  ('lista_variaveis -> lista_variaveis VIRGULA var','lista_variaveis',3,'p_lista_variaveis','tppparser.py',143),
+  ('lista_variaveis -> var','lista_variaveis',1,'p_lista_variaveis','tppparser.py',144),
+  ('lista_variaveis -> error VIRGULA var','lista_variaveis',3,'p_lista_variaveis_error','tppparser.py',157),
+  ('lista_variaveis -> lista_variaveis VIRGULA error','lista_variaveis',3,'p_lista_variaveis_error','tppparser.py',158),
+  ('var -> ID','var',1,'p_var','tppparser.py',164),
+  ('var -> ID indice','var',2,'p_var','tppparser.py',165),
+  ('var -> error indice','var',2,'p_var_error','tppparser.py',177),
+  ('var -> ID error','var',2,'p_var_error','tppparser.py',178),
+  ('indice -> indice ABRE_COLCHETE expressao FECHA_COLCHETE','indice',4,'p_indice','tppparser.py',184),
+  ('indice -> ABRE_COLCHETE expressao FECHA_COLCHETE','indice',3,'p_indice','tppparser.py',185),
+  ('indice -> error ABRE_COLCHETE expressao FECHA_COLCHETE','indice',4,'p_indice_error','tppparser.py',214),
+  ('indice -> indice error expressao FECHA_COLCHETE','indice',4,'p_indice_error','tppparser.py',215),
+  ('indice -> indice ABRE_COLCHETE error FECHA_COLCHETE','indice',4,'p_indice_error','tppparser.py',216),
+  ('indice -> indice ABRE_COLCHETE expressao error','indice',4,'p_indice_error','tppparser.py',217),
+  ('indice -> indice ABRE_COLCHETE error','indice',3,'p_indice_error','tppparser.py',218),
+  ('indice -> error expressao FECHA_COLCHETE','indice',3,'p_indice_error','tppparser.py',219),
+  ('indice -> ABRE_COLCHETE error FECHA_COLCHETE','indice',3,'p_indice_error','tppparser.py',220),
+  ('indice -> ABRE_COLCHETE expressao error','indice',3,'p_indice_error','tppparser.py',221),
+  ('indice -> ABRE_COLCHETE error','indice',2,'p_indice_error','tppparser.py',222),
+  ('tipo -> INTEIRO','tipo',1,'p_tipo','tppparser.py',233),
+  ('tipo -> FLUTUANTE','tipo',1,'p_tipo','tppparser.py',234),
+  ('declaracao_funcao -> tipo cabecalho','declaracao_funcao',2,'p_declaracao_funcao','tppparser.py',251),
+  ('declaracao_funcao -> cabecalho','declaracao_funcao',1,'p_declaracao_funcao','tppparser.py',252),
+  ('declaracao_funcao -> error cabecalho','declaracao_funcao',2,'p_declaracao_funcao_error','tppparser.py',262),
+  ('declaracao_funcao -> tipo error','declaracao_funcao',2,'p_declaracao_funcao_error','tppparser.py',263),
+  ('declaracao_funcao -> error','declaracao_funcao',1,'p_declaracao_funcao_error','tppparser.py',264),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho','tppparser.py',270),
+  ('cabecalho -> error ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',297),
+  ('cabecalho -> ID error lista_parametros FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',298),
+  ('cabecalho -> ID ABRE_PARENTESE error FECHA_PARENTESE corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',299),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros error corpo FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',300),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE error FIM','cabecalho',6,'p_cabecalho_error','tppparser.py',301),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo error','cabecalho',6,'p_cabecalho_error','tppparser.py',302),
+  ('cabecalho -> ID ABRE_PARENTESE lista_parametros FECHA_PARENTESE corpo','cabecalho',5,'p_cabecalho_error','tppparser.py',303),
+  ('lista_parametros -> lista_parametros VIRGULA parametro','lista_parametros',3,'p_lista_parametros','tppparser.py',309),
+  ('lista_parametros -> parametro','lista_parametros',1,'p_lista_parametros','tppparser.py',310),
+  ('lista_parametros -> vazio','lista_parametros',1,'p_lista_parametros','tppparser.py',311),
+  ('lista_parametros -> error VIRGULA parametro','lista_parametros',3,'p_lista_parametros_error','tppparser.py',326),
+  ('lista_parametros -> vazio VIRGULA parametro','lista_parametros',3,'p_lista_parametros_error','tppparser.py',327),
+  ('lista_parametros -> lista_parametros VIRGULA error','lista_parametros',3,'p_lista_parametros_error','tppparser.py',328),
+  ('lista_parametros -> error','lista_parametros',1,'p_lista_parametros_error','tppparser.py',329),
+  ('parametro -> tipo DOIS_PONTOS ID','parametro',3,'p_parametro','tppparser.py',337),
+  ('parametro -> parametro ABRE_COLCHETE FECHA_COLCHETE','parametro',3,'p_parametro','tppparser.py',338),
+  ('parametro -> error DOIS_PONTOS ID','parametro',3,'p_parametro_error','tppparser.py',363),
+  ('parametro -> tipo error ID','parametro',3,'p_parametro_error','tppparser.py',364),
+  ('parametro -> tipo DOIS_PONTOS error','parametro',3,'p_parametro_error','tppparser.py',365),
+  ('parametro -> error ABRE_COLCHETE FECHA_COLCHETE','parametro',3,'p_parametro_error','tppparser.py',366),
+  ('parametro -> parametro error FECHA_COLCHETE','parametro',3,'p_parametro_error','tppparser.py',367),
+  ('parametro -> parametro ABRE_COLCHETE error','parametro',3,'p_parametro_error','tppparser.py',368),
+  ('corpo -> corpo acao','corpo',2,'p_corpo','tppparser.py',375),
+  ('corpo -> vazio','corpo',1,'p_corpo','tppparser.py',376),
+  ('corpo -> error acao','corpo',2,'p_corpo_error','tppparser.py',391),
+  ('corpo -> corpo error','corpo',2,'p_corpo_error','tppparser.py',392),
+  ('acao -> expressao','acao',1,'p_acao','tppparser.py',398),
+  ('acao -> declaracao_variaveis','acao',1,'p_acao','tppparser.py',399),
+  ('acao -> se','acao',1,'p_acao','tppparser.py',400),
+  ('acao -> repita','acao',1,'p_acao','tppparser.py',401),
+  ('acao -> leia','acao',1,'p_acao','tppparser.py',402),
+  ('acao -> escreva','acao',1,'p_acao','tppparser.py',403),
+  ('acao -> retorna','acao',1,'p_acao','tppparser.py',404),
+  ('acao -> error','acao',1,'p_acao','tppparser.py',405),
+  ('se -> SE expressao ENTAO corpo FIM','se',5,'p_se','tppparser.py',428),
+  ('se -> SE expressao ENTAO corpo SENAO corpo FIM','se',7,'p_se','tppparser.py',429),
+  ('se -> error expressao ENTAO corpo FIM','se',5,'p_se_error','tppparser.py',464),
+  ('se -> SE error ENTAO corpo FIM','se',5,'p_se_error','tppparser.py',465),
+  ('se -> SE expressao error corpo FIM','se',5,'p_se_error','tppparser.py',466),
+  ('se -> SE expressao ENTAO error FIM','se',5,'p_se_error','tppparser.py',467),
+  ('se -> SE expressao ENTAO corpo error','se',5,'p_se_error','tppparser.py',468),
+  ('se -> error expressao ENTAO corpo SENAO corpo FIM','se',7,'p_se_error','tppparser.py',469),
+  ('se -> SE error ENTAO corpo SENAO corpo FIM','se',7,'p_se_error','tppparser.py',470),
+  ('se -> SE expressao error corpo SENAO corpo FIM','se',7,'p_se_error','tppparser.py',471),
+  ('se -> SE expressao ENTAO error SENAO corpo FIM','se',7,'p_se_error','tppparser.py',472),
+  ('se -> SE expressao ENTAO corpo error corpo FIM','se',7,'p_se_error','tppparser.py',473),
+  ('se -> SE expressao ENTAO corpo SENAO error FIM','se',7,'p_se_error','tppparser.py',474),
+  ('se -> SE expressao ENTAO corpo SENAO corpo error','se',7,'p_se_error','tppparser.py',475),
+  ('repita -> REPITA corpo ATE expressao','repita',4,'p_repita','tppparser.py',482),
+  ('repita -> error corpo ATE expressao','repita',4,'p_repita_error','tppparser.py',501),
+  ('repita -> REPITA error ATE expressao','repita',4,'p_repita_error','tppparser.py',502),
+  ('repita -> REPITA corpo error expressao','repita',4,'p_repita_error','tppparser.py',503),
+  ('repita -> REPITA corpo ATE error','repita',4,'p_repita_error','tppparser.py',504),
+  ('atribuicao -> var ATRIBUICAO expressao','atribuicao',3,'p_atribuicao','tppparser.py',511),
+  ('atribuicao -> error ATRIBUICAO expressao','atribuicao',3,'p_atribuicao_error','tppparser.py',525),
+  ('atribuicao -> var error expressao','atribuicao',3,'p_atribuicao_error','tppparser.py',526),
+  ('atribuicao -> var ATRIBUICAO error','atribuicao',3,'p_atribuicao_error','tppparser.py',527),
+  ('leia -> LEIA ABRE_PARENTESE var FECHA_PARENTESE','leia',4,'p_leia','tppparser.py',534),
+  ('leia -> LEIA error expressao FECHA_PARENTESE','leia',4,'p_leia_error','tppparser.py',555),
+  ('leia -> LEIA ABRE_PARENTESE error FECHA_PARENTESE','leia',4,'p_leia_error','tppparser.py',556),
+  ('leia -> LEIA ABRE_PARENTESE expressao error','leia',4,'p_leia_error','tppparser.py',557),
+  ('escreva -> ESCREVA ABRE_PARENTESE expressao FECHA_PARENTESE','escreva',4,'p_escreva','tppparser.py',564),
+  ('escreva -> ESCREVA error expressao FECHA_PARENTESE','escreva',4,'p_escreva_error','tppparser.py',584),
+  ('escreva -> ESCREVA ABRE_PARENTESE error FECHA_PARENTESE','escreva',4,'p_escreva_error','tppparser.py',585),
+  ('escreva -> ESCREVA ABRE_PARENTESE expressao error','escreva',4,'p_escreva_error','tppparser.py',586),
+  ('retorna -> RETORNA ABRE_PARENTESE expressao FECHA_PARENTESE','retorna',4,'p_retorna','tppparser.py',593),
+  ('retorna -> RETORNA error expressao FECHA_PARENTESE','retorna',4,'p_retorna_error','tppparser.py',613),
+  ('retorna -> RETORNA ABRE_PARENTESE error FECHA_PARENTESE','retorna',4,'p_retorna_error','tppparser.py',614),
+  ('retorna -> RETORNA ABRE_PARENTESE expressao error','retorna',4,'p_retorna_error','tppparser.py',615),
+  ('fator -> ABRE_PARENTESE expressao FECHA_PARENTESE','fator',3,'p_fator','tppparser.py',825),
+  ('fator -> var','fator',1,'p_fator','tppparser.py',826),
+  ('fator -> chamada_funcao','fator',1,'p_fator','tppparser.py',827),
+  ('fator -> numero','fator',1,'p_fator','tppparser.py',828),
+  ('fator -> ABRE_PARENTESE error FECHA_PARENTESE','fator',3,'p_fator_error','tppparser.py',847),
+  ('fator -> error expressao FECHA_PARENTESE','fator',3,'p_fator_error','tppparser.py',848),
+  ('fator -> ABRE_PARENTESE expressao error','fator',3,'p_fator_error','tppparser.py',849),
+  ('numero -> NUM_INTEIRO','numero',1,'p_numero','tppparser.py',855),
+  ('numero -> NUM_PONTO_FLUTUANTE','numero',1,'p_numero','tppparser.py',856),
+  ('numero -> NUM_NOTACAO_CIENTIFICA','numero',1,'p_numero','tppparser.py',857),
+  ('chamada_funcao -> ID ABRE_PARENTESE lista_argumentos FECHA_PARENTESE','chamada_funcao',4,'p_chamada_funcao','tppparser.py',880),
+  ('chamada_funcao -> ID ABRE_PARENTESE error FECHA_PARENTESE','chamada_funcao',4,'p_chamada_funcao_error','tppparser.py',902),
+  ('lista_argumentos -> lista_argumentos VIRGULA expressao','lista_argumentos',3,'p_lista_argumentos','tppparser.py',907),
+  ('lista_argumentos -> expressao','lista_argumentos',1,'p_lista_argumentos','tppparser.py',908),
+  ('lista_argumentos -> vazio','lista_argumentos',1,'p_lista_argumentos','tppparser.py',909),
+  ('lista_argumentos -> error VIRGULA expressao','lista_argumentos',3,'p_lista_argumentos_error','tppparser.py',925),
+  ('lista_argumentos -> lista_argumentos error expressao','lista_argumentos',3,'p_lista_argumentos_error','tppparser.py',926),
+  ('lista_argumentos -> lista_argumentos VIRGULA error','lista_argumentos',3,'p_lista_argumentos_error','tppparser.py',927),
+  ('vazio -> <empty>','vazio',0,'p_vazio','tppparser.py',934),
+]
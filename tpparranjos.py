@@ -0,0 +1,91 @@
+# Descrição: Armazenamento dos arranjos (vetores e matrizes) dos programas T++ em execução.
+#            Cada arranjo é um bloco contíguo de valores do tipo declarado: array('q') para inteiro e
+#            array('d') para flutuante (ou, com a forma 'numpy', um numpy.ndarray int64/float64, quando o
+#            NumPy estiver instalado). Uma matriz guarda as linhas em sequência no mesmo bloco (ordem por
+#            linhas): o elemento [i][j] fica na posição i * colunas + j. Uma linha da matriz (passada
+#            como argumento para um parâmetro vetor) é uma visão do bloco, sem cópia, de modo que as
+#            atribuições na função chamada alteram a matriz.
+#
+#            Os elementos inteiros têm 64 bits: a atribuição de um valor fora do intervalo é um erro de
+#            execução (OverflowError, convertido pelos executores).
+
+import array
+
+# Formas de armazenamento aceitas pelos executores
+formas = ('array', 'numpy')
+
+# Tipo dos elementos de array.array e do NumPy por tipo T++
+codigos = {'inteiro': 'q', 'flutuante': 'd'}
+tipos_numpy = {'inteiro': 'int64', 'flutuante': 'float64'}
+
+
+# Módulo numpy, ou None se não estiver instalado (importado só quando a forma 'numpy' é pedida)
+def numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# Linha de uma matriz guardada em array.array: visão do bloco que, como o próprio array, acusa OverflowError na
+# atribuição de um inteiro fora do intervalo (a memoryview acusaria ValueError)
+class Linha:
+    __slots__ = ('visao',)
+
+    def __init__(self, visao):
+        self.visao = visao
+
+    def __len__(self):
+        return len(self.visao)
+
+    def __getitem__(self, i):
+        return self.visao[i]
+
+    def __setitem__(self, i, valor):
+        try:
+            self.visao[i] = valor
+        except ValueError:
+            raise OverflowError(valor) from None
+
+
+# Matriz em ordem por linhas; matriz[i] é a linha i (uma visão de dados) e len(matriz) o número de linhas
+class Matriz:
+    __slots__ = ('dados', 'linhas', 'colunas', 'visao')
+
+    def __init__(self, dados, linhas, colunas):
+        self.dados = dados
+        self.linhas = linhas
+        self.colunas = colunas
+        # Visão dos dados para recortar as linhas sem cópia (o próprio ndarray já recorta sem cópia)
+        self.visao = memoryview(dados) if isinstance(dados, array.array) else dados
+
+    def __len__(self):
+        return self.linhas
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.linhas:
+            raise IndexError(i)
+        linha = self.visao[i * self.colunas:(i + 1) * self.colunas]
+        return Linha(linha) if isinstance(self.dados, array.array) else linha
+
+
+# Bloco de n elementos do tipo, iniciados com zero
+def bloco(type, n, forma='array'):
+    if n < 0:
+        raise ValueError(n)
+    modulo = numpy() if forma == 'numpy' else None
+    if modulo is not None:
+        return modulo.zeros(n, dtype=tipos_numpy[type])
+    return array.array(codigos[type], bytes(8 * n))
+
+
+# Cria o arranjo com os tamanhos (um para vetor, dois para matriz), iniciado com zero. forma: 'array', ou
+# 'numpy' (usa array.array se o NumPy não estiver instalado)
+def novoArranjo(type, tamanhos, forma='array'):
+    if len(tamanhos) == 1:
+        return bloco(type, tamanhos[0], forma)
+    linhas, colunas = tamanhos
+    if linhas < 0 or colunas < 0:
+        raise ValueError(tamanhos)
+    return Matriz(bloco(type, linhas * colunas, forma), linhas, colunas)
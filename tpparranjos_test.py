@@ -0,0 +1,77 @@
+import array
+import io
+
+import pytest
+
+import tpparranjos
+import tppbytecode
+import tppcompilador
+import tppexecutor
+
+linhas = '''
+inteiro: m[3][4]
+
+zera(inteiro: w[], inteiro: n)
+  inteiro: i
+  i := 0
+  repita
+    w[i] := i + 10
+    i := i + 1
+  até i = n
+fim
+
+inteiro principal()
+  flutuante: x[2]
+  x[1] := 3
+  zera(m[1], 4)
+  escreva(m[1][3])
+  escreva(m[0][3] + m[2][0])
+  escreva(x[1])
+  retorna(0)
+fim
+'''
+
+
+def executa(fonte, entrada='', forma='closures', arranjos='array'):
+    resultado = tppcompilador.compila(fonte)
+    assert resultado.sucesso(), resultado.erro
+    if forma == 'closures':
+        programa = tppexecutor.compilaPrograma(resultado.root)
+    else:
+        programa = tppbytecode.traduzPrograma(resultado.root)
+    saida = io.StringIO()
+    retorno = programa.executa(io.StringIO(entrada), saida, arranjos)
+    return retorno, saida.getvalue().split()
+
+
+def test_001():
+    # Blocos contíguos do tipo declarado; a matriz guarda as linhas em sequência
+    vetor = tpparranjos.novoArranjo('flutuante', [5])
+    assert isinstance(vetor, array.array) and vetor.typecode == 'd' and list(vetor) == [0.0] * 5
+    matriz = tpparranjos.novoArranjo('inteiro', [2, 3])
+    assert matriz.dados.typecode == 'q' and len(matriz.dados) == 6 and len(matriz) == 2
+    matriz[1][2] = 7
+    assert matriz.dados[5] == 7
+    with pytest.raises(IndexError):
+        matriz[2]
+    with pytest.raises(ValueError):
+        tpparranjos.novoArranjo('inteiro', [-1])
+
+
+@pytest.mark.parametrize('forma', ['closures', 'bytecode'])
+@pytest.mark.parametrize('arranjos', tpparranjos.formas)
+def test_002(forma, arranjos):
+    # Uma linha da matriz passada como vetor é alterada pela função chamada; 'numpy' usa array.array se o NumPy
+    # não estiver instalado
+    assert executa(linhas, forma=forma, arranjos=arranjos) == (0, ['13', '0', '3.0'])
+
+
+@pytest.mark.parametrize('forma', ['closures', 'bytecode'])
+def test_003(forma):
+    # Erros de execução: tamanho negativo e valor fora dos inteiros de 64 bits
+    tamanho = linhas.replace('flutuante: x[2]', 'flutuante: x[1 - 2]')
+    with pytest.raises(tppexecutor.ErroExecucao, match=r"Tamanho \[-1\] inválido para o arranjo 'x'"):
+        executa(tamanho, forma=forma)
+    estouro = linhas.replace('w[i] := i + 10', 'w[i] := 9223372036854775807 + i')
+    with pytest.raises(tppexecutor.ErroExecucao, match='64 bits'):
+        executa(estouro, forma=forma)
@@ -0,0 +1,706 @@
+# Descrição: Bytecode e máquina virtual para programas T++.
+#            A árvore podada é traduzida uma vez para um bytecode de pilha compacto: o código de cada
+#            função é uma sequência de inteiros (instrução seguida dos operandos) guardada em um
+#            array('i'), com um conjunto de constantes do programa (números e nomes usados nas mensagens
+#            de erro). As variáveis locais e os parâmetros ocupam posições fixas do registro de ativação
+#            da função (resolvidas na tradução, a partir das declarações, pelo tppexecutor.Leiaute) e as
+#            globais posições fixas da lista de globais, de modo que nenhum acesso a variável procura um
+#            nome durante a execução. A máquina virtual executa o bytecode em um único laço, com a pilha
+#            de chamadas própria (a profundidade da recursão não depende da pilha do Python).
+#
+#            O programa traduzido pode ser serializado (serializa/carrega, arquivos .tppb) e executado
+#            de novo sem repetir as análises léxica, sintática e semântica. A semântica é a mesma do
+#            executor de closures (tppexecutor.py).
+#
+#            Uso: python tppbytecode.py programa.tpp [--entrada=arquivo] [--precedence] [--grava=arquivo.tppb]
+#                                       [--cache] [--lista] [--arranjos=array|numpy]
+#                 python tppbytecode.py programa.tppb [--entrada=arquivo] [--lista] [--arranjos=array|numpy]
+#            (--grava grava o bytecode; --cache reaproveita o bytecode gravado no diretório de cache para o
+#            mesmo código-fonte; --lista imprime o bytecode na saída de erros)
+
+import array
+import marshal
+import os
+import sys
+
+import tpparranjos
+from tppexecutor import (Leiaute, Leitor, Variavel, analisaExpressao, divideInteiros, erro, error_handler, indices,
+                         tipoOperacao, zero)
+
+# Versão do formato do bytecode; arquivos de outra versão não são carregados
+versao = 2
+assinatura = b'TPPB'
+
+# Limite de chamadas aninhadas de funções T++
+limite_chamadas = 100000
+
+# Instruções e número de operandos
+instrucoes = [
+    ('CONSTANTE', 1),           # empilha constantes[k]
+    ('CARREGA_LOCAL', 1),       # empilha registro[k]
+    ('ARMAZENA_LOCAL', 1),      # registro[k] = desempilha
+    ('CARREGA_GLOBAL', 1),      # empilha globais[k]
+    ('ARMAZENA_GLOBAL', 1),     # globais[k] = desempilha
+    # Elementos do arranjo registro[k] (ou globais[k]); constantes[n]: nome, para a mensagem de erro
+    ('CARREGA_ELEMENTO_LOCAL', 2),      # i -> arranjo[i] (com um índice, a linha de uma matriz)
+    ('CARREGA_ELEMENTO_GLOBAL', 2),
+    ('ARMAZENA_ELEMENTO_LOCAL', 2),     # i, valor -> (arranjo[i] = valor)
+    ('ARMAZENA_ELEMENTO_GLOBAL', 2),
+    ('CARREGA_ELEMENTO2_LOCAL', 2),     # i, j -> matriz[i][j]
+    ('CARREGA_ELEMENTO2_GLOBAL', 2),
+    ('ARMAZENA_ELEMENTO2_LOCAL', 2),    # i, j, valor -> (matriz[i][j] = valor)
+    ('ARMAZENA_ELEMENTO2_GLOBAL', 2),
+    ('SOMA', 0),
+    ('SUBTRAI', 0),
+    ('MULTIPLICA', 0),
+    ('DIVIDE', 0),
+    ('DIVIDE_INTEIRO', 0),
+    ('MENOR', 0),
+    ('MAIOR', 0),
+    ('MENOR_IGUAL', 0),
+    ('MAIOR_IGUAL', 0),
+    ('IGUAL', 0),
+    ('DIFERENTE', 0),
+    ('NEGA', 0),
+    ('NAO', 0),
+    ('LOGICO', 0),              # valor -> 1 ou 0
+    ('PARA_INTEIRO', 0),
+    ('PARA_FLUTUANTE', 0),
+    ('SALTA', 1),               # ip = k
+    ('SALTA_SE_FALSO', 1),      # desempilha; ip = k se o valor for zero
+    ('SALTA_SE_VERDADEIRO', 1),
+    ('CHAMA', 1),               # chama funcoes[k] com os argumentos da pilha
+    ('RETORNA', 0),             # retorna o valor do topo da pilha
+    ('DESCARTA', 0),
+    ('LE', 2),                  # empilha o próximo valor da entrada (constantes[k]: nome; tipo: 0 inteiro, 1 flutuante)
+    ('ESCREVE', 0),
+    ('ALOCA', 3),               # tamanhos -> novo arranjo (dimensões; tipo: 0 inteiro, 1 flutuante; constantes[n]: nome)
+]
+nomes_instrucoes = [nome for nome, operandos in instrucoes]
+operandos_instrucoes = [operandos for nome, operandos in instrucoes]
+
+# Códigos das instruções, na ordem da tabela
+(CONSTANTE, CARREGA_LOCAL, ARMAZENA_LOCAL, CARREGA_GLOBAL, ARMAZENA_GLOBAL, CARREGA_ELEMENTO_LOCAL,
+ CARREGA_ELEMENTO_GLOBAL, ARMAZENA_ELEMENTO_LOCAL, ARMAZENA_ELEMENTO_GLOBAL, CARREGA_ELEMENTO2_LOCAL,
+ CARREGA_ELEMENTO2_GLOBAL, ARMAZENA_ELEMENTO2_LOCAL, ARMAZENA_ELEMENTO2_GLOBAL, SOMA, SUBTRAI, MULTIPLICA, DIVIDE, DIVIDE_INTEIRO, MENOR, MAIOR, MENOR_IGUAL,
+ MAIOR_IGUAL, IGUAL, DIFERENTE, NEGA, NAO, LOGICO, PARA_INTEIRO, PARA_FLUTUANTE, SALTA, SALTA_SE_FALSO,
+ SALTA_SE_VERDADEIRO, CHAMA, RETORNA, DESCARTA, LE, ESCREVE, ALOCA) = range(len(instrucoes))
+
+# Instruções de acesso a elementos por (número de índices, variável local)
+elementos_carrega = {
+    (1, True): CARREGA_ELEMENTO_LOCAL,
+    (1, False): CARREGA_ELEMENTO_GLOBAL,
+    (2, True): CARREGA_ELEMENTO2_LOCAL,
+    (2, False): CARREGA_ELEMENTO2_GLOBAL,
+}
+elementos_armazena = {
+    (1, True): ARMAZENA_ELEMENTO_LOCAL,
+    (1, False): ARMAZENA_ELEMENTO_GLOBAL,
+    (2, True): ARMAZENA_ELEMENTO2_LOCAL,
+    (2, False): ARMAZENA_ELEMENTO2_GLOBAL,
+}
+elementos = set(elementos_carrega.values()) | set(elementos_armazena.values())
+
+instrucoes_binarias = {
+    '+': SOMA,
+    '-': SUBTRAI,
+    '*': MULTIPLICA,
+    '<': MENOR,
+    '>': MAIOR,
+    '<=': MENOR_IGUAL,
+    '>=': MAIOR_IGUAL,
+    '=': IGUAL,
+    '<>': DIFERENTE,
+}
+
+
+# Função traduzida: nome, tipo de retorno, número de parâmetros, registro inicial, código e nomes das posições
+class FuncaoBytecode:
+
+    def __init__(self, nome, type, parametros, modelo, codigo, nomes):
+        self.nome = nome
+        self.type = type
+        self.parametros = parametros
+        self.modelo = modelo
+        self.codigo = codigo
+        self.nomes = nomes
+
+
+# Programa traduzido para bytecode; funcoes[inicio] aloca os arranjos globais, executa as inicializações e
+# chama principal
+class Bytecode:
+
+    def __init__(self, constantes, modeloGlobais, nomesGlobais, funcoes, inicio):
+        self.constantes = constantes
+        self.modeloGlobais = modeloGlobais
+        self.nomesGlobais = nomesGlobais
+        self.funcoes = funcoes
+        self.inicio = inicio
+
+    # Executa o programa; retorna o valor retornado por principal. arranjos: forma de armazenamento dos
+    # arranjos ('array' ou 'numpy', veja tpparranjos.py)
+    def executa(self, entrada=None, saida=None, arranjos='array'):
+        return executa(self, Leitor(sys.stdin if entrada is None else entrada), sys.stdout if saida is None else saida,
+                       arranjos)
+
+    # Serializa o programa (a ordem dos bytes do código é a da máquina que o gerou, registrada no cabeçalho)
+    def serializa(self):
+        funcoes = tuple((funcao.nome, funcao.type, funcao.parametros, tuple(funcao.modelo), funcao.codigo.tobytes(),
+                         tuple(funcao.nomes)) for funcao in self.funcoes)
+        return assinatura + marshal.dumps((versao, sys.byteorder, tuple(self.constantes), tuple(self.modeloGlobais),
+                                           tuple(self.nomesGlobais), funcoes, self.inicio))
+
+    # Texto do bytecode, uma instrução por linha
+    def lista(self):
+        linhas = []
+        for indice, funcao in enumerate(self.funcoes):
+            linhas.append('%d %s (%d parâmetros, %d posições)' % (indice, funcao.nome or '<inicio>',
+                                                                 funcao.parametros, len(funcao.modelo)))
+            codigo = funcao.codigo
+            ip = 0
+            while ip < len(codigo):
+                instrucao = codigo[ip]
+                operandos = list(codigo[ip + 1:ip + 1 + operandos_instrucoes[instrucao]])
+                descricao = ''
+                if instrucao in (CONSTANTE, LE):
+                    descricao = repr(self.constantes[operandos[0]])
+                elif instrucao == ALOCA:
+                    descricao = self.constantes[operandos[2]]
+                elif instrucao in elementos:
+                    descricao = self.constantes[operandos[1]]
+                elif instrucao in (CARREGA_LOCAL, ARMAZENA_LOCAL):
+                    descricao = funcao.nomes[operandos[0]]
+                elif instrucao in (CARREGA_GLOBAL, ARMAZENA_GLOBAL):
+                    descricao = self.nomesGlobais[operandos[0]]
+                elif instrucao == CHAMA:
+                    descricao = self.funcoes[operandos[0]].nome
+                linhas.append('  %4d %-20s %-10s %s' % (ip, nomes_instrucoes[instrucao],
+                                                        ' '.join(map(str, operandos)), descricao))
+                ip += 1 + operandos_instrucoes[instrucao]
+        return '\n'.join(linhas)
+
+
+# Carrega o programa serializado; retorna None se os dados não forem de um bytecode desta versão
+def carrega(dados):
+    if not dados.startswith(assinatura):
+        return None
+    try:
+        conteudo = marshal.loads(dados[len(assinatura):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(conteudo, tuple) or len(conteudo) != 7 or conteudo[0] != versao:
+        return None
+    versaoArquivo, ordem, constantes, modeloGlobais, nomesGlobais, funcoes, inicio = conteudo
+    traduzidas = []
+    for nome, type, parametros, modelo, codigo, nomes in funcoes:
+        instrucoes = array.array('i')
+        instrucoes.frombytes(codigo)
+        if ordem != sys.byteorder:
+            instrucoes.byteswap()
+        traduzidas.append(FuncaoBytecode(nome, type, parametros, list(modelo), instrucoes, list(nomes)))
+    return Bytecode(list(constantes), list(modeloGlobais), list(nomesGlobais), traduzidas, inicio)
+
+
+# Tradução da árvore podada para bytecode
+class Tradutor:
+
+    def __init__(self, root):
+        self.leiaute = Leiaute(root)
+        self.constantes = []
+        self.indiceConstantes = {}
+        self.funcao = None
+        self.codigo = None
+        self.indiceFuncoes = {nome: indice for indice, nome in enumerate(self.leiaute.funcoes)}
+
+    def traduz(self):
+        leiaute = self.leiaute
+        funcoes = []
+        for funcao in leiaute.funcoes.values():
+            self.funcao = funcao
+            self.codigo = []
+            self.alocaArranjosLocais(funcao)
+            self.traduzBloco(funcao.corpo)
+            # Retorno ao fim do corpo, sem retorna: o zero do tipo da função
+            self.emite(CONSTANTE, self.constante(zero(funcao.type) if funcao.type != 'vazio' else None))
+            self.emite(RETORNA)
+            funcoes.append(self.funcaoTraduzida(funcao.nome, funcao.type, len(funcao.parametros), funcao.modelo,
+                                                [variavel.nome for variavel in funcao.variaveis.values()]))
+
+        # Inicialização: arranjos globais e inicializações, na ordem do programa, e a chamada de principal
+        self.funcao = None
+        self.codigo = []
+        for item in leiaute.inicializacoes:
+            if isinstance(item, Variavel):
+                self.alocaArranjo(item)
+            else:
+                self.traduzAtribuicao(item)
+        self.emite(CHAMA, self.indiceFuncoes['principal'])
+        self.emite(RETORNA)
+        funcoes.append(self.funcaoTraduzida('', 'vazio', 0, [], []))
+
+        return Bytecode(self.constantes, list(leiaute.modeloGlobais), list(leiaute.globais), funcoes,
+                        len(funcoes) - 1)
+
+    def funcaoTraduzida(self, nome, type, parametros, modelo, nomes):
+        return FuncaoBytecode(nome, type, parametros, list(modelo), array.array('i', self.codigo), nomes)
+
+    def emite(self, *codigo):
+        self.codigo.extend(codigo)
+        return len(self.codigo) - 1
+
+    # Índice da constante (números e nomes), compartilhado pelos valores iguais do mesmo tipo
+    def constante(self, valor):
+        chave = (type(valor), valor)
+        if chave not in self.indiceConstantes:
+            self.indiceConstantes[chave] = len(self.constantes)
+            self.constantes.append(valor)
+        return self.indiceConstantes[chave]
+
+    # Saltos: emite o salto com o destino a preencher e devolve a posição do operando
+    def salto(self, instrucao):
+        return self.emite(instrucao, -1)
+
+    def marca(self, *operandos):
+        for operando in operandos:
+            self.codigo[operando] = len(self.codigo)
+
+    def busca(self, nome):
+        return self.leiaute.busca(nome, self.funcao)
+
+    # Arranjos
+
+    def alocaArranjosLocais(self, funcao):
+        for variavel in funcao.arranjos:
+            self.alocaArranjo(variavel)
+
+    def alocaArranjo(self, variavel):
+        for node in variavel.tamanhos:
+            self.traduzExpressao(node, 'inteiro')
+        self.emite(ALOCA, variavel.dimensoes, 1 if variavel.type == 'flutuante' else 0, self.constante(variavel.nome))
+        self.emite(ARMAZENA_LOCAL if variavel.local else ARMAZENA_GLOBAL, variavel.slot)
+
+    # Ações
+
+    # Traduz o bloco com uma pilha de pendências (ações, blocos internos e o que vem depois deles), sem usar a
+    # pilha do Python nos blocos aninhados
+    def traduzBloco(self, corpo):
+        pendentes = [corpo]
+        while pendentes:
+            item = pendentes.pop()
+            if callable(item):
+                item()
+            elif item.name == 'corpo':
+                pendentes.extend(reversed(item.children))
+            else:
+                pendentes.extend(reversed(self.traduzAcao(item)))
+
+    # Traduz a ação; devolve o que ainda falta traduzir, em ordem: os blocos internos e as funções que emitem o
+    # código depois de cada um (saltos e a condição do repita)
+    def traduzAcao(self, node):
+        if node.name == 'declaracao_variaveis':
+            return []
+        if node.name == 'atribuicao':
+            self.traduzAtribuicao(node)
+        elif node.name == 'se':
+            self.traduzExpressao(node.children[1])
+            senao = self.salto(SALTA_SE_FALSO)
+            corpos = [child for child in node.children if child.name == 'corpo']
+            if len(corpos) == 1:
+                return [corpos[0], lambda: self.marca(senao)]
+            fim = []
+
+            def iniciaSenao():
+                fim.append(self.salto(SALTA))
+                self.marca(senao)
+            return [corpos[0], iniciaSenao, corpos[1], lambda: self.marca(*fim)]
+        elif node.name == 'repita':
+            inicio = len(self.codigo)
+
+            def condicao():
+                self.traduzExpressao(node.children[3])
+                self.emite(SALTA_SE_FALSO, inicio)
+            return [node.children[1], condicao]
+        elif node.name == 'leia':
+            var = node.children[2]
+            variavel = self.busca(var.children[0].name)
+            self.armazena(variavel, indices(var), lambda: self.emite(
+                LE, self.constante(variavel.nome), 1 if variavel.type == 'flutuante' else 0))
+        elif node.name == 'escreva':
+            self.traduzExpressao(node.children[2])
+            self.emite(ESCREVE)
+        elif node.name == 'retorna':
+            expressoes = [child for child in node.children if child.name == 'expressao']
+            if expressoes:
+                self.traduzExpressao(expressoes[0], self.funcao.type if self.funcao.type != 'vazio' else None)
+            else:
+                self.emite(CONSTANTE, self.constante(None))
+            self.emite(RETORNA)
+        elif node.name == 'expressao':
+            self.traduzExpressao(node)
+            self.emite(DESCARTA)
+        else:
+            raise erro('ERR-EXEC-NOT-SUPPORTED', node.name)
+        return []
+
+    def traduzAtribuicao(self, node):
+        variavel = self.busca(node.children[0].children[0].name)
+        self.armazena(variavel, indices(node.children[0]), lambda: self.traduzExpressao(node.children[2], variavel.type))
+
+    # Variáveis
+
+    def carregaVariavel(self, variavel):
+        self.emite(CARREGA_LOCAL if variavel.local else CARREGA_GLOBAL, variavel.slot)
+
+    # Empilha a variável, o elemento (todos os índices) ou a linha da matriz (um índice)
+    def carrega(self, variavel, posicoes):
+        if not posicoes:
+            self.carregaVariavel(variavel)
+            return
+        for node in posicoes:
+            self.traduzExpressao(node, 'inteiro')
+        self.emite(elementos_carrega[len(posicoes), variavel.local], variavel.slot, self.constante(variavel.nome))
+
+    # Atribui à variável ou ao elemento o valor empilhado pelo código que valor() emite
+    def armazena(self, variavel, posicoes, valor):
+        if not posicoes:
+            valor()
+            self.emite(ARMAZENA_LOCAL if variavel.local else ARMAZENA_GLOBAL, variavel.slot)
+            return
+        for node in posicoes:
+            self.traduzExpressao(node, 'inteiro')
+        valor()
+        self.emite(elementos_armazena[len(posicoes), variavel.local], variavel.slot, self.constante(variavel.nome))
+
+    # Expressões
+
+    # Traduz a expressão, convertendo o valor para o tipo destino (se informado); retorna o tipo do valor
+    def traduzExpressao(self, node, destino=None):
+        type = self.traduzTermo(analisaExpressao(node))
+        if destino == 'inteiro' and type == 'flutuante':
+            self.emite(PARA_INTEIRO)
+            return destino
+        if destino == 'flutuante' and type == 'inteiro':
+            self.emite(PARA_FLUTUANTE)
+            return destino
+        return type
+
+    # Traduz o termo com uma pilha de pendências (operandos e as funções que emitem o código de cada operador depois
+    # deles), sem usar a pilha do Python: o termo de uma expressão longa (a - b + c ...) é tão profundo quanto o
+    # número de operações. tipos tem os tipos dos valores empilhados; retorna o tipo do valor do termo
+    def traduzTermo(self, termo):
+        tipos = []
+        pendentes = [termo]
+        while pendentes:
+            item = pendentes.pop()
+            if callable(item):
+                item(tipos)
+            elif item[0] == 'numero':
+                self.emite(CONSTANTE, self.constante(item[1]))
+                tipos.append(item[2])
+            elif item[0] == 'var':
+                variavel = self.busca(item[1].children[0].name)
+                self.carrega(variavel, indices(item[1]))
+                tipos.append(variavel.type)
+            elif item[0] == 'chamada':
+                tipos.append(self.traduzChamada(item[1]))
+            elif item[0] == 'unario':
+                pendentes.extend([self.unario(item[1]), item[2]])
+            elif item[1] in ('&&', '||'):
+                primeiro, segundo = self.logico(item[1])
+                pendentes.extend([segundo, item[3], primeiro, item[2]])
+            else:
+                pendentes.extend([self.binario(item[1]), item[3], item[2]])
+        return tipos.pop()
+
+    # Código do operador unário, emitido depois do operando
+    def unario(self, operador):
+        def aplica(tipos):
+            if operador == '-':
+                self.emite(NEGA)
+            elif operador == '!':
+                self.emite(NAO)
+                tipos[-1] = 'inteiro'
+        return aplica
+
+    # Código do operador binário, emitido depois dos dois operandos
+    def binario(self, operador):
+        def aplica(tipos):
+            tipoDireita = tipos.pop()
+            tipoEsquerda = tipos.pop()
+            if operador == '/':
+                self.emite(DIVIDE_INTEIRO if tipoEsquerda == tipoDireita == 'inteiro' else DIVIDE)
+            else:
+                self.emite(instrucoes_binarias[operador])
+            tipos.append(tipoOperacao(operador, tipoEsquerda, tipoDireita))
+        return aplica
+
+    # && e || com avaliação em curto-circuito: o código emitido depois do primeiro operando (o salto que decide
+    # sem o segundo) e depois do segundo
+    def logico(self, operador):
+        curto = []
+
+        def depoisPrimeiro(tipos):
+            tipos.pop()
+            curto.append(self.salto(SALTA_SE_FALSO if operador == '&&' else SALTA_SE_VERDADEIRO))
+
+        def depoisSegundo(tipos):
+            tipos.pop()
+            self.emite(LOGICO)
+            fim = self.salto(SALTA)
+            self.marca(*curto)
+            self.emite(CONSTANTE, self.constante(0 if operador == '&&' else 1))
+            self.marca(fim)
+            tipos.append('inteiro')
+        return depoisPrimeiro, depoisSegundo
+
+    def traduzChamada(self, node):
+        funcao, expressoes = self.leiaute.chamada(node)
+        for parametro, expressao in zip(funcao.parametros, expressoes):
+            if parametro.dimensoes:
+                self.carrega(*self.leiaute.argumentoArranjo(parametro, funcao, expressao, self.funcao))
+            else:
+                self.traduzExpressao(expressao, parametro.type)
+        self.emite(CHAMA, self.indiceFuncoes[funcao.nome])
+        return funcao.type
+
+
+# Traduz a árvore podada de um programa para bytecode
+def traduzPrograma(root):
+    return Tradutor(root).traduz()
+
+
+# Máquina virtual: executa o bytecode a partir da função de inicialização
+def executa(programa, leitor, saida, arranjos='array'):
+    novoArranjo = tpparranjos.novoArranjo
+    constantes = programa.constantes
+    funcoes = [(funcao.codigo.tolist(), funcao.modelo, funcao.parametros) for funcao in programa.funcoes]
+    globais = list(programa.modeloGlobais)
+
+    codigo, modelo, parametros = funcoes[programa.inicio]
+    registro = []
+    pilha = []
+    chamadas = []
+    ip = 0
+    try:
+        while True:
+            instrucao = codigo[ip]
+            ip += 1
+            if instrucao == CARREGA_LOCAL:
+                pilha.append(registro[codigo[ip]])
+                ip += 1
+            elif instrucao == CONSTANTE:
+                pilha.append(constantes[codigo[ip]])
+                ip += 1
+            elif instrucao == ARMAZENA_LOCAL:
+                registro[codigo[ip]] = pilha.pop()
+                ip += 1
+            elif instrucao == SALTA_SE_FALSO:
+                if pilha.pop():
+                    ip += 1
+                else:
+                    ip = codigo[ip]
+            elif instrucao == CARREGA_ELEMENTO_LOCAL:
+                i = pilha[-1]
+                arranjo = registro[codigo[ip]]
+                if not 0 <= i < len(arranjo):
+                    raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', i, constantes[codigo[ip + 1]])
+                pilha[-1] = arranjo[i]
+                ip += 2
+            elif instrucao == SOMA:
+                b = pilha.pop()
+                pilha[-1] += b
+            elif instrucao == SUBTRAI:
+                b = pilha.pop()
+                pilha[-1] -= b
+            elif instrucao == MULTIPLICA:
+                b = pilha.pop()
+                pilha[-1] *= b
+            elif instrucao == MENOR:
+                b = pilha.pop()
+                pilha[-1] = 1 if pilha[-1] < b else 0
+            elif instrucao == MAIOR:
+                b = pilha.pop()
+                pilha[-1] = 1 if pilha[-1] > b else 0
+            elif instrucao == MENOR_IGUAL:
+                b = pilha.pop()
+                pilha[-1] = 1 if pilha[-1] <= b else 0
+            elif instrucao == MAIOR_IGUAL:
+                b = pilha.pop()
+                pilha[-1] = 1 if pilha[-1] >= b else 0
+            elif instrucao == IGUAL:
+                b = pilha.pop()
+                pilha[-1] = 1 if pilha[-1] == b else 0
+            elif instrucao == DIFERENTE:
+                b = pilha.pop()
+                pilha[-1] = 1 if pilha[-1] != b else 0
+            elif instrucao == ARMAZENA_ELEMENTO_LOCAL:
+                valor = pilha.pop()
+                i = pilha.pop()
+                arranjo = registro[codigo[ip]]
+                if not 0 <= i < len(arranjo):
+                    raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', i, constantes[codigo[ip + 1]])
+                arranjo[i] = valor
+                ip += 2
+            elif instrucao == CARREGA_GLOBAL:
+                pilha.append(globais[codigo[ip]])
+                ip += 1
+            elif instrucao == ARMAZENA_GLOBAL:
+                globais[codigo[ip]] = pilha.pop()
+                ip += 1
+            elif instrucao == SALTA:
+                ip = codigo[ip]
+            elif instrucao == CHAMA:
+                chamadas.append((codigo, ip + 1, registro))
+                if len(chamadas) > limite_chamadas:
+                    raise erro('ERR-EXEC-RECURSION', limite_chamadas)
+                codigo, modelo, parametros = funcoes[codigo[ip]]
+                registro = modelo[:]
+                if parametros:
+                    registro[:parametros] = pilha[-parametros:]
+                    del pilha[-parametros:]
+                ip = 0
+            elif instrucao == RETORNA:
+                if not chamadas:
+                    return pilha.pop()
+                codigo, ip, registro = chamadas.pop()
+            elif instrucao == CARREGA_ELEMENTO_GLOBAL:
+                i = pilha[-1]
+                arranjo = globais[codigo[ip]]
+                if not 0 <= i < len(arranjo):
+                    raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', i, constantes[codigo[ip + 1]])
+                pilha[-1] = arranjo[i]
+                ip += 2
+            elif instrucao == ARMAZENA_ELEMENTO_GLOBAL:
+                valor = pilha.pop()
+                i = pilha.pop()
+                arranjo = globais[codigo[ip]]
+                if not 0 <= i < len(arranjo):
+                    raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', i, constantes[codigo[ip + 1]])
+                arranjo[i] = valor
+                ip += 2
+            elif instrucao == CARREGA_ELEMENTO2_LOCAL or instrucao == CARREGA_ELEMENTO2_GLOBAL:
+                # Matriz em ordem por linhas (tpparranjos.Matriz)
+                j = pilha.pop()
+                i = pilha[-1]
+                matriz = (registro if instrucao == CARREGA_ELEMENTO2_LOCAL else globais)[codigo[ip]]
+                colunas = matriz.colunas
+                if not (0 <= i < matriz.linhas and 0 <= j < colunas):
+                    raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', '[%d][%d]' % (i, j), constantes[codigo[ip + 1]])
+                pilha[-1] = matriz.dados[i * colunas + j]
+                ip += 2
+            elif instrucao == ARMAZENA_ELEMENTO2_LOCAL or instrucao == ARMAZENA_ELEMENTO2_GLOBAL:
+                valor = pilha.pop()
+                j = pilha.pop()
+                i = pilha.pop()
+                matriz = (registro if instrucao == ARMAZENA_ELEMENTO2_LOCAL else globais)[codigo[ip]]
+                colunas = matriz.colunas
+                if not (0 <= i < matriz.linhas and 0 <= j < colunas):
+                    raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', '[%d][%d]' % (i, j), constantes[codigo[ip + 1]])
+                matriz.dados[i * colunas + j] = valor
+                ip += 2
+            elif instrucao == DIVIDE_INTEIRO:
+                b = pilha.pop()
+                pilha[-1] = divideInteiros(pilha[-1], b)
+            elif instrucao == DIVIDE:
+                b = pilha.pop()
+                pilha[-1] /= b
+            elif instrucao == NEGA:
+                pilha[-1] = -pilha[-1]
+            elif instrucao == NAO:
+                pilha[-1] = 0 if pilha[-1] else 1
+            elif instrucao == LOGICO:
+                pilha[-1] = 1 if pilha[-1] else 0
+            elif instrucao == SALTA_SE_VERDADEIRO:
+                if pilha.pop():
+                    ip = codigo[ip]
+                else:
+                    ip += 1
+            elif instrucao == PARA_INTEIRO:
+                pilha[-1] = int(pilha[-1])
+            elif instrucao == PARA_FLUTUANTE:
+                pilha[-1] = float(pilha[-1])
+            elif instrucao == DESCARTA:
+                pilha.pop()
+            elif instrucao == LE:
+                pilha.append(leitor.le(constantes[codigo[ip]], 'flutuante' if codigo[ip + 1] else 'inteiro'))
+                ip += 2
+            elif instrucao == ESCREVE:
+                saida.write('%s\n' % (pilha.pop(),))
+            elif instrucao == ALOCA:
+                dimensoes = codigo[ip]
+                tamanhos = pilha[-dimensoes:]
+                del pilha[-dimensoes:]
+                try:
+                    pilha.append(novoArranjo('flutuante' if codigo[ip + 1] else 'inteiro', tamanhos, arranjos))
+                except ValueError:
+                    raise erro('ERR-EXEC-ARRAY-SIZE', ''.join('[%d]' % m for m in tamanhos), constantes[codigo[ip + 2]]) from None
+                ip += 3
+            else:
+                raise erro('ERR-EXEC-NOT-SUPPORTED', instrucao)
+    except ZeroDivisionError:
+        raise erro('ERR-EXEC-DIV-ZERO') from None
+    except OverflowError:
+        raise erro('ERR-EXEC-OVERFLOW') from None
+    except (TypeError, ValueError) as e:
+        raise erro('ERR-EXEC-INVALID-OPERATION', e) from None
+
+
+# Grava o bytecode no arquivo (por renomeação, para que um leitor nunca veja o arquivo pela metade)
+def grava(programa, caminho):
+    temporario = '%s.%d.tmp' % (caminho, os.getpid())
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(programa.serializa())
+    os.replace(temporario, caminho)
+
+
+def le(caminho):
+    with open(caminho, 'rb') as arquivo:
+        return carrega(arquivo.read())
+
+
+# Caminho do bytecode do código-fonte no diretório de cache (pelo conteúdo do arquivo, pela gramática e pela
+# eliminação de código morto)
+def caminhoCache(arquivo, opcoes):
+    import hashlib
+    import tpptabelas
+    with open(arquivo, 'rb') as fonte:
+        resumo = hashlib.sha256(fonte.read())
+    resumo.update(('%d %s %s' % (versao, 'precedence' in opcoes, 'elimina' in opcoes)).encode())
+    return os.path.join(tpptabelas.pastaCache(), 'bytecode', resumo.hexdigest() + '.tppb')
+
+
+def main(parametros):
+    from main import separaOpcoes
+    from tppexecutor import compilaFonte, executaComEntrada
+
+    arquivos, opcoes = separaOpcoes(parametros)
+    if len(arquivos) != 1 or not arquivos[0].endswith(('.tpp', '.tppb')):
+        raise IOError(error_handler.newError(False, 'ERR-EXEC-BYTECODE-USE'))
+
+    programa = None
+    if arquivos[0].endswith('.tppb'):
+        programa = le(arquivos[0])
+        if programa is None:
+            raise IOError(error_handler.newError(False, 'ERR-EXEC-BYTECODE').format(arquivos[0]))
+    elif 'cache' in opcoes:
+        cache = caminhoCache(arquivos[0], opcoes)
+        programa = le(cache) if os.path.isfile(cache) else None
+
+    if programa is None:
+        programa = traduzPrograma(compilaFonte(arquivos[0], opcoes))
+        if 'cache' in opcoes:
+            try:
+                os.makedirs(os.path.dirname(cache), exist_ok=True)
+                grava(programa, cache)
+            except OSError:
+                pass
+    if opcoes.get('grava', True) is not True:
+        grava(programa, opcoes['grava'])
+    if 'lista' in opcoes:
+        sys.stderr.write(programa.lista() + '\n')
+    return executaComEntrada(programa, opcoes)
+
+
+if __name__ == "__main__":
+    retorno = main(sys.argv[1:])
+    sys.exit(retorno if isinstance(retorno, int) else 0)
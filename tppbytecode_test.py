@@ -0,0 +1,80 @@
+import io
+
+import pytest
+
+import tppbytecode
+import tppcompilador
+import tppexecutor
+from benchmarks.gerador import geraBlocosAninhados, geraExpressaoLonga
+from tppexecutor_test import bolha, expressoes, fatorial
+
+recursao = '''
+inteiro soma(inteiro: k)
+  se k = 0 então
+    retorna(0)
+  fim
+  retorna(k + soma(k - 1))
+fim
+
+inteiro principal()
+  inteiro: n
+  leia(n)
+  escreva(soma(n))
+  retorna(0)
+fim
+'''
+
+
+def traduz(fonte, gramatica='cascata'):
+    resultado = tppcompilador.compila(fonte, gramatica=gramatica)
+    assert resultado.sucesso(), resultado.erro
+    return tppbytecode.traduzPrograma(resultado.root)
+
+
+def executa(programa, entrada=''):
+    saida = io.StringIO()
+    retorno = programa.executa(io.StringIO(entrada), saida)
+    return retorno, saida.getvalue().split()
+
+
+@pytest.mark.parametrize('fonte, entrada', [(fatorial, '5'), (fatorial, '0'), (bolha, '5 3 8 1\n9 2\n7 4\n'),
+                                            (expressoes, '')])
+def test_001(fonte, entrada):
+    # Mesma saída e mesmo retorno do executor de closures
+    resultado = tppcompilador.compila(fonte)
+    esperado = executa(tppexecutor.compilaPrograma(resultado.root), entrada)
+    assert executa(traduz(fonte), entrada) == esperado
+    assert executa(traduz(fonte, 'precedencia'), entrada) == esperado
+
+
+def test_002():
+    # O bytecode serializado executa sem a árvore; dados de outro formato não são carregados
+    dados = traduz(bolha).serializa()
+    programa = tppbytecode.carrega(dados)
+    assert executa(programa, '8 7 6 5 4 3 2 1') == (9, ['1', '2', '3', '4', '5', '6', '7', '8'])
+    assert programa.serializa() == dados
+    assert tppbytecode.carrega(b'TPPB' + dados[8:]) is None
+    assert tppbytecode.carrega(dados[4:]) is None
+
+
+def test_003():
+    # A recursão usa a pilha de chamadas da máquina virtual, não a do Python
+    assert executa(traduz(recursao), '20000') == (0, [str(20000 * 20001 // 2)])
+
+
+def test_004():
+    # Erros de execução
+    with pytest.raises(tppexecutor.ErroExecucao, match="Índice 8 fora dos limites do arranjo 'v'"):
+        executa(traduz(bolha.replace('até i = 8\n  ordena', 'até i = 9\n  ordena')), '1 2 3 4 5 6 7 8 9')
+    with pytest.raises(tppexecutor.ErroExecucao, match='Fim da entrada'):
+        executa(traduz(fatorial))
+
+
+def test_005():
+    # Blocos se/repita profundamente aninhados: a tradução usa uma pilha de pendências, não a do Python
+    assert executa(traduz(geraBlocosAninhados(1500)), '5000') == (5001, [])
+
+
+def test_006():
+    # Expressão longa (x - 1 + x ...): a tradução do termo usa uma pilha de pendências, não a do Python
+    assert executa(traduz(geraExpressaoLonga(5000)), '3') == (5000, [])
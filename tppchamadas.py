@@ -0,0 +1,152 @@
+# Descrição: Grafo de chamadas do programa T++, montado uma única vez e consultado pelas verificações.
+#            Guarda, para cada função, as funções que ela chama e as que a chamam, com os sites de
+#            chamada (linha e número de argumentos), e responde às consultas:
+#              - alcancaveis: funções alcançadas a partir de principal (ou de outras raízes);
+#              - componentes: componentes fortemente conexos (algoritmo de Tarjan, iterativo), em ordem
+#                topológica reversa (cada componente vem depois dos que ele chama);
+#              - recursivas: funções que fazem parte de um ciclo de chamadas (recursão direta ou mútua);
+#              - grauEntrada / grauSaida: número de funções diferentes que chamam / são chamadas.
+#
+#            O grafo não depende da forma da árvore: a análise semântica (tppsema.grafoChamadas) o monta a
+#            partir da árvore sintática e a eliminação de código morto (tppelimina.grafoChamadas) a partir da
+#            organização do programa da execução. As chamadas nas inicializações globais têm chamador None.
+
+
+# Site de chamada: chamador (None nas declarações globais), função chamada, linha do nome da função,
+# número de argumentos (None se a lista tiver erro), nó chamada_funcao e declaração onde está a chamada
+class Chamada:
+    __slots__ = ('chamador', 'funcao', 'linha', 'argumentos', 'node', 'declaracao')
+
+    def __init__(self, chamador, funcao, linha=None, argumentos=None, node=None, declaracao=None):
+        self.chamador = chamador
+        self.funcao = funcao
+        self.linha = linha
+        self.argumentos = argumentos
+        self.node = node
+        self.declaracao = declaracao
+
+    def __repr__(self):
+        return 'Chamada(%r -> %r, linha %r)' % (self.chamador, self.funcao, self.linha)
+
+
+class GrafoChamadas:
+    def __init__(self):
+        # Funções declaradas, na ordem da primeira declaração
+        self.funcoes = []
+        # Sites de chamada, na ordem do código-fonte
+        self.chamadas = []
+        # {chamador: {função chamada: [Chamada]}} e {função chamada: {chamador: [Chamada]}}
+        self.sucessores = {}
+        self.predecessores = {}
+        # {id do nó da declaração: [Chamada]}
+        self.porDeclaracao = {}
+        self._componentes = None
+
+    def declara(self, nome):
+        if nome not in self.sucessores:
+            self.funcoes.append(nome)
+            self.sucessores[nome] = {}
+            self.predecessores.setdefault(nome, {})
+
+    def adiciona(self, chamada):
+        self.chamadas.append(chamada)
+        self.sucessores.setdefault(chamada.chamador, {}).setdefault(chamada.funcao, []).append(chamada)
+        self.predecessores.setdefault(chamada.funcao, {}).setdefault(chamada.chamador, []).append(chamada)
+        if chamada.declaracao is not None:
+            self.porDeclaracao.setdefault(id(chamada.declaracao), []).append(chamada)
+        self._componentes = None
+
+    # Funções chamadas pela função (None: pelas declarações globais)
+    def chamados(self, nome):
+        return list(self.sucessores.get(nome, {}))
+
+    # Funções que chamam a função (None: as declarações globais)
+    def chamadores(self, nome):
+        return list(self.predecessores.get(nome, {}))
+
+    def grauSaida(self, nome):
+        return len(self.sucessores.get(nome, {}))
+
+    def grauEntrada(self, nome):
+        return len(self.predecessores.get(nome, {}))
+
+    # Linhas das chamadas de chamador para funcao
+    def linhas(self, chamador, funcao):
+        return [chamada.linha for chamada in self.sucessores.get(chamador, {}).get(funcao, [])]
+
+    # Sites de chamada dentro de uma declaração
+    def chamadasEm(self, declaracao):
+        return self.porDeclaracao.get(id(declaracao), [])
+
+    # Funções declaradas alcançadas a partir das raízes (por padrão principal e as inicializações globais)
+    def alcancaveis(self, raizes=('principal', None)):
+        pendentes = list(raizes)
+        visitadas = set()
+        while pendentes:
+            nome = pendentes.pop()
+            if nome not in visitadas and nome in self.sucessores:
+                visitadas.add(nome)
+                pendentes.extend(self.sucessores.get(nome, {}))
+        visitadas.discard(None)
+        return visitadas
+
+    # Componentes fortemente conexos das funções declaradas (listas de nomes), em ordem topológica reversa
+    def componentes(self):
+        if self._componentes is not None:
+            return self._componentes
+        indice = {}
+        menor = {}
+        pilha = []
+        naPilha = set()
+        componentes = []
+        contador = 0
+        for inicio in self.funcoes:
+            if inicio in indice:
+                continue
+            # Cada quadro: (função, iterador das funções chamadas)
+            quadros = [(inicio, iter(self.sucessores[inicio]))]
+            indice[inicio] = menor[inicio] = contador
+            contador += 1
+            pilha.append(inicio)
+            naPilha.add(inicio)
+            while quadros:
+                nome, chamados = quadros[-1]
+                avancou = False
+                for chamado in chamados:
+                    if chamado not in self.sucessores:
+                        continue
+                    if chamado not in indice:
+                        indice[chamado] = menor[chamado] = contador
+                        contador += 1
+                        pilha.append(chamado)
+                        naPilha.add(chamado)
+                        quadros.append((chamado, iter(self.sucessores[chamado])))
+                        avancou = True
+                        break
+                    if chamado in naPilha:
+                        menor[nome] = min(menor[nome], indice[chamado])
+                if avancou:
+                    continue
+                quadros.pop()
+                if quadros:
+                    pai = quadros[-1][0]
+                    menor[pai] = min(menor[pai], menor[nome])
+                if menor[nome] == indice[nome]:
+                    componente = []
+                    while True:
+                        membro = pilha.pop()
+                        naPilha.discard(membro)
+                        componente.append(membro)
+                        if membro == nome:
+                            break
+                    componentes.append(componente[::-1])
+        self._componentes = componentes
+        return componentes
+
+    # Funções que participam de um ciclo de chamadas (recursão direta ou mútua)
+    def recursivas(self):
+        recursivas = set()
+        for componente in self.componentes():
+            if len(componente) > 1 or componente[0] in self.sucessores[componente[0]]:
+                recursivas.update(componente)
+        return recursivas
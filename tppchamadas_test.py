@@ -0,0 +1,101 @@
+import pytest
+
+import tppcompilador
+import tppelimina
+import tppexecutor
+import tppsema
+from tppchamadas import Chamada, GrafoChamadas
+
+mutuas = '''
+inteiro: inicial
+inicial := base(2)
+
+inteiro base(inteiro: n)
+  retorna(n * 10)
+fim
+
+inteiro par(inteiro: n)
+  se n = 0 então
+    retorna(1)
+  fim
+  retorna(impar(n - 1))
+fim
+
+inteiro impar(inteiro: n)
+  se n = 0 então
+    retorna(0)
+  fim
+  retorna(par(n - 1))
+fim
+
+inteiro solta(inteiro: n)
+  retorna(solta(n))
+fim
+
+inteiro principal()
+  escreva(par(inicial))
+  escreva(par(3))
+  retorna(0)
+fim
+'''
+
+chamadasErradas = '''
+inteiro soma(inteiro: a, inteiro: b)
+  retorna(a + b)
+fim
+
+inteiro principal()
+  inteiro: x
+  x := soma(1)
+  x := soma(1, 2, 3)
+  x := ausente(x)
+  x := principal()
+  retorna(x)
+fim
+'''
+
+
+def test_001():
+    # Sites de chamada com linha e número de argumentos; recursão mútua e direta; alcance a partir de principal
+    resultado = tppcompilador.compila(mutuas, poda=False)
+    grafo = tppsema.grafo
+    assert [(chamada.chamador, chamada.funcao, chamada.linha, chamada.argumentos) for chamada in grafo.chamadas] == [
+        (None, 'base', 3, 1), ('par', 'impar', 13, 1), ('impar', 'par', 20, 1), ('solta', 'solta', 24, 1),
+        ('principal', 'par', 28, 1), ('principal', 'par', 29, 1)]
+    assert grafo.recursivas() == {'par', 'impar', 'solta'}
+    assert sorted(map(sorted, grafo.componentes())) == [['base'], ['impar', 'par'], ['principal'], ['solta']]
+    assert grafo.alcancaveis() == {'base', 'par', 'impar', 'principal'}
+    assert (grafo.grauEntrada('par'), grafo.grauSaida('principal')) == (2, 1)
+    assert grafo.linhas('principal', 'par') == [28, 29]
+    # solta só chama a si mesma: não é usada
+    assert resultado.chaves().count('WAR-SEM-FUNC-DECL-NOT-USED') == 1
+    assert "Função 'solta' declarada, mas não utilizada." in resultado.saida
+
+
+@pytest.mark.parametrize('trabalhadores', [1, 2])
+def test_002(trabalhadores):
+    # As verificações de chamadas consultam o grafo, também na verificação paralela por função
+    resultado = tppcompilador.compila(chamadasErradas, poda=False, trabalhadores=trabalhadores)
+    chaves = [chave for chave in resultado.chaves() if 'CALL' in chave]
+    assert chaves == ['ERR-SEM-CALL-FUNC-WITH-FEW-ARGS', 'ERR-SEM-CALL-FUNC-WITH-MANY-ARGS',
+                      'ERR-SEM-CALL-FUNC-NOT-DECL', 'WAR-SEM-CALL-REC-FUNC-MAIN', 'ERR-SEM-CALL-FUNC-MAIN-NOT-ALLOWED']
+
+
+def test_003():
+    # O grafo da organização do programa (eliminação de código morto) tem as mesmas arestas e linhas
+    resultado = tppcompilador.compila(mutuas)
+    grafo = tppelimina.grafoChamadas(tppexecutor.Leiaute(resultado.root, otimiza=False))
+    arestas = sorted((chamada.chamador or '', chamada.funcao, chamada.linha) for chamada in grafo.chamadas)
+    assert arestas == [('', 'base', 3), ('impar', 'par', 20), ('par', 'impar', 13), ('principal', 'par', 28),
+                       ('principal', 'par', 29), ('solta', 'solta', 24)]
+
+
+def test_004():
+    # Cadeia longa: a busca dos componentes não usa a pilha do Python
+    grafo = GrafoChamadas()
+    for i in range(5000):
+        grafo.declara('f%d' % i)
+        if i:
+            grafo.adiciona(Chamada('f%d' % (i - 1), 'f%d' % i))
+    grafo.adiciona(Chamada('f4999', 'f0'))
+    assert len(grafo.componentes()) == 1 and len(grafo.recursivas()) == 5000
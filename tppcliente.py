@@ -0,0 +1,66 @@
+# Descrição: Cliente do servidor de compilação T++ (tppd.py).
+#            Aceita os mesmos parâmetros do programa principal (main.py) e termina com o mesmo código
+#            de saída (0 sem erros, 1 com erro), mas quem compila é o servidor, que mantém o compilador
+#            carregado entre as chamadas. Sem servidor em execução, compila no próprio processo como o
+#            main.py. Não importa o compilador, para que cada chamada seja rápida.
+#
+#            Uso: python tppcliente.py [--socket=CAMINHO] arquivo.tpp [opções do main.py]
+#                 python tppcliente.py [--socket=CAMINHO] --encerra
+
+import json
+import os
+import socket
+import sys
+import tempfile
+
+
+# Caminho do socket do servidor: TPPD_SOCKET ou tppd-<uid>.sock no diretório de execução do usuário
+def caminhoSocket():
+    if os.environ.get('TPPD_SOCKET'):
+        return os.environ['TPPD_SOCKET']
+    pasta = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(pasta, 'tppd-%d.sock' % os.getuid())
+
+
+# Envia uma requisição ao servidor e devolve a resposta; lança OSError se o servidor não estiver em execução
+def envia(requisicao, caminho=None):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        conexao.connect(caminho or caminhoSocket())
+        conexao.sendall((json.dumps(requisicao, ensure_ascii=False) + '\n').encode('utf-8'))
+        conexao.shutdown(socket.SHUT_WR)
+        dados = b''.join(iter(lambda: conexao.recv(65536), b''))
+    return json.loads(dados.decode('utf-8'))
+
+
+def main(parametros):
+    caminho = None
+    argumentos = []
+    for parametro in parametros:
+        if parametro.startswith('--socket='):
+            caminho = parametro[len('--socket='):]
+        else:
+            argumentos.append(parametro)
+
+    if argumentos == ['--encerra']:
+        requisicao = {'comando': 'encerra'}
+    else:
+        requisicao = {'argumentos': argumentos, 'cwd': os.getcwd()}
+
+    try:
+        resposta = envia(requisicao, caminho)
+    except (FileNotFoundError, ConnectionRefusedError):
+        if 'comando' in requisicao:
+            sys.stderr.write('tppd: servidor não está em execução\n')
+            return 1
+        import main as programa
+        programa.main(argumentos)
+        return 0
+
+    sys.stdout.write(resposta.get('saida', ''))
+    if resposta.get('erro'):
+        sys.stderr.write(resposta['erro'])
+    return resposta['codigo']
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,175 @@
+# Descrição: API reentrante do compilador T++.
+#            Permite compilar vários programas no mesmo processo, reaproveitando o analisador léxico
+#            e as tabelas LALR já construídas, e devolve os diagnósticos capturados em vez de apenas
+#            imprimi-los. É usada pelo programa principal (main.py), pelo executor de testes
+#            (tppsuite.py) e pelos benchmarks.
+
+import contextlib
+import io
+from time import perf_counter, process_time
+
+import mytree
+import tpplex
+import tppparser
+import tppprecedencia
+import tppsema
+import tppestatisticas
+
+
+# Resultado de uma compilação
+class Compilacao:
+
+    def __init__(self, fonte):
+        self.fonte = fonte
+        self.root = None
+        self.tabela = None
+        self.diagnosticos = []
+        self.saida = ''
+        self.erro = None
+        self.faseErro = None
+        self.estatisticas = None
+        # O que a eliminação de código morto removeu (tppelimina.eliminaCodigoMorto), se pedida
+        self.eliminado = None
+        # Índice de referências cruzadas da análise semântica (tppreferencias.IndiceReferencias), montado antes da poda
+        self.referencias = None
+
+    # Chaves (ErrorMessages.properties) dos diagnósticos semânticos, na ordem em que foram emitidos
+    def chaves(self):
+        return [diagnostico['key'] for diagnostico in self.diagnosticos]
+
+    # Indica se a árvore sintática foi gerada
+    def arvoreGerada(self):
+        return self.root is not None and self.root.children != ()
+
+    def sucesso(self):
+        return self.erro is None and self.arvoreGerada()
+
+
+# Cria um analisador léxico novo para o código-fonte, sem alterar o analisador do módulo tpplex
+def novoLexer(fonte):
+    lexer = tpplex.lexer.clone()
+    lexer.lineno = 1
+    lexer.input(fonte)
+    return lexer
+
+
+# Retorna a lista de tokens do código-fonte
+def analisaLexico(fonte):
+    return list(iter(novoLexer(fonte).token, None))
+
+
+# Gramáticas de expressões disponíveis: a cascata original (tppparser.py) e a tabela de precedência
+# (tppprecedencia.py), construída apenas quando usada
+gramaticas = {
+    'cascata': lambda: tppparser.parser,
+    'precedencia': tppprecedencia.parser,
+}
+
+
+# Inicializa tudo o que o compilador constrói sob demanda (as tabelas LALR de todas as gramáticas); o
+# analisador léxico, a gramática em cascata e os catálogos de mensagens já são construídos na importação
+def precarrega():
+    for construtor in gramaticas.values():
+        construtor()
+
+
+# Executa a análise sintática; com estatísticas ativas separa o tempo do analisador léxico
+def analisaSintatico(lexer, estatisticas, gramatica='cascata'):
+    parser = gramaticas[gramatica]()
+    if estatisticas is None:
+        return parser.parse(lexer=lexer)
+
+    lexico = {'relogio': 0.0, 'cpu': 0.0, 'tokens': 0}
+
+    def proximoToken():
+        relogio = perf_counter()
+        cpu = process_time()
+        token = lexer.token()
+        lexico['relogio'] += perf_counter() - relogio
+        lexico['cpu'] += process_time() - cpu
+        if token is not None:
+            lexico['tokens'] += 1
+        return token
+
+    relogio = perf_counter()
+    cpu = process_time()
+    tree = parser.parse(lexer=lexer, tokenfunc=proximoToken)
+    relogio = perf_counter() - relogio
+    cpu = process_time() - cpu
+
+    estatisticas.adicionaTempo('lex', lexico['relogio'], lexico['cpu'])
+    estatisticas.adicionaTempo('parse', relogio - lexico['relogio'], cpu - lexico['cpu'])
+    estatisticas.conta('tokens', lexico['tokens'])
+    return tree
+
+
+# Executa as fases da compilação, registrando no resultado a fase em que ocorreu um erro
+def executaFases(resultado, poda, exportar, estatisticas, trabalhadores=1, gramatica='cascata', elimina=False):
+    resultado.faseErro = 'sintatica'
+    analisaSintatico(novoLexer(resultado.fonte), estatisticas, gramatica)
+    resultado.root = tppparser.root
+    if not resultado.arvoreGerada():
+        return
+    if exportar:
+        with tppestatisticas.fase('exportacao'):
+            tppparser.exportaArvore(exportar)
+
+    resultado.faseErro = 'semantica'
+    tppsema.root = resultado.root
+    resultado.tabela = tppsema.checkRules(trabalhadores)
+    resultado.referencias = tppsema.indiceReferencias()
+
+    if poda:
+        resultado.faseErro = 'poda'
+        resultado.eliminado = tppsema.podaArvore(exportar=bool(exportar), elimina=elimina)
+    resultado.faseErro = None
+
+
+# Compila o código-fonte: análise sintática, análise semântica e, opcionalmente, a poda da árvore.
+#   exportar: prefixo dos arquivos da árvore sintática (.unique.ast.png, .ast.dot, ...); None não exporta
+#   captura: captura a saída impressa pelo compilador em resultado.saida em vez de imprimi-la
+#   estatisticas: instância de tppestatisticas.Estatisticas que receberá tempos e contadores
+#   perfil: instância de tppestatisticas.PerfilRegras que receberá o custo de cada regra semântica
+#   trabalhadores: número de processos que verificam os corpos das funções em paralelo (1 = sequencial)
+#   gramatica: gramática de expressões ('cascata' ou 'precedencia')
+#   elimina: remove o código morto da árvore podada (tppelimina.py) antes de exportá-la
+def compila(fonte, poda=True, exportar=None, captura=True, estatisticas=None, perfil=None, trabalhadores=1,
+            gramatica='cascata', elimina=False):
+    resultado = Compilacao(fonte)
+    resultado.estatisticas = estatisticas
+    saida = io.StringIO()
+
+    tppparser.root = None
+    tppsema.reiniciaEstado()
+
+    anterior = tppestatisticas.ativa(estatisticas)
+    if perfil is not None:
+        tppsema.registraGancho(perfil)
+    nos = mytree.node_sequence
+    if estatisticas is not None:
+        mytree.tempo_criacao = 0.0
+
+    redirecionamento = contextlib.redirect_stdout(saida) if captura else contextlib.nullcontext()
+    try:
+        with redirecionamento:
+            executaFases(resultado, poda, exportar, estatisticas, trabalhadores, gramatica, elimina)
+    except Exception as e:
+        resultado.erro = e
+    finally:
+        tppestatisticas.ativa(anterior)
+        if perfil is not None:
+            tppsema.removeGancho(perfil)
+        if estatisticas is not None:
+            estatisticas.adicionaTempo('arvore', mytree.tempo_criacao, None)
+            estatisticas.conta('nos_criados', mytree.node_sequence - nos)
+            mytree.tempo_criacao = None
+
+    resultado.diagnosticos = list(tppsema.diagnosticos)
+    resultado.saida = saida.getvalue()
+    return resultado
+
+
+# Compila um arquivo .tpp
+def compilaArquivo(caminho, **opcoes):
+    with open(caminho, encoding='utf-8') as arquivo:
+        return compila(arquivo.read(), **opcoes)
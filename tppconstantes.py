@@ -0,0 +1,220 @@
+# Descrição: Dobra e propagação de constantes nas expressões da árvore podada.
+#            A poda deixa expressões como 2 * 3 + 4 como sequências infixas completas, avaliadas a cada
+#            execução. Este passo analisa cada expressão do programa (tppexecutor.analisaExpressao) e
+#            substitui as subexpressões formadas só por constantes pelo seu valor, com a mesma semântica
+#            da execução (promoção para flutuante, divisão de inteiros truncada, comparações e operações
+#            lógicas resultando em 1 ou 0; números em notação científica são flutuantes). Também propaga
+#            as variáveis globais constantes: as escalares nunca atribuídas (zero) e as atribuídas uma
+#            única vez, na inicialização global, com uma expressão constante.
+#
+#            Cada nó expressao recebe:
+#              termo: o termo da expressão já dobrado, usado por analisaExpressao no lugar de uma nova
+#                     análise (assim o executor, a máquina virtual e o gerador LLVM se beneficiam);
+#              constante: (valor, tipo) se a expressão inteira for constante, senão None.
+#
+#            Não são dobradas as operações que falhariam na execução (divisão por zero) nem as que
+#            produziriam inteiros fora de 64 bits; o erro fica para a execução. O passo é executado ao
+#            organizar o programa (tppexecutor.Leiaute).
+#
+#            valorExpressao avalia também expressões da árvore antes da poda (os tamanhos dos arranjos
+#            na tabela de símbolos, tppsema.processaVariavel).
+
+from mytree import preOrdem
+from tppexecutor import AnaliseExpressao, ErroExecucao, Variavel, divideInteiros, operadores, tipoOperacao, zero
+
+# Intervalo dos inteiros dobrados (o dos inteiros do código nativo, tppllvm.py)
+minimo_inteiro = -2 ** 63
+maximo_inteiro = 2 ** 63 - 1
+
+# Tokens numéricos da árvore sintática
+numeros = ('NUM_INTEIRO', 'NUM_PONTO_FLUTUANTE', 'NUM_NOTACAO_CIENTIFICA')
+
+
+# Valor da operação binária sobre as constantes, como na execução; None se não puder ser dobrada
+def calcula(operador, a, b, type):
+    if operador == '+':
+        valor = a + b
+    elif operador == '-':
+        valor = a - b
+    elif operador == '*':
+        valor = a * b
+    elif operador == '/':
+        if b == 0:
+            return None
+        valor = divideInteiros(a, b) if type == 'inteiro' else a / b
+    elif operador == '<':
+        valor = 1 if a < b else 0
+    elif operador == '>':
+        valor = 1 if a > b else 0
+    elif operador == '<=':
+        valor = 1 if a <= b else 0
+    elif operador == '>=':
+        valor = 1 if a >= b else 0
+    elif operador == '=':
+        valor = 1 if a == b else 0
+    elif operador == '<>':
+        valor = 1 if a != b else 0
+    elif operador == '&&':
+        valor = 1 if a and b else 0
+    else:
+        valor = 1 if a or b else 0
+    return valor
+
+
+def numero(valor, type):
+    if type == 'inteiro' and not minimo_inteiro <= valor <= maximo_inteiro:
+        return None
+    return ('numero', valor, type)
+
+
+# Constante convertida para o tipo da variável, como na atribuição; None se não couber em um inteiro
+def converte(valor, type):
+    if type == 'flutuante':
+        return ('numero', float(valor), type)
+    try:
+        return numero(int(valor), type)
+    except (OverflowError, ValueError):
+        return None
+
+
+# Dobra o termo (tppexecutor.analisaExpressao). constante(var): (valor, tipo) da variável, se for constante.
+# O termo é percorrido em pós-ordem com uma pilha explícita, pois o de uma expressão longa (a - b + c ...) é tão
+# profundo quanto o número de operações
+def dobraTermo(termo, constante):
+    dobrados = []
+    pendentes = [(termo, False)]
+    while pendentes:
+        termo, operandosDobrados = pendentes.pop()
+        if termo[0] not in ('unario', 'binario'):
+            dobrados.append(dobraOperando(termo, constante))
+        elif not operandosDobrados:
+            pendentes.append((termo, True))
+            pendentes.extend((operando, False) for operando in reversed(termo[2:]))
+        else:
+            quantidade = len(termo) - 2
+            operandos = dobrados[-quantidade:]
+            del dobrados[-quantidade:]
+            dobrados.append(dobraOperacao(termo, operandos))
+    return dobrados[0]
+
+
+# Dobra um operando: a variável constante vira o seu valor
+def dobraOperando(termo, constante):
+    if termo[0] == 'var':
+        valor = constante(termo[1])
+        return termo if valor is None else ('numero',) + valor
+    return termo
+
+
+# Dobra a operação unária ou binária do termo sobre os operandos já dobrados
+def dobraOperacao(termo, operandos):
+    if termo[0] == 'unario':
+        operando, = operandos
+        if operando[0] == 'numero':
+            valor, type = operando[1], operando[2]
+            if termo[1] == '-':
+                return numero(-valor, type) or ('unario', '-', operando)
+            if termo[1] == '!':
+                return ('numero', 0 if valor else 1, 'inteiro')
+            return operando
+        return ('unario', termo[1], operando)
+    operador = termo[1]
+    esquerda, direita = operandos
+    if esquerda[0] == 'numero' and direita[0] == 'numero':
+        type = tipoOperacao(operador, esquerda[2], direita[2])
+        valor = calcula(operador, esquerda[1], direita[1], type)
+        if valor is not None:
+            dobrado = numero(valor, type)
+            if dobrado is not None:
+                return dobrado
+    return ('binario', operador, esquerda, direita)
+
+
+# Dobra a expressão (nó expressao da árvore podada) e guarda no nó o termo dobrado e o valor constante
+def dobraExpressao(node, constante):
+    termo = dobraTermo(AnaliseExpressao(node.children).analisa(), constante)
+    node.termo = termo
+    node.constante = termo[1:] if termo[0] == 'numero' else None
+    return node.constante
+
+
+# Variáveis globais escalares atribuídas (atribuição ou leia) em cada ponto do programa: {Variavel: quantidade}
+def contaEscritas(leiaute):
+    escritas = {}
+
+    def escreve(var, funcao):
+        variavel = leiaute.busca(var.children[0].name, funcao)
+        if not variavel.local:
+            escritas[variavel] = escritas.get(variavel, 0) + 1
+
+    for item in leiaute.inicializacoes:
+        if not isinstance(item, Variavel):
+            escreve(item.children[0], None)
+    for funcao in leiaute.funcoes.values():
+        for node in preOrdem(funcao.corpo):
+            if node.name == 'atribuicao':
+                escreve(node.children[0], funcao)
+            elif node.name == 'leia' and node.children:
+                escreve(node.children[2], funcao)
+    return escritas
+
+
+# Dobra todas as expressões do programa organizado (tppexecutor.Leiaute), propagando as globais constantes
+def dobraConstantes(leiaute):
+    escritas = contaEscritas(leiaute)
+    conhecidas = {variavel: (zero(variavel.type), variavel.type) for variavel in leiaute.globais.values()
+                  if not variavel.dimensoes and variavel not in escritas}
+
+    def constanteEm(funcao, valores):
+        def constante(var):
+            if len(var.children) > 1:
+                return None
+            return valores.get(leiaute.busca(var.children[0].name, funcao))
+        return constante
+
+    # As inicializações globais, na ordem da execução: cada uma vê as constantes inicializadas antes dela. As
+    # funções chamadas por uma inicialização veem só as constantes inicializadas até ali
+    nasFuncoes = None
+    for item in leiaute.inicializacoes:
+        constante = constanteEm(None, conhecidas)
+        if isinstance(item, Variavel):
+            for node in item.tamanhos:
+                for expressao in [child for child in preOrdem(node) if child.name == 'expressao']:
+                    dobraExpressao(expressao, constante)
+            continue
+        if nasFuncoes is None and any(node.name == 'chamada_funcao' for node in preOrdem(item)):
+            nasFuncoes = dict(conhecidas)
+        for node in preOrdem(item):
+            if node.name == 'expressao':
+                dobraExpressao(node, constante)
+        variavel = leiaute.busca(item.children[0].children[0].name)
+        valor = item.children[2].constante
+        if not variavel.dimensoes and escritas.get(variavel) == 1 and valor is not None:
+            convertido = converte(valor[0], variavel.type)
+            if convertido is not None:
+                conhecidas[variavel] = convertido[1:]
+
+    nasFuncoes = conhecidas if nasFuncoes is None else nasFuncoes
+    for funcao in leiaute.funcoes.values():
+        constante = constanteEm(funcao, nasFuncoes)
+        for node in preOrdem(funcao.corpo):
+            if node.name == 'expressao':
+                dobraExpressao(node, constante)
+
+
+# Valor constante (valor, tipo) de uma expressão da árvore sintática antes da poda, ou None: as folhas da
+# expressão são os números e operadores da sequência infixa
+def valorExpressao(node):
+    tokens = []
+    for folha in preOrdem(node, filter_=lambda item: not item.children):
+        if folha.parent.name in numeros:
+            tokens.append(folha.parent)
+        elif folha.name in operadores:
+            tokens.append(folha)
+        else:
+            return None
+    try:
+        termo = dobraTermo(AnaliseExpressao(tokens).analisa(), lambda var: None)
+    except (ErroExecucao, ValueError):
+        return None
+    return termo[1:] if termo[0] == 'numero' else None
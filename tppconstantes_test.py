@@ -0,0 +1,116 @@
+import io
+
+import pytest
+
+import tppcompilador
+import tppconstantes
+import tppexecutor
+from benchmarks.gerador import geraExpressaoLonga
+
+constantes = '''
+inteiro: h
+inteiro: g
+flutuante: taxa
+inteiro: lidos
+h := g + 1
+g := 5
+taxa := 2
+
+inteiro dobro(inteiro: g)
+  retorna(g * 2)
+fim
+
+inteiro principal()
+  inteiro: a, zero
+  flutuante: x
+  a := 2 * 3 + 4
+  escreva(a)
+  escreva(-7 / 2)
+  x := 1.5e1 * 2
+  escreva(x)
+  escreva(2 < 3 && 1 <> 1 || !0)
+  escreva(a + 2 * 3)
+  escreva(g * taxa)
+  escreva(dobro(h))
+  leia(lidos)
+  escreva(lidos + g)
+  zero := 0
+  retorna(1 / zero)
+fim
+'''
+
+
+def compila(fonte, gramatica='cascata'):
+    resultado = tppcompilador.compila(fonte, gramatica=gramatica)
+    assert resultado.sucesso(), resultado.erro
+    return resultado.root
+
+
+# Nós expressao do programa, na ordem da árvore
+def expressoes(root):
+    return [node for node in root.descendants if node.name == 'expressao']
+
+
+@pytest.mark.parametrize('gramatica', ['cascata', 'precedencia'])
+def test_001(gramatica):
+    # Subexpressões constantes dobradas com a semântica da execução; globais constantes propagadas
+    root = compila(constantes, gramatica)
+    tppexecutor.Leiaute(root)
+    valores = [node.constante for node in expressoes(root)]
+    assert (10, 'inteiro') in valores
+    assert (-3, 'inteiro') in valores
+    assert (30.0, 'flutuante') in valores
+    assert (1, 'inteiro') in valores
+    # g := 5 e taxa := 2 só são atribuídas na inicialização: g * taxa vale 10.0
+    assert (10.0, 'flutuante') in valores
+    termos = [node.termo for node in expressoes(root) if node.constante is None]
+    # a + 2 * 3: só a subexpressão 2 * 3 é dobrada
+    assert any(termo[:2] == ('binario', '+') and termo[2][0] == 'var' and termo[3] == ('numero', 6, 'inteiro')
+               for termo in termos)
+
+    # A execução não muda: h := g + 1 vem antes de g := 5; o parâmetro g esconde a global; lidos é lida
+    saida = io.StringIO()
+    with pytest.raises(tppexecutor.ErroExecucao, match='Divisão por zero'):
+        tppexecutor.compilaPrograma(root).executa(io.StringIO('4'), saida)
+    assert saida.getvalue().split() == ['10', '-3', '30.0', '1', '16', '10.0', '2', '9']
+
+
+def test_002():
+    # Não são dobradas a divisão por zero nem as expressões com variáveis que não são constantes
+    root = compila(constantes)
+    tppexecutor.Leiaute(root)
+    nomes = {node.children[0].children[0].name: node.children[2] for node in root.descendants
+             if node.name == 'atribuicao'}
+    assert nomes['h'].constante is None
+    assert nomes['zero'].constante == (0, 'inteiro')
+    retorno = [node for node in root.descendants if node.name == 'retorna' and node.children][-1]
+    assert retorno.children[2].constante is None
+
+
+def test_003():
+    # Expressões antes da poda: os tamanhos dos arranjos na tabela de símbolos
+    resultado = tppcompilador.compila('''
+inteiro: v[2 * 3]
+inteiro: w[1.5 * 2]
+inteiro: m[4 / 2][1 + 1]
+
+inteiro principal()
+  v[0] := w[0] + m[0][0]
+  retorna(v[0])
+fim
+''')
+    tamanhos = {entrada['name']: (entrada['sizeDimension1'], entrada['sizeDimension2'])
+                for entrada in resultado.tabela if entrada['declarationType'] == 'var'}
+    assert tamanhos == {'v': ('6', 0), 'w': ('3.0', 0), 'm': ('2', '2')}
+    assert resultado.chaves().count('ERR-SEM-ARRAY-INDEX-NOT-INT') == 1
+    assert tppconstantes.valorExpressao(resultado.root.children[0]) is None
+
+
+def test_004():
+    # Expressões longas (x - 1 + x ...): o termo, tão profundo quanto o número de operações, é dobrado sem recursão
+    root = compila(geraExpressaoLonga(20000))
+    tppexecutor.Leiaute(root)
+    assert [node.constante for node in expressoes(root)] == [None, None]
+    root = compila('inteiro principal()\n  retorna(%s)\nfim\n' % ' + '.join(['2'] * 5000))
+    tppexecutor.Leiaute(root)
+    assert [node.constante for node in expressoes(root)] == [(10000, 'inteiro')]
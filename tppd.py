@@ -0,0 +1,123 @@
+# Descrição: Servidor de compilação T++ (tppd).
+#            Mantém o compilador carregado (analisador léxico, tabelas LALR e catálogos de mensagens)
+#            e atende requisições de compilação por um socket Unix local, para editores e ganchos de
+#            pre-commit que compilam os mesmos programas repetidamente. As requisições são atendidas
+#            uma de cada vez, pois o estado do compilador é global.
+#
+#            Protocolo: cada conexão envia uma requisição JSON (uma linha) e recebe uma resposta JSON:
+#              {"argumentos": [...], "cwd": "..."}   compila como o main.py com esses parâmetros
+#              {"fonte": "...", "opcoes": {...}}     compila o código-fonte (opções de tppcompilador.compila)
+#              {"comando": "ping"} ou {"comando": "encerra"}
+#            Resposta: {"codigo": 0 ou 1, "saida": "...", "erro": "...", "diagnosticos": [...]}
+#
+#            Uso: python tppd.py [--socket=CAMINHO]
+#            O cliente (tppcliente.py) aceita os mesmos parâmetros do main.py.
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+
+import main as programa
+import tppcompilador
+import tppsema
+from tppcliente import caminhoSocket
+
+
+class TratadorRequisicao(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        try:
+            requisicao = json.loads(self.rfile.readline().decode('utf-8'))
+            resposta = self.server.atende(requisicao)
+        except ValueError as e:
+            resposta = {'codigo': 1, 'saida': '', 'erro': 'requisição inválida: %s\n' % e, 'diagnosticos': []}
+        self.wfile.write((json.dumps(resposta, ensure_ascii=False) + '\n').encode('utf-8'))
+
+
+class ServidorCompilacao(socketserver.UnixStreamServer):
+
+    def __init__(self, caminho=None):
+        self.caminho = caminho or caminhoSocket()
+        self.ativo = True
+        removeSocketAbandonado(self.caminho)
+        super().__init__(self.caminho, TratadorRequisicao)
+
+    # Atende as requisições até receber o comando 'encerra'
+    def servir(self):
+        try:
+            while self.ativo:
+                self.handle_request()
+        finally:
+            self.server_close()
+            if os.path.exists(self.caminho):
+                os.unlink(self.caminho)
+
+    def atende(self, requisicao):
+        comando = requisicao.get('comando', 'compila')
+        if comando == 'ping':
+            return {'codigo': 0, 'pid': os.getpid()}
+        if comando == 'encerra':
+            self.ativo = False
+            return {'codigo': 0}
+        if comando != 'compila':
+            return {'codigo': 1, 'saida': '', 'erro': 'comando desconhecido: %s\n' % comando, 'diagnosticos': []}
+
+        resposta = {'codigo': 0, 'saida': '', 'erro': None, 'diagnosticos': []}
+        saida = io.StringIO()
+        diretorio = os.getcwd()
+        tppsema.reiniciaEstado()
+        try:
+            os.chdir(requisicao.get('cwd') or diretorio)
+            with contextlib.redirect_stdout(saida):
+                if 'fonte' in requisicao:
+                    resultado = tppcompilador.compila(requisicao['fonte'], captura=False,
+                                                      **requisicao.get('opcoes', {}))
+                    programa.verificaResultado(resultado)
+                elif any(argumento.startswith('--watch') for argumento in requisicao.get('argumentos', [])):
+                    raise ValueError('o modo de observação (--watch) não é atendido pelo servidor')
+                else:
+                    programa.main(requisicao.get('argumentos', []))
+        except Exception as e:
+            resposta['codigo'] = 1
+            resposta['erro'] = ''.join(traceback.format_exception_only(type(e), e))
+        finally:
+            os.chdir(diretorio)
+        resposta['saida'] = saida.getvalue()
+        resposta['diagnosticos'] = list(tppsema.diagnosticos)
+        return resposta
+
+
+# Remove o socket deixado por um servidor que terminou sem apagá-lo; falha se outro servidor o estiver usando
+def removeSocketAbandonado(caminho):
+    if not os.path.exists(caminho):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        try:
+            conexao.connect(caminho)
+        except ConnectionRefusedError:
+            os.unlink(caminho)
+            return
+    raise OSError('tppd: já existe um servidor em %s' % caminho)
+
+
+def main(parametros):
+    caminho = None
+    for parametro in parametros:
+        if parametro.startswith('--socket='):
+            caminho = parametro[len('--socket='):]
+
+    servidor = ServidorCompilacao(caminho)
+    signal.signal(signal.SIGTERM, lambda sinal, quadro: sys.exit(0))
+    print('tppd: aguardando requisições em %s' % servidor.caminho, flush=True)
+    servidor.servir()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+import contextlib
+import io
+import os
+import tempfile
+import threading
+
+import main as programa
+import tppcliente
+import tppd
+
+@contextlib.contextmanager
+def servidor():
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'tppd.sock')
+        servidor = tppd.ServidorCompilacao(caminho)
+        tarefa = threading.Thread(target=servidor.servir)
+        tarefa.start()
+        try:
+            yield caminho
+        finally:
+            tppcliente.envia({'comando': 'encerra'}, caminho)
+            tarefa.join()
+        assert not os.path.exists(caminho)
+
+def test_001():
+    # O servidor imprime o mesmo que o main.py e termina com o mesmo código
+    with servidor() as caminho:
+        for arquivo in ['tests/sema-001.tpp', 'tests/sema-017.tpp']:
+            resposta = tppcliente.envia({'argumentos': [arquivo, '--no-export'], 'cwd': os.getcwd()}, caminho)
+            saida = io.StringIO()
+            with contextlib.redirect_stdout(saida):
+                programa.main([arquivo, '--no-export'])
+            assert resposta['codigo'] == 0
+            assert resposta['saida'] == saida.getvalue()
+
+def test_002():
+    # Erros do main.py terminam com código 1 e a mensagem do erro
+    with servidor() as caminho:
+        resposta = tppcliente.envia({'argumentos': ['tests/nao-existe.tpp'], 'cwd': os.getcwd()}, caminho)
+        assert resposta['codigo'] == 1
+        assert resposta['erro'].startswith('OSError')
+        with open('tests/sema-017.tpp', encoding='utf-8') as arquivo:
+            resposta = tppcliente.envia({'fonte': arquivo.read()}, caminho)
+        assert resposta['codigo'] == 0
+        assert len(resposta['diagnosticos']) > 0
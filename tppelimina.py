@@ -0,0 +1,206 @@
+# Descrição: Eliminação de código morto na árvore podada (tppsema.podaArvore), antes da exportação da
+#            árvore podada e da geração de código. Remove:
+#              - as funções que não são alcançadas a partir de principal (nem das inicializações globais)
+#                pelo grafo de chamadas, e as declarações repetidas de uma função (só a primeira é usada);
+#              - as ações depois de um retorna no mesmo bloco (e depois de um se com os dois ramos
+#                terminados em retorna, ou de um repita cujo corpo termina em retorna); as declarações de
+#                variáveis são mantidas, pois valem para a função inteira;
+#              - as atribuições a variáveis que nunca são lidas, quando não chamam funções (repetindo
+#                enquanto a remoção de uma atribuição deixar outra variável sem leitura);
+#              - as declarações de variáveis que não são mais usadas (os parâmetros ficam).
+#
+#            Os usos são recalculados na árvore podada, com a organização do programa da execução
+#            (tppexecutor.Leiaute): as marcas de uso e inicialização da tabela de símbolos ficam em uma
+#            entrada por declaração e não distinguem as variáveis de uma declaração com vários nomes.
+#            O comportamento do programa não muda: leia e as chamadas de função são sempre mantidas.
+
+from mytree import preOrdem
+from tppchamadas import Chamada, GrafoChamadas
+from tppexecutor import ErroExecucao, Leiaute, Variavel, indices
+
+
+# Funções chamadas na subárvore
+def chamadas(node):
+    return {child.children[0].name for child in preOrdem(node) if child.name == 'chamada_funcao'}
+
+
+# Grafo de chamadas (tppchamadas.GrafoChamadas) do programa organizado; as chamadas nas inicializações globais
+# e nos tamanhos dos arranjos globais têm chamador None
+def grafoChamadas(leiaute):
+    grafo = GrafoChamadas()
+    for nome in leiaute.funcoes:
+        grafo.declara(nome)
+
+    def adiciona(chamador, node):
+        for child in preOrdem(node):
+            if child.name == 'chamada_funcao':
+                nome = child.children[0]
+                grafo.adiciona(Chamada(chamador, nome.name, nome.line, node=child))
+
+    for item in leiaute.inicializacoes:
+        for node in item.tamanhos if isinstance(item, Variavel) else [item]:
+            adiciona(None, node)
+    for nome, funcao in leiaute.funcoes.items():
+        adiciona(nome, funcao.corpo)
+    return grafo
+
+
+# Funções alcançadas a partir de principal e das chamadas nas inicializações globais
+def alcancaveis(leiaute):
+    return grafoChamadas(leiaute).alcancaveis()
+
+
+# Remove as ações depois de um retorna no bloco (nó corpo) e nos blocos internos; retorna se o bloco sempre
+# termina em retorna e o número de ações removidas. Os blocos são podados de dentro para fora (pré-ordem invertida),
+# sem recursão: cada bloco usa o resultado já calculado dos blocos dos seus se e repita
+def podaBloco(corpo):
+    resultados = {}
+    for bloco in reversed(list(preOrdem(corpo, filter_=lambda node: node.name == 'corpo'))):
+        resultados[id(bloco)] = podaAcoes(bloco, resultados)
+    return resultados[id(corpo)]
+
+
+# Remove as ações depois de um retorna no bloco; resultados tem (termina, removidas) dos blocos internos, contados
+# só quando a ação que os contém fica
+def podaAcoes(corpo, resultados):
+    acoes = []
+    termina = False
+    removidas = 0
+    for acao in corpo.children:
+        if termina and acao.name != 'declaracao_variaveis':
+            removidas += 1
+            continue
+        acoes.append(acao)
+        if acao.name == 'retorna':
+            termina = True
+        elif acao.name == 'se':
+            blocos = [resultados[id(child)] for child in acao.children if child.name == 'corpo']
+            removidas += sum(quantidade for _, quantidade in blocos)
+            termina = len(blocos) == 2 and all(terminado for terminado, _ in blocos)
+        elif acao.name == 'repita':
+            # O corpo do repita é executado ao menos uma vez
+            termina, quantidade = resultados[id(acao.children[1])]
+            removidas += quantidade
+    if len(acoes) < len(corpo.children):
+        corpo.children = acoes
+    return termina, removidas
+
+
+# Variáveis (Variavel) que aparecem na subárvore, além das próprias declarações: (variavel, lida). Uma variável é
+# lida quando aparece em uma expressão ou em leia; o destino de uma atribuição não é lido
+def ocorrencias(leiaute, node, funcao):
+    for var in preOrdem(node):
+        if var.name != 'var' or var.parent.name == 'lista_variaveis':
+            continue
+        lida = not (var.parent.name == 'atribuicao' and var.parent.children[0] is var)
+        yield leiaute.busca(var.children[0].name, funcao), lida
+
+
+# Usos das variáveis no programa: (lidas, usadas); lidas tem o número de leituras de cada Variavel e usadas é o
+# conjunto das que aparecem em qualquer lugar além da própria declaração
+def usos(leiaute):
+    lidas = {}
+    usadas = set()
+
+    def percorre(node, funcao):
+        for variavel, lida in ocorrencias(leiaute, node, funcao):
+            usadas.add(variavel)
+            if lida:
+                lidas[variavel] = lidas.get(variavel, 0) + 1
+
+    for item in leiaute.inicializacoes:
+        for node in item.tamanhos if isinstance(item, Variavel) else [item.parent]:
+            percorre(node, None)
+    for funcao in leiaute.funcoes.values():
+        percorre(funcao.corpo, funcao)
+    return lidas, usadas
+
+
+# Atribuições (nós atribuicao) do programa, com a função em que estão (None nas inicializações globais)
+def atribuicoes(leiaute):
+    for item in leiaute.inicializacoes:
+        if not isinstance(item, Variavel):
+            yield item, None
+    for funcao in leiaute.funcoes.values():
+        for node in preOrdem(funcao.corpo):
+            if node.name == 'atribuicao':
+                yield node, funcao
+
+
+# Remove o nó da lista de filhos do pai. Só o nó é desligado: atribuir a lista de filhos do pai desligaria e religaria
+# todos os irmãos
+def remove(node):
+    node.parent = None
+
+
+# Elimina o código morto da árvore podada. Retorna o que foi removido: {'funcoes': nomes, 'variaveis': nomes,
+# 'acoes': quantidade}; a árvore não é alterada se o programa não puder ser organizado ou usar variáveis não
+# declaradas
+def eliminaCodigoMorto(root):
+    removido = {'funcoes': [], 'variaveis': [], 'acoes': 0}
+    try:
+        leiaute = Leiaute(root, otimiza=False)
+        usos(leiaute)
+    except ErroExecucao:
+        return removido
+
+    # Funções não alcançadas e declarações repetidas
+    vivas = alcancaveis(leiaute)
+    declaracoes = root.children[0]
+    mantidas = []
+    for node in declaracoes.children:
+        if node.name == 'declaracao_funcao':
+            nome = [child.name for child in node.children]
+            nome = nome[nome.index('(') - 1]
+            if nome not in vivas or leiaute.funcoes[nome].node is not node:
+                removido['funcoes'].append(nome)
+                continue
+        mantidas.append(node)
+    declaracoes.children = mantidas
+
+    # Ações depois de retorna
+    for node in mantidas:
+        if node.name == 'declaracao_funcao':
+            removido['acoes'] += podaBloco([child for child in node.children if child.name == 'corpo'][0])[1]
+
+    # Atribuições a variáveis que não são lidas, com uma lista de trabalho: a remoção de uma atribuição desconta as
+    # leituras feitas por ela, e as variáveis que ficam sem leitura entram na lista
+    leiaute = Leiaute(root, otimiza=False)
+    lidas, usadas = usos(leiaute)
+    destinos = {}
+    for node, funcao in atribuicoes(leiaute):
+        variavel = leiaute.busca(node.children[0].children[0].name, funcao)
+        destinos.setdefault(variavel, []).append((node, funcao))
+    pendentes = [variavel for variavel in destinos if not lidas.get(variavel)]
+    while pendentes:
+        for node, funcao in destinos.pop(pendentes.pop(), []):
+            if chamadas(node):
+                continue
+            removida = node.parent if node.parent.name == 'inicializacao_variaveis' else node
+            for variavel, lida in ocorrencias(leiaute, removida, funcao):
+                if lida:
+                    lidas[variavel] -= 1
+                    if not lidas[variavel]:
+                        pendentes.append(variavel)
+            remove(removida)
+            removido['acoes'] += 1
+
+    # Declarações de variáveis sem uso
+    leiaute = Leiaute(root, otimiza=False)
+    lidas, usadas = usos(leiaute)
+    escopos = [(node, None) for node in declaracoes.children if node.name == 'declaracao_variaveis']
+    for funcao in leiaute.funcoes.values():
+        escopos.extend((node, funcao) for node in preOrdem(funcao.corpo) if node.name == 'declaracao_variaveis')
+    for declaracao, funcao in escopos:
+        lista = declaracao.children[2]
+        restantes = []
+        for var in lista.children:
+            variavel = leiaute.busca(var.children[0].name, funcao)
+            if variavel in usadas or any(chamadas(node) for node in indices(var)):
+                restantes.append(var)
+            else:
+                removido['variaveis'].append(variavel.nome)
+        lista.children = restantes
+        if not restantes:
+            remove(declaracao)
+    return removido
@@ -0,0 +1,109 @@
+import io
+import time
+
+import pytest
+
+import tppcompilador
+import tppelimina
+import tppexecutor
+from benchmarks.gerador import geraBlocosAninhados
+from tppexecutor_test import bolha, expressoes, fatorial
+
+morto = '''
+inteiro: usada, morta, so_escrita
+inteiro: tabela[10]
+usada := 3
+so_escrita := 4
+
+inteiro auxiliar(inteiro: x)
+  retorna(x + 1)
+fim
+
+inteiro biblioteca(inteiro: x)
+  retorna(auxiliar(x) * 2)
+fim
+
+inteiro efeito()
+  escreva(99)
+  retorna(1)
+fim
+
+inteiro principal()
+  inteiro: a, b, c, lixo
+  a := auxiliar(usada)
+  b := efeito()
+  c := a + 1
+  lixo := c
+  se a > 0 então
+    retorna(a)
+    escreva(1)
+  senão
+    retorna(0)
+  fim
+  escreva(2)
+  a := 5
+fim
+'''
+
+
+def executa(resultado, entrada=''):
+    saida = io.StringIO()
+    retorno = tppexecutor.compilaPrograma(resultado.root).executa(io.StringIO(entrada), saida)
+    return retorno, saida.getvalue()
+
+
+def nomes(root):
+    return {node.name for node in root.leaves}
+
+
+@pytest.mark.parametrize('gramatica', ['cascata', 'precedencia'])
+def test_001(gramatica):
+    # Funções não alcançadas, ações depois de retorna e variáveis sem leitura; efeito é chamada e fica
+    resultado = tppcompilador.compila(morto, gramatica=gramatica, elimina=True)
+    assert resultado.eliminado == {'funcoes': ['biblioteca'],
+                                   'variaveis': ['morta', 'so_escrita', 'tabela', 'c', 'lixo'], 'acoes': 6}
+    folhas = nomes(resultado.root)
+    assert 'biblioteca' not in folhas and 'lixo' not in folhas and 'efeito' in folhas and 'b' in folhas
+    escritas = [node for node in resultado.root.descendants if node.name == 'escreva' and node.children]
+    assert len(escritas) == 1
+    assert executa(resultado) == (4, '99\n')
+
+
+@pytest.mark.parametrize('fonte, entrada', [(fatorial, '5'), (bolha, '5 3 8 1\n9 2\n7 4\n'), (expressoes, ''),
+                                            (morto, '')])
+def test_002(fonte, entrada):
+    # A eliminação não muda a saída nem o retorno do programa
+    original = tppcompilador.compila(fonte)
+    eliminado = tppcompilador.compila(fonte, elimina=True)
+    assert original.eliminado is None
+    assert executa(eliminado, entrada) == executa(original, entrada)
+
+
+def test_003():
+    # Programa que não pode ser organizado para a execução: a árvore não muda
+    resultado = tppcompilador.compila(morto.replace('auxiliar(usada)', 'auxiliar(inexistente)'), elimina=True)
+    assert resultado.eliminado == {'funcoes': [], 'variaveis': [], 'acoes': 0}
+    assert 'biblioteca' in nomes(resultado.root)
+
+
+def test_004():
+    # Blocos se/repita profundamente aninhados: a poda das ações depois de retorna não usa a pilha do Python; o
+    # repita mais interno termina em retorna e o escreva depois dele é removido
+    fonte = geraBlocosAninhados(1500).replace('x := x + 1', 'repita\nx := x + 1\nretorna(x)\naté x > 0\nescreva(x)')
+    resultado = tppcompilador.compila(fonte, elimina=True)
+    assert resultado.eliminado == {'funcoes': [], 'variaveis': [], 'acoes': 1}
+    assert executa(resultado, '5000') == (5001, '')
+
+
+def test_005():
+    # Cadeia de atribuições sem leitura no final (x1 := x0 + 1, x2 := x1 + 1, ...): a remoção da última desconta
+    # a leitura da anterior, sem refazer o percurso do programa a cada rodada
+    linhas = ['inteiro principal()'] + ['  inteiro: x%d' % i for i in range(600)] + ['  leia(x0)']
+    linhas += ['  x%d := x%d + 1' % (i, i - 1) for i in range(1, 600)] + ['  retorna(0)', 'fim', '']
+    resultado = tppcompilador.compila('\n'.join(linhas))
+    inicio = time.perf_counter()
+    removido = tppelimina.eliminaCodigoMorto(resultado.root)
+    assert time.perf_counter() - inicio < 5
+    assert removido == {'funcoes': [], 'variaveis': ['x%d' % i for i in range(1, 600)], 'acoes': 599}
+    assert [child.name for child in resultado.root.children[0].children[0].children[5].children] == [
+        'declaracao_variaveis', 'leia', 'retorna']
@@ -0,0 +1,96 @@
+# Descrição: Distribuição do compilador T++ em um único arquivo (zipapp).
+#            Gera um .pyz com os módulos do compilador, as dependências (ply e anytree), os catálogos
+#            .properties e as tabelas pré-computadas (analisador léxico e tabelas LALR das duas
+#            gramáticas), regeneradas a partir das regras atuais. Os módulos também são incluídos
+#            compilados (.pyc que não verificam a fonte) para a versão do Python que gerou o arquivo;
+#            em outra versão os .py são usados. O .pyz carrega tudo de dentro do arquivo, sem construir
+#            tabelas nem gravar o cache ou arquivos .log, e aceita os mesmos parâmetros do main.py.
+#
+#            Uso: python tppempacota.py [--saida dist/tpp.pyz] [--interpretador "/usr/bin/env python3"]
+#                 python dist/tpp.pyz tests/<arquivo>.tpp [opções do main.py]
+
+import argparse
+import importlib.util
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+
+raiz = os.path.dirname(os.path.abspath(__file__))
+
+# Pacotes de terceiros incluídos no arquivo
+dependencias = ['ply', 'anytree']
+
+# Arquivos de dados lidos pelo compilador (tpptabelas.leRecurso)
+recursos = ['ErrorMessages.properties', 'SemaRules.properties']
+
+# Módulo principal do .pyz; o teste do __name__ evita que processos trabalhadores (spawn/forkserver), que
+# executam o principal como __mp_main__, iniciem uma nova compilação
+principal = '''import sys
+
+import main
+
+if __name__ == '__main__':
+    main.main(sys.argv[1:])
+'''
+
+
+# Módulos do compilador: os .py da raiz, exceto os testes e este programa
+def modulosCompilador():
+    return sorted(nome for nome in os.listdir(raiz)
+                  if nome.endswith('.py') and not nome.endswith('_test.py') and nome != os.path.basename(__file__))
+
+
+# Copia os arquivos do compilador, as dependências e as tabelas regeneradas para a pasta
+def preparaPasta(pasta):
+    for nome in modulosCompilador() + recursos:
+        shutil.copy2(os.path.join(raiz, nome), pasta)
+    for pacote in dependencias:
+        origem = importlib.util.find_spec(pacote).submodule_search_locations[0]
+        shutil.copytree(origem, os.path.join(pasta, pacote), ignore=shutil.ignore_patterns('__pycache__', '*.pyc'))
+    with open(os.path.join(pasta, '__main__.py'), 'w', encoding='utf-8') as arquivo:
+        arquivo.write(principal)
+
+    import tpplex
+    import tppparser
+    import tppprecedencia
+    tpplex.geraTabela(pasta)
+    tppparser.geraTabela(pasta)
+    tppprecedencia.geraTabela(pasta)
+
+
+# Compila os módulos da pasta para .pyc ao lado de cada .py (o formato procurado pelo zipimport)
+def compilaPasta(pasta):
+    for diretorio, subpastas, arquivos in os.walk(pasta):
+        for nome in arquivos:
+            if nome.endswith('.py'):
+                fonte = os.path.join(diretorio, nome)
+                py_compile.compile(fonte, cfile=fonte + 'c', dfile=os.path.relpath(fonte, pasta), doraise=True,
+                                   invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+
+# Gera o .pyz; retorna o caminho do arquivo gerado
+def empacota(saida, interpretador='/usr/bin/env python3'):
+    with tempfile.TemporaryDirectory() as pasta:
+        preparaPasta(pasta)
+        compilaPasta(pasta)
+        os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+        zipapp.create_archive(pasta, saida, interpreter=interpretador, compressed=True)
+    return saida
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python tppempacota.py',
+                                     description='Gera a distribuição do compilador T++ em um único arquivo.')
+    parser.add_argument('--saida', default=os.path.join(raiz, 'dist', 'tpp.pyz'), help='arquivo .pyz gerado')
+    parser.add_argument('--interpretador', default='/usr/bin/env python3', help='linha #! do arquivo gerado')
+    opcoes = parser.parse_args(args)
+
+    print(empacota(opcoes.saida, opcoes.interpretador))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+import tppempacota
+
+def test_001():
+    # O .pyz compila como o main.py sem construir tabelas nem gravar arquivos (diretório atual e cache vazios)
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = tppempacota.empacota(os.path.join(pasta, 'dist', 'tpp.pyz'))
+        atual = os.path.join(pasta, 'atual')
+        cache = os.path.join(pasta, 'cache')
+        os.mkdir(atual)
+        os.mkdir(cache)
+        ambiente = dict(os.environ, TPP_CACHE_DIR=cache)
+        fonte = os.path.abspath('tests/sema-002.tpp')
+
+        distribuido = subprocess.run([sys.executable, arquivo, fonte, '--no-export'], cwd=atual, env=ambiente,
+                                     capture_output=True, text=True)
+        codigo = subprocess.run([sys.executable, 'main.py', fonte, '--no-export'], env=ambiente,
+                                capture_output=True, text=True)
+
+        assert distribuido.returncode == codigo.returncode
+        assert distribuido.stdout == codigo.stdout
+        assert os.listdir(atual) == []
+        assert os.listdir(cache) == []
@@ -0,0 +1,103 @@
+# Descrição: Instrumentação do compilador T++.
+#            Registra o tempo de relógio e de CPU de cada fase da compilação (análise léxica, análise
+#            sintática, construção da árvore, regras semânticas, poda e exportação) e contadores
+#            (tokens, nós criados, consultas à tabela de símbolos, percursos na árvore, diagnósticos).
+#            A instrumentação só é ativada quando uma instância de Estatisticas está ativa; caso
+#            contrário as funções fase() e conta() não fazem nada. PerfilRegras detalha o custo
+#            (tempo e nós visitados) de cada regra semântica.
+
+import contextlib
+import json
+import time
+
+# Estatísticas da compilação em andamento (None quando a instrumentação está desligada)
+atual = None
+
+
+class Estatisticas:
+
+    def __init__(self):
+        self.fases = {}
+        self.contadores = {}
+
+    # Acumula o tempo de uma fase (cpu é None quando apenas o tempo de relógio é medido)
+    def adicionaTempo(self, nome, relogio, cpu):
+        fase = self.fases.setdefault(nome, {'relogio': 0.0, 'cpu': 0.0 if cpu is not None else None, 'chamadas': 0})
+        fase['relogio'] += relogio
+        if cpu is not None:
+            fase['cpu'] += cpu
+        fase['chamadas'] += 1
+
+    # Incrementa um contador
+    def conta(self, nome, quantidade=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def dicionario(self):
+        return {
+            'fases': self.fases,
+            'contadores': self.contadores
+        }
+
+    def json(self, indent=2):
+        return json.dumps(self.dicionario(), indent=indent, ensure_ascii=False)
+
+
+# Ativa as estatísticas de uma compilação; retorna as estatísticas que estavam ativas antes
+def ativa(estatisticas):
+    global atual
+    anterior = atual
+    atual = estatisticas
+    return anterior
+
+
+# Mede o tempo de um trecho de código como uma fase da compilação
+@contextlib.contextmanager
+def fase(nome):
+    estatisticas = atual
+    if estatisticas is None:
+        yield
+        return
+    relogio = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield
+    finally:
+        estatisticas.adicionaTempo(nome, time.perf_counter() - relogio, time.process_time() - cpu)
+
+
+# Incrementa um contador da compilação em andamento
+def conta(nome, quantidade=1):
+    if atual is not None:
+        atual.conta(nome, quantidade)
+
+
+# Perfil das regras semânticas: registrado como gancho em tppsema (registraGancho), acumula o tempo,
+# o número de execuções e os nós da árvore visitados por cada regra
+class PerfilRegras:
+
+    def __init__(self):
+        self.regras = {}
+        self._inicio = {}
+
+    def entrada(self, nome, visitas):
+        self._inicio[nome] = (time.perf_counter(), time.process_time(), visitas)
+
+    def saida(self, nome, visitas):
+        relogio, cpu, inicio = self._inicio.pop(nome)
+        regra = self.regras.setdefault(nome, {'relogio': 0.0, 'cpu': 0.0, 'nos_visitados': 0, 'chamadas': 0})
+        regra['relogio'] += time.perf_counter() - relogio
+        regra['cpu'] += time.process_time() - cpu
+        regra['nos_visitados'] += visitas - inicio
+        regra['chamadas'] += 1
+
+    def dicionario(self):
+        return self.regras
+
+    # Tabela com o custo de cada regra, da mais cara para a mais barata
+    def relatorio(self):
+        total = sum(regra['relogio'] for regra in self.regras.values()) or 1.0
+        linhas = ['%-20s %10s %7s %10s %14s' % ('regra', 'tempo (s)', '%', 'cpu (s)', 'nós visitados')]
+        for nome, regra in sorted(self.regras.items(), key=lambda item: -item[1]['relogio']):
+            linhas.append('%-20s %10.4f %6.1f%% %10.4f %14d' % (
+                nome, regra['relogio'], 100 * regra['relogio'] / total, regra['cpu'], regra['nos_visitados']))
+        return '\n'.join(linhas)
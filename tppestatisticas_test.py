@@ -0,0 +1,56 @@
+import copy
+
+import tppcompilador
+import tppsema
+import tppestatisticas
+from tppestatisticas import Estatisticas, PerfilRegras
+
+def compila_com_estatisticas(input_file):
+    estatisticas = Estatisticas()
+    resultado = tppcompilador.compilaArquivo('tests/' + input_file, estatisticas=estatisticas)
+    return resultado, estatisticas.dicionario()
+
+def test_001():
+    resultado, dados = compila_com_estatisticas("sema-017.tpp")
+    for fase in ['lex', 'parse', 'arvore', 'tabelaDeSimbolos', 'verificarVariavel', 'verificaChamada', 'podaArvore']:
+        assert fase in dados['fases']
+        assert dados['fases'][fase]['relogio'] >= 0
+
+def test_002():
+    resultado, dados = compila_com_estatisticas("sema-017.tpp")
+    contadores = dados['contadores']
+    assert contadores['tokens'] > 0
+    assert contadores['nos_criados'] > 0
+    assert contadores['consultas_simbolos'] > 0
+    assert contadores['percursos_arvore'] > 0
+    assert contadores['diagnosticos'] == len(resultado.diagnosticos)
+
+def test_003():
+    # As estatísticas são desativadas no fim da compilação: uma compilação seguinte sem estatísticas não registra
+    # nada nelas
+    estatisticas = Estatisticas()
+    tppcompilador.compilaArquivo('tests/sema-001.tpp', estatisticas=estatisticas)
+    antes = copy.deepcopy(estatisticas.dicionario())
+    assert antes['contadores']['tokens'] > 0
+    tppcompilador.compilaArquivo('tests/sema-001.tpp')
+    assert tppestatisticas.atual is None
+    assert estatisticas.dicionario() == antes
+
+def test_004():
+    # O perfil registra o custo de cada regra semântica
+    perfil = PerfilRegras()
+    tppcompilador.compilaArquivo('tests/sema-017.tpp', perfil=perfil)
+    regras = perfil.dicionario()
+    assert list(regras) == [nome for nome, regra in tppsema.regras]
+    assert regras['verificarVariavel']['nos_visitados'] > 0
+    assert tppsema.ganchos == []
+
+def test_005():
+    # Uma regra desabilitada não emite diagnósticos
+    tppsema.habilitaRegra('variavelEmUso', False)
+    try:
+        resultado = tppcompilador.compilaArquivo('tests/sema-017.tpp')
+    finally:
+        tppsema.habilitaRegra('variavelEmUso')
+    assert 'WAR-SEM-VAR-DECL-NOT-USED' not in resultado.chaves()
+    assert 'WAR-SEM-VAR-DECL-NOT-USED' in tppcompilador.compilaArquivo('tests/sema-017.tpp').chaves()
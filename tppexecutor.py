@@ -0,0 +1,785 @@
+# Descrição: Executor de programas T++ sobre a árvore podada (tppsema.podaArvore).
+#            Cada nó da árvore é compilado uma única vez em uma closure Python: as ações viram funções
+#            que recebem o registro de ativação da função em execução (uma lista, com as variáveis
+#            locais e os parâmetros em posições resolvidas na compilação) e as expressões, que na
+#            árvore podada são sequências infixas achatadas, são analisadas por precedência e viram
+#            funções que devolvem o valor. A execução não consulta o nome dos nós nem tabelas de
+#            símbolos: só chama as closures.
+#
+#            A organização do programa (Leiaute: variáveis globais, funções e posições das variáveis
+#            locais) e a análise das expressões (analisaExpressao) não dependem das closures e também
+#            são usadas pela máquina virtual (tppbytecode.py).
+#
+#            Semântica: inteiro e flutuante com promoção para flutuante; a divisão de inteiros trunca
+#            em direção a zero; comparações e operações lógicas resultam em 1 ou 0; a atribuição, os
+#            argumentos e o retorno convertem o valor para o tipo declarado; variáveis começam com
+#            zero; arranjos (blocos contíguos do tipo declarado, veja tpparranjos.py) são passados por
+#            referência. leia lê o próximo valor (separado por
+#            espaços ou linhas) da entrada e escreva imprime o valor em uma linha. O valor retornado
+#            por principal é o resultado da execução.
+#
+#            Uso: python tppexecutor.py programa.tpp [--entrada=arquivo] [--precedence] [--arranjos=array|numpy]
+#            (os diagnósticos da análise semântica vão para a saída de erros; a saída padrão é a do
+#            programa, e o código de saída é o valor retornado por principal)
+
+import sys
+
+import tpparranjos
+from myerror import MyError
+from mytree import preOrdem
+
+error_handler = MyError('ExecErrors')
+
+
+# Erro na compilação ou na execução de um programa
+class ErroExecucao(Exception):
+    pass
+
+
+def erro(key, *args):
+    return ErroExecucao(error_handler.newError(False, key).format(*args))
+
+
+# Limite de chamadas aninhadas do interpretador Python durante a execução; cada chamada de função T++ usa
+# algumas chamadas Python (a chamada, o bloco, a ação e a expressão)
+limite_recursao = 10000
+
+# Operadores binários por nível de precedência (do menor para o maior); todos associativos à esquerda
+niveis = [
+    ('&&', '||'),
+    ('<', '>', '<=', '>=', '=', '<>'),
+    ('+', '-'),
+    ('*', '/'),
+]
+unarios = ('+', '-', '!')
+operadores = {operador for nivel in niveis for operador in nivel} | set(unarios) | {'(', ')'}
+relacionais = niveis[1]
+logicos = niveis[0]
+
+# Closures dos operadores: recebem as closures dos operandos e devolvem a closure da operação
+binarios = {
+    '+': lambda a, b: lambda f: a(f) + b(f),
+    '-': lambda a, b: lambda f: a(f) - b(f),
+    '*': lambda a, b: lambda f: a(f) * b(f),
+    '<': lambda a, b: lambda f: 1 if a(f) < b(f) else 0,
+    '>': lambda a, b: lambda f: 1 if a(f) > b(f) else 0,
+    '<=': lambda a, b: lambda f: 1 if a(f) <= b(f) else 0,
+    '>=': lambda a, b: lambda f: 1 if a(f) >= b(f) else 0,
+    '=': lambda a, b: lambda f: 1 if a(f) == b(f) else 0,
+    '<>': lambda a, b: lambda f: 1 if a(f) != b(f) else 0,
+    '&&': lambda a, b: lambda f: 1 if a(f) and b(f) else 0,
+    '||': lambda a, b: lambda f: 1 if a(f) or b(f) else 0,
+}
+
+# Passos de uma sequência de operações (veja Programa.compilaSequencia): recebem o valor acumulado, a closure do
+# operando da direita e o registro
+passos = {
+    '+': lambda v, b, f: v + b(f),
+    '-': lambda v, b, f: v - b(f),
+    '*': lambda v, b, f: v * b(f),
+    '<': lambda v, b, f: 1 if v < b(f) else 0,
+    '>': lambda v, b, f: 1 if v > b(f) else 0,
+    '<=': lambda v, b, f: 1 if v <= b(f) else 0,
+    '>=': lambda v, b, f: 1 if v >= b(f) else 0,
+    '=': lambda v, b, f: 1 if v == b(f) else 0,
+    '<>': lambda v, b, f: 1 if v != b(f) else 0,
+    '&&': lambda v, b, f: 1 if v and b(f) else 0,
+    '||': lambda v, b, f: 1 if v or b(f) else 0,
+}
+
+# Número de operações em sequência à esquerda (a - b + c ...) a partir do qual a expressão é compilada em uma
+# única closure que aplica as operações em um laço; com uma closure aninhada por operação, a avaliação de uma
+# expressão longa esgotaria a pilha do Python
+limite_aninhamento = 64
+
+
+# Divisão de inteiros truncada em direção a zero
+def divideInteiros(a, b):
+    quociente = abs(a) // abs(b)
+    return quociente if (a < 0) == (b < 0) else -quociente
+
+
+# Tipo resultante de uma operação aritmética
+def promoveTipo(type1, type2):
+    return 'flutuante' if 'flutuante' in (type1, type2) else 'inteiro'
+
+
+# Tipo resultante de uma operação binária
+def tipoOperacao(operador, type1, type2):
+    if operador in relacionais or operador in logicos:
+        return 'inteiro'
+    return promoveTipo(type1, type2)
+
+
+# Closure que converte o valor da expressão (do tipo origem) para o tipo destino
+def converte(valor, origem, destino):
+    if destino == 'inteiro' and origem == 'flutuante':
+        return lambda f: int(valor(f))
+    if destino == 'flutuante' and origem == 'inteiro':
+        return lambda f: float(valor(f))
+    return valor
+
+
+def zero(type):
+    return 0.0 if type == 'flutuante' else 0
+
+
+# Variável de um programa: global (valores na lista de globais) ou local (no registro de ativação)
+class Variavel:
+
+    def __init__(self, nome, type, slot, local, dimensoes=0, tamanhos=()):
+        self.nome = nome
+        self.type = type
+        self.slot = slot
+        self.local = local
+        self.dimensoes = dimensoes
+        # Nós das expressões dos tamanhos (vazio para parâmetros arranjo, que recebem uma referência)
+        self.tamanhos = tamanhos
+
+
+# Função de um programa: parâmetros (nas primeiras posições do registro de ativação), variáveis locais e
+# o registro inicial (modelo); os arranjos locais são criados a cada chamada
+class Funcao:
+
+    def __init__(self, nome, type, node):
+        self.nome = nome
+        self.type = type
+        self.node = node
+        self.corpo = None
+        self.parametros = []
+        self.variaveis = {}
+        self.modelo = []
+        self.arranjos = []
+
+    def declara(self, nome, type, dimensoes=0, tamanhos=()):
+        if nome not in self.variaveis:
+            self.variaveis[nome] = Variavel(nome, type, len(self.modelo), True, dimensoes, tamanhos)
+            self.modelo.append(zero(type) if dimensoes == 0 else None)
+            if dimensoes and tamanhos:
+                self.arranjos.append(self.variaveis[nome])
+        return self.variaveis[nome]
+
+
+# Expressões dos índices de uma variável (nó var)
+def indices(var):
+    if len(var.children) < 2:
+        return []
+    return [node for node in var.children[1].children if node.name == 'expressao']
+
+
+# Variáveis de uma declaração: (nome, tipo, dimensões, nós das expressões dos tamanhos)
+def declaracoesVariaveis(node):
+    type = node.children[0].name
+    variaveis = []
+    for var in node.children[2].children:
+        tamanhos = indices(var)
+        variaveis.append((var.children[0].name, type, len(tamanhos), tamanhos))
+    return variaveis
+
+
+# Organização do programa da árvore podada: variáveis globais, funções e posições das variáveis
+#   globais: {nome: Variavel}; modeloGlobais: valores iniciais das globais
+#   inicializacoes: arranjos globais (Variavel) e inicializações (nó atribuicao), na ordem do programa
+#   funcoes: {nome: Funcao}, com o corpo (nó) e as variáveis locais de todo o corpo
+# otimiza: dobra e propaga as constantes das expressões (tppconstantes.py)
+class Leiaute:
+
+    def __init__(self, root, otimiza=True):
+        self.globais = {}
+        self.modeloGlobais = []
+        self.inicializacoes = []
+        self.funcoes = {}
+
+        declaracoes = root.children[0].children
+        if any(node.name == 'declaracao' for node in declaracoes):
+            raise erro('ERR-EXEC-NOT-PRUNED')
+        for node in declaracoes:
+            if node.name == 'declaracao_variaveis':
+                for nome, type, dimensoes, tamanhos in declaracoesVariaveis(node):
+                    if nome not in self.globais:
+                        self.globais[nome] = Variavel(nome, type, len(self.modeloGlobais), False, dimensoes, tamanhos)
+                        self.modeloGlobais.append(zero(type) if dimensoes == 0 else None)
+                        if dimensoes:
+                            self.inicializacoes.append(self.globais[nome])
+            elif node.name == 'inicializacao_variaveis':
+                self.inicializacoes.append(node.children[0])
+            elif node.name == 'declaracao_funcao':
+                self.declaraFuncao(node)
+            else:
+                raise erro('ERR-EXEC-NOT-SUPPORTED', node.name)
+        if 'principal' not in self.funcoes:
+            raise erro('ERR-EXEC-MAIN-NOT-DECL')
+        if otimiza:
+            import tppconstantes
+            tppconstantes.dobraConstantes(self)
+
+    def declaraFuncao(self, node):
+        nomes = [child.name for child in node.children]
+        posicao = nomes.index('(')
+        nome = nomes[posicao - 1]
+        if nome in self.funcoes:
+            return
+        funcao = Funcao(nome, nomes[0] if posicao == 2 else 'vazio', node)
+        for parametro in node.children[posicao + 1].children:
+            if parametro.name == 'parametro':
+                dimensoes = sum(1 for child in parametro.children if child.name == '[')
+                funcao.parametros.append(
+                    funcao.declara(parametro.children[2].name, parametro.children[0].name, dimensoes))
+        funcao.corpo = [child for child in node.children if child.name == 'corpo'][0]
+        for declaracao in preOrdem(funcao.corpo):
+            if declaracao.name == 'declaracao_variaveis':
+                for variavel in declaracoesVariaveis(declaracao):
+                    funcao.declara(*variavel)
+        self.funcoes[nome] = funcao
+
+    # Variável visível na função (local ou parâmetro, senão global)
+    def busca(self, nome, funcao=None):
+        if funcao is not None and nome in funcao.variaveis:
+            return funcao.variaveis[nome]
+        if nome in self.globais:
+            return self.globais[nome]
+        raise erro('ERR-EXEC-VAR-NOT-DECL', nome)
+
+    # Função chamada pelo nó chamada_funcao e as expressões dos argumentos, verificando a quantidade
+    def chamada(self, node):
+        nome = node.children[0].name
+        funcao = self.funcoes.get(nome)
+        if funcao is None:
+            raise erro('ERR-EXEC-FUNC-NOT-DECL', nome)
+        expressoes = [child for child in node.children[2].children if child.name == 'expressao']
+        if len(expressoes) != len(funcao.parametros):
+            raise erro('ERR-EXEC-CALL-ARGS', nome, len(expressoes), len(funcao.parametros))
+        return funcao, expressoes
+
+    # Arranjo (ou linha de uma matriz) passado ao parâmetro arranjo: a variável e os índices do argumento
+    def argumentoArranjo(self, parametro, funcao, expressao, chamador=None):
+        operandos = expressao.children
+        variavel = self.busca(operandos[0].children[0].name, chamador) if operandos[0].name == 'var' else None
+        posicoes = indices(operandos[0]) if variavel is not None else []
+        if len(operandos) != 1 or variavel is None or variavel.dimensoes - len(posicoes) != parametro.dimensoes:
+            raise erro('ERR-EXEC-ARRAY-ARG', parametro.nome, funcao.nome)
+        return variavel, posicoes
+
+
+# Análise de uma expressão da árvore podada (sequência infixa de operandos e operadores) por precedência.
+# Retorna o termo da expressão:
+#   ('numero', valor, tipo), ('var', nó var), ('chamada', nó chamada_funcao),
+#   ('unario', operador, termo) ou ('binario', operador, termo, termo)
+# Depois da dobra de constantes (tppconstantes.py) retorna o termo dobrado guardado no nó
+def analisaExpressao(node):
+    termo = getattr(node, 'termo', None)
+    if termo is not None:
+        return termo
+    return AnaliseExpressao(node.children).analisa()
+
+
+class AnaliseExpressao:
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.posicao = 0
+
+    def analisa(self):
+        termo = self.binaria(0)
+        if self.posicao != len(self.tokens):
+            raise erro('ERR-EXEC-NOT-SUPPORTED', self.tokens[self.posicao].name)
+        return termo
+
+    # Operador na posição atual (None se for um operando ou o fim da expressão)
+    def operador(self):
+        if self.posicao < len(self.tokens):
+            token = self.tokens[self.posicao]
+            if not token.children and token.name in operadores:
+                return token.name
+        return None
+
+    def binaria(self, nivel):
+        if nivel == len(niveis):
+            return self.unaria()
+        esquerda = self.binaria(nivel + 1)
+        while self.operador() in niveis[nivel]:
+            operador = self.operador()
+            self.posicao += 1
+            esquerda = ('binario', operador, esquerda, self.binaria(nivel + 1))
+        return esquerda
+
+    def unaria(self):
+        operador = self.operador()
+        if operador in unarios:
+            self.posicao += 1
+            return ('unario', operador, self.unaria())
+        if operador == '(':
+            self.posicao += 1
+            termo = self.binaria(0)
+            if self.operador() != ')':
+                raise erro('ERR-EXEC-NOT-SUPPORTED', '(')
+            self.posicao += 1
+            return termo
+        if self.posicao >= len(self.tokens) or operador is not None:
+            raise erro('ERR-EXEC-NOT-SUPPORTED', operador or 'expressao')
+        token = self.tokens[self.posicao]
+        self.posicao += 1
+        if token.name == 'NUM_INTEIRO':
+            return ('numero', int(token.children[0].name), 'inteiro')
+        if token.name in ('NUM_PONTO_FLUTUANTE', 'NUM_NOTACAO_CIENTIFICA'):
+            return ('numero', float(token.children[0].name), 'flutuante')
+        if token.name == 'var':
+            return ('var', token)
+        if token.name == 'chamada_funcao':
+            return ('chamada', token)
+        raise erro('ERR-EXEC-NOT-SUPPORTED', token.name)
+
+
+# Leitor dos valores da entrada (leia): um valor por vez, separados por espaços ou linhas
+class Leitor:
+
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self.palavras = []
+
+    def le(self, nome, type):
+        while not self.palavras:
+            linha = self.arquivo.readline()
+            if not linha:
+                raise erro('ERR-EXEC-READ-EOF', nome)
+            self.palavras = linha.split()[::-1]
+        palavra = self.palavras.pop()
+        try:
+            return int(palavra) if type == 'inteiro' else float(palavra)
+        except ValueError:
+            raise erro('ERR-EXEC-READ-INVALID', palavra, nome, type) from None
+
+
+# Estado de uma execução: as variáveis globais e a entrada e a saída do programa
+class Execucao:
+
+    def __init__(self):
+        self.globais = []
+        self.leitor = None
+        self.saida = None
+        self.arranjos = 'array'
+
+
+# Programa compilado em closures; pode ser executado várias vezes
+class Programa:
+
+    def __init__(self, root):
+        self.leiaute = Leiaute(root)
+        self.execucao = Execucao()
+        self.funcao = None
+        # Corpo compilado de cada função, preenchido depois de compilar todas (chamadas recursivas)
+        self.corpos = {}
+        # Blocos internos já compilados, à espera do se ou repita que os contém: {id(nó corpo): closure}
+        self.blocos = {}
+        self.inicializacao = [self.alocaArranjo(item) if isinstance(item, Variavel) else self.compilaAtribuicao(item)
+                              for item in self.leiaute.inicializacoes]
+        for funcao in self.leiaute.funcoes.values():
+            self.funcao = funcao
+            self.corpos[funcao.nome] = self.compilaBloco(funcao.corpo)
+        self.funcao = self.leiaute.funcoes['principal']
+        self.principal = self.chamada(self.funcao, [])
+        self.funcao = None
+
+    # Executa o programa; retorna o valor retornado por principal. arranjos: forma de armazenamento dos
+    # arranjos ('array' ou 'numpy', veja tpparranjos.py)
+    def executa(self, entrada=None, saida=None, arranjos='array'):
+        execucao = self.execucao
+        execucao.leitor = Leitor(sys.stdin if entrada is None else entrada)
+        execucao.saida = sys.stdout if saida is None else saida
+        execucao.arranjos = arranjos
+        execucao.globais[:] = self.leiaute.modeloGlobais
+        limite = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limite, limite_recursao))
+        try:
+            for acao in self.inicializacao:
+                acao(None)
+            return self.principal(None)
+        except ZeroDivisionError:
+            raise erro('ERR-EXEC-DIV-ZERO') from None
+        except RecursionError:
+            raise erro('ERR-EXEC-RECURSION', sys.getrecursionlimit()) from None
+        except OverflowError:
+            raise erro('ERR-EXEC-OVERFLOW') from None
+        except (TypeError, ValueError) as e:
+            raise erro('ERR-EXEC-INVALID-OPERATION', e) from None
+        finally:
+            sys.setrecursionlimit(limite)
+
+    # Closure que cria o arranjo da variável (tpparranjos.novoArranjo), com os tamanhos avaliados no registro
+    def alocaArranjo(self, variavel):
+        tamanhos = [self.converteExpressao(node, 'inteiro') for node in variavel.tamanhos]
+        type = variavel.type
+        nome = variavel.nome
+        slot = variavel.slot
+        execucao = self.execucao
+        globais = execucao.globais
+
+        def cria(f):
+            medidas = [tamanho(f) for tamanho in tamanhos]
+            try:
+                return tpparranjos.novoArranjo(type, medidas, execucao.arranjos)
+            except ValueError:
+                raise erro('ERR-EXEC-ARRAY-SIZE', ''.join('[%d]' % m for m in medidas), nome) from None
+
+        if variavel.local:
+            def aloca(f):
+                f[slot] = cria(f)
+        else:
+            def aloca(f):
+                globais[slot] = cria(f)
+        return aloca
+
+    def busca(self, nome):
+        return self.leiaute.busca(nome, self.funcao)
+
+    # Ações
+
+    # Compila o bloco; os blocos internos são compilados antes, do mais interno para o mais externo, para que a
+    # compilação de um bloco aninhado não use a pilha do Python
+    def compilaBloco(self, corpo):
+        if id(corpo) not in self.blocos:
+            internos = [node for node in preOrdem(corpo) if node.name == 'corpo']
+            for bloco in reversed(internos):
+                self.blocos[id(bloco)] = self.montaBloco(bloco)
+        return self.blocos.pop(id(corpo))
+
+    def montaBloco(self, corpo):
+        acoes = [acao for acao in map(self.compilaAcao, corpo.children) if acao is not None]
+        if not acoes:
+            return lambda f: None
+        if len(acoes) == 1:
+            return acoes[0]
+
+        def bloco(f):
+            for acao in acoes:
+                retorno = acao(f)
+                if retorno is not None:
+                    return retorno
+            return None
+        return bloco
+
+    # Compila uma ação em uma closure que devolve None ou, depois de um retorna, a tupla (valor,)
+    def compilaAcao(self, node):
+        if node.name == 'declaracao_variaveis':
+            return None
+        if node.name == 'atribuicao':
+            return self.compilaAtribuicao(node)
+        if node.name == 'se':
+            return self.compilaSe(node)
+        if node.name == 'repita':
+            return self.compilaRepita(node)
+        if node.name == 'leia':
+            return self.compilaLeia(node)
+        if node.name == 'escreva':
+            return self.compilaEscreva(node)
+        if node.name == 'retorna':
+            return self.compilaRetorna(node)
+        if node.name == 'expressao':
+            valor, type = self.compilaExpressao(node)
+
+            def acao(f):
+                valor(f)
+            return acao
+        raise erro('ERR-EXEC-NOT-SUPPORTED', node.name)
+
+    def compilaAtribuicao(self, node):
+        variavel = self.busca(node.children[0].children[0].name)
+        valor = self.converteExpressao(node.children[2], variavel.type)
+        return self.escrita(variavel, indices(node.children[0]), valor)
+
+    def compilaSe(self, node):
+        condicao, type = self.compilaExpressao(node.children[1])
+        corpos = [self.compilaBloco(child) for child in node.children if child.name == 'corpo']
+        entao = corpos[0]
+        if len(corpos) == 1:
+            def se(f):
+                if condicao(f):
+                    return entao(f)
+                return None
+        else:
+            senao = corpos[1]
+
+            def se(f):
+                if condicao(f):
+                    return entao(f)
+                return senao(f)
+        return se
+
+    def compilaRepita(self, node):
+        corpo = self.compilaBloco(node.children[1])
+        condicao, type = self.compilaExpressao(node.children[3])
+
+        def repita(f):
+            while True:
+                retorno = corpo(f)
+                if retorno is not None:
+                    return retorno
+                if condicao(f):
+                    return None
+        return repita
+
+    def compilaLeia(self, node):
+        var = node.children[2]
+        variavel = self.busca(var.children[0].name)
+        execucao = self.execucao
+        nome, type = variavel.nome, variavel.type
+        return self.escrita(variavel, indices(var), lambda f: execucao.leitor.le(nome, type))
+
+    def compilaEscreva(self, node):
+        valor, type = self.compilaExpressao(node.children[2])
+        execucao = self.execucao
+
+        def escreva(f):
+            execucao.saida.write('%s\n' % (valor(f),))
+        return escreva
+
+    def compilaRetorna(self, node):
+        funcao = self.funcao
+        expressoes = [child for child in node.children if child.name == 'expressao']
+        if not expressoes or funcao.type == 'vazio':
+            valor = self.compilaExpressao(expressoes[0])[0] if expressoes else (lambda f: None)
+        else:
+            valor = self.converteExpressao(expressoes[0], funcao.type)
+        return lambda f: (valor(f),)
+
+    # Variáveis
+
+    # Closure que lê a variável (o elemento, se houver índices, ou a referência ao arranjo; com um índice em uma
+    # matriz, a linha)
+    def leitura(self, variavel, indices):
+        slot = variavel.slot
+        nome = variavel.nome
+        globais = self.execucao.globais
+        if variavel.local:
+            if not indices:
+                return lambda f: f[slot]
+            arranjo = lambda f: f[slot]
+        else:
+            if not indices:
+                return lambda f: globais[slot]
+            arranjo = lambda f: globais[slot]
+
+        posicoes = [self.converteExpressao(node, 'inteiro') for node in indices]
+        if len(posicoes) == 1:
+            posicao, = posicoes
+
+            def le(f):
+                k = posicao(f)
+                try:
+                    if k >= 0:
+                        return arranjo(f)[k]
+                except IndexError:
+                    pass
+                raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', k, nome)
+            return le
+
+        # Elemento da matriz (tpparranjos.Matriz), na posição i * colunas + j do bloco
+        linha, coluna = posicoes
+
+        def le(f):
+            i = linha(f)
+            j = coluna(f)
+            matriz = arranjo(f)
+            if 0 <= i < matriz.linhas and 0 <= j < matriz.colunas:
+                return matriz.dados[i * matriz.colunas + j]
+            raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', '[%d][%d]' % (i, j), nome)
+        return le
+
+    # Closure que atribui o valor (já convertido para o tipo da variável) à variável ou ao elemento
+    def escrita(self, variavel, indices, valor):
+        slot = variavel.slot
+        nome = variavel.nome
+        globais = self.execucao.globais
+        if not indices:
+            if variavel.local:
+                def atribui(f):
+                    f[slot] = valor(f)
+            else:
+                def atribui(f):
+                    globais[slot] = valor(f)
+            return atribui
+
+        arranjo = (lambda f: f[slot]) if variavel.local else (lambda f: globais[slot])
+        posicoes = [self.converteExpressao(node, 'inteiro') for node in indices]
+        if len(posicoes) == 1:
+            posicao, = posicoes
+
+            def atribui(f):
+                k = posicao(f)
+                try:
+                    if k >= 0:
+                        arranjo(f)[k] = valor(f)
+                        return
+                except IndexError:
+                    pass
+                raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', k, nome)
+            return atribui
+
+        linha, coluna = posicoes
+
+        def atribui(f):
+            i = linha(f)
+            j = coluna(f)
+            matriz = arranjo(f)
+            if 0 <= i < matriz.linhas and 0 <= j < matriz.colunas:
+                matriz.dados[i * matriz.colunas + j] = valor(f)
+                return
+            raise erro('ERR-EXEC-INDEX-OUT-OF-RANGE', '[%d][%d]' % (i, j), nome)
+        return atribui
+
+    # Chamadas
+
+    # Closure que chama a função com os argumentos (closures que recebem o registro de quem chama)
+    def chamada(self, funcao, argumentos):
+        modelo = funcao.modelo
+        arranjos = [self.alocaArranjo(variavel) for variavel in funcao.arranjos]
+        padrao = zero(funcao.type) if funcao.type != 'vazio' else None
+        corpos = self.corpos
+        nome = funcao.nome
+
+        def chama(f):
+            registro = modelo[:]
+            k = 0
+            for argumento in argumentos:
+                registro[k] = argumento(f)
+                k += 1
+            for aloca in arranjos:
+                aloca(registro)
+            retorno = corpos[nome](registro)
+            return padrao if retorno is None else retorno[0]
+        return chama
+
+    def compilaChamada(self, node):
+        funcao, expressoes = self.leiaute.chamada(node)
+        argumentos = []
+        for parametro, expressao in zip(funcao.parametros, expressoes):
+            if parametro.dimensoes:
+                argumentos.append(self.leitura(*self.leiaute.argumentoArranjo(parametro, funcao, expressao,
+                                                                             self.funcao)))
+            else:
+                argumentos.append(self.converteExpressao(expressao, parametro.type))
+        # Os arranjos locais são alocados com os tamanhos avaliados no registro da função chamada
+        chamador, self.funcao = self.funcao, funcao
+        try:
+            return self.chamada(funcao, argumentos), funcao.type
+        finally:
+            self.funcao = chamador
+
+    # Expressões
+
+    # Compila a expressão; retorna a closure e o tipo do valor
+    def compilaExpressao(self, node):
+        return self.compilaTermo(analisaExpressao(node))
+
+    def converteExpressao(self, node, destino):
+        valor, type = self.compilaExpressao(node)
+        return converte(valor, type, destino)
+
+    def compilaTermo(self, termo):
+        if termo[0] == 'numero':
+            constante = termo[1]
+            return (lambda f: constante), termo[2]
+        if termo[0] == 'var':
+            variavel = self.busca(termo[1].children[0].name)
+            return self.leitura(variavel, indices(termo[1])), variavel.type
+        if termo[0] == 'chamada':
+            return self.compilaChamada(termo[1])
+        if termo[0] == 'unario':
+            valor, type = self.compilaTermo(termo[2])
+            if termo[1] == '-':
+                return (lambda a: lambda f: -a(f))(valor), type
+            if termo[1] == '!':
+                return (lambda a: lambda f: 0 if a(f) else 1)(valor), 'inteiro'
+            return valor, type
+
+        sequencia = []
+        while termo[0] == 'binario':
+            sequencia.append(termo)
+            termo = termo[2]
+        if len(sequencia) > limite_aninhamento:
+            return self.compilaSequencia(termo, sequencia[::-1])
+        termo = sequencia[0]
+
+        operador = termo[1]
+        esquerda, tipoEsquerda = self.compilaTermo(termo[2])
+        direita, tipoDireita = self.compilaTermo(termo[3])
+        if operador == '/':
+            if tipoEsquerda == tipoDireita == 'inteiro':
+                valor = (lambda a, b: lambda f: divideInteiros(a(f), b(f)))(esquerda, direita)
+            else:
+                valor = (lambda a, b: lambda f: a(f) / b(f))(esquerda, direita)
+        else:
+            valor = binarios[operador](esquerda, direita)
+        return valor, tipoOperacao(operador, tipoEsquerda, tipoDireita)
+
+    # Compila a sequência de operações binárias sobre o primeiro operando (os termos de baixo para cima, cada um com
+    # o resultado do anterior à esquerda) em uma closure que aplica os passos em um laço
+    def compilaSequencia(self, primeiro, sequencia):
+        inicial, type = self.compilaTermo(primeiro)
+        etapas = []
+        for termo in sequencia:
+            operador = termo[1]
+            direita, tipoDireita = self.compilaTermo(termo[3])
+            if operador != '/':
+                passo = passos[operador]
+            elif type == tipoDireita == 'inteiro':
+                passo = lambda v, b, f: divideInteiros(v, b(f))
+            else:
+                passo = lambda v, b, f: v / b(f)
+            etapas.append((passo, direita))
+            type = tipoOperacao(operador, type, tipoDireita)
+
+        def aplica(f):
+            valor = inicial(f)
+            for passo, direita in etapas:
+                valor = passo(valor, direita, f)
+            return valor
+        return aplica, type
+
+
+# Compila a árvore podada de um programa
+def compilaPrograma(root):
+    return Programa(root)
+
+
+# Compila o arquivo .tpp dos parâmetros da linha de comando e devolve a árvore podada; os diagnósticos
+# vão para a saída de erros. Também é usado pela máquina virtual (tppbytecode.py)
+def compilaFonte(arquivo, opcoes):
+    import tppcompilador
+    from main import verificaResultado
+
+    resultado = tppcompilador.compilaArquivo(arquivo, gramatica='precedencia' if 'precedence' in opcoes else 'cascata',
+                                             elimina='elimina' in opcoes)
+    sys.stderr.write(resultado.saida)
+    verificaResultado(resultado)
+    return resultado.root
+
+
+# Executa o programa com a entrada da opção --entrada (ou a entrada padrão) e os arranjos na forma da opção
+# --arranjos (array ou numpy)
+def executaComEntrada(programa, opcoes):
+    arranjos = opcoes.get('arranjos', 'array')
+    if arranjos not in tpparranjos.formas:
+        raise IOError(error_handler.newError(False, 'ERR-EXEC-ARRAY-FORM').format(arranjos))
+    if 'entrada' in opcoes:
+        with open(opcoes['entrada'], encoding='utf-8') as entrada:
+            return programa.executa(entrada, arranjos=arranjos)
+    return programa.executa(arranjos=arranjos)
+
+
+def main(parametros):
+    from main import separaOpcoes
+
+    arquivos, opcoes = separaOpcoes(parametros)
+    if len(arquivos) != 1 or not arquivos[0].endswith('.tpp'):
+        raise IOError(error_handler.newError(False, 'ERR-EXEC-USE'))
+    return executaComEntrada(compilaPrograma(compilaFonte(arquivos[0], opcoes)), opcoes)
+
+
+if __name__ == "__main__":
+    # Executado como script, este arquivo é o módulo __main__; a execução usa o módulo tppexecutor importado, o
+    # mesmo de tppconstantes, tppelimina e tppbytecode (senão a organização do programa teria classes Variavel
+    # diferentes das que esses módulos conhecem)
+    import tppexecutor
+    retorno = tppexecutor.main(sys.argv[1:])
+    sys.exit(retorno if isinstance(retorno, int) else 0)
@@ -0,0 +1,169 @@
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+import tppcompilador
+import tppexecutor
+from benchmarks.gerador import geraBlocosAninhados, geraExpressaoLonga
+
+fatorial = '''
+inteiro fatorial(inteiro: n)
+  inteiro: fat
+  se n > 0 então
+    fat := 1
+    repita
+      fat := fat * n
+      n := n - 1
+    até n = 0
+    retorna(fat)
+  senão
+    retorna(0)
+  fim
+fim
+
+inteiro principal()
+  inteiro: n
+  leia(n)
+  escreva(fatorial(n))
+  retorna(0)
+fim
+'''
+
+bolha = '''
+inteiro: v[8]
+
+ordena(inteiro: w[], inteiro: n)
+  inteiro: i, j, aux
+  i := 0
+  repita
+    j := 0
+    repita
+      se w[j] > w[j+1] então
+        aux := w[j]
+        w[j] := w[j+1]
+        w[j+1] := aux
+      fim
+      j := j + 1
+    até j >= n - i - 1
+    i := i + 1
+  até i >= n - 1
+fim
+
+inteiro principal()
+  inteiro: i
+  i := 0
+  repita
+    leia(v[i])
+    i := i + 1
+  até i = 8
+  ordena(v, 8)
+  i := 0
+  repita
+    escreva(v[i])
+    i := i + 1
+  até i = 8
+  retorna(v[0] + v[7])
+fim
+'''
+
+expressoes = '''
+flutuante: m[2][3]
+inteiro: g
+g := 7
+
+inteiro principal()
+  inteiro: a
+  flutuante: x
+  a := -7 / 2
+  escreva(a)
+  x := 7 / 2.0
+  escreva(x)
+  escreva(2 + 3 * 4 - (1 + 1) * 2)
+  escreva(!(a < 0) || g = 7 && a <> 0)
+  m[1][2] := -2.5e3 + 1.0
+  a := m[1][2]
+  escreva(a)
+  retorna(g)
+fim
+'''
+
+
+def executa(fonte, entrada='', gramatica='cascata'):
+    resultado = tppcompilador.compila(fonte, gramatica=gramatica)
+    assert resultado.sucesso(), resultado.erro
+    saida = io.StringIO()
+    retorno = tppexecutor.compilaPrograma(resultado.root).executa(io.StringIO(entrada), saida)
+    return retorno, saida.getvalue().split()
+
+
+def test_001():
+    assert executa(fatorial, '5') == (0, ['120'])
+    assert executa(fatorial, '0') == (0, ['0'])
+
+
+def test_002():
+    # Arranjo global passado por referência e lido com valores em várias linhas
+    retorno, saida = executa(bolha, '5 3 8 1\n9 2\n7 4\n')
+    assert saida == ['1', '2', '3', '4', '5', '7', '8', '9']
+    assert retorno == 10
+
+
+@pytest.mark.parametrize('gramatica', ['cascata', 'precedencia'])
+def test_003(gramatica):
+    # Precedência, divisão de inteiros truncada, conversão na atribuição e operadores lógicos
+    assert executa(expressoes, gramatica=gramatica) == (7, ['-3', '3.5', '10', '1', '-2499'])
+
+
+def test_004():
+    # O programa compilado pode ser executado várias vezes, com as variáveis reiniciadas
+    resultado = tppcompilador.compila(bolha)
+    programa = tppexecutor.compilaPrograma(resultado.root)
+    for entrada in ('8 7 6 5 4 3 2 1', '1 1 1 1 1 1 1 9'):
+        saida = io.StringIO()
+        programa.executa(io.StringIO(entrada), saida)
+        assert saida.getvalue().split() == sorted(entrada.split())
+
+
+def test_005():
+    # Erros de execução
+    with pytest.raises(tppexecutor.ErroExecucao, match='Fim da entrada'):
+        executa(fatorial)
+    with pytest.raises(tppexecutor.ErroExecucao, match='inválido'):
+        executa(fatorial, 'x')
+    with pytest.raises(tppexecutor.ErroExecucao, match='limites'):
+        executa(bolha.replace('até i = 8\n  ordena', 'até i = 9\n  ordena'), '1 2 3 4 5 6 7 8 9')
+
+    resultado = tppcompilador.compila(fatorial, poda=False)
+    with pytest.raises(tppexecutor.ErroExecucao, match='podada'):
+        tppexecutor.compilaPrograma(resultado.root)
+
+
+@pytest.mark.parametrize('opcoes', [[], ['--elimina'], ['--arranjos=numpy']])
+def test_006(tmp_path, opcoes):
+    # Linha de comando: programa com arranjo global, entrada de um arquivo e código de saída igual ao retorno
+    fonte = tmp_path / 'bolha.tpp'
+    fonte.write_text(bolha, encoding='utf-8')
+    entrada = tmp_path / 'entrada.txt'
+    entrada.write_text('5 3 8 1 9 2 7 4\n', encoding='utf-8')
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tppexecutor.py')
+    processo = subprocess.run([sys.executable, script, str(fonte), '--entrada=%s' % entrada] + opcoes,
+                              cwd=tmp_path, capture_output=True, text=True)
+    assert processo.stdout.split() == ['1', '2', '3', '4', '5', '7', '8', '9'], processo.stderr
+    assert processo.returncode == 10
+
+
+def test_007():
+    # Blocos se/repita profundamente aninhados: a organização e a compilação não usam a pilha do Python
+    assert executa(geraBlocosAninhados(1500), '5000') == (5001, [])
+
+
+def test_008():
+    # Expressão longa (x - 1 + x ...): a compilação do termo não usa a pilha do Python; 2500 vezes x menos 2500,
+    # também com a promoção para flutuante
+    fonte = geraExpressaoLonga(5000)
+    assert executa(fonte, '3') == (5000, [])
+    fonte = fonte.replace('inteiro: x', 'flutuante: x').replace('retorna(x)', 'escreva(x)\n  retorna(0)')
+    assert executa(fonte, '0.5') == (0, ['-1250.0'])
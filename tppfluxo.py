@@ -0,0 +1,153 @@
+# Descrição: Grafo de fluxo de controle de uma função T++, em blocos básicos.
+#            Cada bloco guarda as suas ações em sequência (atribuições, leia, escreva, retorna, declarações e
+#            as condições de se e repita, que fecham o bloco) e as arestas para os blocos seguintes:
+#
+#              se c então A senão B fim      repita A até c
+#
+#                  [... c]                       [...]
+#                  /     \                         |
+#                [A]     [B]                     [A ... c] <-+
+#                  \     /                       /     \_____|
+#                  [junção]                   [após]
+#
+#            Um retorna liga o bloco à saída da função; as ações que vêm depois dele começam um bloco sem
+#            predecessores. Sobre o grafo, em tempo linear no tamanho da função:
+#              - semRetorno: algum caminho chega ao fim da função sem passar por um retorna;
+#              - inalcancaveis: as primeiras ações de cada trecho de código que nunca é executado.
+#
+#            A construção aceita a árvore sintática (ações dentro de nós acao) e a árvore podada (ações
+#            diretamente no corpo) e não usa recursão: os corpos aninhados são empilhados.
+
+
+# Primeira linha do código-fonte registrada nas folhas do nó (None se nenhuma folha tiver linha)
+def linha(node):
+    pilha = [node]
+    while pilha:
+        item = pilha.pop()
+        if getattr(item, 'line', None) is not None:
+            return item.line
+        pilha.extend(reversed(item.children))
+    return None
+
+
+class Bloco:
+    __slots__ = ('indice', 'acoes', 'sucessores', 'predecessores')
+
+    def __init__(self, indice):
+        self.indice = indice
+        self.acoes = []
+        self.sucessores = []
+        self.predecessores = []
+
+    def __repr__(self):
+        return 'Bloco(%d, %s -> %s)' % (self.indice, [acao.name for acao in self.acoes],
+                                        [bloco.indice for bloco in self.sucessores])
+
+
+class GrafoFluxo:
+    def __init__(self, nome, corpo):
+        self.nome = nome
+        self.blocos = []
+        self.entrada = self.novoBloco()
+        # Bloco sem ações que representa o fim da função (alcançado por retorna ou pelo fim do corpo)
+        self.saida = self.novoBloco()
+        # Nós retorna, na ordem do código-fonte
+        self.retornos = []
+        # Ações na ordem do código-fonte: (ação, bloco em que começa, ação anterior no mesmo corpo, se ou repita
+        # em que está)
+        self.sequencia = []
+        # Bloco que termina no fim do corpo, sem retorna
+        self.queda = self.constroi(corpo)
+        self.liga(self.queda, self.saida)
+        self._alcancaveis = None
+
+    def novoBloco(self):
+        bloco = Bloco(len(self.blocos))
+        self.blocos.append(bloco)
+        return bloco
+
+    def liga(self, origem, destino):
+        origem.sucessores.append(destino)
+        destino.predecessores.append(origem)
+
+    # Constrói os blocos do corpo a partir do bloco de entrada e retorna o bloco em que o corpo termina. Cada
+    # corpo é um gerador que pede os corpos aninhados (yield corpo, bloco, ação) e recebe o bloco em que terminaram
+    def constroi(self, corpo):
+        pilha = [self._corpo(corpo, self.entrada)]
+        resultado = None
+        while pilha:
+            try:
+                pilha.append(self._corpo(*pilha[-1].send(resultado)))
+                resultado = None
+            except StopIteration as fim:
+                pilha.pop()
+                resultado = fim.value
+        return resultado
+
+    def _corpo(self, corpo, atual, pai=None):
+        anterior = None
+        for acao in corpo.children:
+            if acao.name == 'acao':
+                acao = acao.children[0]
+            if acao.name == 'vazio':
+                continue
+            self.sequencia.append((acao, atual, anterior, pai))
+            anterior = acao
+            if acao.name == 'se':
+                corpos = [child for child in acao.children if child.name == 'corpo']
+                atual.acoes.append(acao.children[1])
+                juncao = self.novoBloco()
+                for bloco in corpos:
+                    inicio = self.novoBloco()
+                    self.liga(atual, inicio)
+                    self.liga((yield bloco, inicio, acao), juncao)
+                if len(corpos) == 1:
+                    self.liga(atual, juncao)
+                atual = juncao
+            elif acao.name == 'repita':
+                inicio = self.novoBloco()
+                self.liga(atual, inicio)
+                fim = yield acao.children[1], inicio, acao
+                fim.acoes.append(acao.children[3])
+                self.liga(fim, inicio)
+                atual = self.novoBloco()
+                self.liga(fim, atual)
+            elif acao.name == 'retorna':
+                atual.acoes.append(acao)
+                self.retornos.append(acao)
+                self.liga(atual, self.saida)
+                atual = self.novoBloco()
+            else:
+                atual.acoes.append(acao)
+        return atual
+
+    # Blocos alcançados a partir da entrada
+    def alcancaveis(self):
+        if self._alcancaveis is None:
+            visitados = {self.entrada}
+            pendentes = [self.entrada]
+            while pendentes:
+                for bloco in pendentes.pop().sucessores:
+                    if bloco not in visitados:
+                        visitados.add(bloco)
+                        pendentes.append(bloco)
+            self._alcancaveis = visitados
+        return self._alcancaveis
+
+    # Algum caminho chega ao fim do corpo sem retorna
+    def semRetorno(self):
+        return self.queda in self.alcancaveis()
+
+    # Primeira ação de cada trecho inalcançável: as ações seguintes do mesmo corpo e as ações aninhadas em uma
+    # ação inalcançável fazem parte do mesmo trecho
+    def inalcancaveis(self):
+        alcancaveis = self.alcancaveis()
+        mortas = set()
+        trechos = []
+        for acao, bloco, anterior, pai in self.sequencia:
+            if bloco in alcancaveis:
+                continue
+            mortas.add(id(acao))
+            if id(anterior) not in mortas and id(pai) not in mortas:
+                trechos.append(acao)
+        return trechos
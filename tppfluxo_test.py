@@ -0,0 +1,101 @@
+import pytest
+
+import tppcompilador
+import tppexecutor
+import tppsema
+from mytree import MyNode, semVerificarCiclos
+from tppfluxo import GrafoFluxo, linha
+
+fluxo = '''
+inteiro talvez(inteiro: n)
+  se n > 0 então
+    retorna(1)
+  fim
+fim
+
+inteiro sempre(inteiro: n)
+  se n > 0 então
+    retorna(1)
+  senão
+    retorna(2)
+    escreva(3)
+    escreva(4)
+  fim
+  n := 5
+  se n > 1 então
+    escreva(n)
+  fim
+fim
+
+inteiro laco(inteiro: n)
+  repita
+    retorna(n)
+  até n > 0
+  escreva(n)
+fim
+
+nada()
+  escreva(1)
+fim
+
+inteiro principal()
+  nada()
+  escreva(talvez(1) + sempre(2) + laco(3))
+  retorna(0)
+fim
+'''
+
+
+@pytest.mark.parametrize('trabalhadores', [1, 2])
+def test_001(trabalhadores):
+    # Caminho sem retorna e trechos inalcançáveis, com a linha da primeira ação de cada trecho
+    resultado = tppcompilador.compila(fluxo, poda=False, trabalhadores=trabalhadores)
+    assert resultado.chaves() == ['WAR-SEM-FUNC-RET-MISSING', 'WAR-SEM-UNREACHABLE-CODE',
+                                  'WAR-SEM-UNREACHABLE-CODE', 'WAR-SEM-UNREACHABLE-CODE']
+    assert "Função 'talvez' do tipo 'inteiro' pode terminar sem retornar um valor." in resultado.saida
+    mensagens = [diagnostico['message'] for diagnostico in resultado.diagnosticos
+                 if diagnostico['key'] == 'WAR-SEM-UNREACHABLE-CODE']
+    esperadas = ["Código inalcançável na função 'sempre' (linha 13).",
+                 "Código inalcançável na função 'sempre' (linha 16).",
+                 "Código inalcançável na função 'laco' (linha 26)."]
+    assert len(mensagens) == 3 and all(esperada in mensagem for esperada, mensagem in zip(esperadas, mensagens))
+
+
+def test_002():
+    # Blocos: a condição fecha o bloco; se com senão tem dois ramos até a junção; repita volta ao início do corpo
+    tppcompilador.compila(fluxo, poda=False)
+    grafos = {grafo.nome: grafo for grafo in tppsema.fluxos.values()}
+    assert set(grafos) == {'talvez', 'sempre', 'laco', 'nada', 'principal'}
+    sempre = grafos['sempre']
+    assert [acao.name for acao in sempre.entrada.acoes] == ['expressao']
+    assert len(sempre.entrada.sucessores) == 2 and len(sempre.retornos) == 2
+    laco = grafos['laco']
+    inicio = laco.entrada.sucessores[0]
+    assert len(inicio.predecessores) == 2
+    assert not laco.semRetorno() and grafos['talvez'].semRetorno() and not grafos['principal'].semRetorno()
+
+
+def test_003():
+    # A árvore podada (os corpos das funções na organização da execução) também é aceita
+    resultado = tppcompilador.compila(fluxo)
+    leiaute = tppexecutor.Leiaute(resultado.root, otimiza=False)
+    talvez = leiaute.funcoes['talvez']
+    assert GrafoFluxo('talvez', talvez.corpo).semRetorno()
+    inalcancaveis = GrafoFluxo('sempre', leiaute.funcoes['sempre'].corpo).inalcancaveis()
+    assert [linha(acao) for acao in inalcancaveis] == [13, 16]
+
+
+def test_004():
+    # Aninhamento profundo: a construção não usa a pilha do Python
+    corpo = raiz = MyNode(name='corpo')
+    with semVerificarCiclos():
+        for _ in range(5000):
+            se = MyNode(name='se', parent=corpo)
+            MyNode(name='se', parent=se)
+            MyNode(name='expressao', parent=se)
+            MyNode(name='então', parent=se)
+            corpo = MyNode(name='corpo', parent=se)
+            MyNode(name='fim', parent=se)
+        MyNode(name='retorna', parent=corpo)
+    grafo = GrafoFluxo('profunda', raiz)
+    assert grafo.semRetorno() and len(grafo.retornos) == 1 and not grafo.inalcancaveis()
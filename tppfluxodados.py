@@ -0,0 +1,128 @@
+# Descrição: Análise de fluxo de dados das variáveis locais de uma função T++, sobre o grafo de fluxo de
+#            controle (tppfluxo.GrafoFluxo) da árvore sintática.
+#            Cada variável declarada no corpo da função recebe uma posição (slot) e os conjuntos de
+#            variáveis são inteiros usados como vetores de bits (o bit 1 << slot), de modo que as operações
+#            de cada bloco custam o mesmo para funções com poucas ou com milhares de variáveis.
+#
+#            Atribuição definitiva (reaching definitions "em todos os caminhos"), para frente:
+#              entrada[bloco] = interseção (&) das saídas dos predecessores alcançáveis
+#              saida[bloco]   = entrada[bloco] | variáveis escalares atribuídas no bloco
+#            Uma leitura de variável escalar cujo bit não está na entrada da ação é um uso antes da
+#            inicialização (em algum caminho), com a linha exata da leitura. Os arranjos não entram nessa
+#            verificação: a escrita de um elemento não inicializa os demais.
+#
+#            Também guarda, sem considerar o fluxo, as variáveis lidas e as escritas em qualquer ponto da
+#            função: são as marcas de uso e inicialização dos avisos WAR-SEM-VAR-* das variáveis locais,
+#            uma por nome declarado (a tabela de símbolos guarda só o último nome de uma declaração com
+#            várias variáveis).
+#
+#            Os parâmetros e as variáveis globais não são variáveis da análise (os parâmetros chegam
+#            inicializados e as globais podem ser inicializadas por outras funções), nem as declarações locais
+#            que a tabela de símbolos recusou por repetirem o nome de uma global ou de um parâmetro (recusados).
+
+from mytree import preOrdem
+from tppfluxo import linha
+
+
+# Nome da variável de um nó var da árvore sintática (var -> ID -> nome)
+def nomeVar(var):
+    return var.children[0].children[0].name
+
+
+# Leituras e escrita de uma ação ou condição: (nós var lidos na ordem do código, nó var escrito ou None). Em
+# uma declaração, só as variáveis dos tamanhos dos arranjos são lidas
+def leiturasEscrita(acao):
+    if acao.name == 'declaracao_variaveis':
+        return [node for node in preOrdem(acao) if node.name == 'var' and node.parent.name != 'lista_variaveis'], None
+    escrita = None
+    if acao.name == 'expressao' and acao.children and acao.children[0].name == 'atribuicao':
+        escrita = acao.children[0].children[0]
+    elif acao.name == 'leia':
+        escrita = acao.children[2]
+    lidas = [node for node in preOrdem(acao) if node.name == 'var' and node is not escrita]
+    return lidas, escrita
+
+
+class FluxoDados:
+    def __init__(self, fluxo, corpo, recusados=()):
+        self.fluxo = fluxo
+        # Variáveis locais: nomes na ordem da declaração, {nome: slot} e os bits dos arranjos
+        self.nomes = []
+        self.slots = {}
+        self.arranjos = 0
+        for declaracao in preOrdem(corpo):
+            if declaracao.name == 'declaracao_variaveis':
+                for var in preOrdem(declaracao):
+                    if var.name == 'var' and nomeVar(var) not in self.slots and nomeVar(var) not in recusados:
+                        self.slots[nomeVar(var)] = len(self.nomes)
+                        self.nomes.append(nomeVar(var))
+                        if len(var.children) > 1:
+                            self.arranjos |= 1 << self.slots[nomeVar(var)]
+        # Variáveis lidas e escritas em qualquer ponto da função
+        self.lidas = 0
+        self.escritas = 0
+        # {bloco: [([(slot, nó var)] das leituras, bit da variável escrita)]}, uma entrada por ação do bloco
+        self.acoes = {}
+        for bloco in fluxo.blocos:
+            resumo = []
+            for acao in bloco.acoes:
+                lidas, escrita = leiturasEscrita(acao)
+                leituras = [(self.slots[nomeVar(var)], var) for var in lidas if nomeVar(var) in self.slots]
+                bit = 0
+                if escrita is not None and nomeVar(escrita) in self.slots:
+                    bit = 1 << self.slots[nomeVar(escrita)]
+                for slot, _ in leituras:
+                    self.lidas |= 1 << slot
+                self.escritas |= bit
+                resumo.append((leituras, bit))
+            self.acoes[bloco] = resumo
+        self.entradas = self.atribuidas()
+
+    # Variáveis definitivamente atribuídas na entrada de cada bloco alcançável: {bloco: bits}
+    def atribuidas(self):
+        alcancaveis = self.fluxo.alcancaveis()
+        todas = (1 << len(self.nomes)) - 1
+        geradas = {}
+        for bloco in alcancaveis:
+            bits = 0
+            for _, bit in self.acoes[bloco]:
+                bits |= bit
+            geradas[bloco] = bits & ~self.arranjos
+        entradas = {bloco: todas for bloco in alcancaveis}
+        entradas[self.fluxo.entrada] = 0
+        # Os blocos são criados na ordem do código: a lista é usada como pilha, dos primeiros para os últimos
+        pendentes = sorted(alcancaveis, key=lambda bloco: bloco.indice, reverse=True)
+        marcados = set(pendentes)
+        while pendentes:
+            bloco = pendentes.pop()
+            marcados.discard(bloco)
+            saida = entradas[bloco] | geradas[bloco]
+            for sucessor in bloco.sucessores:
+                entrada = entradas[sucessor] & saida
+                if entrada != entradas[sucessor]:
+                    entradas[sucessor] = entrada
+                    if sucessor not in marcados:
+                        marcados.add(sucessor)
+                        pendentes.append(sucessor)
+        return entradas
+
+    # Leituras de variáveis escalares antes da inicialização em algum caminho: [(nome, linha)], a primeira de
+    # cada variável, na ordem do código-fonte
+    def antesDeInicializar(self):
+        encontradas = {}
+        for bloco, atribuidas in self.entradas.items():
+            for leituras, bit in self.acoes[bloco]:
+                for slot, var in leituras:
+                    if not (atribuidas >> slot) & 1 and not (self.arranjos >> slot) & 1:
+                        nome = self.nomes[slot]
+                        numero = linha(var)
+                        if nome not in encontradas or (numero or 0) < (encontradas[nome] or 0):
+                            encontradas[nome] = numero
+                atribuidas |= bit
+        return sorted(encontradas.items(), key=lambda item: (item[1] or 0, self.slots[item[0]]))
+
+    def lida(self, nome):
+        return bool((self.lidas >> self.slots[nome]) & 1)
+
+    def escrita(self, nome):
+        return bool((self.escritas >> self.slots[nome]) & 1)
@@ -0,0 +1,109 @@
+import pytest
+
+import tppcompilador
+import tppsema
+
+inicializacao = '''
+inteiro: global
+
+inteiro calcula(inteiro: n)
+  inteiro: a
+  inteiro: b
+  inteiro: c
+  inteiro: nunca
+  inteiro: soescrita
+  inteiro: lida
+  inteiro: v[4]
+  se n > 0 então
+    a := 1
+  senão
+    b := 2
+  fim
+  c := a + n
+  repita
+    a := a + 1
+    b := a
+  até a > 10
+  v[0] := b + lida
+  soescrita := v[1] + global
+  retorna(c + b)
+fim
+
+inteiro principal()
+  retorna(calcula(3))
+fim
+'''
+
+
+def mensagens(resultado, chave):
+    return [diagnostico['message'] for diagnostico in resultado.diagnosticos if diagnostico['key'] == chave]
+
+
+@pytest.mark.parametrize('trabalhadores', [1, 2])
+def test_001(trabalhadores):
+    # a só é atribuída em um ramo do se; b é atribuída no corpo do repita antes da leitura seguinte; os parâmetros,
+    # as globais e os arranjos não são verificados
+    resultado = tppcompilador.compila(inicializacao, poda=False, trabalhadores=trabalhadores)
+    avisos = mensagens(resultado, 'WAR-SEM-VAR-USED-BEFORE-INIT')
+    esperados = ["Variável 'a' pode ser usada antes de ser inicializada (linha 17).",
+                 "Variável 'lida' pode ser usada antes de ser inicializada (linha 22)."]
+    assert len(avisos) == 2 and all(esperado in aviso for esperado, aviso in zip(esperados, avisos))
+
+
+def test_002():
+    # Avisos de uso das variáveis locais pelas leituras e escritas da análise; os das globais pela tabela
+    resultado = tppcompilador.compila(inicializacao, poda=False)
+    avisos = {chave: [mensagem.split("'")[1] for mensagem in mensagens(resultado, chave)]
+              for chave in ('WAR-SEM-VAR-DECL-NOT-USED', 'WAR-SEM-VAR-DECL-INIT-NOT-USED', 'WAR-SEM-VAR-DECL-NOT-INIT')}
+    assert avisos == {'WAR-SEM-VAR-DECL-NOT-USED': ['nunca'], 'WAR-SEM-VAR-DECL-INIT-NOT-USED': ['soescrita'],
+                      'WAR-SEM-VAR-DECL-NOT-INIT': ['global', 'lida']}
+
+
+def test_003():
+    # Vetores de bits por posição: as entradas dos blocos do se e do repita
+    tppcompilador.compila(inicializacao, poda=False)
+    analise = [analise for analise in tppsema.dados.values() if analise.fluxo.nome == 'calcula'][0]
+    assert analise.nomes == ['a', 'b', 'c', 'nunca', 'soescrita', 'lida', 'v']
+    assert analise.arranjos == 1 << 6
+    fluxo = analise.fluxo
+    juncao = [bloco for bloco in fluxo.blocos if len(bloco.predecessores) == 2 and bloco is not fluxo.saida][0]
+    assert analise.entradas[juncao] == 0
+    assert analise.lida('lida') and not analise.escrita('lida') and analise.escrita('v')
+    # No fim da função a, b e c estão atribuídas em todos os caminhos
+    assert analise.entradas[fluxo.saida] & 0b111 == 0b111
+
+
+def test_004():
+    # Muitas variáveis locais: um único inteiro por conjunto
+    nomes = ['x%d' % i for i in range(2000)]
+    fonte = 'inteiro principal()\n' + ''.join('  inteiro: %s\n' % nome for nome in nomes)
+    fonte += ''.join('  %s := %s + 1\n' % (nomes[i], nomes[i - 1]) for i in range(1, len(nomes)))
+    fonte += '  retorna(%s)\nfim\n' % nomes[-1]
+    resultado = tppcompilador.compila(fonte, poda=False)
+    avisos = mensagens(resultado, 'WAR-SEM-VAR-USED-BEFORE-INIT')
+    assert len(avisos) == 1 and "'x0'" in avisos[0]
+
+
+def test_005():
+    # A declaração local recusada (o nome é de uma global ou de um parâmetro) não é variável da análise: o nome
+    # continua sendo o da global, com um único aviso; a declaração repetida de uma local continua local
+    fonte = '''
+inteiro: a
+
+inteiro principal(inteiro: p)
+  flutuante: a
+  flutuante: p
+  inteiro: b
+  inteiro: b
+  escreva(a + p)
+  b := 1
+  retorna(b)
+fim
+'''
+    resultado = tppcompilador.compila(fonte, poda=False)
+    assert resultado.chaves().count('WAR-SEM-VAR-DECL-PREV') == 3
+    avisos = mensagens(resultado, 'WAR-SEM-VAR-DECL-NOT-INIT')
+    assert len(avisos) == 1 and "'a'" in avisos[0]
+    assert not mensagens(resultado, 'WAR-SEM-VAR-USED-BEFORE-INIT')
+    analise = list(tppsema.dados.values())[0]
+    assert analise.nomes == ['b']
@@ -3,6 +3,11 @@ import ply.lex as lex
 from sys import argv, exit
 from myerror import MyError
 
+import hashlib
+import os
+
+import tpptabelas
+
 import logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -168,7 +173,7 @@ def t_error(token):
     # line = token.lineno
     # column = define_column(token.lexer.lexdata, token.lexpos)
     
-    message_error = le.newError('ERR-LEX-INV-CHAR', valor=token.value[0])
+    message_error = le.newError(False, 'ERR-LEX-INV-CHAR', valor=token.value[0])
     # message_error = f"ERRO:[{line},{column}]: {message_error}."
     
     print(message_error)
@@ -215,8 +220,79 @@ def test(pdata):
   return s
 
 
+# Tabelas do analisador léxico (lextab.py).
+# O lex.lex(optimize=True) procura o lextab pelo sys.path (o diretório atual, por exemplo), usa a tabela
+# encontrada mesmo que não corresponda mais às regras acima e, se não a encontra, grava uma nova sem
+# proteção contra outros processos. Aqui a tabela é carregada dos caminhos conhecidos de tpptabelas.py (a
+# tabela distribuída junto com este módulo e a do diretório de cache) e só é usada se a assinatura das regras
+# gravada nela for a atual. Caso contrário o analisador é construído a partir das regras e a tabela é gravada
+# no cache por renomeação atômica (se o cache não puder ser gravado, o analisador construído é usado assim mesmo).
+
+modulo_tabela = 'lextab'
+pasta_modulo = tpptabelas.pasta_modulo
+
+
+# Assinatura das regras do analisador léxico: tokens e expressões regulares, na ordem em que foram definidas
+def assinaturaRegras():
+    cadeias = []
+    funcoes = []
+    for nome, valor in globals().items():
+        if not nome.startswith('t_'):
+            continue
+        if callable(valor):
+            funcoes.append((valor.__code__.co_firstlineno, nome, getattr(valor, 'regex', valor.__doc__)))
+        else:
+            cadeias.append((nome, valor))
+    funcoes = [(nome, regex) for linha, nome, regex in sorted(funcoes)]
+    conteudo = repr((sorted(tokens), cadeias, funcoes, lex.__tabversion__))
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()
+
+
+# Carrega a tabela do arquivo; None se não existir ou não corresponder às regras atuais
+def carregaTabela(caminho, assinatura):
+    tabela = tpptabelas.carregaModulo(caminho)
+    if getattr(tabela, '_tabversion', None) != lex.__tabversion__ or getattr(tabela, '_assinatura', None) != assinatura:
+        return None
+    return tabela
+
+
+# Grava a tabela do analisador na pasta (por renomeação atômica)
+def gravaTabela(analisador, pasta, assinatura):
+    def escreve(temporaria):
+        analisador.writetab(modulo_tabela, temporaria)
+        with open(os.path.join(temporaria, modulo_tabela + '.py'), 'a', encoding='utf-8') as arquivo:
+            arquivo.write('_assinatura   = %r\n' % assinatura)
+    tpptabelas.gravaTabela(pasta, modulo_tabela, escreve)
+
+
+# Reconstrói o analisador a partir das regras e grava a tabela na pasta (por padrão, a tabela distribuída
+# junto com este módulo, que deve ser regenerada sempre que as regras mudarem):
+#   python -c "import tpplex; tpplex.geraTabela()"
+def geraTabela(pasta=pasta_modulo):
+    analisador = lex.lex(debug=True, debuglog=log)
+    gravaTabela(analisador, pasta, assinaturaRegras())
+    return analisador
+
+
+# Constrói o analisador léxico a partir da tabela válida ou, sem ela, das regras
+# (as regras são lidas dos globais deste módulo, como no lex.lex() chamado no nível do módulo)
+def constroiLexer():
+    assinatura = assinaturaRegras()
+    for pasta in (pasta_modulo, tpptabelas.pastaCache()):
+        tabela = carregaTabela(os.path.join(pasta, modulo_tabela + '.py'), assinatura)
+        if tabela is not None:
+            return lex.lex(optimize=True, lextab=tabela)
+
+    analisador = lex.lex(debug=True, debuglog=log)
+    try:
+        gravaTabela(analisador, tpptabelas.pastaCache(), assinatura)
+    except (OSError, UnicodeError) as e:
+        log.warning("Não foi possível gravar a tabela do analisador léxico em %s: %s", tpptabelas.pastaCache(), e)
+    return analisador
+
+
 # Build the lexer.
-lexer = lex.lex(optimize=True, debug=True, debuglog=log)
+lexer = constroiLexer()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
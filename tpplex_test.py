@@ -1,26 +1,20 @@
+import os
+import tempfile
+
 import tpplex
-import subprocess
-import os, fnmatch
+import tppsuite
 
+# Executa o caso no próprio processo (API reentrante), sem iniciar um interpretador por caso
 def execute_test(input_file):
     path_file = 'tests/' + input_file
-    process = subprocess.Popen(['python', 'tpplex.py', path_file],
-                     stdout=subprocess.PIPE,
-                     stderr=subprocess.PIPE)
-    stdout, stderr = process.communicate()
-    stdout, stderr
-
-    output_file = open(path_file + ".out", "r")
-
-    #read whole file to a string
-    expected_output = output_file.read()
+    caso = tppsuite.executaCaso(path_file, fase='lex')
 
-    output_file.close()
+    print(caso['obtido'])
+    print(caso['esperado'])
+    if caso['erro']:
+        print(caso['erro'])
 
-    print(stdout)
-    print(expected_output)
-
-    return stdout.decode("utf-8") == expected_output
+    return caso['passou']
 
 #def testes():
 #    for file in fnmatch.filter(os.listdir('tests'), '*.tpp'):
@@ -121,3 +115,16 @@ def test_031():
 
 def test_032():
     assert execute_test("verif_num_negativo.tpp") == True
+
+def test_tabela():
+    # A tabela distribuída corresponde às regras; uma tabela de outras regras é recusada
+    assinatura = tpplex.assinaturaRegras()
+    assert tpplex.carregaTabela(os.path.join(tpplex.pasta_modulo, 'lextab.py'), assinatura) is not None
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'lextab.py')
+        tpplex.geraTabela(pasta)
+        assert tpplex.carregaTabela(caminho, assinatura) is not None
+        assert not [nome for nome in os.listdir(pasta) if nome.startswith('.lextab-')]
+        with open(caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write("_assinatura = 'outras regras'\n")
+        assert tpplex.carregaTabela(caminho, assinatura) is None
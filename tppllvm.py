@@ -0,0 +1,586 @@
+# Descrição: Geração de código LLVM (IR textual, .ll) a partir da árvore podada (tppsema.podaArvore).
+#            Usa a mesma organização do programa (tppexecutor.Leiaute) e a mesma análise das
+#            expressões (tppexecutor.analisaExpressao) do executor e da máquina virtual:
+#              - variáveis globais viram globais LLVM (arranjos globais com tamanhos constantes, dobrados
+#                por tppconstantes.py, e as matrizes em ordem por linhas em um único bloco), iniciadas
+#                com zero; as inicializações globais ficam em @tpp.inicializa, chamada por @main antes
+#                de principal;
+#              - cada função T++ vira uma função LLVM com os tipos dos parâmetros (i64 para inteiro,
+#                double para flutuante); parâmetros arranjo recebem o ponteiro para o primeiro elemento
+#                (e, para matriz, também o número de colunas);
+#              - variáveis locais e parâmetros ficam em alloca (load/store), iniciados com zero; os
+#                arranjos locais são alocados na entrada da função com os tamanhos avaliados na chamada;
+#              - a atribuição, os argumentos e o retorno convertem o valor para o tipo declarado (sitofp
+#                e fptosi), nos mesmos pontos em que a análise semântica avisa da coerção implícita;
+#              - leia e escreva chamam as funções do ambiente de execução (@tpp.rt.*), definidas no
+#                próprio módulo sobre scanf e printf, ou apenas declaradas (--sem-runtime) para serem
+#                ligadas com outra implementação.
+#
+#            Semântica: a mesma do executor (divisão de inteiros truncada, comparações e operações lógicas
+#            resultam em 1 ou 0, && e || avaliam o segundo operando só quando necessário), com inteiros de
+#            64 bits. O código nativo não verifica os limites dos arranjos nem a divisão por zero; ao
+#            faltar um valor na entrada o programa termina com o código 1. escreva imprime os flutuantes como
+#            o executor (o menor número de dígitos que representa o valor).
+#
+#            Uso: python tppllvm.py programa.tpp [--saida=programa.ll] [--precedence] [--sem-runtime]
+#            (o código pode então ser executado com lli programa.ll ou compilado com clang/llc)
+
+import struct
+import sys
+
+from tppexecutor import Leiaute, Variavel, analisaExpressao, erro, error_handler, indices, promoveTipo, tipoOperacao
+
+tipos = {'inteiro': 'i64', 'flutuante': 'double', 'vazio': 'void'}
+
+# Instruções das operações aritméticas e das comparações: (inteiro, flutuante)
+aritmeticas = {
+    '+': ('add', 'fadd'),
+    '-': ('sub', 'fsub'),
+    '*': ('mul', 'fmul'),
+    '/': ('sdiv', 'fdiv'),
+}
+comparacoes = {
+    '<': ('icmp slt', 'fcmp olt'),
+    '>': ('icmp sgt', 'fcmp ogt'),
+    '<=': ('icmp sle', 'fcmp ole'),
+    '>=': ('icmp sge', 'fcmp oge'),
+    '=': ('icmp eq', 'fcmp oeq'),
+    '<>': ('icmp ne', 'fcmp une'),
+}
+
+# Funções do ambiente de execução chamadas por leia e escreva
+declaracoes_runtime = '''declare i64 @tpp.rt.leia_inteiro()
+declare double @tpp.rt.leia_flutuante()
+declare void @tpp.rt.escreva_inteiro(i64)
+declare void @tpp.rt.escreva_flutuante(double)
+'''
+
+runtime = '''@tpp.rt.formato_leia_inteiro = private unnamed_addr constant [5 x i8] c"%lld\\00"
+@tpp.rt.formato_leia_flutuante = private unnamed_addr constant [4 x i8] c"%lf\\00"
+@tpp.rt.formato_escreva_inteiro = private unnamed_addr constant [6 x i8] c"%lld\\0A\\00"
+@tpp.rt.formato_digitos = private unnamed_addr constant [5 x i8] c"%.*g\\00"
+@tpp.rt.formato_linha = private unnamed_addr constant [4 x i8] c"%s\\0A\\00"
+@tpp.rt.formato_linha_ponto = private unnamed_addr constant [6 x i8] c"%s.0\\0A\\00"
+@tpp.rt.marcas = private unnamed_addr constant [4 x i8] c".en\\00"
+
+declare i32 @scanf(i8*, ...)
+declare i32 @printf(i8*, ...)
+declare void @exit(i32)
+declare i32 @snprintf(i8*, i64, i8*, ...)
+declare double @strtod(i8*, i8**)
+declare i8* @strchr(i8*, i32)
+declare i8* @strpbrk(i8*, i8*)
+declare double @llvm.fabs.f64(double)
+
+define internal i64 @tpp.rt.leia_inteiro() {
+entrada:
+  %valor = alloca i64
+  %lidos = call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([5 x i8], [5 x i8]* @tpp.rt.formato_leia_inteiro, i64 0, i64 0), i64* %valor)
+  %ok = icmp eq i32 %lidos, 1
+  br i1 %ok, label %lido, label %falha
+falha:
+  call void @exit(i32 1)
+  unreachable
+lido:
+  %lido.valor = load i64, i64* %valor
+  ret i64 %lido.valor
+}
+
+define internal double @tpp.rt.leia_flutuante() {
+entrada:
+  %valor = alloca double
+  %lidos = call i32 (i8*, ...) @scanf(i8* getelementptr inbounds ([4 x i8], [4 x i8]* @tpp.rt.formato_leia_flutuante, i64 0, i64 0), double* %valor)
+  %ok = icmp eq i32 %lidos, 1
+  br i1 %ok, label %lido, label %falha
+falha:
+  call void @exit(i32 1)
+  unreachable
+lido:
+  %lido.valor = load double, double* %valor
+  ret double %lido.valor
+}
+
+define internal void @tpp.rt.escreva_inteiro(i64 %valor) {
+entrada:
+  call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([6 x i8], [6 x i8]* @tpp.rt.formato_escreva_inteiro, i64 0, i64 0), i64 %valor)
+  ret void
+}
+
+; Escreve o flutuante como o executor (repr do Python): o menor número de dígitos que lê de volta o mesmo valor,
+; em notação científica só fora de [1e-4, 1e16), e com ".0" quando o texto não tiver ponto nem expoente
+define internal void @tpp.rt.escreva_flutuante(double %valor) {
+entrada:
+  %texto = alloca [32 x i8]
+  %inicio = getelementptr inbounds [32 x i8], [32 x i8]* %texto, i64 0, i64 0
+  %modulo = call double @llvm.fabs.f64(double %valor)
+  %grande = fcmp oge double %modulo, 1.0e16
+  %pequeno = fcmp olt double %modulo, 1.0e-4
+  %cientifica = or i1 %grande, %pequeno
+  br label %tenta
+tenta:
+  %digitos = phi i32 [1, %entrada], [%proximo, %continua]
+  call i32 (i8*, i64, i8*, ...) @snprintf(i8* %inicio, i64 32, i8* getelementptr inbounds ([5 x i8], [5 x i8]* @tpp.rt.formato_digitos, i64 0, i64 0), i32 %digitos, double %valor)
+  %lido = call double @strtod(i8* %inicio, i8** null)
+  %igual = fcmp oeq double %lido, %valor
+  %expoente = call i8* @strchr(i8* %inicio, i32 101)
+  %fixa = icmp eq i8* %expoente, null
+  %notacao = or i1 %fixa, %cientifica
+  %aceito = and i1 %igual, %notacao
+  %ultimo = icmp sge i32 %digitos, 17
+  %pronto = or i1 %aceito, %ultimo
+  br i1 %pronto, label %escreve, label %continua
+continua:
+  %proximo = add i32 %digitos, 1
+  br label %tenta
+escreve:
+  %marca = call i8* @strpbrk(i8* %inicio, i8* getelementptr inbounds ([4 x i8], [4 x i8]* @tpp.rt.marcas, i64 0, i64 0))
+  %semMarca = icmp eq i8* %marca, null
+  %linha = select i1 %semMarca, i8* getelementptr inbounds ([6 x i8], [6 x i8]* @tpp.rt.formato_linha_ponto, i64 0, i64 0), i8* getelementptr inbounds ([4 x i8], [4 x i8]* @tpp.rt.formato_linha, i64 0, i64 0)
+  call i32 (i8*, ...) @printf(i8* %linha, i8* %inicio)
+  ret void
+}
+'''
+
+
+# Nome LLVM entre aspas (os identificadores T++ podem ter letras acentuadas, escritas como \XX em UTF-8)
+def nome(prefixo, identificador):
+    texto = ''.join(chr(b) if b < 0x80 else '\\%02X' % b for b in (prefixo + identificador).encode('utf-8'))
+    return '"%s"' % texto
+
+
+# Constante LLVM do valor (os flutuantes em hexadecimal, a representação exata do double)
+def constante(valor, type):
+    if type == 'flutuante':
+        return '0x%016X' % struct.unpack('>Q', struct.pack('>d', float(valor)))[0]
+    return str(int(valor))
+
+
+# Gerador do módulo LLVM de um programa
+class Gerador:
+
+    def __init__(self, root, runtime=True):
+        self.leiaute = Leiaute(root)
+        self.runtime = runtime
+        # Endereço de cada variável (Variavel): (ponteiro, colunas da matriz ou None)
+        self.enderecos = {}
+        self.funcao = None
+        self.linhas = []
+        self.temporarios = 0
+        self.rotulos = 0
+        self.bloco = None
+
+    def gera(self):
+        globais = [self.declaraGlobal(variavel) for variavel in self.leiaute.globais.values()]
+        funcoes = [self.geraInicializacao()]
+        funcoes.extend(self.geraFuncao(funcao) for funcao in self.leiaute.funcoes.values())
+        funcoes.append(self.geraMain())
+        partes = ['; Programa T++ traduzido por tppllvm.py\n',
+                  '\n'.join(globais) + '\n' if globais else '',
+                  'declare void @llvm.memset.p0i8.i64(i8*, i8, i64, i1)\n',
+                  runtime if self.runtime else declaracoes_runtime]
+        return '\n'.join(partes + funcoes)
+
+    # Emissão
+
+    def emite(self, instrucao):
+        self.linhas.append('  ' + instrucao)
+
+    # Emite a instrução que produz um valor; retorna o temporário
+    def valor(self, instrucao):
+        self.temporarios += 1
+        temporario = '%%t%d' % self.temporarios
+        self.emite('%s = %s' % (temporario, instrucao))
+        return temporario
+
+    def novoRotulo(self):
+        self.rotulos += 1
+        return 'l%d' % self.rotulos
+
+    def inicia(self, rotulo):
+        self.linhas.append('%s:' % rotulo)
+        self.bloco = rotulo
+
+    def iniciaFuncao(self, funcao):
+        self.funcao = funcao
+        self.linhas = []
+        self.temporarios = 0
+        self.rotulos = 0
+        self.inicia('entrada')
+
+    # Variáveis
+
+    def declaraGlobal(self, variavel):
+        simbolo = '@' + nome('tpp.g.', variavel.nome)
+        tipo = tipos[variavel.type]
+        if not variavel.dimensoes:
+            self.enderecos[variavel] = (simbolo, None)
+            return '%s = internal global %s %s' % (simbolo, tipo, constante(0, variavel.type))
+        # Tamanhos dobrados pela análise das constantes (tppconstantes.py)
+        constantes = [node.constante for node in variavel.tamanhos]
+        if None in constantes or any(type != 'inteiro' or valor < 0 for valor, type in constantes):
+            raise erro('ERR-EXEC-LLVM-ARRAY-SIZE', variavel.nome)
+        tamanhos = [valor for valor, type in constantes]
+        total = tamanhos[0] * (tamanhos[1] if len(tamanhos) == 2 else 1)
+        arranjo = '[%d x %s]' % (total, tipo)
+        ponteiro = 'getelementptr inbounds (%s, %s* %s, i64 0, i64 0)' % (arranjo, arranjo, simbolo)
+        self.enderecos[variavel] = (ponteiro, str(tamanhos[1]) if len(tamanhos) == 2 else None)
+        return '%s = internal global %s zeroinitializer' % (simbolo, arranjo)
+
+    def busca(self, nome):
+        return self.leiaute.busca(nome, self.funcao)
+
+    # Ponteiro para a variável escalar ou para o elemento do arranjo nas posições (nós expressao)
+    def ponteiro(self, variavel, posicoes):
+        base, colunas = self.enderecos[variavel]
+        tipo = tipos[variavel.type]
+        if not posicoes:
+            return base
+        deslocamento = self.converteExpressao(posicoes[0], 'inteiro')
+        if len(posicoes) == 2:
+            linha = self.valor('mul i64 %s, %s' % (deslocamento, colunas))
+            deslocamento = self.valor('add i64 %s, %s' % (linha, self.converteExpressao(posicoes[1], 'inteiro')))
+        return self.valor('getelementptr inbounds %s, %s* %s, i64 %s' % (tipo, tipo, base, deslocamento))
+
+    def carrega(self, variavel, posicoes):
+        tipo = tipos[variavel.type]
+        return self.valor('load %s, %s* %s' % (tipo, tipo, self.ponteiro(variavel, posicoes)))
+
+    def armazena(self, variavel, posicoes, valor):
+        tipo = tipos[variavel.type]
+        ponteiro = self.ponteiro(variavel, posicoes)
+        self.emite('store %s %s, %s* %s' % (tipo, valor, tipo, ponteiro))
+
+    # Funções
+
+    def geraInicializacao(self):
+        self.iniciaFuncao(None)
+        for item in self.leiaute.inicializacoes:
+            # Os arranjos globais já são globais LLVM zeradas
+            if not isinstance(item, Variavel):
+                self.geraAtribuicao(item)
+        self.emite('ret void')
+        return 'define internal void @tpp.inicializa() {\n%s\n}\n' % '\n'.join(self.linhas)
+
+    def geraFuncao(self, funcao):
+        self.iniciaFuncao(funcao)
+        assinatura = []
+        for parametro in funcao.parametros:
+            tipo = tipos[parametro.type]
+            if parametro.dimensoes:
+                argumento = '%' + nome('p.', parametro.nome)
+                assinatura.append('%s* %s' % (tipo, argumento))
+                colunas = None
+                if parametro.dimensoes == 2:
+                    colunas = '%' + nome('c.', parametro.nome)
+                    assinatura.append('i64 %s' % colunas)
+                self.enderecos[parametro] = (argumento, colunas)
+            else:
+                assinatura.append('%s %s' % (tipo, '%' + nome('p.', parametro.nome)))
+
+        # Variáveis escalares (e parâmetros) em alloca, iniciadas com zero ou com o argumento
+        for variavel in funcao.variaveis.values():
+            if variavel.dimensoes:
+                continue
+            tipo = tipos[variavel.type]
+            endereco = '%' + nome('v.', variavel.nome)
+            self.emite('%s = alloca %s' % (endereco, tipo))
+            inicial = '%' + nome('p.', variavel.nome) if variavel in funcao.parametros else constante(0, variavel.type)
+            self.emite('store %s %s, %s* %s' % (tipo, inicial, tipo, endereco))
+            self.enderecos[variavel] = (endereco, None)
+        for variavel in funcao.arranjos:
+            self.alocaArranjo(variavel)
+
+        self.geraBloco(funcao.corpo)
+        # Função que termina sem retorna: devolve zero
+        self.emite('ret void' if funcao.type == 'vazio' else 'ret %s %s' % (tipos[funcao.type],
+                                                                             constante(0, funcao.type)))
+        return 'define internal %s @%s(%s) {\n%s\n}\n' % (tipos[funcao.type], nome('tpp.', funcao.nome),
+                                                           ', '.join(assinatura), '\n'.join(self.linhas))
+
+    # Arranjo local, alocado na entrada da função com os tamanhos avaliados na chamada e zerado
+    def alocaArranjo(self, variavel):
+        tipo = tipos[variavel.type]
+        tamanhos = [self.converteExpressao(node, 'inteiro') for node in variavel.tamanhos]
+        total = tamanhos[0]
+        colunas = None
+        if len(tamanhos) == 2:
+            colunas = tamanhos[1]
+            total = self.valor('mul i64 %s, %s' % (tamanhos[0], colunas))
+        endereco = '%' + nome('v.', variavel.nome)
+        self.emite('%s = alloca %s, i64 %s' % (endereco, tipo, total))
+        tamanho = self.valor('mul i64 %s, 8' % total)
+        inicio = self.valor('bitcast %s* %s to i8*' % (tipo, endereco))
+        self.emite('call void @llvm.memset.p0i8.i64(i8* %s, i8 0, i64 %s, i1 false)' % (inicio, tamanho))
+        self.enderecos[variavel] = (endereco, colunas)
+
+    # @main: inicializa as globais, chama principal e devolve o seu valor como código de saída
+    def geraMain(self):
+        principal = self.leiaute.funcoes['principal']
+        linhas = ['  call void @tpp.inicializa()']
+        if principal.type == 'vazio':
+            linhas += ['  call void @%s()' % nome('tpp.', 'principal'), '  ret i32 0']
+        else:
+            conversao = 'trunc i64' if principal.type == 'inteiro' else 'fptosi double'
+            linhas += ['  %%retorno = call %s @%s()' % (tipos[principal.type], nome('tpp.', 'principal')),
+                       '  %%codigo = %s %%retorno to i32' % conversao,
+                       '  ret i32 %codigo']
+        return 'define i32 @main() {\nentrada:\n%s\n}\n' % '\n'.join(linhas)
+
+    # Ações
+
+    # Gera o bloco com uma pilha de pendências (ações, blocos internos e o que vem depois deles), sem usar a pilha
+    # do Python nos blocos aninhados
+    def geraBloco(self, corpo):
+        pendentes = [corpo]
+        while pendentes:
+            item = pendentes.pop()
+            if callable(item):
+                item()
+            elif item.name == 'corpo':
+                pendentes.extend(reversed(item.children))
+            else:
+                pendentes.extend(reversed(self.geraAcao(item)))
+
+    # Gera a ação; devolve o que ainda falta gerar, em ordem: os blocos internos do se e do repita e as funções
+    # que emitem o código depois de cada um
+    def geraAcao(self, node):
+        if node.name == 'declaracao_variaveis':
+            return []
+        if node.name == 'atribuicao':
+            self.geraAtribuicao(node)
+        elif node.name == 'se':
+            return self.geraSe(node)
+        elif node.name == 'repita':
+            return self.geraRepita(node)
+        elif node.name == 'leia':
+            self.geraLeia(node)
+        elif node.name == 'escreva':
+            self.geraEscreva(node)
+        elif node.name == 'retorna':
+            self.geraRetorna(node)
+        elif node.name == 'expressao':
+            self.geraExpressao(node)
+        else:
+            raise erro('ERR-EXEC-NOT-SUPPORTED', node.name)
+        return []
+
+    def geraAtribuicao(self, node):
+        variavel = self.busca(node.children[0].children[0].name)
+        valor = self.converteExpressao(node.children[2], variavel.type)
+        self.armazena(variavel, indices(node.children[0]), valor)
+
+    def geraSe(self, node):
+        condicao = self.condicao(*self.geraExpressao(node.children[1]))
+        corpos = [child for child in node.children if child.name == 'corpo']
+        entao, fim = self.novoRotulo(), self.novoRotulo()
+        senao = self.novoRotulo() if len(corpos) == 2 else fim
+        self.emite('br i1 %s, label %%%s, label %%%s' % (condicao, entao, senao))
+        self.inicia(entao)
+
+        # Depois de cada bloco, o salto para o fim e o início do próximo bloco (o senao, ou o fim sem senao)
+        def termina(proximo):
+            def salta():
+                self.emite('br label %%%s' % fim)
+                self.inicia(proximo)
+            return salta
+        if len(corpos) == 2:
+            return [corpos[0], termina(senao), corpos[1], termina(fim)]
+        return [corpos[0], termina(fim)]
+
+    def geraRepita(self, node):
+        corpo, fim = self.novoRotulo(), self.novoRotulo()
+        self.emite('br label %%%s' % corpo)
+        self.inicia(corpo)
+
+        def terminaCorpo():
+            condicao = self.condicao(*self.geraExpressao(node.children[3]))
+            self.emite('br i1 %s, label %%%s, label %%%s' % (condicao, fim, corpo))
+            self.inicia(fim)
+        return [node.children[1], terminaCorpo]
+
+    def geraLeia(self, node):
+        var = node.children[2]
+        variavel = self.busca(var.children[0].name)
+        tipo = tipos[variavel.type]
+        valor = self.valor('call %s @tpp.rt.leia_%s()' % (tipo, variavel.type))
+        self.armazena(variavel, indices(var), valor)
+
+    def geraEscreva(self, node):
+        valor, type = self.geraExpressao(node.children[2])
+        if type == 'vazio':
+            raise erro('ERR-EXEC-NOT-SUPPORTED', 'escreva')
+        self.emite('call void @tpp.rt.escreva_%s(%s %s)' % (type, tipos[type], valor))
+
+    def geraRetorna(self, node):
+        funcao = self.funcao
+        expressoes = [child for child in node.children if child.name == 'expressao']
+        if funcao.type == 'vazio':
+            if expressoes:
+                self.geraExpressao(expressoes[0])
+            self.emite('ret void')
+        elif expressoes:
+            self.emite('ret %s %s' % (tipos[funcao.type], self.converteExpressao(expressoes[0], funcao.type)))
+        else:
+            self.emite('ret %s %s' % (tipos[funcao.type], constante(0, funcao.type)))
+        # As ações depois do retorna ficam em um bloco sem predecessores
+        self.inicia(self.novoRotulo())
+
+    # Chamadas
+
+    def geraChamada(self, node):
+        funcao, expressoes = self.leiaute.chamada(node)
+        argumentos = []
+        for parametro, expressao in zip(funcao.parametros, expressoes):
+            tipo = tipos[parametro.type]
+            if parametro.dimensoes:
+                variavel, posicoes = self.leiaute.argumentoArranjo(parametro, funcao, expressao, self.funcao)
+                base, colunas = self.enderecos[variavel]
+                if posicoes:
+                    # Linha de uma matriz passada a um parâmetro vetor
+                    linha = self.converteExpressao(posicoes[0], 'inteiro')
+                    inicio = self.valor('mul i64 %s, %s' % (linha, colunas))
+                    base = self.valor('getelementptr inbounds %s, %s* %s, i64 %s' % (tipo, tipo, base, inicio))
+                argumentos.append('%s* %s' % (tipo, base))
+                if parametro.dimensoes == 2:
+                    argumentos.append('i64 %s' % colunas)
+            else:
+                argumentos.append('%s %s' % (tipo, self.converteExpressao(expressao, parametro.type)))
+        chamada = 'call %s @%s(%s)' % (tipos[funcao.type], nome('tpp.', funcao.nome), ', '.join(argumentos))
+        if funcao.type == 'vazio':
+            self.emite(chamada)
+            return None, 'vazio'
+        return self.valor(chamada), funcao.type
+
+    # Expressões
+
+    # Gera a expressão; retorna o valor (temporário ou constante) e o tipo
+    def geraExpressao(self, node):
+        return self.geraTermo(analisaExpressao(node))
+
+    def converteExpressao(self, node, destino):
+        return self.converte(*self.geraExpressao(node), destino)
+
+    def converte(self, valor, origem, destino):
+        if origem == 'vazio':
+            raise erro('ERR-EXEC-NOT-SUPPORTED', 'vazio')
+        if origem == 'inteiro' and destino == 'flutuante':
+            return self.valor('sitofp i64 %s to double' % valor)
+        if origem == 'flutuante' and destino == 'inteiro':
+            return self.valor('fptosi double %s to i64' % valor)
+        return valor
+
+    # Valor i1 da condição (diferente de zero)
+    def condicao(self, valor, type):
+        if type == 'flutuante':
+            return self.valor('fcmp une double %s, 0.0' % valor)
+        return self.valor('icmp ne i64 %s, 0' % self.converte(valor, type, 'inteiro'))
+
+    # Gera o termo com uma pilha de pendências (operandos e as funções que geram cada operação depois deles), sem
+    # usar a pilha do Python: o termo de uma expressão longa (a - b + c ...) é tão profundo quanto o número de
+    # operações. valores tem os (valor, tipo) dos operandos já gerados
+    def geraTermo(self, termo):
+        valores = []
+        pendentes = [termo]
+        while pendentes:
+            item = pendentes.pop()
+            if callable(item):
+                item(valores)
+            elif item[0] == 'numero':
+                valores.append((constante(item[1], item[2]), item[2]))
+            elif item[0] == 'var':
+                variavel = self.busca(item[1].children[0].name)
+                valores.append((self.carrega(variavel, indices(item[1])), variavel.type))
+            elif item[0] == 'chamada':
+                valores.append(self.geraChamada(item[1]))
+            elif item[0] == 'unario':
+                pendentes.extend([self.operacao(self.geraUnario, item[1], 1), item[2]])
+            elif item[1] in ('&&', '||'):
+                primeiro, segundo = self.geraLogico(item[1])
+                pendentes.extend([segundo, item[3], primeiro, item[2]])
+            else:
+                pendentes.extend([self.operacao(self.geraBinario, item[1], 2), item[3], item[2]])
+        return valores.pop()
+
+    # Função que gera a operação sobre os últimos operandos gerados e guarda o seu (valor, tipo) no lugar deles
+    def operacao(self, gera, operador, operandos):
+        def aplica(valores):
+            resultado = gera(operador, *valores[-operandos:])
+            del valores[-operandos:]
+            valores.append(resultado)
+        return aplica
+
+    def geraUnario(self, operador, operando):
+        valor, type = operando
+        if operador == '-':
+            if type == 'flutuante':
+                return self.valor('fneg double %s' % valor), type
+            return self.valor('sub i64 0, %s' % self.converte(valor, type, type)), type
+        if operador == '!':
+            negacao = self.valor('xor i1 %s, true' % self.condicao(valor, type))
+            return self.valor('zext i1 %s to i64' % negacao), 'inteiro'
+        return valor, type
+
+    def geraBinario(self, operador, esquerda, direita):
+        esquerda, tipoEsquerda = esquerda
+        direita, tipoDireita = direita
+        type = promoveTipo(tipoEsquerda, tipoDireita)
+        esquerda = self.converte(esquerda, tipoEsquerda, type)
+        direita = self.converte(direita, tipoDireita, type)
+        flutuante = type == 'flutuante'
+        if operador in comparacoes:
+            comparacao = self.valor('%s %s %s, %s' % (comparacoes[operador][flutuante], tipos[type], esquerda, direita))
+            return self.valor('zext i1 %s to i64' % comparacao), 'inteiro'
+        valor = self.valor('%s %s %s, %s' % (aritmeticas[operador][flutuante], tipos[type], esquerda, direita))
+        return valor, tipoOperacao(operador, tipoEsquerda, tipoDireita)
+
+    # && e ||: o segundo operando só é avaliado se o primeiro não decidir o resultado. Retorna as funções que geram
+    # o código depois do primeiro operando (o desvio) e depois do segundo (a junção dos dois caminhos)
+    def geraLogico(self, operador):
+        # Bloco em que o primeiro operando termina e rótulo da junção, criados depois do primeiro operando
+        rotulos = {}
+
+        def depoisPrimeiro(valores):
+            primeiro = self.condicao(*valores.pop())
+            rotulos['inicio'] = self.bloco
+            segundo, fim = self.novoRotulo(), self.novoRotulo()
+            rotulos['fim'] = fim
+            if operador == '&&':
+                self.emite('br i1 %s, label %%%s, label %%%s' % (primeiro, segundo, fim))
+            else:
+                self.emite('br i1 %s, label %%%s, label %%%s' % (primeiro, fim, segundo))
+            self.inicia(segundo)
+
+        def depoisSegundo(valores):
+            fim = rotulos['fim']
+            resultado = self.condicao(*valores.pop())
+            final = self.bloco
+            self.emite('br label %%%s' % fim)
+            self.inicia(fim)
+            decidido = 'false' if operador == '&&' else 'true'
+            valor = self.valor('phi i1 [%s, %%%s], [%s, %%%s]' % (decidido, rotulos['inicio'], resultado, final))
+            valores.append((self.valor('zext i1 %s to i64' % valor), 'inteiro'))
+        return depoisPrimeiro, depoisSegundo
+
+
+# Gera o módulo LLVM (texto .ll) da árvore podada de um programa. runtime: define as funções de leia e escreva
+# no módulo (sobre scanf e printf); False apenas as declara
+def geraPrograma(root, runtime=True):
+    return Gerador(root, runtime).gera()
+
+
+def main(parametros):
+    from main import separaOpcoes
+    from tppexecutor import compilaFonte
+
+    arquivos, opcoes = separaOpcoes(parametros)
+    if len(arquivos) != 1 or not arquivos[0].endswith('.tpp'):
+        raise IOError(error_handler.newError(False, 'ERR-EXEC-LLVM-USE'))
+    codigo = geraPrograma(compilaFonte(arquivos[0], opcoes), runtime='sem-runtime' not in opcoes)
+    saida = opcoes['saida'] if opcoes.get('saida', True) is not True else arquivos[0][:-len('.tpp')] + '.ll'
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(codigo)
+    return saida
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,100 @@
+import io
+import shutil
+import subprocess
+
+import pytest
+
+import tppcompilador
+import tppexecutor
+import tppllvm
+from benchmarks.gerador import geraBlocosAninhados, geraExpressaoLonga
+from tppexecutor_test import bolha, expressoes, fatorial
+from tpparranjos_test import linhas
+
+coercoes = '''
+flutuante: taxa
+taxa := 2
+
+flutuante metade(inteiro: n)
+  retorna(n / 2)
+fim
+
+inteiro principal()
+  inteiro: a
+  a := metade(7) * taxa
+  escreva(a)
+  retorna(a)
+fim
+'''
+
+
+def gera(fonte, runtime=True):
+    resultado = tppcompilador.compila(fonte)
+    assert resultado.sucesso(), resultado.erro
+    return tppllvm.geraPrograma(resultado.root, runtime)
+
+
+def test_001():
+    # Globais, funções com os tipos dos parâmetros, variáveis locais em alloca e chamadas do ambiente de execução
+    codigo = gera(bolha)
+    assert '@"tpp.g.v" = internal global [8 x i64] zeroinitializer' in codigo
+    assert 'define internal void @"tpp.ordena"(i64* %"p.w", i64 %"p.n")' in codigo
+    assert 'define internal i64 @"tpp.principal"()' in codigo
+    assert '%"v.aux" = alloca i64' in codigo
+    assert 'call i64 @tpp.rt.leia_inteiro()' in codigo
+    assert 'call void @tpp.rt.escreva_inteiro(i64 ' in codigo
+    assert 'define i32 @main()' in codigo
+
+    # Matriz global em um único bloco; flutuantes (já dobrados) como constantes exatas
+    codigo = gera(expressoes)
+    assert '@"tpp.g.m" = internal global [6 x double] zeroinitializer' in codigo
+    assert 'define internal void @tpp.inicializa()' in codigo
+    assert 'store double 0xC0A3860000000000, double* %t' in codigo
+
+
+def test_002():
+    # Conversões nos mesmos pontos dos avisos de coerção: atribuição, argumento e retorno
+    codigo = gera(coercoes)
+    assert 'sitofp i64 2 to double' in codigo and 'double* @"tpp.g.taxa"' in codigo
+    assert 'sdiv i64' in codigo and 'sitofp i64' in codigo and 'fptosi double' in codigo
+
+    # Sem o ambiente de execução, as funções de leia e escreva são apenas declaradas
+    codigo = gera(fatorial, runtime=False)
+    assert 'declare i64 @tpp.rt.leia_inteiro()' in codigo
+    assert '@printf' not in codigo
+
+
+def test_003():
+    with pytest.raises(tppexecutor.ErroExecucao, match="arranjo global 'v'"):
+        gera(bolha.replace('inteiro: v[8]', 'inteiro: k\ninteiro: v[k]').replace('  inteiro: i\n', '  inteiro: i\n  leia(k)\n'))
+
+
+@pytest.mark.skipif(shutil.which('lli') is None, reason='lli (LLVM) não instalado')
+@pytest.mark.parametrize('fonte, entrada', [(fatorial, '5'), (bolha, '5 3 8 1\n9 2\n7 4\n'), (expressoes, ''),
+                                            (linhas, ''), (coercoes, '')])
+def test_004(fonte, entrada, tmp_path):
+    # O código executado pelo lli tem a mesma saída e o mesmo retorno do executor de closures
+    resultado = tppcompilador.compila(fonte)
+    saida = io.StringIO()
+    retorno = tppexecutor.compilaPrograma(resultado.root).executa(io.StringIO(entrada), saida)
+    arquivo = tmp_path / 'programa.ll'
+    arquivo.write_text(tppllvm.geraPrograma(resultado.root), encoding='utf-8')
+    processo = subprocess.run(['lli', str(arquivo)], input=entrada, capture_output=True, text=True)
+    assert (processo.returncode, processo.stdout) == (retorno, saida.getvalue())
+
+
+def test_005():
+    # Blocos se/repita profundamente aninhados: a geração usa uma pilha de pendências, não a do Python; cada se
+    # e cada repita tem o seu desvio condicional
+    codigo = gera(geraBlocosAninhados(1500))
+    principal = codigo[codigo.index('define internal i64 @"tpp.principal"'):]
+    assert principal[:principal.index('\n}\n')].count('br i1 ') == 1500
+
+
+def test_006():
+    # Expressão longa (x - 1 + x ...): a geração do termo usa uma pilha de pendências, não a do Python; uma
+    # instrução por operação
+    codigo = gera(geraExpressaoLonga(5000))
+    principal = codigo[codigo.index('define internal i64 @"tpp.principal"'):]
+    principal = principal[:principal.index('\n}\n')]
+    assert (principal.count(' = add i64 '), principal.count(' = sub i64 ')) == (2499, 2500)
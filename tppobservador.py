@@ -0,0 +1,216 @@
+# Descrição: Modo de observação do compilador T++ (main.py --watch PASTA).
+#            Observa os arquivos .tpp de uma pasta (e subpastas) e, a cada alteração, recompila apenas
+#            os arquivos modificados no mesmo processo, imprimindo os diagnósticos semânticos. No Linux
+#            as alterações são recebidas do inotify; nas demais plataformas (ou se o inotify não estiver
+#            disponível) a pasta é varrida periodicamente. Rajadas de gravações são agrupadas (espera
+#            sem novos eventos) e um arquivo cujo conteúdo não mudou não é recompilado.
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+
+import tppcompilador
+
+
+# Indica se o caminho é um programa T++
+def ehFonte(caminho):
+    return caminho.endswith('.tpp')
+
+
+# Lista os arquivos .tpp da pasta e das subpastas
+def listaFontes(pasta):
+    fontes = []
+    for diretorio, subpastas, arquivos in os.walk(pasta):
+        subpastas.sort()
+        fontes += [os.path.join(diretorio, nome) for nome in sorted(arquivos) if ehFonte(nome)]
+    return fontes
+
+
+# Observador baseado no inotify (Linux), acessado pela libc com ctypes
+class ObservadorInotify:
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    eventos = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    evento = struct.Struct('iIII')
+
+    def __init__(self, pasta):
+        self.pasta = pasta
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1')
+        self.pastas = {}
+        for diretorio, subpastas, arquivos in os.walk(pasta):
+            self.adicionaPasta(diretorio)
+
+    def adicionaPasta(self, diretorio):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(diretorio), self.eventos)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_add_watch', diretorio)
+        self.pastas[wd] = diretorio
+
+    # Aguarda alterações por até espera segundos (None = sem limite); devolve os arquivos .tpp alterados
+    def aguarda(self, espera=None):
+        if not select.select([self.fd], [], [], espera)[0]:
+            return set()
+        dados = os.read(self.fd, 65536)
+        alterados = set()
+        posicao = 0
+        while posicao < len(dados):
+            wd, mascara, cookie, tamanho = self.evento.unpack_from(dados, posicao)
+            posicao += self.evento.size
+            nome = os.fsdecode(dados[posicao:posicao + tamanho].rstrip(b'\0'))
+            posicao += tamanho
+
+            if mascara & self.IN_Q_OVERFLOW:
+                # Eventos perdidos: considera todos os arquivos (os que não mudaram são ignorados pela sessão)
+                alterados.update(listaFontes(self.pasta))
+            elif mascara & self.IN_IGNORED:
+                self.pastas.pop(wd, None)
+            elif wd in self.pastas:
+                caminho = os.path.join(self.pastas[wd], nome)
+                if mascara & self.IN_ISDIR:
+                    if mascara & (self.IN_CREATE | self.IN_MOVED_TO):
+                        self.adicionaPasta(caminho)
+                        alterados.update(listaFontes(caminho))
+                elif ehFonte(nome):
+                    alterados.add(caminho)
+        return alterados
+
+    def fecha(self):
+        os.close(self.fd)
+
+
+# Observador que varre a pasta periodicamente comparando a data de modificação e o tamanho dos arquivos
+class ObservadorVarredura:
+
+    def __init__(self, pasta, intervalo=0.5):
+        self.pasta = pasta
+        self.intervalo = intervalo
+        self.estado = self.varre()
+
+    def varre(self):
+        estado = {}
+        for caminho in listaFontes(self.pasta):
+            try:
+                informacao = os.stat(caminho)
+            except FileNotFoundError:
+                continue
+            estado[caminho] = (informacao.st_mtime_ns, informacao.st_size)
+        return estado
+
+    # Aguarda alterações por até espera segundos (None = sem limite); devolve os arquivos .tpp alterados
+    def aguarda(self, espera=None):
+        limite = None if espera is None else time.monotonic() + espera
+        while True:
+            estado = self.varre()
+            alterados = {caminho for caminho in estado.keys() | self.estado.keys()
+                         if estado.get(caminho) != self.estado.get(caminho)}
+            self.estado = estado
+            if alterados:
+                return alterados
+            if limite is not None and time.monotonic() >= limite:
+                return set()
+            intervalo = self.intervalo if limite is None else min(self.intervalo, max(0.0, limite - time.monotonic()))
+            time.sleep(intervalo)
+
+    def fecha(self):
+        pass
+
+
+# Cria o observador da pasta: inotify quando disponível, senão a varredura periódica
+def criaObservador(pasta):
+    if sys.platform.startswith('linux'):
+        try:
+            return ObservadorInotify(pasta)
+        except (OSError, AttributeError):
+            pass
+    return ObservadorVarredura(pasta)
+
+
+# Sessão de compilação do modo de observação: mantém o resultado de cada arquivo e só recompila os
+# arquivos cujo conteúdo mudou
+class SessaoObservacao:
+
+    # opcoes: repassadas a tppcompilador.compila (gramatica, trabalhadores, ...)
+    def __init__(self, **opcoes):
+        self.opcoes = opcoes
+        self.cache = {}
+
+    # Compila o arquivo se o conteúdo mudou; devolve o resultado ou None se nada mudou
+    def compila(self, caminho):
+        try:
+            with open(caminho, 'rb') as arquivo:
+                dados = arquivo.read()
+        except FileNotFoundError:
+            self.cache.pop(caminho, None)
+            return None
+        resumo = hashlib.sha1(dados).hexdigest()
+        if caminho in self.cache and self.cache[caminho][0] == resumo:
+            return None
+        resultado = tppcompilador.compila(dados.decode('utf-8'), poda=False, **self.opcoes)
+        self.cache[caminho] = (resumo, resultado.diagnosticos)
+        return resultado
+
+
+# Imprime o resultado da compilação de um arquivo
+def imprimeResultado(caminho, resultado, saida):
+    if resultado.erro is not None or not resultado.arvoreGerada():
+        situacao = 'erro na análise %s' % (resultado.faseErro or 'sintatica')
+    else:
+        situacao = '%d diagnóstico(s)' % len(resultado.diagnosticos)
+    saida.write('[%s] %s: %s\n' % (time.strftime('%H:%M:%S'), caminho, situacao))
+    saida.write(resultado.saida)
+    saida.flush()
+
+
+# Compila todos os arquivos da pasta e depois recompila os alterados até ser interrompido (Ctrl+C).
+#   agrupamento: segundos sem novos eventos antes de recompilar uma rajada de gravações
+#   saida: onde os resultados são impressos (padrão: sys.stdout)
+#   ciclos: número de rajadas atendidas antes de retornar (None = sem limite)
+def observa(pasta, agrupamento=0.2, saida=None, ciclos=None, **opcoes):
+    saida = saida or sys.stdout
+    sessao = SessaoObservacao(**opcoes)
+    observador = criaObservador(pasta)
+    try:
+        for caminho in listaFontes(pasta):
+            resultado = sessao.compila(caminho)
+            if resultado is not None:
+                imprimeResultado(caminho, resultado, saida)
+
+        while ciclos is None or ciclos > 0:
+            alterados = observador.aguarda()
+            while True:
+                rajada = observador.aguarda(agrupamento)
+                if not rajada:
+                    break
+                alterados |= rajada
+
+            for caminho in sorted(alterados):
+                if not os.path.exists(caminho):
+                    if sessao.cache.pop(caminho, None) is not None:
+                        saida.write('[%s] %s: removido\n' % (time.strftime('%H:%M:%S'), caminho))
+                    continue
+                resultado = sessao.compila(caminho)
+                if resultado is not None:
+                    imprimeResultado(caminho, resultado, saida)
+            saida.flush()
+            if ciclos is not None:
+                ciclos -= 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observador.fecha()
+    return sessao
@@ -0,0 +1,45 @@
+import os
+import shutil
+import tempfile
+
+import tppobservador
+
+def copia_caso(pasta, nome):
+    destino = os.path.join(pasta, nome)
+    shutil.copy(os.path.join('tests', nome), destino)
+    return destino
+
+def test_001():
+    # Um arquivo só é recompilado quando o conteúdo muda
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = copia_caso(pasta, 'sema-017.tpp')
+        sessao = tppobservador.SessaoObservacao()
+        resultado = sessao.compila(caminho)
+        assert len(resultado.diagnosticos) > 0
+        os.utime(caminho)
+        assert sessao.compila(caminho) is None
+        with open(caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write('\n')
+        assert sessao.compila(caminho).diagnosticos == resultado.diagnosticos
+
+def test_002():
+    # Os dois observadores informam os arquivos .tpp criados, alterados e removidos
+    with tempfile.TemporaryDirectory() as pasta:
+        existente = copia_caso(pasta, 'sema-001.tpp')
+        for cria in [tppobservador.criaObservador, lambda pasta: tppobservador.ObservadorVarredura(pasta, 0.05)]:
+            observador = cria(pasta)
+            assert observador.aguarda(0.1) == set()
+            novo = copia_caso(pasta, 'sema-003.tpp')
+            with open(existente, 'a', encoding='utf-8') as arquivo:
+                arquivo.write('\n')
+            with open(os.path.join(pasta, 'notas.txt'), 'w') as arquivo:
+                arquivo.write('ignorado')
+            alterados = set()
+            while {novo, existente} - alterados:
+                rajada = observador.aguarda(2)
+                assert rajada
+                alterados |= rajada
+            assert alterados == {novo, existente}
+            os.remove(novo)
+            assert novo in observador.aguarda(2)
+            observador.fecha()
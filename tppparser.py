@@ -29,9 +29,9 @@ import ply.yacc as yacc
 # Get the token map from the lexer.  This is required.
 from tpplex import tokens
 
+import mytree
 from mytree import MyNode
-from anytree.exporter import DotExporter, UniqueDotExporter
-from anytree import RenderTree, AsciiStyle
+import tpptabelas
 
 error_handler = MyError('ParserErrors')
 
@@ -55,21 +55,27 @@ def p_programa(p):
     p[0] = programa
     p[1].parent = programa
 
-#    (lista_declaracoes)                          (lista_declaracoes)
-#          /           \                                    |
-# (lista_declaracoes)  (declaracao)                    (declaracao)
+# Sub-árvore.
+#          (lista_declaracoes)
+#          /       |       \
+# (declaracao) (declaracao) ...
+#
+# As listas (lista_declaracoes, lista_variaveis, lista_parametros, lista_argumentos e corpo) são
+# achatadas: a produção recursiva acrescenta o novo elemento ao nó da lista já criado, em vez de
+# criar um nó por elemento.
 
 
 def p_lista_declaracoes(p):
     """lista_declaracoes : lista_declaracoes declaracao
                         | declaracao
     """
-    pai = MyNode(name='lista_declaracoes', type='LISTA_DECLARACOES')
-    p[0] = pai
-    p[1].parent = pai
-
     if len(p) > 2:
+        pai = p[1]
         p[2].parent = pai
+    else:
+        pai = MyNode(name='lista_declaracoes', type='LISTA_DECLARACOES')
+        p[1].parent = pai
+    p[0] = pai
 
 # Sub-árvore.
 #      (declaracao)
@@ -128,19 +134,24 @@ def p_inicializacao_variaveis(p):
     p[1].parent = pai
 
 
+# Sub-árvore.
+#        (lista_variaveis)
+#      /      |       \    \
+#  (var)  (virgula)  (var)  ...
+
 def p_lista_variaveis(p):
     """lista_variaveis : lista_variaveis VIRGULA var
                         | var
     """
-    pai = MyNode(name='lista_variaveis', type='LISTA_VARIAVEIS')
-    p[0] = pai
     if len(p) > 2:
-        p[1].parent = pai
+        pai = p[1]
         filho = MyNode(name='virgula', type='VIRGULA', parent=pai)
         filho_sym = MyNode(name=',', type='SIMBOLO', parent=filho)
         p[3].parent = pai
     else:
-       p[1].parent = pai
+        pai = MyNode(name='lista_variaveis', type='LISTA_VARIAVEIS')
+        p[1].parent = pai
+    p[0] = pai
 
 def p_lista_variaveis_error(p):
     """lista_variaveis : error VIRGULA var
@@ -157,7 +168,7 @@ def p_var(p):
     pai = MyNode(name='var', type='VAR')
     p[0] = pai
     filho = MyNode(name='ID', type='ID', parent=pai)
-    filho_id = MyNode(name=p[1], type='ID', parent=filho)
+    filho_id = MyNode(name=p[1], type='ID', parent=filho, line=p.lineno(1))
     p[1] = filho
     if len(p) > 2:
         p[2].parent = pai
@@ -262,7 +273,7 @@ def p_cabecalho(p):
     p[0] = pai
 
     filho1 = MyNode(name='ID', type='ID', parent=pai)
-    filho_id = MyNode(name=p[1], type='ID', parent=filho1)
+    filho_id = MyNode(name=p[1], type='ID', parent=filho1, line=p.lineno(1))
     p[1] = filho1
 
     filho2 = MyNode(name='ABRE_PARENTESE', type='ABRE_PARENTESE', parent=pai)
@@ -300,15 +311,16 @@ def p_lista_parametros(p):
                     | vazio
     """
 
-    pai = MyNode(name='lista_parametros', type='LISTA_PARAMETROS')
-    p[0] = pai
-    p[1].parent = pai
-
     if len(p) > 2:
+        pai = p[1]
         filho2 = MyNode(name='virgula', type='VIRGULA', parent=pai)
         filho_sym2 = MyNode(name=',', type='SIMBOLO', parent=filho2)
         p[2] = filho2
         p[3].parent = pai
+    else:
+        pai = MyNode(name='lista_parametros', type='LISTA_PARAMETROS')
+        p[1].parent = pai
+    p[0] = pai
 
 def p_lista_parametros_error(p):
     """lista_parametros : error VIRGULA parametro
@@ -336,7 +348,7 @@ def p_parametro(p):
         p[2] = filho2
 
         filho3 = MyNode(name='id', type='ID', parent=pai)
-        filho_id = MyNode(name=p[3], type='ID', parent=filho3)
+        filho_id = MyNode(name=p[3], type='ID', parent=filho3, line=p.lineno(3))
     else:
         filho2 = MyNode(name='abre_colchete', type='ABRE_COLCHETE', parent=pai)
         filho_sym2 = MyNode(name='[', type='SIMBOLO', parent=filho2)
@@ -364,12 +376,16 @@ def p_corpo(p):
             | vazio
     """
 
-    pai = MyNode(name='corpo', type='CORPO')
-    p[0] = pai
-    p[1].parent = pai
-
     if len(p) > 2:
+        pai = p[1]
+        # O corpo vazio só mantém o nó vazio enquanto não tem ações
+        if pai.children[0].name == 'vazio':
+            pai.children[0].parent = None
         p[2].parent = pai
+    else:
+        pai = MyNode(name='corpo', type='CORPO')
+        p[1].parent = pai
+    p[0] = pai
 
 def p_corpo_error(p):
     """corpo : error acao
@@ -417,7 +433,7 @@ def p_se(p):
     p[0] = pai
 
     filho1 = MyNode(name='SE', type='SE', parent=pai)
-    filho_se = MyNode(name=p[1], type='SE', parent=filho1)
+    filho_se = MyNode(name=p[1], type='SE', parent=filho1, line=p.lineno(1))
     p[1] = filho1
 
     p[2].parent = pai
@@ -469,7 +485,7 @@ def p_repita(p):
     p[0] = pai
 
     filho1 = MyNode(name='REPITA', type='REPITA', parent=pai)
-    filho_repita = MyNode(name=p[1], type='REPITA', parent=filho1)
+    filho_repita = MyNode(name=p[1], type='REPITA', parent=filho1, line=p.lineno(1))
     p[1] = filho1
 
     p[2].parent = pai  # corpo.
@@ -521,7 +537,7 @@ def p_leia(p):
     p[0] = pai
 
     filho1 = MyNode(name='LEIA', type='LEIA', parent=pai)
-    filho_sym1 = MyNode(name=p[1], type='LEIA', parent=filho1)
+    filho_sym1 = MyNode(name=p[1], type='LEIA', parent=filho1, line=p.lineno(1))
     p[1] = filho1
 
     filho2 = MyNode(name='ABRE_PARENTESE', type='ABRE_PARENTESE', parent=pai)
@@ -551,7 +567,7 @@ def p_escreva(p):
     p[0] = pai
 
     filho1 = MyNode(name='ESCREVA', type='ESCREVA', parent=pai)
-    filho_sym1 = MyNode(name=p[1], type='ESCREVA', parent=filho1)
+    filho_sym1 = MyNode(name=p[1], type='ESCREVA', parent=filho1, line=p.lineno(1))
     p[1] = filho1
 
     filho2 = MyNode(name='ABRE_PARENTESE', type='ABRE_PARENTESE', parent=pai)
@@ -580,7 +596,7 @@ def p_retorna(p):
     p[0] = pai
 
     filho1 = MyNode(name='RETORNA', type='RETORNA', parent=pai)
-    filho_sym1 = MyNode(name=p[1], type='RETORNA', parent=filho1)
+    filho_sym1 = MyNode(name=p[1], type='RETORNA', parent=filho1, line=p.lineno(1))
     p[1] = filho1
 
     filho2 = MyNode(name='ABRE_PARENTESE', type='ABRE_PARENTESE', parent=pai)
@@ -867,7 +883,7 @@ def p_chamada_funcao(p):
     p[0] = pai
     if len(p) > 2:
         filho1 = MyNode(name='ID', type='ID', parent=pai)
-        filho_id = MyNode(name=p[1], type='ID', parent=filho1)
+        filho_id = MyNode(name=p[1], type='ID', parent=filho1, line=p.lineno(1))
         p[1] = filho1
 
         filho2 = MyNode(name='ABRE_PARENTESE', type='ABRE_PARENTESE', parent=pai)
@@ -892,11 +908,8 @@ def p_lista_argumentos(p):
                     | expressao
                     | vazio
         """
-    pai = MyNode(name='lista_argumentos', type='LISTA_ARGUMENTOS')
-    p[0] = pai
-
     if len(p) > 2:
-        p[1].parent = pai
+        pai = p[1]
 
         filho2 = MyNode(name='VIRGULA', type='VIRGULA', parent=pai)
         filho_sym = MyNode(name=p[2], type='SIMBOLO', parent=filho2)
@@ -904,7 +917,9 @@ def p_lista_argumentos(p):
 
         p[3].parent = pai
     else:
+        pai = MyNode(name='lista_argumentos', type='LISTA_ARGUMENTOS')
         p[1].parent = pai
+    p[0] = pai
 
 def p_lista_argumentos_error(p):
     """lista_argumentos : error VIRGULA expressao
@@ -952,17 +967,27 @@ def main():
         parser.parse(source_file)
 
     if root and root.children != ():
-        UniqueDotExporter(root).to_picture(argv[1] + ".unique.ast.png")
-        DotExporter(root).to_dotfile(argv[1] + ".ast.dot")
-        UniqueDotExporter(root).to_dotfile(argv[1] + ".unique.ast.dot")
-
+        exportaArvore(argv[1])
     else:
         print(error_handler.newError(False, 'WAR-SYN-NOT-GEN-SYN-TREE'))
     return root
 
-# Build the parser.
-parser = yacc.yacc(method="LALR", optimize=True, start='programa', debug=False,
-                   debuglog=log, write_tables=False, tabmodule='tpp_parser_tab')
+# Exporta a árvore sintática (imagem e arquivos .dot) com o prefixo informado
+def exportaArvore(prefixo):
+    mytree.ExportadorDotUnico(root).to_picture(prefixo + ".unique.ast.png")
+    mytree.ExportadorDot(root).to_dotfile(prefixo + ".ast.dot")
+    mytree.ExportadorDotUnico(root).to_dotfile(prefixo + ".unique.ast.dot")
+
+# Opções do yacc.yacc para esta gramática
+opcoes_parser = dict(method="LALR", start='programa', debuglog=log)
+
+# Regenera a tabela LALR distribuída (tpp_parser_tab.py) depois de alterar a gramática:
+#   python -c "import tppparser; tppparser.geraTabela()"
+def geraTabela(pasta=tpptabelas.pasta_modulo):
+    return tpptabelas.geraParser(sys.modules[__name__], 'tpp_parser_tab', pasta, **opcoes_parser)
+
+# Build the parser (a partir da tabela distribuída ou do cache, veja tpptabelas.py).
+parser = tpptabelas.constroiParser(sys.modules[__name__], 'tpp_parser_tab', **opcoes_parser)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,17 @@
+# Descrição: Pré-carga do compilador T++ no servidor de fork dos trabalhadores (tpptrabalhadores.py).
+#            O servidor de fork importa este módulo uma única vez: o analisador léxico, as tabelas
+#            LALR das duas gramáticas e os catálogos de mensagens (ErrorMessages.properties) são
+#            construídos aqui, e os objetos criados são congelados (gc.freeze) para que o coletor de
+#            lixo dos trabalhadores não os toque. Cada trabalhador é um fork do servidor e compartilha
+#            essas páginas de memória (cópia na escrita) em vez de reconstruí-las.
+#            Não deve ser importado pelo programa principal.
+
+import gc
+
+import tppcompilador
+import tppsuite
+import tpptrabalhadores
+
+tppcompilador.precarrega()
+gc.collect()
+gc.freeze()
@@ -0,0 +1,175 @@
+# Descrição: Gramática alternativa de expressões da linguagem T++ baseada em tabela de precedência.
+#            A gramática original reduz cada fator por sete níveis (expressao, expressao_logica,
+#            expressao_simples, expressao_aditiva, expressao_multiplicativa, expressao_unaria e fator),
+#            criando um nó por nível. Aqui os operadores binários são resolvidos pela tabela de
+#            precedência do PLY e cada operação gera diretamente o nó do seu nível, com os mesmos
+#            nomes da gramática original:
+#
+#              (expressao_aditiva)                  (expressao)
+#              /        |         \                      |
+#         (fator) (operador_soma) (fator)             (fator)
+#                       |                                |
+#                    (MAIS)                           (numero)
+#
+#            A associatividade (à esquerda) e a ordem de precedência dos operadores (lógicos,
+#            relacionais, soma, multiplicação e, por último, os unários sobre um fator) são as mesmas.
+#            As demais produções são as do analisador sintático (tppparser.py), e a raiz continua
+#            em tppparser.root.
+
+import types
+
+import ply.yacc as yacc
+
+import tppparser
+from tppparser import error_handler, log
+from tpplex import tokens
+from mytree import MyNode
+import tpptabelas
+
+# Produções da gramática original substituídas pela gramática de precedência
+producoes_cascata = [
+    'p_expressao',
+    'p_expressao_logica',
+    'p_error_expressao_logica',
+    'p_expressao_simples',
+    'p_expressao_aditiva',
+    'p_expressao_multiplicativa',
+    'p_expressao_unaria',
+    'p_operador_relacional',
+    'p_operador_soma',
+    'p_operador_logico',
+    'p_error_operador_logico',
+    'p_operador_negacao',
+    'p_error_operador_negacao',
+    'p_operador_multiplicacao',
+    'p_error_operador_multiplicacao',
+]
+
+precedence = (
+    ('left', 'E', 'OU'),
+    ('left', 'MENOR', 'MAIOR', 'IGUAL', 'DIFERENTE', 'MENOR_IGUAL', 'MAIOR_IGUAL'),
+    ('left', 'MAIS', 'MENOS'),
+    ('left', 'VEZES', 'DIVIDE'),
+)
+
+# Nível (nome do nó da expressão e do nó do operador) de cada operador binário
+niveis = {
+    'E': ('expressao_logica', 'operador_logico'),
+    'OU': ('expressao_logica', 'operador_logico'),
+    'MENOR': ('expressao_simples', 'operador_relacional'),
+    'MAIOR': ('expressao_simples', 'operador_relacional'),
+    'IGUAL': ('expressao_simples', 'operador_relacional'),
+    'DIFERENTE': ('expressao_simples', 'operador_relacional'),
+    'MENOR_IGUAL': ('expressao_simples', 'operador_relacional'),
+    'MAIOR_IGUAL': ('expressao_simples', 'operador_relacional'),
+    'MAIS': ('expressao_aditiva', 'operador_soma'),
+    'MENOS': ('expressao_aditiva', 'operador_soma'),
+    'VEZES': ('expressao_multiplicativa', 'operador_multiplicacao'),
+    'DIVIDE': ('expressao_multiplicativa', 'operador_multiplicacao'),
+}
+
+
+# Cria o nó de um operador: (operador_*) -> (TOKEN) -> (lexema)
+def criaOperador(nome, token, lexema):
+    pai = MyNode(name=nome, type=nome.upper())
+    filho = MyNode(name=token, type=token, parent=pai)
+    filho_sym = MyNode(name=lexema, type='SIMBOLO', parent=filho)
+    return pai
+
+
+# Sub-árvore.
+#     (expressao)
+#          |
+#  (atribuicao ou operação)
+
+def p_expressao(p):
+    """expressao : expressao_binaria
+                 | atribuicao
+    """
+    pai = MyNode(name='expressao', type='EXPRESSAO')
+    p[0] = pai
+    p[1].parent = pai
+
+
+def p_expressao_binaria(p):
+    """expressao_binaria : expressao_binaria E expressao_binaria
+                         | expressao_binaria OU expressao_binaria
+                         | expressao_binaria MENOR expressao_binaria
+                         | expressao_binaria MAIOR expressao_binaria
+                         | expressao_binaria IGUAL expressao_binaria
+                         | expressao_binaria DIFERENTE expressao_binaria
+                         | expressao_binaria MENOR_IGUAL expressao_binaria
+                         | expressao_binaria MAIOR_IGUAL expressao_binaria
+                         | expressao_binaria MAIS expressao_binaria
+                         | expressao_binaria MENOS expressao_binaria
+                         | expressao_binaria VEZES expressao_binaria
+                         | expressao_binaria DIVIDE expressao_binaria
+    """
+    token = p.slice[2].type
+    nome, operador = niveis[token]
+    pai = MyNode(name=nome, type=nome.upper())
+    p[0] = pai
+    p[1].parent = pai
+    criaOperador(operador, token, p[2]).parent = pai
+    p[3].parent = pai
+
+
+def p_expressao_binaria_fator(p):
+    """expressao_binaria : fator
+                         | expressao_unaria
+    """
+    p[0] = p[1]
+
+
+def p_expressao_binaria_error(p):
+    """expressao_binaria : expressao_binaria E error
+                         | expressao_binaria OU error
+    """
+    p[0] = MyNode(name='ERR-SYN-OPERADOR-LOGICO', type='ERR-SYN-OPERADOR-LOGICO')
+    print(error_handler.newError(False, 'ERR-SYN-OPERADOR-LOGICO'))
+
+
+def p_expressao_unaria(p):
+    """expressao_unaria : MAIS fator
+                        | MENOS fator
+                        | NAO fator
+    """
+    token = p.slice[1].type
+    pai = MyNode(name='expressao_unaria', type='EXPRESSAO_UNARIA')
+    p[0] = pai
+    nome = 'operador_negacao' if token == 'NAO' else 'operador_soma'
+    criaOperador(nome, token, p[1]).parent = pai
+    p[2].parent = pai
+
+
+# Módulo da gramática: produções do tppparser, exceto a cascata de expressões, e as produções acima
+def gramatica():
+    modulo = types.SimpleNamespace(tokens=tokens, precedence=precedence, __file__=__file__)
+    for nome in dir(tppparser):
+        if nome.startswith('p_') and nome not in producoes_cascata:
+            setattr(modulo, nome, getattr(tppparser, nome))
+    for nome, valor in list(globals().items()):
+        if nome.startswith('p_'):
+            setattr(modulo, nome, valor)
+    return modulo
+
+
+_parser = None
+
+# Opções do yacc.yacc para esta gramática
+opcoes_parser = dict(method="LALR", start='programa', debuglog=log, errorlog=yacc.NullLogger())
+
+
+# Regenera a tabela LALR distribuída (tpp_precedencia_tab.py) depois de alterar a gramática:
+#   python -c "import tppprecedencia; tppprecedencia.geraTabela()"
+def geraTabela(pasta=tpptabelas.pasta_modulo):
+    return tpptabelas.geraParser(gramatica(), 'tpp_precedencia_tab', pasta, **opcoes_parser)
+
+
+# Retorna o analisador sintático com a gramática de precedência (construído no primeiro uso, a partir da
+# tabela distribuída ou do cache)
+def parser():
+    global _parser
+    if _parser is None:
+        _parser = tpptabelas.constroiParser(gramatica(), 'tpp_precedencia_tab', **opcoes_parser)
+    return _parser
@@ -0,0 +1,222 @@
+# Descrição: Índice de referências cruzadas do programa T++: para cada símbolo (nome, escopo), a declaração
+#            (nó do nome e linha) e todos os pontos em que ele é lido, escrito ou chamado.
+#            O escopo é 'global' (variáveis globais e funções) ou o nome da função (parâmetros e variáveis
+#            locais). Cada uso é resolvido como na tabela de símbolos: primeiro o escopo da função em que
+#            aparece, depois o global; os usos de nomes não declarados ficam em naoResolvidas.
+#
+#            O índice é montado uma vez pela análise semântica (tppsema.indiceReferencias), a partir da
+#            árvore sintática e dos sites de chamada do grafo de chamadas, e responde às consultas sem
+#            percorrer a árvore de novo:
+#              - definicao / referencias: o símbolo visível com um nome em um escopo e os seus usos;
+#              - simboloEm: o símbolo com o nome informado declarado ou usado em uma linha (localizar
+#                referências e renomear a partir da posição no editor);
+#              - dicionario / json: o índice inteiro, exportado pelo main.py com --xref.
+
+import json
+
+from mytree import preOrdem
+from tppfluxodados import nomeVar
+
+
+# Uso de um símbolo: 'leitura', 'escrita' ou 'chamada', linha, escopo em que aparece ('global' nas declarações
+# globais) e a folha com o nome na árvore sintática
+class Referencia:
+    __slots__ = ('tipo', 'linha', 'escopo', 'node')
+
+    def __init__(self, tipo, linha, escopo, node=None):
+        self.tipo = tipo
+        self.linha = linha
+        self.escopo = escopo
+        self.node = node
+
+    def dicionario(self):
+        return {'tipo': self.tipo, 'linha': self.linha, 'escopo': self.escopo}
+
+    def __repr__(self):
+        return 'Referencia(%s, linha %r, %r)' % (self.tipo, self.linha, self.escopo)
+
+
+# Símbolo declarado: categoria 'variavel', 'parametro' ou 'funcao', tipo, dimensões (variáveis e parâmetros),
+# folha com o nome na primeira declaração e a sua linha, folhas das declarações repetidas no mesmo escopo e os usos
+class Simbolo:
+    __slots__ = ('nome', 'escopo', 'categoria', 'tipo', 'dimensoes', 'node', 'linha', 'redeclaracoes', 'referencias')
+
+    def __init__(self, nome, escopo, categoria, tipo=None, dimensoes=0, node=None):
+        self.nome = nome
+        self.escopo = escopo
+        self.categoria = categoria
+        self.tipo = tipo
+        self.dimensoes = dimensoes
+        self.node = node
+        self.linha = getattr(node, 'line', None)
+        self.redeclaracoes = []
+        self.referencias = []
+
+    def dicionario(self):
+        return {
+            'nome': self.nome,
+            'escopo': self.escopo,
+            'categoria': self.categoria,
+            'tipo': self.tipo,
+            'dimensoes': self.dimensoes,
+            'linha': self.linha,
+            'redeclaracoes': [getattr(node, 'line', None) for node in self.redeclaracoes],
+            'referencias': [referencia.dicionario() for referencia in self.referencias]
+        }
+
+    def __repr__(self):
+        return 'Simbolo(%r, %r, %s, linha %r)' % (self.nome, self.escopo, self.categoria, self.linha)
+
+
+class IndiceReferencias:
+    def __init__(self):
+        # {(nome, escopo): Simbolo}, na ordem das declarações
+        self.simbolos = {}
+        # Usos de nomes não declarados: [(nome, Referencia)], na ordem do código-fonte
+        self.naoResolvidas = []
+        # {(nome, linha): [Simbolo]}, montado na primeira consulta de simboloEm
+        self._porLinha = None
+
+    # Registra a declaração de um símbolo; uma declaração repetida no mesmo escopo fica no primeiro símbolo
+    def declara(self, nome, escopo, categoria, tipo=None, dimensoes=0, node=None):
+        chave = (nome, escopo)
+        if chave in self.simbolos:
+            self.simbolos[chave].redeclaracoes.append(node)
+        else:
+            self.simbolos[chave] = Simbolo(nome, escopo, categoria, tipo, dimensoes, node)
+        self._porLinha = None
+        return self.simbolos[chave]
+
+    # Símbolo visível com o nome no escopo: o do próprio escopo ou o global (None se não declarado)
+    def definicao(self, nome, escopo='global'):
+        simbolo = self.simbolos.get((nome, escopo))
+        if simbolo is None and escopo != 'global':
+            simbolo = self.simbolos.get((nome, 'global'))
+        return simbolo
+
+    # Registra um uso do nome no escopo em que aparece, no símbolo visível ou em naoResolvidas (as chamadas
+    # são resolvidas no escopo global, onde estão as funções)
+    def referencia(self, nome, escopo, tipo, node=None):
+        referencia = Referencia(tipo, getattr(node, 'line', None), escopo, node)
+        simbolo = self.definicao(nome, 'global' if tipo == 'chamada' else escopo)
+        if simbolo is None:
+            self.naoResolvidas.append((nome, referencia))
+        else:
+            simbolo.referencias.append(referencia)
+            self._porLinha = None
+        return simbolo
+
+    # Usos do símbolo visível com o nome no escopo, opcionalmente só os de alguns tipos ('leitura', 'escrita',
+    # 'chamada')
+    def referencias(self, nome, escopo='global', tipos=None):
+        simbolo = self.definicao(nome, escopo)
+        if simbolo is None:
+            return []
+        return [referencia for referencia in simbolo.referencias if tipos is None or referencia.tipo in tipos]
+
+    def leituras(self, nome, escopo='global'):
+        return self.referencias(nome, escopo, ('leitura',))
+
+    def escritas(self, nome, escopo='global'):
+        return self.referencias(nome, escopo, ('escrita',))
+
+    def chamadas(self, nome):
+        return self.referencias(nome, 'global', ('chamada',))
+
+    # Símbolos declarados em um escopo
+    def doEscopo(self, escopo):
+        return [simbolo for simbolo in self.simbolos.values() if simbolo.escopo == escopo]
+
+    # Símbolos com o nome declarados ou usados na linha (mais de um quando o nome aparece em escopos diferentes na
+    # mesma linha)
+    def simboloEm(self, nome, linha):
+        if self._porLinha is None:
+            self._porLinha = {}
+            for simbolo in self.simbolos.values():
+                linhas = [simbolo.linha] + [getattr(node, 'line', None) for node in simbolo.redeclaracoes]
+                linhas += [referencia.linha for referencia in simbolo.referencias]
+                for numero in linhas:
+                    encontrados = self._porLinha.setdefault((simbolo.nome, numero), [])
+                    if simbolo not in encontrados:
+                        encontrados.append(simbolo)
+        return list(self._porLinha.get((nome, linha), ()))
+
+    def dicionario(self):
+        return {
+            'simbolos': [simbolo.dicionario() for simbolo in self.simbolos.values()],
+            'naoResolvidas': [dict(nome=nome, **referencia.dicionario()) for nome, referencia in self.naoResolvidas]
+        }
+
+    def json(self, indent=2):
+        return json.dumps(self.dicionario(), indent=indent, ensure_ascii=False)
+
+
+# Nome do tipo de um nó tipo (tipo -> INTEIRO -> inteiro)
+def nomeTipo(tipo):
+    return tipo.children[0].children[0].name
+
+
+# Escrita ou leitura de um nó var: é escrita o lado esquerdo de uma atribuição e a variável de um leia
+def tipoUso(var):
+    pai = var.parent
+    if (pai.name == 'atribuicao' and pai.children[0] is var) or pai.name == 'leia':
+        return 'escrita'
+    return 'leitura'
+
+
+# Declara as variáveis de uma declaracao_variaveis no escopo
+def declaraVariaveis(indice, declaracao, escopo):
+    tipo = nomeTipo(declaracao.children[0])
+    for var in preOrdem(declaracao):
+        if var.name == 'var' and var.parent.name == 'lista_variaveis':
+            dimensoes = sum(1 for node in preOrdem(var.children[1]) if node.name == 'fecha_colchete') \
+                if len(var.children) > 1 else 0
+            indice.declara(nomeVar(var), escopo, 'variavel', tipo, dimensoes, var.children[0].children[0])
+
+
+# Declara uma função e os seus parâmetros (os parâmetros de arranjos são parametro -> parametro [ ])
+def declaraFuncao(indice, declaracaoFuncao, cabecalho):
+    nome = cabecalho.children[0].children[0]
+    tipo = nomeTipo(declaracaoFuncao.children[0]) if len(declaracaoFuncao.children) > 1 else None
+    indice.declara(nome.name, 'global', 'funcao', tipo, node=nome)
+    for parametro in preOrdem(cabecalho.children[2]):
+        if parametro.name != 'parametro' or parametro.parent.name != 'lista_parametros':
+            continue
+        dimensoes = 0
+        while parametro.children[0].name == 'parametro':
+            parametro = parametro.children[0]
+            dimensoes += 1
+        if parametro.children[0].name == 'tipo':
+            folha = parametro.children[2].children[0]
+            indice.declara(folha.name, nome.name, 'parametro', nomeTipo(parametro.children[0]), dimensoes, folha)
+
+
+# Monta o índice da árvore sintática: primeiro todas as declarações (os usos podem vir antes da declaração no
+# código-fonte), depois as leituras e escritas das variáveis e as chamadas dos sites do grafo de chamadas
+def montaIndice(tree, grafo):
+    indice = IndiceReferencias()
+    usos = []
+    for declaracao in preOrdem(tree):
+        if declaracao.name != 'declaracao':
+            continue
+        filho = declaracao.children[0]
+        escopo = 'global'
+        if filho.name == 'declaracao_funcao':
+            cabecalho = filho.children[-1]
+            if cabecalho.name != 'cabecalho' or cabecalho.children[0].name != 'ID':
+                continue
+            declaraFuncao(indice, filho, cabecalho)
+            escopo = cabecalho.children[0].children[0].name
+            filho = cabecalho.children[4]
+        for node in preOrdem(filho):
+            if node.name == 'declaracao_variaveis':
+                declaraVariaveis(indice, node, escopo)
+            elif node.name == 'var' and node.parent.name != 'lista_variaveis':
+                usos.append((nomeVar(node), escopo, tipoUso(node), node.children[0].children[0]))
+
+    for nome, escopo, tipo, node in usos:
+        indice.referencia(nome, escopo, tipo, node)
+    for chamada in grafo.chamadas:
+        folha = chamada.node.children[0].children[0] if chamada.node is not None else None
+        indice.referencia(chamada.funcao, chamada.chamador or 'global', 'chamada', folha)
+    return indice
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+import main as programa
+import tppcompilador
+import tppsema
+
+referencias = '''
+inteiro: total
+flutuante: m[3][2]
+total := dobro(2)
+
+inteiro dobro(inteiro: n, inteiro: v[])
+  inteiro: x
+  x := n * 2
+  leia(x)
+  total := total + x
+  retorna(x)
+fim
+
+inteiro principal()
+  inteiro: total
+  total := dobro(total, 1)
+  escreva(ausente + total)
+  retorna(0)
+fim
+'''
+
+
+def usos(simbolo):
+    return [(referencia.tipo, referencia.linha, referencia.escopo) for referencia in simbolo.referencias]
+
+
+@pytest.mark.parametrize('trabalhadores', [1, 2])
+def test_001(trabalhadores):
+    # Declarações de cada escopo, com linha, tipo e dimensões; a variável local esconde a global de mesmo nome
+    resultado = tppcompilador.compila(referencias, poda=False, trabalhadores=trabalhadores)
+    indice = resultado.referencias
+    assert indice is tppsema.indice
+    assert [(simbolo.nome, simbolo.escopo, simbolo.categoria, simbolo.linha) for simbolo in indice.simbolos.values()] == [
+        ('total', 'global', 'variavel', 2), ('m', 'global', 'variavel', 3), ('dobro', 'global', 'funcao', 6),
+        ('n', 'dobro', 'parametro', 6), ('v', 'dobro', 'parametro', 6), ('x', 'dobro', 'variavel', 7),
+        ('principal', 'global', 'funcao', 14), ('total', 'principal', 'variavel', 15)]
+    assert (indice.definicao('m').tipo, indice.definicao('m').dimensoes, indice.definicao('v', 'dobro').dimensoes) == \
+        ('flutuante', 2, 1)
+    assert usos(indice.definicao('total', 'dobro')) == [('escrita', 4, 'global'), ('escrita', 10, 'dobro'),
+                                                        ('leitura', 10, 'dobro')]
+    assert usos(indice.definicao('total', 'principal')) == [('escrita', 16, 'principal'), ('leitura', 16, 'principal'),
+                                                           ('leitura', 17, 'principal')]
+
+
+def test_002():
+    # Consultas por tipo de uso, pela posição no editor e os nomes não declarados
+    indice = tppcompilador.compila(referencias, poda=False).referencias
+    assert [referencia.linha for referencia in indice.escritas('x', 'dobro')] == [8, 9]
+    assert [referencia.linha for referencia in indice.leituras('x', 'dobro')] == [10, 11]
+    assert [(referencia.escopo, referencia.linha) for referencia in indice.chamadas('dobro')] == [
+        ('global', 4), ('principal', 16)]
+    assert indice.simboloEm('total', 10) == [indice.definicao('total')]
+    assert indice.simboloEm('total', 16) == [indice.definicao('total', 'principal')]
+    assert indice.simboloEm('total', 1) == []
+    assert [(nome, referencia.linha) for nome, referencia in indice.naoResolvidas] == [('ausente', 17)]
+    # As folhas guardadas são os nomes na árvore (renomear um símbolo é trocar o nome dessas folhas)
+    simbolo = indice.definicao('n', 'dobro')
+    assert {simbolo.node.name} | {referencia.node.name for referencia in simbolo.referencias} == {'n'}
+
+
+def test_003(tmp_path, capsys):
+    # Exportação em JSON pelo main.py (--xref=arquivo)
+    fonte = tmp_path / 'programa.tpp'
+    fonte.write_text(referencias.replace('ausente', 'total'), encoding='utf-8')
+    destino = tmp_path / 'xref.json'
+    programa.main([str(fonte), '--no-export', '--xref=%s' % destino])
+    exportado = json.loads(destino.read_text(encoding='utf-8'))
+    assert exportado['naoResolvidas'] == []
+    dobro = [simbolo for simbolo in exportado['simbolos'] if simbolo['nome'] == 'dobro'][0]
+    assert dobro == {'nome': 'dobro', 'escopo': 'global', 'categoria': 'funcao', 'tipo': 'inteiro', 'dimensoes': 0,
+                     'linha': 6, 'redeclaracoes': [],
+                     'referencias': [{'tipo': 'chamada', 'linha': 4, 'escopo': 'global'},
+                                     {'tipo': 'chamada', 'linha': 16, 'escopo': 'principal'}]}
+
+
+def test_004():
+    # Com a regra desabilitada o índice é montado na primeira consulta, antes da poda
+    tppsema.habilitaRegra('indiceReferencias', False)
+    try:
+        resultado = tppcompilador.compila(referencias)
+    finally:
+        tppsema.habilitaRegra('indiceReferencias')
+    assert len(resultado.referencias.referencias('x', 'dobro')) == 4
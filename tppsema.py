@@ -11,14 +11,25 @@
 import sys
 import os
 from sys import argv, exit
+import contextlib
+import io
 import logging
+import configparser
 import ply.yacc as yacc
 
 from tpplex import tokens
-from mytree import MyNode
-from anytree.exporter import DotExporter, UniqueDotExporter
-from anytree import RenderTree, AsciiStyle, findall_by_attr
+import mytree
+from mytree import MyNode, preOrdem, semVerificarCiclos
 from myerror import MyError
+import tppestatisticas
+from tppestatisticas import fase, conta
+import tpptabelas
+from tppconstantes import valorExpressao
+import tppelimina
+from tppchamadas import Chamada, GrafoChamadas
+from tppfluxo import GrafoFluxo, linha
+from tppfluxodados import FluxoDados
+import tppreferencias
 
 # Configuração do logger para registrar mensagens de depuração
 logging.basicConfig(
@@ -38,6 +49,78 @@ root = None
 # Tabela de erros de variáveis
 variablesError = []
 
+# Diagnósticos emitidos na análise atual (chave do ErrorMessages.properties e mensagem formatada)
+diagnosticos = []
+
+# Grafo de chamadas da árvore atual (tppchamadas.GrafoChamadas), montado uma vez por grafoChamadas()
+grafo = None
+
+# Grafos de fluxo de controle das funções da árvore atual (tppfluxo.GrafoFluxo), por cabeçalho: montados uma vez
+# por fluxoFuncao()
+fluxos = {}
+
+# Análises de fluxo de dados das funções da árvore atual (tppfluxodados.FluxoDados), por cabeçalho: feitas uma vez
+# por dadosFuncao()
+dados = {}
+
+# Declarações locais recusadas pela tabela de símbolos (WAR-SEM-VAR-DECL-PREV) porque o nome já é de uma variável
+# global ou de um parâmetro: {escopo: {nome}}. Nesses escopos o nome continua sendo o da global ou do parâmetro
+locaisRecusados = {}
+
+# Índice de referências cruzadas da árvore atual (tppreferencias.IndiceReferencias), montado uma vez por
+# indiceReferencias()
+indice = None
+
+# Emite um erro/aviso semântico, registrando-o na lista de diagnósticos
+def emiteMensagem(key, *args):
+    registraDiagnostico({
+        'key': key,
+        'message': error_handler.newError(False, key).format(*args)
+    })
+
+# Registra e imprime um diagnóstico já formatado
+def registraDiagnostico(diagnostico):
+    conta('diagnosticos')
+    diagnosticos.append(diagnostico)
+    print(diagnostico['message'])
+
+# Reinicia o estado do analisador para uma nova compilação no mesmo processo
+def reiniciaEstado():
+    global root, grafo, indice, tabelaIndexada
+    root = None
+    grafo = None
+    indice = None
+    tabelaIndexada = None
+    fluxos.clear()
+    dados.clear()
+    locaisRecusados.clear()
+    variablesError.clear()
+    diagnosticos.clear()
+
+# Total de nós visitados pelos percursos na árvore; só é contado quando medeVisitas é verdadeiro
+nosVisitados = 0
+medeVisitas = False
+
+# Busca na subárvore os nós com o nome informado
+def buscaNos(node, name):
+    conta('percursos_arvore')
+    if not medeVisitas:
+        return [item for item in preOrdem(node) if item.name == name]
+    def filtro(item):
+        global nosVisitados
+        nosVisitados += 1
+        return item.name == name
+    return list(preOrdem(node, filter_=filtro))
+
+# Lista os nós da subárvore em pré-ordem
+def listaNos(node):
+    global nosVisitados
+    conta('percursos_arvore')
+    nodes = list(preOrdem(node))
+    if medeVisitas:
+        nosVisitados += len(nodes)
+    return nodes
+
 # Adiciona uma variável com erro na tabela de erros
 def adicionaErroVariavel(name, scope):
     variablesError.append({
@@ -54,15 +137,15 @@ def variavelComErro(name, scope):
 
 # Gera a tabela de símbolos a partir da árvore sintática
 def tabelaDeSimbolos():
-    res = findall_by_attr(root, "declaracao")
+    res = buscaNos(root, "declaracao")
     variables = []
     for p in res:
-        item = [node for pre, fill, node in RenderTree(p)]
+        item = listaNos(p)
         if item[1].name == "declaracao_variaveis":
             variable = processaVariavel(node1=item[1], scope="global")
             if declaracaoVariavel(table=variables, name=variable['name'], scope='global'):
                 typeVar = buscaTipo(table=variables, name=variable['name'], scope='global')
-                print(error_handler.newError(False, 'WAR-SEM-VAR-DECL-PREV').format(variable['name'], typeVar))
+                emiteMensagem('WAR-SEM-VAR-DECL-PREV', variable['name'], typeVar)
             else:
                 variables.append(variable)
         elif item[1].name == "declaracao_funcao":
@@ -92,7 +175,7 @@ def tabelaDeSimbolos():
             }
             if declaracaoVariavel(table=variables, name=name, scope='global'):
                 typeVar = buscaTipo(table=variables, name=name, scope='global')
-                print(error_handler.newError(False, 'WAR-SEM-FUNC-DECL-PREV').format(name, typeVar))
+                emiteMensagem('WAR-SEM-FUNC-DECL-PREV', name, typeVar)
             else:
                 variables.append(variable)
                 declaracaoFunc(node1=item[1], scope=name, table=variables)
@@ -104,7 +187,7 @@ def declaracaoParams(node1):
     for item in node1:
         if item.name == 'cabecalho':
             # Obtém a lista de parâmetros
-            lista_parametros = findall_by_attr(item.children[2], "parametro")
+            lista_parametros = buscaNos(item.children[2], "parametro")
             for parametro in lista_parametros:
                 # Extrai o tipo e o nome do parâmetro
                 tipo = parametro.children[0].children[0].children[0].name
@@ -117,12 +200,14 @@ def declaracaoParams(node1):
 
 # Processa a declaração de variáveis dentro do escopo de uma função
 def declaracaoFunc(node1, scope, table):
-    res = findall_by_attr(node1, "declaracao_variaveis")
+    res = buscaNos(node1, "declaracao_variaveis")
     for p in res:
         variable = processaVariavel(node1=p, scope=scope)
         if declaracaoVariavel(table=table, name=variable['name'], scope=scope):
             typeVar = buscaTipo(table=table, name=variable['name'], scope=scope)
-            print(error_handler.newError(False, 'WAR-SEM-VAR-DECL-PREV').format(variable['name'], typeVar))
+            emiteMensagem('WAR-SEM-VAR-DECL-PREV', variable['name'], typeVar)
+            if not any(table[i]['scope'] == scope for i in posicoesPorNome.get(variable['name'], ())):
+                locaisRecusados.setdefault(scope, set()).add(variable['name'])
         else:
             table.append(variable)
 
@@ -131,7 +216,7 @@ def processaVariavel(node1, scope):
     d1 = 1
     d2 = 0
     dimension = 0
-    renderNodeTree = [node for pre, fill, node in RenderTree(node1)]
+    renderNodeTree = listaNos(node1)
     for i in range(len(renderNodeTree)):
         if renderNodeTree[i].name == 'tipo':
             type = renderNodeTree[i+2].name
@@ -141,11 +226,20 @@ def processaVariavel(node1, scope):
             name = renderNodeTree[i+1].name
         elif renderNodeTree[i].name == 'fecha_colchete':
             dimension += 1
-            if renderNodeTree[i-2].name == 'NUM_PONTO_FLUTUANTE':
+            # Tamanho da dimensão: o valor da expressão, se for constante (2 * 3 vale 6); senão o último token
+            irmaos = renderNodeTree[i].parent.children
+            expressao = irmaos[irmaos.index(renderNodeTree[i]) - 1]
+            constante = valorExpressao(expressao) if expressao.name == 'expressao' else None
+            if constante is not None:
+                flutuante = constante[1] == 'flutuante'
+                index = str(constante[0])
+            else:
+                flutuante = renderNodeTree[i-2].name == 'NUM_PONTO_FLUTUANTE'
+                index = renderNodeTree[i-1].name
+            if flutuante:
                 if not variavelComErro(name, scope):
                     adicionaErroVariavel(name, scope)
-                    print(error_handler.newError(False, 'ERR-SEM-ARRAY-INDEX-NOT-INT').format(name))
-            index = renderNodeTree[i-1].name
+                    emiteMensagem('ERR-SEM-ARRAY-INDEX-NOT-INT', name)
             if dimension == 2:
                 d2 = index
             else:
@@ -175,269 +269,430 @@ def existeMain(table):
             return True
     return False
 
-# Verifica se uma variável está declarada na tabela de símbolos dentro de um escopo específico
+# Índice da tabela de símbolos por nome: as posições das entradas com o nome e as posições das funções com um
+# parâmetro com o nome (e o tipo do último deles). A tabela só cresce, então cada consulta apenas indexa as
+# entradas acrescentadas desde a anterior
+tabelaIndexada = None
+entradasIndexadas = 0
+posicoesPorNome = {}
+posicoesPorParametro = {}
+
+def indexaTabela(table):
+    global tabelaIndexada, entradasIndexadas
+    if tabelaIndexada is not table:
+        tabelaIndexada = table
+        entradasIndexadas = 0
+        posicoesPorNome.clear()
+        posicoesPorParametro.clear()
+    for i in range(entradasIndexadas, len(table)):
+        entry = table[i]
+        posicoesPorNome.setdefault(entry['name'], []).append(i)
+        if entry['declarationType'] == 'func':
+            tipos = {param['name']: param['type'] for param in entry['parameters']}
+            for nome, tipo in tipos.items():
+                posicoesPorParametro.setdefault(nome, []).append((i, tipo))
+    entradasIndexadas = len(table)
+
+# Entradas da tabela com o nome, na ordem da tabela: [(posição, tipo)], com as variáveis e funções do escopo ou
+# globais e, se parametros for verdadeiro, as demais funções com um parâmetro com o nome (com o tipo do parâmetro)
+def entradasNome(table, name, scope, parametros=True):
+    indexaTabela(table)
+    diretas = [(i, table[i]['type']) for i in posicoesPorNome.get(name, ())
+               if table[i]['scope'] == 'global' or table[i]['scope'] == scope]
+    if not parametros or name not in posicoesPorParametro:
+        return diretas
+    posicoes = {i for i, _ in diretas}
+    return sorted(diretas + [item for item in posicoesPorParametro[name] if item[0] not in posicoes])
+
+# Verifica se uma variável está declarada na tabela de símbolos dentro de um escopo específico (no escopo global
+# ou no escopo especificado, ou como parâmetro de uma função)
 def declaracaoVariavel(table, name, scope):
-    for entry in table:
-        # Verifica se a variável está no escopo global ou no escopo especificado
-        if entry['name'] == name and (entry['scope'] == 'global' or entry['scope'] == scope):
-            return True
-        # Verifica se a variável é um parâmetro de função no escopo especificado
-        elif scope != 'global' and entry['declarationType'] == 'func':
-            for param in entry['parameters']:
-                if param['name'] == name:
-                    return True
-    return False
+    conta('consultas_simbolos')
+    return bool(entradasNome(table, name, scope, parametros=scope != 'global'))
 
 # Retorna o tipo de uma variável ou parâmetro de acordo com a tabela de símbolos
 def buscaTipo(table, name, scope):
-    for entry in table:
-        # Verifica se a variável está no escopo global ou no escopo especificado
-        if entry['name'] == name and (entry['scope'] == 'global' or entry['scope'] == scope):
-            return entry['type']
-        # Verifica se a variável é um parâmetro de função no escopo especificado
-        elif scope != 'global' and entry['declarationType'] == 'func':
-            for param in entry['parameters']:
-                if param['name'] == name:
-                    return param['type']
-    return None
+    conta('consultas_simbolos')
+    entradas = entradasNome(table, name, scope, parametros=scope != 'global')
+    return entradas[0][1] if entradas else None
 
 # Obtém o escopo de uma função a partir de um nó na árvore sintática
+# (sobe pelos pais sem montar o caminho até a raiz; vale o cabeçalho mais externo)
 def buscaEscopo(node):
-    for ancestor in node.anchestors:
+    scope = 'global'
+    ancestor = node.parent
+    while ancestor is not None:
         if ancestor.name == 'cabecalho' and ancestor.children[0].name == 'ID':
-            return ancestor.children[0].children[0].name
-    return 'global'
-
-# Verifica se um valor está sendo usado como índice em uma expressão
-def verificaIndice(node):
-    return any(ancestor.name == 'indice' for ancestor in node.anchestors)
-
-# Verifica se um valor está sendo usado como argumento em uma função
-def verificaArgumento(node):
-    anchestors = list(node.anchestors)
-    for i in range(len(anchestors)):
-        if anchestors[i].name == 'lista_argumentos':
-            return True
-    return False
+            scope = ancestor.children[0].children[0].name
+        ancestor = ancestor.parent
+    return scope
 
-# Obtém os fatores (variáveis, números ou funções) de uma expressão
-def buscaFator(node1, table, scope):
-    res = findall_by_attr(node1, "fator")
-    factors = []
-    for p in res:
-        # Filtra fatores que não são índices ou argumentos de função
-        if not verificaIndice(p) and not verificaArgumento(p):
-            factor = p.children[0].name
-            factor = factor if factor != 'chamada_funcao' else 'func'
-            
-            value = p.children[0].children[0].children[0].name
-            type = p.children[0].children[0].name
-            real_scope = scope if factor != 'func' else 'global'
-            # Determina o tipo do fator, seja ele uma variável, número ou função
-            type = ('inteiro' if type == 'NUM_INTEIRO' else 'flutuante') if factor == 'numero' else buscaTipo(table, value, real_scope)
-            
-            if type is not None:
-                factors.append({
-                    'factor': factor,
-                    'type': type,
-                    'value': value
-                })
-    return factors
+# Nós de expressão cujo tipo é combinado a partir dos operandos (nas duas gramáticas de expressões)
+nosExpressao = ('expressao', 'expressao_logica', 'expressao_simples', 'expressao_aditiva',
+                'expressao_multiplicativa', 'expressao_unaria')
 
-# Verifica se todos os fatores de uma expressão são do mesmo tipo; caso contrário, retorna o tipo predominante
-def buscaTipoFator(factors, type):
-    type_factor = type
-    for factor in factors:
-        if factor['type'] != type:
-            type_factor = factor['type']
-    return type_factor
+# Operadores cujo resultado é inteiro, qualquer que seja o tipo dos operandos
+operadoresInteiros = ('operador_relacional', 'operador_logico', 'operador_negacao')
+
+# Tipo resultante de uma operação: inteiro com flutuante é promovido a flutuante; um operando sem tipo
+# (variável não declarada) não altera o tipo
+def promoveTipo(type1, type2):
+    if type1 is None or type1 == type2:
+        return type2
+    if type2 is None:
+        return type1
+    if {type1, type2} == {'inteiro', 'flutuante'}:
+        return 'flutuante'
+    return type2
+
+# Tipo de um símbolo, consultado na tabela uma única vez por passo de anotação (simbolos: cache do passo)
+def tipoSimbolo(table, name, scope, simbolos):
+    if (name, scope) not in simbolos:
+        simbolos[name, scope] = buscaTipo(table, name, scope)
+    return simbolos[name, scope]
+
+# Anota um fator: variável (o tipo dos elementos, se for um arranjo), número, chamada de função (o tipo de
+# retorno) ou expressão entre parênteses
+def anotaFator(node, table, scope, simbolos):
+    child = node.children[0]
+    if child.name == 'ABRE_PARENTESE':
+        expression = node.children[1]
+        node.return_type, node.fatores, node.fator = expression.return_type, expression.fatores, expression.fator
+        return
+    if child.name == 'numero':
+        factor = 'numero'
+        value = child.children[0].children[0].name
+        type = 'inteiro' if child.children[0].name == 'NUM_INTEIRO' else 'flutuante'
+    else:
+        factor = 'func' if child.name == 'chamada_funcao' else child.name
+        value = child.children[0].children[0].name
+        type = tipoSimbolo(table, value, scope if factor != 'func' else 'global', simbolos)
+    node.return_type = type
+    node.fatores = 0 if type is None else 1
+    node.fator = None if type is None else {'factor': factor, 'type': type, 'value': value}
+
+# Anota os nós da expressão, dos operandos para a raiz, guardando em cada nó (fator ou nó de expressão):
+#   return_type: o tipo resultante (None se nenhum fator tiver tipo);
+#   fatores: o número de fatores com tipo (os índices e argumentos são expressões à parte);
+#   fator: o único fator ({'factor', 'type', 'value'}) quando fatores == 1.
+# Subexpressões já anotadas não são percorridas de novo; retorna o próprio nó
+def anotaExpressao(node, table, scope, simbolos=None):
+    if getattr(node, 'fatores', None) is not None:
+        return node
+    simbolos = {} if simbolos is None else simbolos
+    conta('percursos_arvore')
+    nodes = list(preOrdem(node, stop=lambda item: getattr(item, 'fatores', None) is not None))
+    for item in reversed(nodes):
+        if item.name == 'fator':
+            anotaFator(item, table, scope, simbolos)
+        elif item.name in nosExpressao:
+            type = None
+            fatores = 0
+            fator = None
+            inteiro = False
+            for child in item.children:
+                if getattr(child, 'fatores', None) is not None:
+                    type = promoveTipo(type, child.return_type)
+                    fatores += child.fatores
+                    if child.fatores:
+                        fator = child.fator
+                elif child.name in operadoresInteiros:
+                    inteiro = True
+            item.return_type = 'inteiro' if inteiro and type is not None else type
+            item.fatores = fatores
+            item.fator = fator if fatores == 1 else None
+    return node
+
+# Anota os tipos de todas as expressões do programa, uma vez, depois da tabela de símbolos; as verificações
+# de coerção e de retorno e as fases seguintes leem o tipo de cada expressão no próprio nó
+def anotaTipos(table, node=None):
+    simbolos = {}
+    for declaracao in buscaNos(root if node is None else node, 'declaracao'):
+        scope = nomeDeclaracao(declaracao) or 'global'
+        for expression in buscaNos(declaracao, 'expressao'):
+            anotaExpressao(expression, table, scope, simbolos)
+
+# Expressão atribuída pela ação (o lado direito de uma atribuição) ou None se a ação não tiver expressão
+def expressaoAtribuida(node):
+    if node.name != 'expressao':
+        return None
+    if node.children[0].name == 'atribuicao':
+        return node.children[0].children[2]
+    return node
 
 # Conta o número de parâmetros em uma lista de argumentos
 def contagemParametros(node):
-    i = 1
-    item = node
-    while item.name == 'lista_argumentos':
-        if item.name == 'lista_argumentos' and len(item.children) > 1 and item.children[1].name == 'VIRGULA':
-            i += 1
-        item = item.children[0]
-    return i
+    return 1 + sum(1 for item in node.children if item.name == 'VIRGULA')
 
 # Verifica coerções de tipos em atribuições e operações, emitindo avisos se necessário
 def verificarCoercao(table, name, scope, node):
-    factors = buscaFator(node, table, scope)
-    type = None
-    for i in range(len(table)):
-        type = None
-        try:
-            parameters = table[i]['parameters']
-        except KeyError:
-            parameters = None
-
-        # Verifica o tipo da variável ou parâmetro na tabela de símbolos
-        if table[i]['name'] == name and (table[i]['scope'] == 'global' or table[i]['scope'] == scope):
-            type = table[i]['type']
-        elif parameters is not None and len(parameters) > 0:
-            for parameter in parameters:
-                if parameter['name'] == name:
-                    type = parameter['type']
-        
+    expression = expressaoAtribuida(node)
+    if expression is not None:
+        anotaExpressao(expression, table, scope)
+    fatores = expression.fatores if expression is not None else 0
+    conta('consultas_simbolos')
+    # Tipo de cada variável ou parâmetro com o nome na tabela de símbolos
+    for _, type in entradasNome(table, name, scope):
         if type is not None:
             # Se a expressão contém um único fator, verifica se o tipo precisa de coerção
-            if len(factors) == 1:
-                type_factor = factors[0]['type']
+            if fatores == 1:
+                type_factor = expression.fator['type']
                 if type_factor != type:
-                    value_factor = factors[0]['value']
-                    factor = factors[0]['factor']
+                    value_factor = expression.fator['value']
+                    factor = expression.fator['factor']
                     if factor == 'var':
-                        print(error_handler.newError(False, 'WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-VAR').format(value_factor, type_factor, name, type))
+                        emiteMensagem('WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-VAR', value_factor, type_factor, name, type)
                     elif factor == 'func':
-                        print(error_handler.newError(False, 'WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-RET-VAL').format(value_factor, type_factor, name, type))
+                        emiteMensagem('WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-RET-VAL', value_factor, type_factor, name, type)
                     else:
-                        print(error_handler.newError(False, 'WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-NUM').format(value_factor, type_factor, name, type))
-            else:
-                # Se a expressão contém múltiplos fatores, determina o tipo predominante
-                type_factor = buscaTipoFator(factors, type)
+                        emiteMensagem('WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-NUM', value_factor, type_factor, name, type)
+            elif fatores > 1:
+                # Se a expressão contém múltiplos fatores, usa o tipo da expressão (com a promoção)
+                type_factor = expression.return_type
                 if type_factor != type:
                     value_factor = 'expressao'
-                    print(error_handler.newError(False, 'WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-EXP').format(value_factor, type_factor, name, type))
+                    emiteMensagem('WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-EXP', value_factor, type_factor, name, type)
 
-# Inicializa a variável na tabela de símbolos e verifica coerção de tipos
-def inicializarVariavel(table, name, scope, node):
+# Inicializa a variável na tabela de símbolos e verifica coerção de tipos (temChamada indica se há chamada de
+# função na subárvore do nó; se não for informado, a subárvore é percorrida)
+def inicializarVariavel(table, name, scope, node, temChamada=None):
     if declaracaoVariavel(table=table, name=name, scope=scope):
         verificarCoercao(table=table, name=name, scope=scope, node=node)
-        for i in range(len(table)):
-            if table[i]['name'] == name and (table[i]['scope'] == 'global' or table[i]['scope'] == scope):
-                table[i]['init'] = 'Y'  # Marca a variável como inicializada
+        conta('consultas_simbolos')
+        for i, _ in entradasNome(table, name, scope, parametros=False):
+            table[i]['init'] = 'Y'  # Marca a variável como inicializada
     else:
         # Se a variável não está declarada, verifica se não é uma chamada de função antes de reportar erro
-        res = findall_by_attr(node, 'chamada_funcao')
-        if not res and not variavelComErro(name, scope):
+        if temChamada is None:
+            temChamada = bool(buscaNos(node, 'chamada_funcao'))
+        if not temChamada and not variavelComErro(name, scope):
             adicionaErroVariavel(name, scope)
-            print(error_handler.newError(False, 'ERR-SEM-VAR-NOT-DECL').format(name))
+            emiteMensagem('ERR-SEM-VAR-NOT-DECL', name)
 
 # Marca a variável como usada na tabela de símbolos
-def variavelUsada(table, name, scope, node):
+def variavelUsada(table, name, scope, node, temChamada=None):
     if declaracaoVariavel(table=table, name=name, scope=scope):
-        for i in range(len(table)):
-            if table[i]['name'] == name and (table[i]['scope'] == 'global' or table[i]['scope'] == scope):
-                table[i]['used'] = 'Y'  # Marca a variável como usada
+        conta('consultas_simbolos')
+        for i, _ in entradasNome(table, name, scope, parametros=False):
+            table[i]['used'] = 'Y'  # Marca a variável como usada
     else:
         # Se a variável não está declarada, verifica se não é uma chamada de função antes de reportar erro
-        res = findall_by_attr(node, 'chamada_funcao')
-        if not res and not variavelComErro(name, scope):
+        if temChamada is None:
+            temChamada = bool(buscaNos(node, 'chamada_funcao'))
+        if not temChamada and not variavelComErro(name, scope):
             adicionaErroVariavel(name, scope)
-            print(error_handler.newError(False, 'ERR-SEM-VAR-NOT-DECL').format(name))
+            emiteMensagem('ERR-SEM-VAR-NOT-DECL', name)
+
+# Nós cuja subárvore inteira tem as variáveis marcadas como usadas (além das expressões que não são atribuições)
+nosDeUso = ('se', 'repita', 'escreva', 'retorna')
 
 # Verifica todas as variáveis em uso no código, identificando e inicializando ou marcando-as como usadas
-def verificarVariavel(table):
-    res = findall_by_attr(root, "acao")
-    for p in res:
-        renderNodeTree = [node for pre, fill, node in RenderTree(p)]
-        for node1 in renderNodeTree:
-            renderNode1Tree = [node for pre, fill, node in RenderTree(node1)]
-            if node1.name == 'expressao':
-                if renderNode1Tree[1].name == 'atribuicao':
-                    scope = buscaEscopo(node1)
-                    name = renderNode1Tree[4].name
-                    inicializarVariavel(table=table, name=name, scope=scope, node=node1)
-                else:
-                    for index in range(len(renderNode1Tree)):
-                        if renderNode1Tree[index].name == 'ID':
-                            scope = buscaEscopo(node1)
-                            name = renderNode1Tree[index+1].name
-                            variavelUsada(table=table, name=name, scope=scope, node=node1)
-            elif node1.name == 'leia':
-                for index in range(len(renderNode1Tree)):
-                    if renderNode1Tree[index].name == 'ID':
-                        scope = buscaEscopo(node1)
-                        name = renderNode1Tree[index+1].name
-                        inicializarVariavel(table=table, name=name, scope=scope, node=node1)
-            elif node1.name in ['se', 'repita', 'escreva', 'retorna']:
-                for index in range(len(renderNode1Tree)):
-                    if renderNode1Tree[index].name == 'ID':
-                        scope = buscaEscopo(node1)
-                        name = renderNode1Tree[index+1].name
-                        variavelUsada(table=table, name=name, scope=scope, node=node1)
-            elif node1.name == 'chamada_funcao':
-                scope = buscaEscopo(node1)
-                name = node1.children[0].children[0].name
-                variavelUsada(table=table, name=name, scope=scope, node=node1)
-
-# Verifica se as variáveis declaradas estão em uso, e se foram inicializadas corretamente
+# (node restringe a verificação a uma subárvore; por padrão, a árvore inteira)
+def verificarVariavel(table, node=None):
+    for p in buscaNos(root if node is None else node, 'cabecalho'):
+        scope = p.children[0].children[0].name if p.children[0].name == 'ID' else 'global'
+        for corpo in p.children:
+            if corpo.name == 'corpo':
+                verificaVariaveisCorpo(table, scope, corpo)
+
+# Verifica as variáveis do corpo de uma função em um único percurso. Cada ID dentro de um se, repita, escreva,
+# retorna ou expressão (que não seja uma atribuição) marca a variável como usada; o lado esquerdo de uma
+# atribuição e os IDs de um leia a inicializam. A verificação de cada ID é feita no nó mais externo que a
+# provoca (o mais externo sem chamada de função, que pode reportar a variável não declarada), na ordem em que
+# esses nós aparecem no código-fonte
+def verificaVariaveisCorpo(table, scope, corpo):
+    nodes = listaNos(corpo)
+    posicao = {id(item): i for i, item in enumerate(nodes)}
+    # Nós com alguma chamada de função na subárvore (os filhos vêm depois dos pais na pré-ordem)
+    chamadas = set()
+    for item in reversed(nodes):
+        if item.name == 'chamada_funcao' or any(id(child) in chamadas for child in item.children):
+            chamadas.add(id(item))
+    # Para cada nó: (nó de uso mais externo, nó de uso mais externo sem chamada, leia) entre ele e os ancestrais
+    ancestrais = {id(corpo): (None, None, None)}
+    # Verificações feitas em cada nó, pela posição na pré-ordem: (função, nome da variável)
+    verificacoes = [[] for _ in nodes]
+    for i in range(1, len(nodes)):
+        item = nodes[i]
+        uso, semChamada, leia = ancestrais[id(item.parent)]
+        atribuicao = item.name == 'expressao' and item.children and item.children[0].name == 'atribuicao'
+        if item.name in nosDeUso or (item.name == 'expressao' and not atribuicao):
+            uso = uso or item
+            if semChamada is None and id(item) not in chamadas:
+                semChamada = item
+        elif item.name == 'leia':
+            leia = item
+        ancestrais[id(item)] = (uso, semChamada, leia)
+        if atribuicao:
+            verificacoes[i].append((inicializarVariavel, nodes[i + 4].name))
+        elif item.name == 'ID' and i + 1 < len(nodes):
+            if uso is not None:
+                verificacoes[posicao[id(semChamada or uso)]].append((variavelUsada, nodes[i + 1].name))
+            if leia is not None:
+                verificacoes[posicao[id(leia)]].append((inicializarVariavel, nodes[i + 1].name))
+    for i, lista in enumerate(verificacoes):
+        for verifica, name in lista:
+            verifica(table=table, name=name, scope=scope, node=nodes[i], temChamada=id(nodes[i]) in chamadas)
+
+# Emite o aviso de uso da variável a partir das marcas de inicialização e de uso
+def avisoUso(name, init, used):
+    if not init and not used:
+        emiteMensagem('WAR-SEM-VAR-DECL-NOT-USED', name)
+    elif init and not used:
+        emiteMensagem('WAR-SEM-VAR-DECL-INIT-NOT-USED', name)
+    elif not init:
+        emiteMensagem('WAR-SEM-VAR-DECL-NOT-INIT', name)
+
+# Verifica se as variáveis declaradas estão em uso, e se foram inicializadas corretamente. As variáveis globais
+# usam as marcas da tabela de símbolos; as locais, as leituras e escritas da análise de fluxo de dados da função
+# (uma vez por função, na posição da primeira variável local da tabela, para todos os nomes declarados)
 def variavelEmUso(table):
+    cabecalhos = {}
+    for cabecalho in buscaNos(root, 'cabecalho'):
+        cabecalhos.setdefault(cabecalho.children[0].children[0].name, cabecalho)
+    analisadas = set()
     for i in range(len(table)):
         name = table[i]['name']
         scope = table[i]['scope']
-        if table[i]['declarationType'] == 'var' and table[i]['errors'] <= 0 and not variavelComErro(name, scope):
-            if table[i]['init'] == 'N' and table[i]['used'] == 'N':
-                print(error_handler.newError(False, 'WAR-SEM-VAR-DECL-NOT-USED').format(name))
-            elif table[i]['init'] == 'Y' and table[i]['used'] == 'N':
-                print(error_handler.newError(False, 'WAR-SEM-VAR-DECL-INIT-NOT-USED').format(name))
-            elif table[i]['init'] == 'N':
-                print(error_handler.newError(False, 'WAR-SEM-VAR-DECL-NOT-INIT').format(name))
-
-# Verifica se as funções têm o retorno adequado ao seu tipo declarado
-def buscaRetornoFuncao(table):
-    res = findall_by_attr(root, 'declaracao_funcao')
+        if table[i]['declarationType'] != 'var':
+            continue
+        if scope in cabecalhos:
+            if scope not in analisadas:
+                analisadas.add(scope)
+                analise = dadosFuncao(cabecalhos[scope])
+                for nome in analise.nomes:
+                    if not variavelComErro(nome, scope):
+                        avisoUso(nome, analise.escrita(nome), analise.lida(nome))
+        elif table[i]['errors'] <= 0 and not variavelComErro(name, scope):
+            avisoUso(name, table[i]['init'] == 'Y', table[i]['used'] == 'Y')
+
+# Verifica, pela análise de fluxo de dados de cada função, as variáveis locais lidas antes de serem inicializadas
+# em algum caminho, com a linha da leitura (node restringe a verificação a uma subárvore)
+def verificaInicializacao(table, node=None):
+    for p in buscaNos(root if node is None else node, 'declaracao_funcao'):
+        for cabecalho in p.children:
+            if cabecalho.name == 'cabecalho':
+                analise = dadosFuncao(cabecalho)
+                scope = analise.fluxo.nome
+                for nome, numero in analise.antesDeInicializar():
+                    if not variavelComErro(nome, scope):
+                        emiteMensagem('WAR-SEM-VAR-USED-BEFORE-INIT', nome, numero)
+
+# Grafo de fluxo de controle da função do cabeçalho (montado na primeira consulta)
+def fluxoFuncao(cabecalho):
+    chave = id(cabecalho)
+    if chave not in fluxos:
+        fluxos[chave] = GrafoFluxo(cabecalho.children[0].children[0].name, cabecalho.children[4])
+    return fluxos[chave]
+
+# Análise de fluxo de dados das variáveis locais da função do cabeçalho (feita na primeira consulta)
+def dadosFuncao(cabecalho):
+    chave = id(cabecalho)
+    if chave not in dados:
+        fluxo = fluxoFuncao(cabecalho)
+        dados[chave] = FluxoDados(fluxo, cabecalho.children[4], locaisRecusados.get(fluxo.nome, ()))
+    return dados[chave]
+
+# Verifica se as funções têm o retorno adequado ao seu tipo declarado, se todos os caminhos da função terminam
+# em retorna e se há código inalcançável, pelo grafo de fluxo de controle de cada função
+def buscaRetornoFuncao(table, node=None):
+    res = buscaNos(root if node is None else node, 'declaracao_funcao')
+    if not res:
+        return
+    conta('consultas_simbolos')
+    tipos = {entry['name']: entry['type'] for entry in table if entry['declarationType'] == 'func'}
     for p in res:
-        renderNodeTree = [node for pre, fill, node in RenderTree(p)]
-        for node1 in renderNodeTree:
+        for node1 in p.children:
             if node1.name == 'cabecalho':
-                renderNode1Tree = [node for pre, fill, node in RenderTree(node1)]
-                returns = findall_by_attr(node1, 'retorna')
-                funcName = renderNode1Tree[2].name
-                if not returns:
-                    for i in range(len(table)):
-                        if table[i]['name'] == funcName and table[i]['declarationType'] == 'func' and table[i]['type'] != 'vazio':
-                            print(error_handler.newError(False, 'ERR-SEM-FUNC-RET-TYPE-ERROR').format(funcName, table[i]['type'], 'vazio'))
+                fluxo = fluxoFuncao(node1)
+                funcName = fluxo.nome
+                type = tipos.get(funcName)
+                if not fluxo.retornos:
+                    if type is not None and type != 'vazio':
+                        emiteMensagem('ERR-SEM-FUNC-RET-TYPE-ERROR', funcName, type, 'vazio')
                 else:
-                    for return1 in returns:
-                        if return1.children:
-                            expression = return1.children[2]
-                            if expression.name == 'expressao':
-                                scope = buscaEscopo(return1)
-                                factors = buscaFator(expression, table, scope)
-                                for i in range(len(table)):
-                                    if table[i]['name'] == funcName and table[i]['declarationType'] == 'func':
-                                        type = table[i]['type']
-                                        type_factor = buscaTipoFator(factors, type)
-                                        if type_factor != type:
-                                            print(error_handler.newError(False, 'ERR-SEM-FUNC-RET-TYPE-ERROR').format(funcName, type, type_factor))
+                    for return1 in fluxo.retornos:
+                        expression = return1.children[2]
+                        if expression.name == 'expressao':
+                            anotaExpressao(expression, table, funcName)
+                            if type is not None:
+                                type_factor = expression.return_type or type
+                                if type_factor != type:
+                                    emiteMensagem('ERR-SEM-FUNC-RET-TYPE-ERROR', funcName, type, type_factor)
+                    if type is not None and type != 'vazio' and fluxo.semRetorno():
+                        emiteMensagem('WAR-SEM-FUNC-RET-MISSING', funcName, type)
+                for acao in fluxo.inalcancaveis():
+                    emiteMensagem('WAR-SEM-UNREACHABLE-CODE', funcName, linha(acao))
+
+# Monta o grafo de chamadas da árvore sintática: um site por chamada_funcao, com o chamador (a função da
+# declaração, None nas declarações globais), a linha e o número de argumentos
+def montaGrafoChamadas(tree):
+    novo = GrafoChamadas()
+    for declaracao in buscaNos(tree, 'declaracao'):
+        chamador = nomeDeclaracao(declaracao)
+        if chamador is not None:
+            novo.declara(chamador)
+        for p in buscaNos(declaracao, 'chamada_funcao'):
+            nome = p.children[0].children[0]
+            argumentos = p.children[2]
+            if argumentos.name != 'lista_argumentos':
+                numero = None
+            elif argumentos.children[0].name == 'vazio':
+                numero = 0
+            else:
+                numero = contagemParametros(argumentos)
+            novo.adiciona(Chamada(chamador, nome.name, nome.line, numero, p, declaracao))
+    return novo
+
+# Grafo de chamadas da árvore atual, montado na primeira consulta (ou pela regra grafoChamadas)
+def grafoChamadas():
+    global grafo
+    if grafo is None:
+        grafo = montaGrafoChamadas(root)
+    return grafo
+
+# Índice de referências cruzadas da árvore atual: declaração e usos de cada símbolo, montado na primeira consulta
+# (ou pela regra indiceReferencias) a partir da árvore e dos sites de chamada do grafo
+def indiceReferencias():
+    global indice
+    if indice is None:
+        conta('percursos_arvore')
+        indice = tppreferencias.montaIndice(root, grafoChamadas())
+    return indice
 
 # Verifica se as funções são chamadas corretamente e se os argumentos correspondem aos parâmetros
-def verificaChamada(table):
-    res = findall_by_attr(root, 'chamada_funcao')
-    for p in res:
-        renderNodeTree = [node for pre, fill, node in RenderTree(p)]
-        name = renderNodeTree[2].name
-        if declaracaoVariavel(table=table, name=name, scope='global'):
-            scopeCall = buscaEscopo(p)
+# (consulta os sites de chamada do grafo; node restringe a verificação a uma declaração)
+def verificaChamada(table, node=None):
+    chamadas = grafoChamadas().chamadas if node is None else grafoChamadas().chamadasEm(node)
+    if not chamadas:
+        return
+    conta('consultas_simbolos')
+    globais = {entry['name'] for entry in table if entry['scope'] == 'global'}
+    parametros = {entry['name']: len(entry['parameters']) for entry in table if entry['declarationType'] == 'func'}
+    for chamada in chamadas:
+        name = chamada.funcao
+        if name in globais:
             if name == 'principal':
-                if scopeCall == 'principal':
-                    print(error_handler.newError(False, 'WAR-SEM-CALL-REC-FUNC-MAIN').format(name))
-                print(error_handler.newError(False, 'ERR-SEM-CALL-FUNC-MAIN-NOT-ALLOWED'))
-            else:
-                node1 = renderNodeTree[5]
-                if node1.name == 'lista_argumentos':
-                    if node1.children[0].name != 'vazio':
-                        numberArguments = contagemParametros(node1)
-                        for i in range(len(table)):
-                            if table[i]['name'] == name and table[i]['declarationType'] == 'func':
-                                parameters = table[i]['parameters']
-                                if numberArguments < len(parameters):
-                                    print(error_handler.newError(False, 'ERR-SEM-CALL-FUNC-WITH-FEW-ARGS').format(name))
-                                elif numberArguments > len(parameters):
-                                    print(error_handler.newError(False, 'ERR-SEM-CALL-FUNC-WITH-MANY-ARGS').format(name))
+                if chamada.chamador == 'principal':
+                    emiteMensagem('WAR-SEM-CALL-REC-FUNC-MAIN', name)
+                emiteMensagem('ERR-SEM-CALL-FUNC-MAIN-NOT-ALLOWED')
+            elif chamada.argumentos and name in parametros:
+                if chamada.argumentos < parametros[name]:
+                    emiteMensagem('ERR-SEM-CALL-FUNC-WITH-FEW-ARGS', name)
+                elif chamada.argumentos > parametros[name]:
+                    emiteMensagem('ERR-SEM-CALL-FUNC-WITH-MANY-ARGS', name)
         else:
-            print(error_handler.newError(False, 'ERR-SEM-CALL-FUNC-NOT-DECL').format(name))
+            emiteMensagem('ERR-SEM-CALL-FUNC-NOT-DECL', name)
 
-# Verifica se as funções declaradas foram usadas em algum ponto do código
+# Verifica se as funções declaradas foram usadas em algum ponto do código: chamadas por outra função ou por
+# uma inicialização global, pelo grafo de chamadas (só as chamadas recursivas não contam como uso)
 def verificaUsoFuncao(table):
+    chamadas = grafoChamadas()
     for i in range(len(table)):
         if table[i]['declarationType'] == 'func':
             name = table[i]['name']
-            if table[i]['used'] == 'N':
-                print(error_handler.newError(False, 'WAR-SEM-FUNC-DECL-NOT-USED').format(name))
+            if name != 'principal' and not set(chamadas.chamadores(name)) - {name}:
+                emiteMensagem('WAR-SEM-FUNC-DECL-NOT-USED', name)
 
 # Realiza as verificações de retorno, chamada e uso de funções
 def verificarFuncoes(table):
@@ -445,14 +700,203 @@ def verificarFuncoes(table):
     verificaChamada(table)
     verificaUsoFuncao(table)
 
-# Função principal para verificar as regras semânticas do código
-def checkRules():
-    table = tabelaDeSimbolos()
+# Regra: a função principal deve ser declarada
+def regraExisteMain(table):
     if not existeMain(table):
-        print(error_handler.newError(False, 'ERR-SEM-MAIN-NOT-DECL'))
-    verificarVariavel(table)
-    variavelEmUso(table)
-    verificarFuncoes(table)
+        emiteMensagem('ERR-SEM-MAIN-NOT-DECL')
+
+# Regra: monta a tabela de símbolos (as demais regras dependem dela)
+def regraTabelaDeSimbolos(table):
+    table.extend(tabelaDeSimbolos())
+
+# Regra: anota os tipos das expressões (sem ela, cada expressão é anotada quando verificada)
+def regraAnotaTipos(table):
+    anotaTipos(table)
+
+# Regra: monta o grafo de chamadas (sem ela, o grafo é montado na primeira consulta)
+def regraGrafoChamadas(table):
+    grafoChamadas()
+
+# Regra: monta o índice de referências cruzadas (sem ela, o índice é montado na primeira consulta)
+def regraIndiceReferencias(table):
+    indiceReferencias()
+
+# Regras semânticas executadas pelo checkRules, na ordem: (nome, função que recebe a tabela de símbolos)
+regras = [
+    ('tabelaDeSimbolos', regraTabelaDeSimbolos),
+    ('anotaTipos', regraAnotaTipos),
+    ('grafoChamadas', regraGrafoChamadas),
+    ('indiceReferencias', regraIndiceReferencias),
+    ('existeMain', regraExisteMain),
+    ('verificarVariavel', verificarVariavel),
+    ('variavelEmUso', variavelEmUso),
+    ('verificaInicializacao', verificaInicializacao),
+    ('buscaRetornoFuncao', buscaRetornoFuncao),
+    ('verificaChamada', verificaChamada),
+    ('verificaUsoFuncao', verificaUsoFuncao),
+]
+
+# Regras desabilitadas (por nome)
+regrasDesabilitadas = set()
+
+# Ganchos chamados na entrada e na saída de cada regra: objetos com os métodos
+# entrada(nome, visitas) e saida(nome, visitas), onde visitas é o total de nós visitados até o momento
+ganchos = []
+
+# Arquivo com a configuração das regras (seção [SemaRules], regra = sim/nao)
+arquivoRegras = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'SemaRules.properties')
+
+# Habilita ou desabilita uma regra semântica
+def habilitaRegra(nome, habilitada=True):
+    if nome not in dict(regras):
+        raise KeyError('Regra semântica desconhecida: ' + nome)
+    if nome == 'tabelaDeSimbolos' and not habilitada:
+        raise ValueError('A regra tabelaDeSimbolos não pode ser desabilitada')
+    if habilitada:
+        regrasDesabilitadas.discard(nome)
+    else:
+        regrasDesabilitadas.add(nome)
+
+# Lê a configuração das regras semânticas; regras ausentes do arquivo ficam habilitadas
+def carregaConfiguracaoRegras(caminho=arquivoRegras):
+    config = configparser.RawConfigParser()
+    config.optionxform = str
+    if caminho == arquivoRegras:
+        # Lido por tpptabelas para funcionar também de dentro do .pyz
+        config.read_string(tpptabelas.leRecurso('SemaRules.properties').decode('UTF-8'))
+    else:
+        config.read(caminho, encoding='UTF-8')
+    if not config.has_section('SemaRules'):
+        return
+    for nome, valor in config.items('SemaRules'):
+        habilitaRegra(nome, valor.strip().lower() in ('sim', 's', 'true', '1'))
+
+carregaConfiguracaoRegras()
+
+def registraGancho(gancho):
+    ganchos.append(gancho)
+
+def removeGancho(gancho):
+    ganchos.remove(gancho)
+
+# Executa uma regra, chamando os ganchos de entrada e saída
+def executaRegra(nome, regra, table):
+    for gancho in ganchos:
+        gancho.entrada(nome, nosVisitados)
+    with fase(nome):
+        regra(table)
+    for gancho in ganchos:
+        gancho.saida(nome, nosVisitados)
+
+# Regras que percorrem apenas o corpo de cada declaração e podem ser verificadas em paralelo
+regrasPorDeclaracao = ['verificarVariavel', 'verificaInicializacao', 'buscaRetornoFuncao', 'verificaChamada']
+
+# Estado compartilhado com os processos trabalhadores da verificação paralela (herdado pelo fork)
+_paralelo = {}
+
+# Nome da função declarada em uma declaração (None para declarações globais de variáveis)
+def nomeDeclaracao(declaracao):
+    if declaracao.children[0].name != 'declaracao_funcao':
+        return None
+    for cabecalho in buscaNos(declaracao, 'cabecalho'):
+        return cabecalho.children[0].children[0].name
+    return None
+
+# Verifica, num processo trabalhador, as declarações de funções de um grupo (funções com o mesmo nome);
+# retorna os diagnósticos de cada declaração por regra, as marcas de uso/inicialização e os erros de variáveis
+def _verificaGrupo(indices):
+    global medeVisitas
+    medeVisitas = False
+    tppestatisticas.ativa(None)
+    table = _paralelo['tabela']
+    declaracoes = _paralelo['declaracoes']
+    funcoes = dict(regras)
+    erros = len(variablesError)
+    resultados = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for indice in indices:
+            porRegra = {}
+            for nome in _paralelo['regras']:
+                diagnosticos.clear()
+                funcoes[nome](table, declaracoes[indice])
+                porRegra[nome] = list(diagnosticos)
+            resultados.append((indice, porRegra))
+    marcas = [(entry.get('init'), entry['used']) for entry in table]
+    return resultados, marcas, variablesError[erros:]
+
+# Verifica os corpos das funções em paralelo; retorna, para cada regra, uma função que reproduz os
+# diagnósticos na ordem do código-fonte (as declarações globais são verificadas no processo principal)
+def verificaDeclaracoesParalelo(table, trabalhadores):
+    import multiprocessing
+    declaracoes = list(buscaNos(root, 'declaracao'))
+    nomes = [regra for regra in regrasPorDeclaracao if regra not in regrasDesabilitadas]
+    grupos = {}
+    for indice, declaracao in enumerate(declaracoes):
+        nome = nomeDeclaracao(declaracao)
+        if nome is not None:
+            grupos.setdefault(nome, []).append(indice)
+
+    respostas = []
+    if grupos:
+        _paralelo.update(tabela=table, declaracoes=declaracoes, regras=nomes)
+        try:
+            contexto = multiprocessing.get_context('fork')
+            with contexto.Pool(min(trabalhadores, len(grupos))) as pool:
+                respostas = pool.map(_verificaGrupo, list(grupos.values()))
+        finally:
+            _paralelo.clear()
+
+    porDeclaracao = {}
+    for resultados, marcas, erros in respostas:
+        porDeclaracao.update(resultados)
+        for entry, (init, used) in zip(table, marcas):
+            if init == 'Y':
+                entry['init'] = 'Y'
+            if used == 'Y':
+                entry['used'] = 'Y'
+        variablesError.extend(erros)
+
+    funcoes = dict(regras)
+    def reproduz(nome):
+        def regra(table):
+            for indice, declaracao in enumerate(declaracoes):
+                if indice in porDeclaracao:
+                    for diagnostico in porDeclaracao[indice][nome]:
+                        registraDiagnostico(diagnostico)
+                else:
+                    funcoes[nome](table, declaracao)
+        return regra
+    return {nome: reproduz(nome) for nome in nomes}
+
+# Indica se a verificação paralela pode ser usada (o multiprocessing só é importado quando pedida)
+def forkDisponivel():
+    import multiprocessing
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+# Função principal para verificar as regras semânticas do código.
+# Com trabalhadores > 1, depois da tabela de símbolos, as regras de regrasPorDeclaracao são verificadas
+# em paralelo por função (o tempo da verificação paralela é registrado na fase verificacaoParalela).
+def checkRules(trabalhadores=1):
+    global medeVisitas
+    medeVisitas = bool(ganchos) or tppestatisticas.atual is not None
+    visitas = nosVisitados
+    paralelo = trabalhadores > 1 and forkDisponivel()
+    substitutas = {}
+    table = []
+    try:
+        for nome, regra in regras:
+            if nome in regrasDesabilitadas:
+                continue
+            if paralelo and nome in regrasPorDeclaracao:
+                if not substitutas:
+                    with fase('verificacaoParalela'):
+                        substitutas.update(verificaDeclaracoesParalelo(table, trabalhadores))
+                regra = substitutas[nome]
+            executaRegra(nome, regra, table)
+    finally:
+        conta('nos_visitados', nosVisitados - visitas)
+        medeVisitas = False
+    return table
 
 # Lista de tokens relevantes para a poda
 string_tokens = [
@@ -466,18 +910,11 @@ string_tokens = [
 
 # Função principal para podar a lista de declarações
 def podaDeclaracoes(tree):
-    item = tree.children[0]
-    dec = ()
+    dec = []
     
-    # Navega pela lista de declarações, acumulando nós relevantes
-    while item.name == 'lista_declaracoes':
-        if item.name == 'lista_declaracoes':
-            if len(item.children) == 1:
-                node = item.children[0]
-            else:
-                node = item.children[1]
-            dec = node.children + dec
-        item = item.children[0]
+    # Percorre a lista de declarações, acumulando nós relevantes
+    for node in tree.children[0].children:
+        dec += node.children
     
     # Realiza a poda em cada tipo de declaração
     for i in dec:
@@ -495,34 +932,28 @@ def podaDeclaracoes(tree):
 def PodaDeclaracaoFuncao(tree):
     dec = ()
     
-    # Caso a função tenha apenas um nó filho
-    if len(tree.children) == 1:
-        dec += tree.children[0].children
-    else:
+    # Tipo de retorno (a função sem tipo tem apenas o cabeçalho como filho)
+    if len(tree.children) > 1:
         dec += tree.children[0].children[0].children
-        # Processa os filhos da função
-        for child in tree.children[1].children:
-            if child.name in string_tokens:
-                dec += child.children
-            elif child.name == 'corpo':
-                dec += (podaCorpo(child),)
-            elif child.name == 'lista_parametros':
-                item = child
-                dec1 = ()
-                # Poda da lista de parâmetros
-                while item.name == 'lista_parametros':
-                    if item.children[0].name == 'vazio':
-                        aux = item.children[0]
-                        dec1 = (aux,) + dec1
-                    elif len(item.children) == 1:
-                        dec1 = (podaParametros(item.children[0]),) + dec1
-                    else:
-                        dec1 = (podaParametros(item.children[2]),) + dec1
-                    item = item.children[0]
-                child.children = dec1
-                dec += (child,)
-            else:
-                dec += (child,)
+
+    # Processa os filhos do cabeçalho da função
+    for child in tree.children[-1].children:
+        if child.name in string_tokens:
+            dec += child.children
+        elif child.name == 'corpo':
+            dec += (podaCorpo(child),)
+        elif child.name == 'lista_parametros':
+            dec1 = ()
+            # Poda da lista de parâmetros
+            for item in child.children:
+                if item.name == 'vazio':
+                    dec1 += (item,)
+                elif item.name == 'parametro':
+                    dec1 += (podaParametros(item),)
+            child.children = dec1
+            dec += (child,)
+        else:
+            dec += (child,)
     
     # Atualiza os filhos da árvore com a função podada
     tree.children = dec
@@ -537,14 +968,9 @@ def podaDeclaracaoVariavel(tree):
 
     # Processa a lista de variáveis
     dec1 = ()
-    item = tree.children[2]
-    while item.name == 'lista_variaveis':
-        if item.name == 'lista_variaveis':
-            if len(item.children) == 1:
-                dec1 = (podaVariavel(item.children[0]),) + dec1
-            else:
-                dec1 = (podaVariavel(item.children[2]),) + dec1
-        item = item.children[0]
+    for item in tree.children[2].children:
+        if item.name == 'var':
+            dec1 += (podaVariavel(item),)
     
     # Atualiza a lista de variáveis podada
     tree.children[2].children = dec1
@@ -565,7 +991,7 @@ def podaInicializacao(tree):
     dec += (tree.children[1].children[0],)
     
     # Poda da expressão de inicialização
-    tree.children[2].children = podaExpressao(tree.children[2])
+    podaExpressao(tree.children[2])
     dec += (tree.children[2],)
     
     # Atualiza a árvore com a inicialização podada
@@ -587,16 +1013,16 @@ def podaVariavel(tree):
         # Poda do array com dois colchetes
         if len(aux.children[1].children) == 4:
             dec1 += aux1[0].children[0].children
-            aux1[0].children[1].children = podaExpressao(aux1[0].children[1])
+            podaExpressao(aux1[0].children[1])
             dec1 += (aux1[0].children[1],)
             dec1 += aux1[0].children[2].children
             dec1 += aux1[1].children
-            aux1[2].children = podaExpressao(aux1[2])
+            podaExpressao(aux1[2])
             dec1 += (aux1[2],)
             dec1 += aux1[3].children
         else:
             dec1 += aux1[0].children
-            aux1[1].children = podaExpressao(aux1[1])
+            podaExpressao(aux1[1])
             dec1 += (aux1[1],)
             dec1 += aux1[2].children
         
@@ -609,42 +1035,67 @@ def podaVariavel(tree):
     return tree
 
 # Função para podar expressões
+# A expressão é achatada com uma pilha explícita (operando esquerdo, operador, operando direito), sem
+# recursão nos operandos nem nos parênteses, para suportar expressões muito longas ou aninhadas.
+# Os filhos podados são atribuídos à própria expressão (reatribuí-los depois desanexaria um a um cada
+# filho). As variáveis e chamadas são podadas só depois de penduradas na expressão achatada: o anytree
+# percorre o caminho até a raiz a cada troca de pai, e na cadeia original esse caminho cresce com a expressão
 def podaExpressao(tree):
-    aux = tree.children
-    name = tree.name
-    
-    # Condensa a expressão em uma forma mais simples
-    while len(aux) == 1 and name != 'expressao_unaria':
-        name = aux[0].name
-        aux = aux[0].children
-    
-    dec = ()
-    
-    # Verifica se a expressão é unária
-    if aux[0].parent.name == 'expressao_unaria':
-        if len(aux) == 1:
-            if aux[0].children[0].name == 'chamada_funcao':
-                dec += (podaChamadaFuncao(aux[0].children[0]),)
-            elif aux[0].children[0].name == 'var':
-                dec += (podaVariavel(aux[0].children[0]),)
-            elif aux[0].children[0].name == 'numero':
-                dec += aux[0].children[0].children
+    dec = []
+    operandos = []
+    pilha = [tree]
+
+    while pilha:
+        item = pilha.pop()
+        # Tokens já podados que aguardam a vez de entrar no resultado (ex.: o operador e o ')')
+        if type(item) is tuple:
+            dec += item
+            continue
+
+        aux = item.children
+        name = item.name
+
+        # Condensa a expressão em uma forma mais simples
+        while len(aux) == 1 and name not in ('expressao_unaria', 'fator'):
+            name = aux[0].name
+            aux = aux[0].children
+
+        # Na gramática de precedência o fator não é envolvido por uma expressão unária
+        if name == 'fator':
+            aux = (aux[0].parent,)
+            name = 'expressao_unaria'
+
+        # Verifica se a expressão é unária
+        if name == 'expressao_unaria':
+            if len(aux) == 1:
+                if aux[0].children[0].name == 'chamada_funcao':
+                    operandos.append((podaChamadaFuncao, aux[0].children[0]))
+                    dec.append(aux[0].children[0])
+                elif aux[0].children[0].name == 'var':
+                    operandos.append((podaVariavel, aux[0].children[0]))
+                    dec.append(aux[0].children[0])
+                elif aux[0].children[0].name == 'numero':
+                    dec += aux[0].children[0].children
+                else:
+                    dec += aux[0].children[0].children
+                    pilha.append(aux[0].children[2].children)
+                    pilha.append(aux[0].children[1])
             else:
+                # Operador unário seguido do fator, podado como um fator isolado (variável, chamada,
+                # número ou expressão entre parênteses)
                 dec += aux[0].children[0].children
-                dec += podaExpressao(aux[0].children[1])
-                dec += aux[0].children[2].children
+                pilha.append(aux[1])
         else:
-            dec += aux[0].children[0].children
-            dec += aux[1].children[0].children
-        aux = dec
-    else:
-        dec += podaExpressao(aux[0])
-        dec += (aux[1].children[0].children[0],)
-        dec += podaExpressao(aux[2])
-        aux = dec
-    
+            pilha.append(aux[2])
+            pilha.append((aux[1].children[0].children[0],))
+            pilha.append(aux[0])
+
+    tree.children = dec
+    for poda, operando in operandos:
+        poda(operando)
+
     # Retorna a expressão podada
-    return aux
+    return tree
 
 # Função para podar a chamada de função
 def podaChamadaFuncao(tree):
@@ -659,22 +1110,14 @@ def podaChamadaFuncao(tree):
             if child.name in string_tokens:
                 dec += child.children
             elif child.name == 'lista_argumentos':
-                item = child
                 dec1 = ()
                 # Poda da lista de argumentos
-                while item.name == 'lista_argumentos':
-                    if item.children[0].name == 'vazio':
-                        aux = item.children[0]
-                        dec1 = (aux,) + dec1
-                    elif len(item.children) == 1:
-                        aux = item.children[0]
-                        aux.children = podaExpressao(item.children[0])
-                        dec1 = (aux,) + dec1
-                    else:
-                        aux = item.children[2]
-                        aux.children = podaExpressao(item.children[2])
-                        dec1 = (aux,) + dec1
-                    item = item.children[0]
+                for item in child.children:
+                    if item.name == 'vazio':
+                        dec1 += (item,)
+                    elif item.name != 'VIRGULA':
+                        podaExpressao(item)
+                        dec1 += (item,)
                 child.children = dec1
                 dec += (child,)
             else:
@@ -716,7 +1159,7 @@ def podaFuncoesEntradaSaida(tree):
     if tree.name == 'leia':
         dec += (podaVariavel(tree.children[2]),)
     else:
-        tree.children[2].children = podaExpressao(tree.children[2])
+        podaExpressao(tree.children[2])
         dec += (tree.children[2],)
     
     # Adiciona o token final
@@ -727,24 +1170,27 @@ def podaFuncoesEntradaSaida(tree):
     return tree
 
 # Função para podar a estrutura de controle 'se'
-def podaSe(tree):
+# Os corpos são acrescentados a pendentes e podados depois por podaCorpo
+def podaSe(tree, pendentes):
     dec = ()
     
     # Adiciona o token 'SE' e a expressão condicional
     dec += tree.children[0].children
-    tree.children[1].children = podaExpressao(tree.children[1])
+    podaExpressao(tree.children[1])
     dec += (tree.children[1],)
     
     # Adiciona o token 'ENTAO' e o corpo correspondente
     dec += tree.children[2].children
-    dec += (podaCorpo(tree.children[3]),)
+    pendentes.append(tree.children[3])
+    dec += (tree.children[3],)
     
     # Verifica se há um bloco 'SENAO'
     if len(tree.children) == 5:
         dec += (tree.children[4],) # Adiciona 'FIM'
     else:
         dec += (tree.children[4],) # Adiciona 'SENAO'
-        dec += (podaCorpo(tree.children[5]),) # Adiciona corpo do 'SENAO'
+        pendentes.append(tree.children[5])
+        dec += (tree.children[5],) # Adiciona corpo do 'SENAO'
         dec += (tree.children[6],) # Adiciona 'FIM'
     
     # Atualiza a árvore com a estrutura 'se' podada
@@ -752,16 +1198,18 @@ def podaSe(tree):
     return tree
 
 # Função para podar a estrutura de repetição 'repita'
-def podaRepita(tree):
+# O corpo é acrescentado a pendentes e podado depois por podaCorpo
+def podaRepita(tree, pendentes):
     dec = ()
     
     # Adiciona o token 'REPITA' e o corpo correspondente
     dec += tree.children[0].children
-    dec += (podaCorpo(tree.children[1]),)
+    pendentes.append(tree.children[1])
+    dec += (tree.children[1],)
     
     # Adiciona o token 'ATE' e a expressão condicional
     dec += tree.children[2].children
-    tree.children[3].children = podaExpressao(tree.children[3])
+    podaExpressao(tree.children[3])
     dec += (tree.children[3],)
     
     # Atualiza a árvore com a estrutura 'repita' podada
@@ -769,43 +1217,54 @@ def podaRepita(tree):
     return tree
 
 # Função para podar o corpo das funções e estruturas
+# Os corpos aninhados (se/repita) são podados com uma pilha explícita, sem recursão
 def podaCorpo(tree):
-    dec = ()
-    item = tree
-    
-    # Itera sobre o corpo da função/estrutura
-    while item.name == 'corpo':
-        if len(item.children) == 2:
-            action = item.children[1].children[0]
-            
-            # Identifica o tipo de ação e realiza a poda correspondente
-            if action.name == 'expressao':
-                if action.children[0].name == 'atribuicao':
-                    dec = (podaInicializacao(action.children[0]),) + dec
+    pendentes = [tree]
+
+    while pendentes:
+        corpo = pendentes.pop()
+        dec = []
+
+        # Itera sobre as ações do corpo da função/estrutura
+        for item in corpo.children:
+            if item.name == 'acao':
+                action = item.children[0]
+
+                # Identifica o tipo de ação e realiza a poda correspondente
+                if action.name == 'expressao':
+                    if action.children[0].name == 'atribuicao':
+                        dec.append(podaInicializacao(action.children[0]))
+                    else:
+                        podaExpressao(action)
+                        dec.append(action)
+                elif action.name == 'declaracao_variaveis':
+                    dec.append(podaDeclaracaoVariavel(action))
+                elif action.name == 'se':
+                    dec.append(podaSe(action, pendentes))
+                elif action.name == 'repita':
+                    dec.append(podaRepita(action, pendentes))
                 else:
-                    action.children = podaExpressao(action)
-                    dec = (action,) + dec
-            elif action.name == 'declaracao_variaveis':
-                dec = (podaDeclaracaoVariavel(action),) + dec
-            elif action.name == 'se':
-                dec = (podaSe(action),) + dec
-            elif action.name == 'repita':
-                dec = (podaRepita(action),) + dec
-            else:
-                dec = (podaFuncoesEntradaSaida(action),) + dec
-        
-        # Passa para o próximo nó
-        item = item.children[0]
-    
-    # Atualiza a árvore com o corpo podado
-    tree.children = dec
+                    dec.append(podaFuncoesEntradaSaida(action))
+
+        # Atualiza a árvore com o corpo podado
+        corpo.children = dec
     return tree
 
 # Função principal para iniciar a poda da árvore
-def podaArvore():
+# Com exportar=False apenas poda a árvore, sem gerar a imagem da árvore podada; com elimina=True remove também o
+# código morto (tppelimina.py) e retorna o que foi removido
+def podaArvore(exportar=True, elimina=False):
     tree = root
-    podaDeclaracoes(tree)
-    UniqueDotExporter(tree).to_picture("prunedTree.png")
+    removido = None
+    with fase('podaArvore'), semVerificarCiclos():
+        podaDeclaracoes(tree)
+    if elimina:
+        with fase('eliminacao'):
+            removido = tppelimina.eliminaCodigoMorto(tree)
+    if exportar:
+        with fase('exportacao'):
+            mytree.ExportadorDotUnico(tree).to_picture("prunedTree.png")
+    return removido
 
 # Função principal do programa
 def main():
@@ -1,26 +1,22 @@
-import tpplex
-import subprocess
-import os, fnmatch
+import time
 
+import tppcompilador
+import tppsema
+import tppsuite
+import tpptrabalhadores
+from benchmarks.gerador import geraBlocosAninhados
+
+# Executa o caso no próprio processo (API reentrante), sem iniciar um interpretador por caso
 def execute_test(input_file):
     path_file = 'tests/' + input_file
-    process = subprocess.Popen(['python', 'tppsema.py', path_file],
-                     stdout=subprocess.PIPE,
-                     stderr=subprocess.PIPE)
-    stdout, stderr = process.communicate()
-    stdout, stderr
-
-    output_file = open(path_file + ".out", "r")
-
-    #read whole file to a string
-    expected_output = output_file.read()
+    caso = tppsuite.executaCaso(path_file)
 
-    output_file.close()
+    print(caso['obtido'])
+    print(caso['esperado'])
+    if caso['erro']:
+        print(caso['erro'])
 
-    print(stdout)
-    print(expected_output)
-
-    return stdout.decode("utf-8") == expected_output
+    return caso['passou']
 
 #def testes():
 #    for file in fnmatch.filter(os.listdir('tests'), '*.tpp'):
@@ -85,3 +81,129 @@ def test_019():
 
 def test_020():
     assert execute_test("sema-020.tpp") == True
+
+def test_paralelo():
+    # A verificação paralela por função emite os mesmos diagnósticos, na mesma ordem
+    for caminho, esperado in tppsuite.descobreCasos(padrao='sema-*.tpp'):
+        sequencial = tppcompilador.compilaArquivo(caminho, poda=False)
+        paralelo = tppcompilador.compilaArquivo(caminho, poda=False, trabalhadores=2)
+        assert paralelo.diagnosticos == sequencial.diagnosticos
+
+# Texto da árvore, um nó por linha (nome e tipo) indentado pela profundidade, sem recursão
+def arvoreTexto(root):
+    linhas = []
+    pilha = [(root, 0)] if root is not None else []
+    while pilha:
+        node, profundidade = pilha.pop()
+        linhas.append('  ' * profundidade + '%s %s' % (node.name, getattr(node, 'type', '')))
+        pilha.extend((child, profundidade + 1) for child in reversed(node.children))
+    return '\n'.join(linhas)
+
+def test_precedencia():
+    # A gramática de precedência gera os mesmos diagnósticos e a mesma árvore podada
+    for caminho, esperado in tppsuite.descobreCasos(padrao='sema-*.tpp'):
+        cascata = tppcompilador.compilaArquivo(caminho)
+        precedencia = tppcompilador.compilaArquivo(caminho, gramatica='precedencia')
+        assert precedencia.diagnosticos == cascata.diagnosticos
+        assert arvoreTexto(precedencia.root) == arvoreTexto(cascata.root)
+
+def test_trabalhadores():
+    # O pool com o compilador pré-carregado devolve os mesmos diagnósticos que a compilação no processo
+    caminhos = [caminho for caminho, esperado in tppsuite.descobreCasos(padrao='sema-*.tpp')]
+    with tpptrabalhadores.PoolCompilacao(2) as pool:
+        resumos = pool.compilaArquivos(caminhos)
+    for caminho, resumo in zip(caminhos, resumos):
+        assert resumo['caminho'] == caminho
+        assert resumo['diagnosticos'] == tppcompilador.compilaArquivo(caminho).diagnosticos
+
+def test_tipos():
+    # O tipo de cada expressão é anotado no nó, com a promoção de inteiro para flutuante
+    fonte = ("inteiro: v[10]\n\ninteiro principal()\n  flutuante: a\n"
+             "  a := v[2] + 3 * (a - 1)\n  a := a + 1\n  retorna(v[0] > a)\nfim\n")
+    resultado = tppcompilador.compila(fonte, poda=False)
+    atribuicoes = [node for node in tppsema.buscaNos(resultado.root, 'atribuicao')]
+    expressao = atribuicoes[0].children[2]
+    assert (expressao.return_type, expressao.fatores) == ('flutuante', 4)
+    indice = tppsema.buscaNos(expressao, 'indice')[0].children[1]
+    assert (indice.return_type, indice.fator['value']) == ('inteiro', '2')
+    assert 'WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-EXP' not in resultado.chaves()
+    assert 'ERR-SEM-FUNC-RET-TYPE-ERROR' not in resultado.chaves()
+
+def test_tabela_indexada():
+    # As consultas pelo índice da tabela de símbolos dão o mesmo resultado da busca linear: o global é visível em
+    # todos os escopos e, fora do escopo global, o parâmetro de qualquer função
+    fonte = ("inteiro: g\nflutuante: h\n\ninteiro soma(inteiro: a, flutuante: b)\n  flutuante: g\n  retorna(a)\nfim\n\n"
+             "inteiro principal()\n  inteiro: a\n  a := soma(1, 2.0)\n  retorna(a)\nfim\n")
+    tabela = tppcompilador.compila(fonte, poda=False).tabela
+    def linear(name, scope):
+        for entry in tabela:
+            if entry['name'] == name and (entry['scope'] == 'global' or entry['scope'] == scope):
+                return entry['type']
+            elif scope != 'global' and entry['declarationType'] == 'func':
+                for param in entry['parameters']:
+                    if param['name'] == name:
+                        return param['type']
+        return None
+    for name in ['g', 'h', 'a', 'b', 'soma', 'principal', 'ausente']:
+        for scope in ['global', 'soma', 'principal']:
+            assert tppsema.buscaTipo(tabela, name, scope) == linear(name, scope)
+            assert tppsema.declaracaoVariavel(tabela, name, scope) == (linear(name, scope) is not None)
+    # Uma entrada acrescentada depois da primeira consulta também é encontrada
+    tabela.append(dict(tabela[0], name='nova'))
+    assert tppsema.buscaTipo(tabela, 'nova', 'principal') == tabela[0]['type']
+
+def test_fator_sem_tipo():
+    # Um operando sem tipo (x não foi declarado) não apaga o único fator com tipo da expressão: a coerção de t é
+    # avisada e x é reportado
+    fonte = ("inteiro principal()\n  inteiro: t\n  flutuante: f\n"
+             "  t := 1\n  f := t + x\n  retorna(0)\nfim\n")
+    resultado = tppcompilador.compila(fonte, poda=False)
+    assert resultado.erro is None
+    expressao = tppsema.buscaNos(resultado.root, 'atribuicao')[1].children[2]
+    assert (expressao.fatores, expressao.fator['value']) == (1, 't')
+    assert "Coerção implícita do valor de 't' do tipo 'inteiro' para 'f' que é 'flutuante'." in resultado.saida
+    naoDeclaradas = [diagnostico['message'] for diagnostico in resultado.diagnosticos
+                     if diagnostico['key'] == 'ERR-SEM-VAR-NOT-DECL']
+    assert len(naoDeclaradas) == 1 and "'x'" in naoDeclaradas[0]
+
+podaFuncoes = '''
+nada(inteiro: n)
+  escreva(n)
+fim
+
+inteiro principal()
+  inteiro: a
+  inteiro: b
+  a := 1
+  b := 2
+  se !(a < b) então
+    nada(a)
+  fim
+  retorna(0)
+fim
+'''
+
+def test_poda_negacao():
+    # O operador unário aplicado a uma expressão entre parênteses mantém o operando na árvore podada
+    resultado = tppcompilador.compila(podaFuncoes)
+    condicao = tppsema.buscaNos(resultado.root, 'se')[0].children[1]
+    assert [child.name for child in condicao.children] == ['!', '(', 'var', '<', 'var', ')']
+
+def test_poda_funcao_sem_tipo():
+    # A função sem tipo de retorno também é podada: nome, parâmetros e corpo com as ações
+    resultado = tppcompilador.compila(podaFuncoes)
+    funcao = resultado.root.children[0].children[0]
+    assert [child.name for child in funcao.children] == ['nada', '(', 'lista_parametros', ')', 'corpo', 'fim']
+    assert [child.name for child in funcao.children[2].children[0].children] == ['inteiro', ':', 'n']
+    assert [child.name for child in funcao.children[4].children] == ['escreva']
+
+def test_aninhamento():
+    # Blocos profundamente aninhados: as variáveis de cada função são verificadas em um único percurso, e a
+    # coerção de uma atribuição aninhada é avisada uma única vez
+    fonte = geraBlocosAninhados(1500).replace('inteiro: x', 'inteiro: x\n  flutuante: y').replace(
+        'x := x + 1', 'x := x + 1\ny := x')
+    inicio = time.perf_counter()
+    resultado = tppcompilador.compila(fonte, poda=False)
+    assert time.perf_counter() - inicio < 30
+    assert resultado.chaves().count('WAR-SEM-ATR-DIFF-TYPES-IMP-COERC-OF-VAR') == 1
+    assert 'ERR-SEM-VAR-NOT-DECL' not in resultado.chaves()
@@ -0,0 +1,122 @@
+# Descrição: Executor em processo único dos casos de teste do compilador T++.
+#            Descobre automaticamente os arquivos tests/*.tpp e as saídas esperadas (.tpp.out) e
+#            compila todos os casos no mesmo processo através da API reentrante (tppcompilador.py),
+#            sem iniciar um interpretador Python por caso. Opcionalmente distribui os casos entre
+#            processos trabalhadores, criados já com o compilador carregado (tpptrabalhadores.py).
+#
+#            Uso: python tppsuite.py [-j N] [--lex] [arquivos ou pastas...]
+
+import argparse
+import fnmatch
+import os
+import sys
+
+import tppcompilador
+import tpptrabalhadores
+
+pasta_testes = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests')
+
+
+# Descobre os casos de teste (.tpp) de uma pasta, com o caminho da saída esperada (ou None)
+def descobreCasos(pasta=pasta_testes, padrao='*.tpp'):
+    casos = []
+    for nome in sorted(fnmatch.filter(os.listdir(pasta), padrao)):
+        caminho = os.path.join(pasta, nome)
+        esperado = caminho + '.out'
+        casos.append((caminho, esperado if os.path.exists(esperado) else None))
+    return casos
+
+
+# Saída da análise léxica: o tipo de cada token, um por linha
+def saidaLexica(fonte):
+    return ''.join(str(token.type) + '\n' for token in tppcompilador.analisaLexico(fonte))
+
+
+# Saída da análise semântica: a chave de cada diagnóstico, uma por linha
+def saidaSemantica(fonte):
+    resultado = tppcompilador.compila(fonte, poda=False)
+    if resultado.erro is not None:
+        raise resultado.erro
+    return ''.join(key + '\n' for key in resultado.chaves())
+
+
+# Executa um caso de teste e compara com a saída esperada
+def executaCaso(caminho, fase='sema', esperado=None):
+    if esperado is None:
+        esperado = caminho + '.out'
+
+    caso = {
+        'caso': caminho,
+        'fase': fase,
+        'obtido': None,
+        'esperado': None,
+        'passou': False,
+        'erro': None
+    }
+    try:
+        with open(caminho, encoding='utf-8') as arquivo:
+            fonte = arquivo.read()
+        with open(esperado, encoding='utf-8') as arquivo:
+            caso['esperado'] = arquivo.read()
+        if fase == 'lex':
+            caso['obtido'] = saidaLexica(fonte)
+        else:
+            caso['obtido'] = saidaSemantica(fonte)
+        caso['passou'] = caso['obtido'] == caso['esperado']
+    except Exception as e:
+        caso['erro'] = '%s: %s' % (type(e).__name__, e)
+    return caso
+
+
+def _executaCaso(argumentos):
+    return executaCaso(*argumentos)
+
+
+# Executa vários casos, opcionalmente distribuídos em processos trabalhadores; a ordem é preservada
+def executaCasos(caminhos, fase='sema', trabalhadores=1):
+    argumentos = [(caminho, fase) for caminho in caminhos]
+    if trabalhadores <= 1 or len(argumentos) <= 1:
+        return [executaCaso(*item) for item in argumentos]
+
+    with tpptrabalhadores.contexto().Pool(trabalhadores) as pool:
+        return pool.map(_executaCaso, argumentos,
+                        chunksize=max(1, len(argumentos) // (trabalhadores * 4)))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python tppsuite.py',
+                                     description='Executa os casos de teste do compilador T++ em processo único.')
+    parser.add_argument('caminhos', nargs='*', help='arquivos .tpp ou pastas (padrão: tests/)')
+    parser.add_argument('-j', '--trabalhadores', type=int, default=1,
+                        help='número de processos trabalhadores (0 = um por CPU)')
+    parser.add_argument('--lex', action='store_true', help='compara a saída da análise léxica')
+    opcoes = parser.parse_args(args)
+
+    caminhos = []
+    for caminho in opcoes.caminhos or [pasta_testes]:
+        if os.path.isdir(caminho):
+            caminhos += [tpp for tpp, out in descobreCasos(caminho) if out is not None]
+        else:
+            caminhos.append(caminho)
+
+    trabalhadores = opcoes.trabalhadores or os.cpu_count() or 1
+    casos = executaCasos(caminhos, fase='lex' if opcoes.lex else 'sema', trabalhadores=trabalhadores)
+
+    falhas = 0
+    for caso in casos:
+        if caso['passou']:
+            print('OK     ' + caso['caso'])
+            continue
+        falhas += 1
+        print('FALHOU ' + caso['caso'])
+        if caso['erro']:
+            print('    ' + caso['erro'])
+        else:
+            print('    esperado: ' + ' '.join(caso['esperado'].split()))
+            print('    obtido:   ' + ' '.join(caso['obtido'].split()))
+    print('%d casos, %d falhas' % (len(casos), falhas))
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Descrição: Tabelas pré-computadas do compilador T++ (analisador léxico e tabelas LALR).
+#            As tabelas são módulos Python (lextab.py, tpp_parser_tab.py e tpp_precedencia_tab.py)
+#            distribuídos junto com o código e carregados de caminhos conhecidos, na ordem:
+#              - a pasta dos módulos do compilador (que pode ser o próprio arquivo .pyz da distribuição
+#                em arquivo único, veja tppempacota.py);
+#              - o diretório de cache (TPP_CACHE_DIR, ou tpp em XDG_CACHE_HOME/~/.cache).
+#            Uma tabela só é usada se a assinatura gravada nela corresponder às regras atuais. Sem tabela
+#            válida o analisador é construído a partir das regras e a tabela é gravada no cache por
+#            renomeação atômica. Os arquivos de dados (.properties) também são lidos por aqui, para que
+#            funcionem tanto da pasta do código quanto de dentro do .pyz.
+
+import importlib.machinery
+import importlib.util
+import logging
+import os
+
+import ply.yacc as yacc
+
+# Pasta dos módulos do compilador (no .pyz, o caminho do próprio arquivo)
+pasta_modulo = os.path.dirname(os.path.abspath(__file__))
+
+# Distribuição em arquivo único (.pyz): os módulos do compilador configuram o registro (logging.basicConfig)
+# em arquivos .log no diretório atual. Configurado antes aqui, o registro vai para a saída de erros (apenas
+# avisos) e as configurações seguintes não têm efeito, de modo que nada é gravado em disco
+arquivo_unico = not os.path.isdir(pasta_modulo)
+if arquivo_unico:
+    logging.basicConfig(level=logging.WARNING, format="%(filename)10s:%(lineno)4d:%(message)s")
+
+
+# Diretório de cache das tabelas
+def pastaCache():
+    if os.environ.get('TPP_CACHE_DIR'):
+        return os.environ['TPP_CACHE_DIR']
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'tpp')
+
+
+# Carrega o módulo do arquivo .py informado, sem passar pelo sys.path nem registrá-lo em sys.modules;
+# o caminho pode estar dentro de um .pyz. Retorna None se o arquivo não existir ou não puder ser executado
+def carregaModulo(caminho):
+    pasta, arquivo = os.path.split(caminho)
+    nome = os.path.splitext(arquivo)[0]
+    try:
+        especificacao = importlib.machinery.PathFinder.find_spec(nome, [pasta])
+        if especificacao is None or especificacao.loader is None:
+            return None
+        modulo = importlib.util.module_from_spec(especificacao)
+        especificacao.loader.exec_module(modulo)
+    except Exception:
+        return None
+    return modulo
+
+
+# Lê o arquivo de dados da pasta dos módulos do compilador (ou de dentro do .pyz)
+def leRecurso(nome):
+    caminho = os.path.join(pasta_modulo, nome)
+    if os.path.isfile(caminho):
+        with open(caminho, 'rb') as arquivo:
+            return arquivo.read()
+    return __loader__.get_data(caminho)
+
+
+# Grava a tabela nome.py na pasta: escreve(temporaria) gera o arquivo em um diretório temporário na mesma
+# pasta, que é então renomeado; retorna o que escreve retornar
+def gravaTabela(pasta, nome, escreve):
+    import shutil
+    import tempfile
+    os.makedirs(pasta, exist_ok=True)
+    temporaria = tempfile.mkdtemp(prefix='.' + nome + '-', dir=pasta)
+    try:
+        retorno = escreve(temporaria)
+        os.replace(os.path.join(temporaria, nome + '.py'), os.path.join(pasta, nome + '.py'))
+    finally:
+        shutil.rmtree(temporaria, ignore_errors=True)
+    return retorno
+
+
+# Assinatura da gramática do módulo, calculada como o yacc.yacc() calcula (símbolo inicial, precedência,
+# tokens e produções); é gravada nas tabelas LALR como _lr_signature
+def assinaturaGramatica(modulo, start=None):
+    dicionario = {nome: getattr(modulo, nome) for nome in dir(modulo)}
+    if start is not None:
+        dicionario['start'] = start
+    informacao = yacc.ParserReflect(dicionario, log=yacc.NullLogger())
+    informacao.get_all()
+    return informacao.signature()
+
+
+# Nome da tabela passado ao yacc.yacc quando a tabela deve ser construída: o yacc tenta antes importá-la pelo
+# nome (pelo sys.path), e um submódulo deste módulo, que não é um pacote, nunca é encontrado
+def nomeConstrucao(tabela):
+    return __name__ + '.' + tabela
+
+
+# Constrói o analisador LALR da gramática do módulo a partir das regras e grava a tabela na pasta
+# (por padrão, a tabela distribuída junto com o compilador)
+def geraParser(modulo, tabela, pasta=pasta_modulo, **opcoes):
+    return gravaTabela(pasta, tabela, lambda temporaria: yacc.yacc(
+        module=modulo, tabmodule=nomeConstrucao(tabela), outputdir=temporaria, optimize=True, write_tables=True,
+        debug=False, **opcoes))
+
+
+# Constrói o analisador LALR da gramática do módulo a partir da tabela válida ou, sem ela, das regras
+# (gravando a tabela no cache). opcoes: repassadas ao yacc.yacc (start, method, debuglog, errorlog)
+def constroiParser(modulo, tabela, **opcoes):
+    assinatura = assinaturaGramatica(modulo, opcoes.get('start'))
+    for pasta in (pasta_modulo, pastaCache()):
+        tabelas = carregaModulo(os.path.join(pasta, tabela + '.py'))
+        if (tabelas is not None and getattr(tabelas, '_tabversion', None) == yacc.__tabversion__
+                and getattr(tabelas, '_lr_signature', None) == assinatura):
+            return yacc.yacc(module=modulo, tabmodule=tabelas, optimize=True, write_tables=False, debug=False,
+                             **opcoes)
+
+    try:
+        return geraParser(modulo, tabela, pastaCache(), **opcoes)
+    except (OSError, UnicodeError):
+        # Sem cache gravável o analisador construído é usado assim mesmo
+        return yacc.yacc(module=modulo, tabmodule=nomeConstrucao(tabela), optimize=True, write_tables=False,
+                         debug=False, **opcoes)
@@ -0,0 +1,95 @@
+# Descrição: Pool de processos trabalhadores para compilar muitos programas T++.
+#            Os trabalhadores são criados por um servidor de fork (multiprocessing 'forkserver') que
+#            importou e inicializou o compilador uma única vez (tppprecarga.py): cada trabalhador é
+#            um fork desse processo, já com o analisador léxico, as tabelas LALR e os catálogos de
+#            mensagens prontos e compartilhados por cópia na escrita. Onde não há servidor de fork o
+#            pool usa fork direto do processo atual, após a mesma pré-carga.
+#
+#            Uso:
+#                with PoolCompilacao(4) as pool:
+#                    for resumo in pool.compilaArquivos(caminhos):
+#                        ...
+
+import multiprocessing
+import os
+
+import tppcompilador
+
+# Módulos importados pelo servidor de fork antes de criar os trabalhadores
+modulos_precarregados = ['tppprecarga']
+
+
+# Contexto do multiprocessing para os trabalhadores: servidor de fork com o compilador pré-carregado,
+# fork do processo atual ou, sem fork, o método padrão da plataforma
+def contexto():
+    metodos = multiprocessing.get_all_start_methods()
+    if 'forkserver' in metodos:
+        contexto = multiprocessing.get_context('forkserver')
+        contexto.set_forkserver_preload(modulos_precarregados)
+        return contexto
+    if 'fork' in metodos:
+        tppcompilador.precarrega()
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+# Resumo de uma compilação que pode ser devolvido pelo trabalhador (a árvore sintática fica no trabalhador)
+def resumo(resultado, caminho=None):
+    return {
+        'caminho': caminho,
+        'diagnosticos': resultado.diagnosticos,
+        'saida': resultado.saida,
+        'erro': '%s: %s' % (type(resultado.erro).__name__, resultado.erro) if resultado.erro else None,
+        'faseErro': resultado.faseErro,
+        'arvoreGerada': resultado.arvoreGerada(),
+    }
+
+
+def _compilaFonte(argumentos):
+    fonte, opcoes = argumentos
+    return resumo(tppcompilador.compila(fonte, **opcoes))
+
+
+def _compilaArquivo(argumentos):
+    caminho, opcoes = argumentos
+    try:
+        resultado = tppcompilador.compilaArquivo(caminho, **opcoes)
+    except OSError as e:
+        return {'caminho': caminho, 'diagnosticos': [], 'saida': '', 'erro': '%s: %s' % (type(e).__name__, e),
+                'faseErro': 'leitura', 'arvoreGerada': False}
+    return resumo(resultado, caminho)
+
+
+class PoolCompilacao:
+
+    # trabalhadores: número de processos (None = um por CPU)
+    def __init__(self, trabalhadores=None):
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.pool = contexto().Pool(self.trabalhadores)
+
+    # Compila os códigos-fonte; devolve os resumos na mesma ordem.
+    #   opcoes: repassadas a tppcompilador.compila (poda, gramatica, ...)
+    def compila(self, fontes, **opcoes):
+        return self.pool.map(_compilaFonte, [(fonte, opcoes) for fonte in fontes],
+                             chunksize=self._tamanhoLote(len(fontes)))
+
+    # Compila os arquivos .tpp; devolve os resumos na mesma ordem
+    def compilaArquivos(self, caminhos, **opcoes):
+        return self.pool.map(_compilaArquivo, [(caminho, opcoes) for caminho in caminhos],
+                             chunksize=self._tamanhoLote(len(caminhos)))
+
+    def _tamanhoLote(self, casos):
+        return max(1, casos // (self.trabalhadores * 4))
+
+    def fecha(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        if excecao[0] is None:
+            self.fecha()
+        else:
+            self.pool.terminate()